@@ -18,10 +18,12 @@ import hashlib
 import logging
 import os
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 
-from flask import Flask, jsonify, send_file
-from gtts import gTTS
+from flask import Flask, Response, jsonify, request, send_file, stream_with_context
+
+from phrase_audio_cache import get_phrase_cache
+from tts_backends import get_backend
 
 logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
@@ -117,6 +119,16 @@ AVAILABLE_VOICES = [
         "emotion_adaptability": 0.9,
         "age_category": "adult",
     },
+    {
+        "id": "offline",
+        "label": "Offline Voice",
+        "description": "Local synthesizer that works without a network connection",
+        "gender": "neutral",
+        "backend": "espeak",
+        "espeak_voice": "en-us",
+        "emotion_adaptability": 0.6,
+        "age_category": "adult",
+    },
 ]
 
 
@@ -167,26 +179,42 @@ def text_to_speech(
         if not text.endswith(".") and not text.endswith("?") and not text.endswith("!"):
             text = text + "."
 
+    effective_slow = slow or (effective_speed_factor < 0.92)
+    backend = get_backend(selected_voice)
+    voice_settings = dict(selected_voice, slow=effective_slow)
+
+    def render(path: str) -> None:
+        backend.save(text, voice_settings, path, rate=effective_speed_factor, lang=lang)
+
     if not output_path:
-        audio_dir = os.path.join(os.getcwd(), "static", "audio")
-        os.makedirs(audio_dir, exist_ok=True)
         content_hash = hashlib.md5(
             f"{text}|{voice_id}|{lang}|{slow}|{rate}".encode()
         ).hexdigest()
-        filename = f"{content_hash}.mp3"
-        output_path = os.path.join(audio_dir, filename)
+        return get_phrase_cache().get_or_render(
+            f"{content_hash}{backend.extension}", render
+        )
 
-        if os.path.exists(output_path):
-            return output_path
+    render(output_path)
+    return output_path
 
-    effective_slow = slow or (effective_speed_factor < 0.92)
 
-    tts = gTTS(
-        text=text, lang=lang, slow=effective_slow, tld=selected_voice.get("tld", "com")
-    )
+EMOTION_RATES = {
+    "positive": {"mild": 1.05, "moderate": 1.1, "strong": 1.15, "urgent": 1.2},
+    "negative": {"mild": 0.95, "moderate": 0.9, "strong": 0.85, "urgent": 0.8},
+    "neutral": {"mild": 1.0, "moderate": 1.0, "strong": 1.0, "urgent": 1.1},
+    "questioning": {
+        "mild": 1.0,
+        "moderate": 0.95,
+        "strong": 0.9,
+        "urgent": 0.85,
+    },
+}
 
-    tts.save(output_path)
-    return output_path
+
+def _emotion_rate(emotion: Optional[str], emotion_tier: Optional[str]) -> float:
+    if emotion and emotion_tier:
+        return EMOTION_RATES.get(emotion, {}).get(emotion_tier, 1.0)
+    return 1.0
 
 
 def text_to_speech_with_emotion(
@@ -197,34 +225,38 @@ def text_to_speech_with_emotion(
     output_path: Optional[str] = None,
     lang: str = "en",
 ) -> str:
-    rate = 1.0
+    rate = _emotion_rate(emotion, emotion_tier)
     slow = False
 
-    if emotion and emotion_tier:
-        emotion_rates = {
-            "positive": {"mild": 1.05, "moderate": 1.1, "strong": 1.15, "urgent": 1.2},
-            "negative": {"mild": 0.95, "moderate": 0.9, "strong": 0.85, "urgent": 0.8},
-            "neutral": {"mild": 1.0, "moderate": 1.0, "strong": 1.0, "urgent": 1.1},
-            "questioning": {
-                "mild": 1.0,
-                "moderate": 0.95,
-                "strong": 0.9,
-                "urgent": 0.85,
-            },
-        }
-        if emotion in emotion_rates and emotion_tier in emotion_rates[emotion]:
-            rate = emotion_rates[emotion][emotion_tier]
-
     return text_to_speech(text, voice_id, output_path, lang, slow, rate)
 
 
+def stream_speech(
+    text: str,
+    voice_id: str = "calming",
+    emotion: Optional[str] = None,
+    emotion_tier: Optional[str] = None,
+    lang: str = "en",
+) -> Tuple[Iterator[bytes], str]:
+    """Stream speech sentence by sentence with the voice's backend.
+
+    Returns:
+        Tuple of (audio chunk iterator, mimetype)
+    """
+    voice = get_voice_description(voice_id)
+    backend = get_backend(voice)
+    rate = _emotion_rate(emotion, emotion_tier)
+    return backend.stream(text, voice, rate=rate, lang=lang), backend.mimetype
+
+
 def get_voice_preview(
     voice_id: str, text: str = "Hello, this is a sample of my voice."
 ) -> str:
     preview_dir = os.path.join(os.getcwd(), "static", "voices")
     os.makedirs(preview_dir, exist_ok=True)
     content_hash = hashlib.md5(f"preview_{voice_id}_{text}".encode()).hexdigest()
-    filename = f"preview_{voice_id}_{content_hash}.mp3"
+    extension = get_backend(get_voice_description(voice_id)).extension
+    filename = f"preview_{voice_id}_{content_hash}{extension}"
     output_path = os.path.join(preview_dir, filename)
 
     if not os.path.exists(output_path):
@@ -275,6 +307,10 @@ def get_voice_for_emotion(
     return get_voice_description(selected_voice_id)
 
 
+def _audio_mimetype(filename: str) -> str:
+    return "audio/wav" if filename.endswith(".wav") else "audio/mpeg"
+
+
 app = Flask(__name__)
 
 
@@ -294,7 +330,23 @@ def generate_greeting():
 @app.route("/audio/<filename>")
 def serve_audio(filename):
     audio_path = os.path.join("static", "audio", filename)
-    return send_file(audio_path, mimetype="audio/mpeg")
+    return send_file(audio_path, mimetype=_audio_mimetype(filename))
+
+
+@app.route("/speak/stream", methods=["GET", "POST"])
+def speak_stream():
+    """Stream speech for text as chunked audio, one sentence at a time."""
+    params = request.get_json(silent=True) or request.args
+    text = params.get("text", "")
+    if not text:
+        return jsonify({"error": "No text provided"}), 400
+    chunks, mimetype = stream_speech(
+        text,
+        voice_id=params.get("voice_id", "calming"),
+        emotion=params.get("emotion"),
+        emotion_tier=params.get("emotion_tier"),
+    )
+    return Response(stream_with_context(chunks), mimetype=mimetype)
 
 
 @app.route("/voices", methods=["GET"])
@@ -320,7 +372,7 @@ def voice_preview(voice_id):
 def serve_voice_audio(filename):
     """Serve voice preview audio files."""
     path = os.path.join("static", "voices", filename)
-    return send_file(path, mimetype="audio/mpeg")
+    return send_file(path, mimetype=_audio_mimetype(filename))
 
 
 @app.route("/status", methods=["GET"])
@@ -25,6 +25,8 @@ from collections import deque
 from datetime import datetime
 from neural_learning_core import NeuralLearningCore
 from research_module import AlphaVoxResearchModule
+from model_registry import get_model_registry
+from write_behind import WriteBehindPersister
 
 # Configure logging
 logging.basicConfig(
@@ -58,6 +60,7 @@ class AlphaVoxInputProcessor:
         self.memory = deque(maxlen=max_memory)
         self.context_window = {}
         self.lock = threading.Lock()
+        self.model_registry = get_model_registry()
         self.nlc = NeuralLearningCore()
         self.research_module = AlphaVoxResearchModule()
         self.symbol_map = {
@@ -115,6 +118,10 @@ class AlphaVoxInputProcessor:
             },
         }
         self.load_context()
+        # Context is flushed in the background instead of on every interaction
+        self.context_persister = WriteBehindPersister(
+            "input_context", CONTEXT_FILE, self._serialize_context
+        )
         self.update_from_research()
         logger.info("AlphaVoxInputProcessor initialized")
 
@@ -132,16 +139,14 @@ class AlphaVoxInputProcessor:
                 self.context_window = {}
 
     def save_context(self):
-        """Save context window to disk."""
+        """Save context window to disk immediately."""
+        if self.context_persister.flush(force=True):
+            logger.info(f"Saved context window for {len(self.context_window)} users")
+
+    def _serialize_context(self) -> bytes:
+        """Snapshot the context window under the processor lock."""
         with self.lock:
-            try:
-                with open(CONTEXT_FILE, "wb") as f:
-                    pickle.dump(self.context_window, f)
-                logger.info(
-                    f"Saved context window for {len(self.context_window)} users"
-                )
-            except Exception as e:
-                logger.error(f"Error saving context: {str(e)}")
+            return pickle.dumps(self.context_window)
 
     def update_from_research(self):
         """Update mappings from research insights."""
@@ -177,16 +182,19 @@ class AlphaVoxInputProcessor:
             interaction = self._validate_interaction(interaction)
             interaction["context"] = self._add_context(interaction, user_id)
 
+            # Text is parsed once here and shared with the NLC
+            doc = None
             if interaction["type"] == "gesture":
                 interaction = self._process_gesture(interaction)
             elif interaction["type"] == "symbol":
                 interaction = self._process_symbol(interaction)
             elif interaction["type"] == "text":
-                interaction = self._process_text(interaction)
+                doc = self._parse_text(interaction)
+                interaction = self._process_text(interaction, doc=doc)
             elif interaction["type"] == "sound":
                 interaction = self._process_sound(interaction)
 
-            result = self.nlc.process_interaction(interaction, user_id)
+            result = self.nlc.process_interaction(interaction, user_id, doc=doc)
             self.memory.append(
                 {
                     "user_id": user_id,
@@ -196,7 +204,7 @@ class AlphaVoxInputProcessor:
                 }
             )
             self._update_context(user_id, interaction, result)
-            self.save_context()
+            self.context_persister.mark_dirty()
 
             logger.info(f"Processed interaction for user {user_id}: {result}")
             return result
@@ -235,26 +243,11 @@ class AlphaVoxInputProcessor:
                 logger.warning("Invalid gesture features")
                 return interaction
 
-            model_path = os.path.join(self.model_dir, "gesture_model.pkl")
-            if not os.path.exists(model_path):
+            predictions = self.classify_gestures([features])
+            if predictions is None:
                 logger.error("Gesture model not found")
                 return interaction
-
-            with open(model_path, "rb") as f:
-                gesture_model = pickle.load(f)
-
-            X = np.array([features])
-            prediction = gesture_model.predict(X)[0]
-            confidence = float(np.max(gesture_model.predict_proba(X)))
-
-            gesture_info = self.gesture_map.get(
-                prediction,
-                {
-                    "intent": "unknown",
-                    "message": f"Gesture {prediction} not recognized.",
-                    "emotion": "neutral",
-                },
-            )
+            prediction, confidence, gesture_info = predictions[0]
 
             interaction["intent"] = gesture_info["intent"]
             interaction["message"] = gesture_info["message"]
@@ -269,6 +262,38 @@ class AlphaVoxInputProcessor:
             logger.error(f"Error processing gesture: {str(e)}")
             return interaction
 
+    def classify_gestures(self, feature_rows: List[List[float]]):
+        """Classify one or more gesture feature vectors in a single model call.
+
+        Args:
+            feature_rows: List of gesture feature vectors
+
+        Returns:
+            List of (prediction, confidence, gesture_info) tuples, or None
+            if the gesture model is not available
+        """
+        model_path = os.path.join(self.model_dir, "gesture_model.pkl")
+        result = self.model_registry.predict_with_proba(model_path, np.array(feature_rows))
+        if result is None:
+            return None
+        predictions, probabilities = result
+
+        classified = []
+        for i, prediction in enumerate(predictions):
+            confidence = (
+                float(np.max(probabilities[i])) if probabilities is not None else 1.0
+            )
+            gesture_info = self.gesture_map.get(
+                prediction,
+                {
+                    "intent": "unknown",
+                    "message": f"Gesture {prediction} not recognized.",
+                    "emotion": "neutral",
+                },
+            )
+            classified.append((prediction, confidence, gesture_info))
+        return classified
+
     def _process_symbol(self, interaction: Dict[str, Any]) -> Dict[str, Any]:
         """Process symbol input."""
         try:
@@ -294,11 +319,25 @@ class AlphaVoxInputProcessor:
             logger.error(f"Error processing symbol: {str(e)}")
             return interaction
 
-    def _process_text(self, interaction: Dict[str, Any]) -> Dict[str, Any]:
-        """Process text input with NLU."""
+    def _parse_text(self, interaction: Dict[str, Any]):
+        """Run the spaCy pipeline over the interaction text, or None on failure."""
+        try:
+            return nlp(interaction.get("input", "").lower())
+        except Exception as e:
+            logger.error(f"Error parsing text: {str(e)}")
+            return None
+
+    def _process_text(self, interaction: Dict[str, Any], doc=None) -> Dict[str, Any]:
+        """Process text input with NLU.
+
+        Args:
+            interaction: Interaction dictionary
+            doc: Optional spaCy Doc already parsed from the lowercased text
+        """
         try:
             text = interaction.get("input", "")
-            doc = nlp(text.lower())
+            if doc is None:
+                doc = nlp(text.lower())
             intent = "communicate"
             emotion = "neutral"
             confidence = 0.9
@@ -33,6 +33,8 @@ from pathlib import Path
 from datetime import datetime
 import re
 
+from knowledge_index import KnowledgeIndex
+
 
 class KnowledgeEngine:
     """
@@ -58,6 +60,11 @@ class KnowledgeEngine:
         self.memory_mesh = memory_mesh
         self.local_reasoning = local_reasoning
         
+        # Token index over the knowledge files, loaded once and refreshed
+        # as files are added or changed
+        self.knowledge_index = KnowledgeIndex(self.knowledge_dir)
+        self.knowledge_index.refresh(force=True)
+        
         # Knowledge confidence thresholds
         self.high_confidence = 0.8
         self.medium_confidence = 0.6
@@ -144,55 +151,8 @@ class KnowledgeEngine:
         if not self.knowledge_dir.exists():
             return {"items": [], "confidence": 0.0}
         
-        relevant_knowledge = []
-        question_lower = question.lower()
-        question_words = set(re.findall(r'\b\w+\b', question_lower))
-        
-        # Search all knowledge domains
-        for domain_dir in self.knowledge_dir.iterdir():
-            if not domain_dir.is_dir() or domain_dir.name == "generated_code":
-                continue
-            
-            for knowledge_file in domain_dir.glob("*.json"):
-                try:
-                    with open(knowledge_file, 'r') as f:
-                        data = json.load(f)
-                        
-                        # Extract searchable content
-                        content = " ".join([
-                            str(data.get('topic', '')),
-                            str(data.get('summary', '')),
-                            str(data.get('key_concepts', [])),
-                            str(data.get('practical_applications', []))
-                        ]).lower()
-                        
-                        content_words = set(re.findall(r'\b\w+\b', content))
-                        
-                        # Calculate relevance
-                        word_overlap = len(question_words & content_words)
-                        if word_overlap > 0:
-                            relevance = word_overlap / len(question_words)
-                            
-                            # Boost if exact phrase match
-                            if any(phrase in content for phrase in question_lower.split()):
-                                relevance *= 1.5
-                            
-                            if relevance > 0.15:  # Minimum threshold
-                                relevant_knowledge.append({
-                                    "topic": data.get('topic', ''),
-                                    "domain": data.get('domain', ''),
-                                    "summary": data.get('summary', ''),
-                                    "key_concepts": data.get('key_concepts', []),
-                                    "applications": data.get('practical_applications', []),
-                                    "learned_at": data.get('learned_at', ''),
-                                    "relevance": min(relevance, 1.0)
-                                })
-                
-                except Exception as e:
-                    continue
-        
-        # Sort by relevance
-        relevant_knowledge.sort(key=lambda x: x['relevance'], reverse=True)
+        # Index lookup instead of reading every knowledge file
+        relevant_knowledge = self.knowledge_index.search(question)
         
         # Calculate overall confidence
         if relevant_knowledge:
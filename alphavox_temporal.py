@@ -34,15 +34,26 @@ import io
 import json
 import logging
 import os
-import tempfile
 
 import numpy as np
 import sounddevice as sd
-from flask import Flask, Response, jsonify, render_template, request, session
+from flask import (
+    Flask,
+    Response,
+    jsonify,
+    render_template,
+    request,
+    session,
+    stream_with_context,
+)
 from flask_session import Session
-from gtts import gTTS
 
-from engine_temporal import TemporalNonverbalEngine
+from engine_temporal import (
+    BatchInferenceScheduler,
+    TemporalNonverbalEngine,
+    TemporalSessionTable,
+)
+from tts_backends import get_backend
 
 # Set up logging
 logging.basicConfig(
@@ -71,8 +82,15 @@ temporal_engine = TemporalNonverbalEngine(
     conversation_persona="default",
 )
 
-# Cache for storing feature sequences by session
-sequence_cache = {}
+# Per-session feature buffers, bounded and evicted when idle
+temporal_sessions = TemporalSessionTable(
+    sequence_length=temporal_engine.sequence_length,
+    max_sessions=256,
+    idle_timeout=600,
+)
+
+# Batches ready sequences from all sessions into one predict per modality
+inference_scheduler = BatchInferenceScheduler(temporal_engine, max_wait=0.005)
 
 
 def get_session_id():
@@ -83,13 +101,8 @@ def get_session_id():
 
 
 def init_session_cache(session_id):
-    """Initialize or reset cache for a session."""
-    if session_id not in sequence_cache:
-        sequence_cache[session_id] = {
-            "gesture_count": 0,
-            "eye_count": 0,
-            "emotion_count": 0,
-        }
+    """Get or create the temporal buffers for a session."""
+    return temporal_sessions.get(session_id)
 
 
 @app.route("/heartbeat")
@@ -146,15 +159,23 @@ def analyze_frame():
         "frame": "base64_encoded_image",
         "frame_index": 0
     }
+
+    or the raw JPEG bytes as the body (Content-Type: image/jpeg) with the
+    frame index in the query string, which avoids base64 encoding.
     """
     session_id = get_session_id()
-    init_session_cache(session_id)
+    temporal_session = init_session_cache(session_id)
 
     try:
-        data = request.json
+        if request.mimetype == "image/jpeg":
+            if not request.get_data(cache=False):
+                return jsonify({"error": "No frame data provided"}), 400
+            data = {"frame_index": request.args.get("frame_index", 0, type=int)}
+        else:
+            data = request.json
 
-        if "frame" not in data:
-            return jsonify({"error": "No frame data provided"}), 400
+            if "frame" not in data:
+                return jsonify({"error": "No frame data provided"}), 400
 
         # In a production system, we would:
         # 1. Decode the base64 image
@@ -191,28 +212,15 @@ def analyze_frame():
             0.3 + 0.05 * np.sin(frame_index / 10),
         ]
 
-        # Add features to temporal engine
-        gesture_ready = temporal_engine.add_gesture_features(gesture_features)
-        eye_ready = temporal_engine.add_eye_features(eye_features)
-        emotion_ready = temporal_engine.add_emotion_features(emotion_features)
-
-        # Update sequence counts
-        sequence_cache[session_id]["gesture_count"] += 1
-        sequence_cache[session_id]["eye_count"] += 1
-        sequence_cache[session_id]["emotion_count"] += 1
-
-        # Process if any sequence is ready
-        result = None
-        if gesture_ready or eye_ready or emotion_ready:
-            result = temporal_engine.process_multimodal_sequence()
-
-            # Reset counts after processing
-            if gesture_ready:
-                sequence_cache[session_id]["gesture_count"] = 0
-            if eye_ready:
-                sequence_cache[session_id]["eye_count"] = 0
-            if emotion_ready:
-                sequence_cache[session_id]["emotion_count"] = 0
+        # Add features to this session's buffers; ready sequences are
+        # classified in a batch shared with other sessions
+        result = temporal_engine.process_session_frame(
+            temporal_session,
+            gesture_features=gesture_features,
+            eye_features=eye_features,
+            emotion_features=emotion_features,
+            scheduler=inference_scheduler,
+        )
 
         # Return the result or progress
         if result:
@@ -222,14 +230,7 @@ def analyze_frame():
                     "status": "success",
                     "result": result,
                     "message": result["enhanced_response"],
-                    "progress": {
-                        "gesture": sequence_cache[session_id]["gesture_count"]
-                        / temporal_engine.sequence_length,
-                        "eye": sequence_cache[session_id]["eye_count"]
-                        / temporal_engine.sequence_length,
-                        "emotion": sequence_cache[session_id]["emotion_count"]
-                        / temporal_engine.sequence_length,
-                    },
+                    "progress": temporal_session.progress(),
                 }
             )
         else:
@@ -237,14 +238,7 @@ def analyze_frame():
             return jsonify(
                 {
                     "status": "collecting",
-                    "progress": {
-                        "gesture": sequence_cache[session_id]["gesture_count"]
-                        / temporal_engine.sequence_length,
-                        "eye": sequence_cache[session_id]["eye_count"]
-                        / temporal_engine.sequence_length,
-                        "emotion": sequence_cache[session_id]["emotion_count"]
-                        / temporal_engine.sequence_length,
-                    },
+                    "progress": temporal_session.progress(),
                 }
             )
 
@@ -382,7 +376,7 @@ def clear_buffers():
     try:
         temporal_engine.clear_buffers()
         session_id = get_session_id()
-        init_session_cache(session_id)
+        init_session_cache(session_id).clear()
         return jsonify({"status": "success", "message": "All buffers cleared"})
     except Exception as e:
         logger.error(f"Error clearing buffers: {e}")
@@ -469,29 +463,47 @@ def speak():
 
         text = data["text"]
 
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
-            temp_path = temp_file.name
-
-        # Generate speech
-        tts = gTTS(text=text, lang="en", slow=False)
-        tts.save(temp_path)
-
-        # Read the file and encode as base64
-        with open(temp_path, "rb") as f:
-            audio_data = f.read()
+        # Generate speech in memory and encode as base64
+        backend = get_backend()
+        audio_data = backend.synthesize(text, {})
         audio_base64 = base64.b64encode(audio_data).decode("utf-8")
 
-        # Clean up
-        os.unlink(temp_path)
-
-        return jsonify({"status": "success", "audio": audio_base64, "text": text})
+        return jsonify(
+            {
+                "status": "success",
+                "audio": audio_base64,
+                "mimetype": backend.mimetype,
+                "text": text,
+            }
+        )
 
     except Exception as e:
         logger.error(f"Error generating speech: {e}")
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/speak/stream", methods=["POST"])
+def speak_stream():
+    """Stream speech as chunked audio, one sentence at a time.
+
+    Long academic responses start playing after their first sentence.
+
+    Expected input:
+    {
+        "text": "Text to speak"
+    }
+    """
+    data = request.get_json(silent=True) or {}
+    text = data.get("text")
+    if not text:
+        return jsonify({"error": "No text provided"}), 400
+
+    backend = get_backend()
+    return Response(
+        stream_with_context(backend.stream(text, {})), mimetype=backend.mimetype
+    )
+
+
 @app.route("/language_map", methods=["GET"])
 def get_language_map():
     """Get the current language map."""
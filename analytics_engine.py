@@ -26,88 +26,236 @@ allowing comprehensive tracking of user interactions, progress, and communicatio
 It serves as the foundation for evidence-based assessment and personalized adaptations.
 """
 
+import atexit
 import json
 import os
 import sqlite3
+import threading
+import time
+import uuid
 from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
 
+# Table name -> (legacy CSV file, columns, timestamp columns)
+TABLES = {
+    "interactions": (
+        "interactions.csv",
+        ["user_id", "interaction_type", "input", "output", "confidence", "timestamp"],
+        ["timestamp"],
+    ),
+    "symbol_selections": (
+        "symbol_selections.csv",
+        ["user_id", "symbol", "context", "timestamp"],
+        ["timestamp"],
+    ),
+    "games": (
+        "games.csv",
+        ["user_id", "game_type", "score", "duration", "timestamp"],
+        ["timestamp"],
+    ),
+    "training_access": (
+        "training_access.csv",
+        ["user_id", "tutorial_id", "completion_status", "timestamp"],
+        ["timestamp"],
+    ),
+    "points": (
+        "points.csv",
+        ["user_id", "points", "reason", "timestamp"],
+        ["timestamp"],
+    ),
+    "sessions": (
+        "sessions.csv",
+        [
+            "user_id",
+            "session_id",
+            "start_time",
+            "end_time",
+            "duration",
+            "interaction_count",
+        ],
+        ["start_time", "end_time"],
+    ),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS interactions (
+    user_id TEXT, interaction_type TEXT, input TEXT, output TEXT,
+    confidence REAL, timestamp TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_interactions_user_ts ON interactions (user_id, timestamp);
+CREATE TABLE IF NOT EXISTS symbol_selections (
+    user_id TEXT, symbol TEXT, context TEXT, timestamp TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_symbols_user_ts ON symbol_selections (user_id, timestamp);
+CREATE TABLE IF NOT EXISTS games (
+    user_id TEXT, game_type TEXT, score REAL, duration REAL, timestamp TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_games_user_ts ON games (user_id, timestamp);
+CREATE TABLE IF NOT EXISTS training_access (
+    user_id TEXT, tutorial_id TEXT, completion_status TEXT, timestamp TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_training_user_ts ON training_access (user_id, timestamp);
+CREATE TABLE IF NOT EXISTS points (
+    user_id TEXT, points REAL, reason TEXT, timestamp TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_points_user_ts ON points (user_id, timestamp);
+CREATE TABLE IF NOT EXISTS sessions (
+    user_id TEXT, session_id TEXT PRIMARY KEY, start_time TIMESTAMP,
+    end_time TIMESTAMP, duration REAL, interaction_count INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_user ON sessions (user_id);
+"""
+
+
+def _ts(value):
+    """Format a datetime as the sortable ISO text stored in TIMESTAMP columns."""
+    return value.isoformat(sep=" ") if value is not None else None
+
 
 class AnalyticsEngine:
     """A comprehensive analytics engine for tracking user interactions with
     AlphaVox.
 
-    Uses pandas DataFrames for efficient data processing and analysis.
+    Events are buffered in memory and appended in batches to an indexed
+    SQLite database; reports query only the rows and columns they need
+    and come back as pandas DataFrames with parsed timestamps.
     """
 
-    def __init__(self, data_dir="data"):
+    def __init__(self, data_dir="data", db_name="analytics.db", batch_size=50,
+                 flush_interval=2.0):
         """Initialize the analytics engine.
 
         Args:
             data_dir: Directory for storing data files
+            db_name: SQLite database file inside data_dir
+            batch_size: Buffered rows that trigger a flush
+            flush_interval: Seconds after which a log call flushes the buffer
         """
         self.data_dir = data_dir
         Path(data_dir).mkdir(exist_ok=True)
 
-        # Initialize DataFrames for tracking different interaction types
-        self.interactions_df = self._load_or_create_df(
-            "interactions.csv",
-            columns=[
-                "user_id",
-                "interaction_type",
-                "input",
-                "output",
-                "confidence",
-                "timestamp",
-            ],
-        )
-
-        self.symbol_selections_df = self._load_or_create_df(
-            "symbol_selections.csv",
-            columns=["user_id", "symbol", "context", "timestamp"],
-        )
-
-        self.games_df = self._load_or_create_df(
-            "games.csv",
-            columns=["user_id", "game_type", "score", "duration", "timestamp"],
-        )
-
-        self.training_access_df = self._load_or_create_df(
-            "training_access.csv",
-            columns=["user_id", "tutorial_id", "completion_status", "timestamp"],
-        )
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = {table: [] for table in TABLES}
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+
+        self.db_path = os.path.join(data_dir, db_name)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self._migrate_csv_files()
+        atexit.register(self.flush)
+
+    # ------------------------------------------------------------------
+    # Storage helpers
+    # ------------------------------------------------------------------
+
+    def _migrate_csv_files(self):
+        """Import the legacy per-table CSV files once, then set them aside."""
+        for table, (filename, columns, dates) in TABLES.items():
+            filepath = os.path.join(self.data_dir, filename)
+            if not os.path.exists(filepath):
+                continue
+            df = pd.read_csv(filepath)
+            df = df[[c for c in columns if c in df.columns]]
+            if "session_id" in df.columns:
+                df["session_id"] = self._unique_session_ids(df["session_id"])
+            for column in dates:
+                if column in df.columns:
+                    parsed = pd.to_datetime(df[column], errors="coerce")
+                    df[column] = [_ts(v) if pd.notna(v) else None for v in parsed]
+            with self._lock, self._conn:
+                df.to_sql(table, self._conn, if_exists="append", index=False)
+            os.replace(filepath, f"{filepath}.migrated")
+
+    def _unique_session_ids(self, session_ids):
+        """Rename legacy session ids that repeat or are already stored.
+
+        Old ids only had one-second resolution, so two sessions started in
+        the same second shared an id; later ones get a "_2", "_3"... suffix
+        instead of colliding on the primary key.
+        """
+        with self._lock:
+            taken = {
+                row[0] for row in self._conn.execute("SELECT session_id FROM sessions")
+            }
+        unique = []
+        for session_id in session_ids:
+            if pd.isna(session_id):
+                unique.append(session_id)
+                continue
+            session_id = str(session_id)
+            candidate, n = session_id, 1
+            while candidate in taken:
+                n += 1
+                candidate = f"{session_id}_{n}"
+            taken.add(candidate)
+            unique.append(candidate)
+        return unique
+
+    def _append(self, table, row):
+        """Buffer a row for a table, flushing when the batch is due."""
+        with self._lock:
+            self._pending[table].append(row)
+            self._pending_count += 1
+            if (
+                self._pending_count >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self.flush()
+
+    def flush(self):
+        """Write all buffered rows in one transaction."""
+        with self._lock:
+            if self._pending_count:
+                with self._conn:
+                    for table, rows in self._pending.items():
+                        if not rows:
+                            continue
+                        columns = TABLES[table][1]
+                        placeholders = ", ".join("?" for _ in columns)
+                        self._conn.executemany(
+                            f"INSERT INTO {table} ({', '.join(columns)}) "
+                            f"VALUES ({placeholders})",
+                            [tuple(row.get(c) for c in columns) for row in rows],
+                        )
+                        rows.clear()
+                self._pending_count = 0
+            self._last_flush = time.monotonic()
+
+    def _query_df(self, sql, params=(), parse_dates=None):
+        """Run a query (after flushing buffered rows) into a DataFrame."""
+        with self._lock:
+            self.flush()
+            return pd.read_sql_query(
+                sql, self._conn, params=params, parse_dates=parse_dates
+            )
 
-        self.points_df = self._load_or_create_df(
-            "points.csv", columns=["user_id", "points", "reason", "timestamp"]
-        )
+    def _query_one(self, sql, params=()):
+        with self._lock:
+            self.flush()
+            return self._conn.execute(sql, params).fetchone()
 
-        self.sessions_df = self._load_or_create_df(
-            "sessions.csv",
-            columns=[
-                "user_id",
-                "session_id",
-                "start_time",
-                "end_time",
-                "duration",
-                "interaction_count",
-            ],
+    def _read_table(self, table):
+        columns, dates = TABLES[table][1], TABLES[table][2]
+        return self._query_df(
+            f"SELECT {', '.join(columns)} FROM {table}", parse_dates=dates
         )
 
-    def _load_or_create_df(self, filename, columns):
-        """Load a DataFrame from CSV or create a new one if it doesn't
-        exist."""
-        filepath = os.path.join(self.data_dir, filename)
-        if os.path.exists(filepath):
-            return pd.read_csv(filepath)
-        else:
-            return pd.DataFrame(columns=columns)
+    # Full-table views kept for callers that used the old DataFrame attributes
+    interactions_df = property(lambda self: self._read_table("interactions"))
+    symbol_selections_df = property(lambda self: self._read_table("symbol_selections"))
+    games_df = property(lambda self: self._read_table("games"))
+    training_access_df = property(lambda self: self._read_table("training_access"))
+    points_df = property(lambda self: self._read_table("points"))
+    sessions_df = property(lambda self: self._read_table("sessions"))
 
-    def _save_df(self, df, filename):
-        """Save a DataFrame to CSV."""
-        filepath = os.path.join(self.data_dir, filename)
-        df.to_csv(filepath, index=False)
+    # ------------------------------------------------------------------
+    # Logging
+    # ------------------------------------------------------------------
 
     def log_interaction(
         self,
@@ -126,23 +274,17 @@ class AnalyticsEngine:
             output_data: Output response (optional)
             confidence: Confidence score (optional)
         """
-        new_row = pd.DataFrame(
-            [
-                {
-                    "user_id": user_id,
-                    "interaction_type": interaction_type,
-                    "input": str(input_data) if input_data is not None else None,
-                    "output": str(output_data) if output_data is not None else None,
-                    "confidence": confidence,
-                    "timestamp": datetime.now(),
-                }
-            ]
+        self._append(
+            "interactions",
+            {
+                "user_id": user_id,
+                "interaction_type": interaction_type,
+                "input": str(input_data) if input_data is not None else None,
+                "output": str(output_data) if output_data is not None else None,
+                "confidence": confidence,
+                "timestamp": _ts(datetime.now()),
+            },
         )
-
-        self.interactions_df = pd.concat(
-            [self.interactions_df, new_row], ignore_index=True
-        )
-        self._save_df(self.interactions_df, "interactions.csv")
         return True
 
     def log_symbol_selection(self, user_id, symbol, context=None):
@@ -153,21 +295,15 @@ class AnalyticsEngine:
             symbol: Selected symbol
             context: Context of selection (optional)
         """
-        new_row = pd.DataFrame(
-            [
-                {
-                    "user_id": user_id,
-                    "symbol": symbol,
-                    "context": context,
-                    "timestamp": datetime.now(),
-                }
-            ]
-        )
-
-        self.symbol_selections_df = pd.concat(
-            [self.symbol_selections_df, new_row], ignore_index=True
+        self._append(
+            "symbol_selections",
+            {
+                "user_id": user_id,
+                "symbol": symbol,
+                "context": context,
+                "timestamp": _ts(datetime.now()),
+            },
         )
-        self._save_df(self.symbol_selections_df, "symbol_selections.csv")
         return True
 
     def log_game_activity(self, user_id, game_type, score=None, duration=None):
@@ -179,20 +315,16 @@ class AnalyticsEngine:
             score: Game score (optional)
             duration: Game duration in seconds (optional)
         """
-        new_row = pd.DataFrame(
-            [
-                {
-                    "user_id": user_id,
-                    "game_type": game_type,
-                    "score": score,
-                    "duration": duration,
-                    "timestamp": datetime.now(),
-                }
-            ]
+        self._append(
+            "games",
+            {
+                "user_id": user_id,
+                "game_type": game_type,
+                "score": score,
+                "duration": duration,
+                "timestamp": _ts(datetime.now()),
+            },
         )
-
-        self.games_df = pd.concat([self.games_df, new_row], ignore_index=True)
-        self._save_df(self.games_df, "games.csv")
         return True
 
     def log_training_access(self, user_id, tutorial_id, completion_status=None):
@@ -203,21 +335,15 @@ class AnalyticsEngine:
             tutorial_id: Training material identifier
             completion_status: Completion status (optional)
         """
-        new_row = pd.DataFrame(
-            [
-                {
-                    "user_id": user_id,
-                    "tutorial_id": tutorial_id,
-                    "completion_status": completion_status,
-                    "timestamp": datetime.now(),
-                }
-            ]
-        )
-
-        self.training_access_df = pd.concat(
-            [self.training_access_df, new_row], ignore_index=True
+        self._append(
+            "training_access",
+            {
+                "user_id": user_id,
+                "tutorial_id": tutorial_id,
+                "completion_status": completion_status,
+                "timestamp": _ts(datetime.now()),
+            },
         )
-        self._save_df(self.training_access_df, "training_access.csv")
         return True
 
     def log_points(self, user_id, points, reason=None):
@@ -228,19 +354,15 @@ class AnalyticsEngine:
             points: Number of points
             reason: Reason for points (optional)
         """
-        new_row = pd.DataFrame(
-            [
-                {
-                    "user_id": user_id,
-                    "points": points,
-                    "reason": reason,
-                    "timestamp": datetime.now(),
-                }
-            ]
+        self._append(
+            "points",
+            {
+                "user_id": user_id,
+                "points": points,
+                "reason": reason,
+                "timestamp": _ts(datetime.now()),
+            },
         )
-
-        self.points_df = pd.concat([self.points_df, new_row], ignore_index=True)
-        self._save_df(self.points_df, "points.csv")
         return True
 
     def start_session(self, user_id):
@@ -252,22 +374,17 @@ class AnalyticsEngine:
         Returns:
             session_id: Unique session identifier
         """
-        session_id = f"{user_id}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        new_row = pd.DataFrame(
-            [
-                {
-                    "user_id": user_id,
-                    "session_id": session_id,
-                    "start_time": datetime.now(),
-                    "end_time": None,
-                    "duration": None,
-                    "interaction_count": 0,
-                }
-            ]
+        # The random suffix keeps sessions started in the same second apart
+        started = datetime.now()
+        session_id = (
+            f"{user_id}_{started.strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:12]}"
         )
-
-        self.sessions_df = pd.concat([self.sessions_df, new_row], ignore_index=True)
-        self._save_df(self.sessions_df, "sessions.csv")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO sessions (user_id, session_id, start_time, "
+                "end_time, duration, interaction_count) VALUES (?, ?, ?, NULL, NULL, 0)",
+                (user_id, session_id, _ts(started)),
+            )
         return session_id
 
     def end_session(self, session_id):
@@ -276,33 +393,48 @@ class AnalyticsEngine:
         Args:
             session_id: Session identifier
         """
-        if session_id in self.sessions_df["session_id"].values:
-            idx = self.sessions_df[self.sessions_df["session_id"] == session_id].index[
-                0
-            ]
-            start_time = pd.to_datetime(self.sessions_df.at[idx, "start_time"])
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-
-            # Get interaction count for this session
-            user_id = self.sessions_df.at[idx, "user_id"]
-            if not pd.isna(start_time):
-                interactions = self.interactions_df[
-                    (self.interactions_df["user_id"] == user_id)
-                    & (pd.to_datetime(self.interactions_df["timestamp"]) >= start_time)
-                    & (pd.to_datetime(self.interactions_df["timestamp"]) <= end_time)
-                ]
-                interaction_count = len(interactions)
-            else:
-                interaction_count = 0
-
-            # Update session record
-            self.sessions_df.at[idx, "end_time"] = end_time
-            self.sessions_df.at[idx, "duration"] = duration
-            self.sessions_df.at[idx, "interaction_count"] = interaction_count
-            self._save_df(self.sessions_df, "sessions.csv")
-            return True
-        return False
+        row = self._query_one(
+            "SELECT user_id, start_time FROM sessions WHERE session_id = ?",
+            (session_id,),
+        )
+        if row is None:
+            return False
+
+        user_id, start_time = row
+        end_time = datetime.now()
+
+        # Get interaction count for this session
+        if start_time:
+            duration = (end_time - datetime.fromisoformat(start_time)).total_seconds()
+            interaction_count = self._query_one(
+                "SELECT COUNT(*) FROM interactions "
+                "WHERE user_id = ? AND timestamp >= ? AND timestamp <= ?",
+                (user_id, start_time, _ts(end_time)),
+            )[0]
+        else:
+            duration = None
+            interaction_count = 0
+
+        # Update session record
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE sessions SET end_time = ?, duration = ?, interaction_count = ? "
+                "WHERE session_id = ?",
+                (_ts(end_time), duration, interaction_count, session_id),
+            )
+        return True
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def _most_common(self, table, column, user_id):
+        row = self._query_one(
+            f"SELECT {column} FROM {table} WHERE user_id = ? AND {column} IS NOT NULL "
+            f"GROUP BY {column} ORDER BY COUNT(*) DESC LIMIT 1",
+            (user_id,),
+        )
+        return row[0] if row else None
 
     def get_user_stats(self, user_id):
         """Get statistics for a specific user.
@@ -313,61 +445,46 @@ class AnalyticsEngine:
         Returns:
             Dictionary with user statistics
         """
-        user_interactions = self.interactions_df[
-            self.interactions_df["user_id"] == user_id
-        ]
-        user_sessions = self.sessions_df[self.sessions_df["user_id"] == user_id]
-        user_games = self.games_df[self.games_df["user_id"] == user_id]
-        user_symbols = self.symbol_selections_df[
-            self.symbol_selections_df["user_id"] == user_id
-        ]
-        user_points = self.points_df[self.points_df["user_id"] == user_id]
-
-        # Calculate statistics
-        interaction_count = len(user_interactions)
-        session_count = len(user_sessions)
-        avg_session_duration = (
-            user_sessions["duration"].mean()
-            if not user_sessions.empty and "duration" in user_sessions
-            else 0
-        )
-        total_points = user_points["points"].sum() if not user_points.empty else 0
-
-        # Calculate most used interaction type
-        most_used_type = None
-        if not user_interactions.empty and "interaction_type" in user_interactions:
-            type_counts = user_interactions["interaction_type"].value_counts()
-            if not type_counts.empty:
-                most_used_type = type_counts.index[0]
-
-        # Calculate most selected symbol
-        most_used_symbol = None
-        if not user_symbols.empty and "symbol" in user_symbols:
-            symbol_counts = user_symbols["symbol"].value_counts()
-            if not symbol_counts.empty:
-                most_used_symbol = symbol_counts.index[0]
-
-        # Calculate game performance
-        avg_score = (
-            user_games["score"].mean()
-            if not user_games.empty and "score" in user_games
-            else 0
+        interaction_count = self._query_one(
+            "SELECT COUNT(*) FROM interactions WHERE user_id = ?", (user_id,)
+        )[0]
+        session_count, avg_session_duration = self._query_one(
+            "SELECT COUNT(*), AVG(duration) FROM sessions WHERE user_id = ?",
+            (user_id,),
         )
+        total_points = self._query_one(
+            "SELECT SUM(points) FROM points WHERE user_id = ?", (user_id,)
+        )[0]
+        avg_score = self._query_one(
+            "SELECT AVG(score) FROM games WHERE user_id = ?", (user_id,)
+        )[0]
 
         # Create and return stats dictionary
         stats = {
             "user_id": user_id,
             "total_interactions": interaction_count,
             "total_sessions": session_count,
-            "avg_session_duration": avg_session_duration,
-            "total_points": total_points,
-            "most_used_interaction": most_used_type,
-            "most_used_symbol": most_used_symbol,
-            "avg_game_score": avg_score,
+            "avg_session_duration": avg_session_duration or 0,
+            "total_points": total_points or 0,
+            "most_used_interaction": self._most_common(
+                "interactions", "interaction_type", user_id
+            ),
+            "most_used_symbol": self._most_common("symbol_selections", "symbol", user_id),
+            "avg_game_score": avg_score or 0,
         }
 
         return stats
 
+    def _daily(self, table, user_id, cutoff, value_sql, value_name):
+        """Per-day aggregate for one user since cutoff, as a DataFrame."""
+        df = self._query_df(
+            f"SELECT date(timestamp) AS date, {value_sql} AS {value_name} FROM {table} "
+            "WHERE user_id = ? AND timestamp >= ? GROUP BY date(timestamp) ORDER BY date",
+            (user_id, _ts(cutoff)),
+            parse_dates=["date"],
+        )
+        return df
+
     def get_progress_report(self, user_id, days=30):
         """Generate a progress report for a user over the specified time
         period.
@@ -381,79 +498,30 @@ class AnalyticsEngine:
         """
         cutoff_date = datetime.now() - pd.Timedelta(days=days)
 
-        # Filter data for the specified time period
-        user_interactions = self.interactions_df[
-            (self.interactions_df["user_id"] == user_id)
-            & (pd.to_datetime(self.interactions_df["timestamp"]) >= cutoff_date)
-        ]
-
-        user_symbols = self.symbol_selections_df[
-            (self.symbol_selections_df["user_id"] == user_id)
-            & (pd.to_datetime(self.symbol_selections_df["timestamp"]) >= cutoff_date)
-        ]
-
-        user_games = self.games_df[
-            (self.games_df["user_id"] == user_id)
-            & (pd.to_datetime(self.games_df["timestamp"]) >= cutoff_date)
-        ]
-
         # Calculate daily statistics
-        if not user_interactions.empty and "timestamp" in user_interactions:
-            user_interactions["date"] = pd.to_datetime(
-                user_interactions["timestamp"]
-            ).dt.date
-            daily_interactions = (
-                user_interactions.groupby("date").size().reset_index(name="count")
-            )
-            daily_interactions["date"] = pd.to_datetime(daily_interactions["date"])
-        else:
-            daily_interactions = pd.DataFrame(columns=["date", "count"])
-
-        if not user_symbols.empty and "timestamp" in user_symbols:
-            user_symbols["date"] = pd.to_datetime(user_symbols["timestamp"]).dt.date
-            daily_symbols = (
-                user_symbols.groupby("date").size().reset_index(name="count")
-            )
-            daily_symbols["date"] = pd.to_datetime(daily_symbols["date"])
-        else:
-            daily_symbols = pd.DataFrame(columns=["date", "count"])
-
-        if not user_games.empty and "timestamp" in user_games and "score" in user_games:
-            user_games["date"] = pd.to_datetime(user_games["timestamp"]).dt.date
-            daily_scores = (
-                user_games.groupby("date")["score"].mean().reset_index(name="avg_score")
-            )
-            daily_scores["date"] = pd.to_datetime(daily_scores["date"])
-        else:
-            daily_scores = pd.DataFrame(columns=["date", "avg_score"])
-
-        # Convert DataFrames to lists for JSON serialization
-        daily_interactions_list = (
-            daily_interactions.to_dict("records")
-            if not daily_interactions.empty
-            else []
-        )
-        daily_symbols_list = (
-            daily_symbols.to_dict("records") if not daily_symbols.empty else []
+        daily_interactions = self._daily(
+            "interactions", user_id, cutoff_date, "COUNT(*)", "count"
         )
-        daily_scores_list = (
-            daily_scores.to_dict("records") if not daily_scores.empty else []
+        daily_symbols = self._daily(
+            "symbol_selections", user_id, cutoff_date, "COUNT(*)", "count"
         )
+        daily_scores = self._daily("games", user_id, cutoff_date, "AVG(score)", "avg_score")
+
+        avg_score = self._query_one(
+            "SELECT AVG(score) FROM games WHERE user_id = ? AND timestamp >= ?",
+            (user_id, _ts(cutoff_date)),
+        )[0]
 
         # Create progress report
         report = {
             "user_id": user_id,
             "period_days": days,
-            "daily_interactions": daily_interactions_list,
-            "daily_symbols": daily_symbols_list,
-            "daily_scores": daily_scores_list,
-            "total_interactions": len(user_interactions),
-            "total_symbols": len(user_symbols),
-            "avg_game_score": (
-                user_games["score"].mean()
-                if not user_games.empty and "score" in user_games
-                else 0
-            ),
+            "daily_interactions": daily_interactions.to_dict("records"),
+            "daily_symbols": daily_symbols.to_dict("records"),
+            "daily_scores": daily_scores.to_dict("records"),
+            "total_interactions": int(daily_interactions["count"].sum()),
+            "total_symbols": int(daily_symbols["count"].sum()),
+            "avg_game_score": avg_score or 0,
         }
 
         return report
@@ -467,12 +535,14 @@ class AnalyticsEngine:
         Returns:
             Dictionary with therapeutic insights
         """
-        user_interactions = self.interactions_df[
-            self.interactions_df["user_id"] == user_id
-        ]
-        user_symbols = self.symbol_selections_df[
-            self.symbol_selections_df["user_id"] == user_id
-        ]
+        user_interactions = self._query_df(
+            "SELECT interaction_type, timestamp FROM interactions WHERE user_id = ?",
+            (user_id,),
+            parse_dates=["timestamp"],
+        )
+        user_symbols = self._query_df(
+            "SELECT symbol FROM symbol_selections WHERE user_id = ?", (user_id,)
+        )
 
         insights = {
             "user_id": user_id,
@@ -509,9 +579,6 @@ class AnalyticsEngine:
 
         # Analyze interaction patterns over time
         if not user_interactions.empty and "timestamp" in user_interactions:
-            user_interactions["timestamp"] = pd.to_datetime(
-                user_interactions["timestamp"]
-            )
             user_interactions = user_interactions.sort_values("timestamp")
 
             # Check for increased interaction frequency
@@ -23,6 +23,7 @@ import csv
 import traceback
 import time  # Added for sleep function
 import math  # Added for math functions
+import secrets
 import pandas as pd
 from datetime import datetime, timedelta
 from flask import (
@@ -36,12 +37,14 @@ from flask import (
     session,
     flash,
     send_file,
+    send_from_directory,
+    stream_with_context,
 )
+from werkzeug.exceptions import NotFound
 import threading
 import pygame
 import cv2
 import numpy as np
-from gtts import gTTS
 
 # Import app_init (centralized app and db setup)
 from app_init import app, db
@@ -51,7 +54,19 @@ from nonverbal_engine import NonverbalEngine
 from eye_tracking_service import EyeTrackingService
 from sound_recognition_service import SoundRecognitionService
 from learning_analytics import LearningAnalytics
-from behavior_capture import get_behavior_capture
+from behavior_capture import (
+    decode_jpeg,
+    find_behavior_pipeline,
+    get_behavior_capture,
+    get_behavior_result_store,
+    read_frame_stream,
+    stop_behavior_pipeline,
+    submit_behavior_frame,
+)
+from interaction_log import InteractionDBWriter, InteractionLog
+from phrase_audio_cache import AUDIO_DIR, PhrasePrewarmer, get_phrase_cache
+from speech_jobs import SpeechJobService
+from tts_backends import get_backend
 from color_scheme_routes import color_scheme_bp, get_current_scheme as get_scheme_func
 
 # Import alphavox module loader to ensure all modules are loaded
@@ -101,7 +116,10 @@ behavior_capture = None
 
 # Data directory
 os.makedirs("data", exist_ok=True)
-INTERACTIONS_FILE = "data/user_interactions.json"
+INTERACTIONS_FILE = "data/user_interactions.jsonl"
+LEGACY_INTERACTIONS_FILE = "data/user_interactions.json"
+interaction_log = InteractionLog(INTERACTIONS_FILE, legacy_path=LEGACY_INTERACTIONS_FILE)
+interaction_db_writer = InteractionDBWriter(app, db)
 
 
 # Make functions available to templates
@@ -122,6 +140,7 @@ app.jinja_env.globals.update(get_current_scheme=get_current_scheme)
 def init_services():
     global nonverbal_engine, eye_tracking_service, sound_recognition_service, interpreter
     global knowledge_integration, speech_integration, caregiver_dashboard, temporal_engine, behavior_capture
+    global phrase_prewarmer
 
     # Load all alphavox modules if loader is available
     if alphavox_LOADER_AVAILABLE:
@@ -135,6 +154,16 @@ def init_services():
 
     nonverbal_engine = NonverbalEngine()
 
+    # Render the known phrase set in the background so common outputs
+    # never synthesize on the request path (in the cache owner process only)
+    if phrase_prewarmer is None and get_phrase_cache().owner:
+        phrase_prewarmer = PhrasePrewarmer(
+            get_phrase_cache(),
+            collect_prewarm_phrases,
+            render_speech,
+        )
+        phrase_prewarmer.start()
+
     # Initialize real eye tracking service if available, fall back to simulated service
     try:
         from real_eye_tracking import get_real_eye_tracking_service
@@ -398,7 +427,7 @@ def init_services():
         logging.error(traceback.format_exc())
 
 
-# Save user interaction to JSON file and database
+# Save user interaction to the JSON-lines log and (batched) database
 def save_interaction(text, intent, confidence):
     interaction = {
         "text": text,
@@ -406,37 +435,19 @@ def save_interaction(text, intent, confidence):
         "confidence": confidence,
         "timestamp": str(datetime.now()),
     }
+    interaction_log.append(interaction)
 
-    # Create file if it doesn't exist
-    if not os.path.exists(INTERACTIONS_FILE):
-        with open(INTERACTIONS_FILE, "w") as f:
-            json.dump([], f)
-
-    # Read existing interactions
-    with open(INTERACTIONS_FILE, "r") as f:
-        try:
-            interactions = json.load(f)
-        except json.JSONDecodeError:
-            interactions = []
-
-    # Add new interaction and save
-    interactions.append(interaction)
-    with open(INTERACTIONS_FILE, "w") as f:
-        json.dump(interactions, f)
-
-    # Also save to database
+    # Also queue for the database; rows are committed in batches
     try:
-        from models import UserInteraction
-
-        user_id = session.get("user_id")
-        db_interaction = UserInteraction(
-            user_id=user_id, text=text, intent=intent, confidence=confidence
+        interaction_db_writer.submit(
+            user_id=session.get("user_id"),
+            text=text,
+            intent=intent,
+            confidence=confidence,
+            timestamp=datetime.utcnow(),
         )
-        db.session.add(db_interaction)
-        db.session.commit()
-        logging.debug(f"Saved interaction to database: {text}")
     except Exception as e:
-        logging.error(f"Error saving interaction to database: {str(e)}")
+        logging.error(f"Error queueing interaction for database: {str(e)}")
 
 
 # Global cache for speech files
@@ -448,6 +459,43 @@ audio_dir = os.path.join(os.getcwd(), "static", "audio")
 # Create audio directory if it doesn't exist
 os.makedirs(audio_dir, exist_ok=True)
 
+# Default message patterns based on symbol name
+DEFAULT_SYMBOL_MESSAGES = {
+    "food": "I'm hungry. I would like something to eat.",
+    "drink": "I'm thirsty. I would like something to drink.",
+    "bathroom": "I need to use the bathroom.",
+    "medicine": "I need my medicine.",
+    "happy": "I'm feeling happy!",
+    "sad": "I'm feeling sad.",
+    "pain": "I'm in pain or discomfort.",
+    "tired": "I'm feeling tired.",
+    "yes": "Yes.",
+    "no": "No.",
+    "help": "I need help, please.",
+    "question": "I have a question.",
+    "play": "I want to play.",
+    "music": "I want to listen to music.",
+    "book": "I want to read a book.",
+    "outside": "I want to go outside.",
+}
+
+# Map gestures to common phrases (extended)
+BASIC_GESTURE_MESSAGES = {
+    "nod": "Yes, I agree.",
+    "shake": "No, I don't want that.",
+    "point_up": "I need help.",
+    "wave": "Hello there!",
+    "thumbs_up": "That's great!",
+    "thumbs_down": "I don't like that.",
+    "open_palm": "Please stop.",
+    "stimming": "I need to self-regulate, please give me a moment.",
+    "rapid_blink": "I'm feeling overwhelmed.",
+}
+
+# Emotion tiers rendered ahead of time for messages without a mapped emotion
+PREWARM_EMOTION_TIERS = ("moderate",)
+phrase_prewarmer = None
+
 
 # Text-to-speech function with emotion processing
 def text_to_speech(text, emotion=None, emotion_tier=None, voice_id="us_male"):
@@ -462,31 +510,43 @@ def text_to_speech(text, emotion=None, emotion_tier=None, voice_id="us_male"):
     """
     global latest_speech_file
 
+    # Get the user's voice preference if available, otherwise use default male voice
+    if not voice_id or voice_id == "default":
+        try:
+            user_id = session.get("user_id")
+            if user_id:
+                from models import UserProfile
+
+                profile = UserProfile.query.filter_by(user_id=user_id).first()
+                if profile and profile.voice_profile:
+                    voice_id = profile.voice_profile
+
+            # Use male voice as default
+            if not voice_id or voice_id == "default":
+                voice_id = "us_male"
+        except Exception as e:
+            logging.error(f"Error getting voice preference: {str(e)}")
+            voice_id = "us_male"  # Fall back to male voice
+
+    speech_url = render_speech(text, emotion, emotion_tier, voice_id)
+    if speech_url:
+        # Store the filename for client to access
+        latest_speech_file = os.path.basename(speech_url)
+    return speech_url
+
+
+def render_speech(text, emotion=None, emotion_tier=None, voice_id="us_male"):
+    """Render speech through the phrase audio cache and return its URL.
+
+    Does not touch the request session, so the phrase pre-warmer can call it.
+    """
     # Try to use the advanced TTS service first
     try:
-        from attached_assets.advanced_tts_service import (
+        from advanced_tts_service import (
             text_to_speech_with_emotion,
             get_voice_description,
         )
 
-        # Get the user's voice preference if available, otherwise use default male voice
-        user_id = session.get("user_id")
-        if not voice_id or voice_id == "default":
-            try:
-                if user_id:
-                    from models import UserProfile
-
-                    profile = UserProfile.query.filter_by(user_id=user_id).first()
-                    if profile and profile.voice_profile:
-                        voice_id = profile.voice_profile
-
-                # Use male voice as default
-                if not voice_id or voice_id == "default":
-                    voice_id = "us_male"
-            except Exception as e:
-                logging.error(f"Error getting voice preference: {str(e)}")
-                voice_id = "us_male"  # Fall back to male voice
-
         # Log voice information
         voice_info = get_voice_description(voice_id)
         logging.info(f"Using voice: {voice_info.get('label')} ({voice_id})")
@@ -498,7 +558,6 @@ def text_to_speech(text, emotion=None, emotion_tier=None, voice_id="us_male"):
 
         # Extract filename for client access
         filename = os.path.basename(filepath)
-        latest_speech_file = filename
 
         logging.info(f"Generated speech with advanced TTS: {filename}")
         return f"/static/audio/{filename}"
@@ -546,30 +605,95 @@ def text_to_speech(text, emotion=None, emotion_tier=None, voice_id="us_male"):
         # Create a unique filename based on text and emotion
         import hashlib
 
+        backend = get_backend()
         text_hash = hashlib.md5(
             f"{text}_{emotion}_{emotion_tier}_{rate}".encode()
         ).hexdigest()
-        filename = f"{text_hash}.mp3"
-        filepath = os.path.join(audio_dir, filename)
+        filename = f"{text_hash}{backend.extension}"
 
-        # Store the filename for client to access
-        latest_speech_file = filename
+        def render(path):
+            # Adjust speech parameters based on emotion
+            backend.save(text, {"slow": rate < 0.9}, path, rate=rate)
+            logging.info(f"Generated speech file: {filename}")
 
-        # Only generate if file doesn't exist
-        if not os.path.exists(filepath):
-            try:
-                # Adjust speech parameters based on emotion
-                tts = gTTS(text=text, lang="en", slow=(rate < 0.9))
-                tts.save(filepath)
-                logging.info(f"Generated speech file: {filename}")
-            except Exception as e:
-                logging.error(f"Error generating speech: {str(e)}")
-                return
+        # Only generates if the cache does not already hold the file
+        try:
+            get_phrase_cache().get_or_render(filename, render)
+        except Exception as e:
+            logging.error(f"Error generating speech: {str(e)}")
+            return
 
     # Return the URL for the client to play
     return f"/static/audio/{filename}"
 
 
+# Background speech synthesis shared by the interaction routes
+# (job status is shared through data/speech_jobs so any worker can answer)
+speech_jobs = SpeechJobService(
+    render_speech, state_dir=os.path.join("data", "speech_jobs")
+)
+
+# Seconds a route waits for a queued job, so cached audio is returned inline
+SPEECH_INLINE_WAIT = 0.05
+
+
+def queue_speech(text, emotion=None, emotion_tier=None, voice_id="us_male"):
+    """Queue speech synthesis and return the speech fields for a JSON response.
+
+    speech_url is set when the audio is already available (typically a
+    cache hit); otherwise clients poll speech_status_url or listen on
+    speech_events_url until the job is done.
+    """
+    global latest_speech_file
+
+    job = speech_jobs.submit(
+        text, emotion, emotion_tier, voice_id, wait=SPEECH_INLINE_WAIT
+    )
+    if job.speech_url:
+        latest_speech_file = os.path.basename(job.speech_url)
+    return {
+        "speech_url": job.speech_url,
+        "speech_job": job.id,
+        "speech_status": job.status,
+        "speech_status_url": f"/speech/jobs/{job.id}",
+        "speech_events_url": f"/speech/jobs/{job.id}/events",
+    }
+
+
+def collect_prewarm_phrases():
+    """Known AAC outputs as (text, emotion, emotion_tier, voice_id) tuples."""
+    voices = [
+        v.strip()
+        for v in os.environ.get("ALPHAVOX_PREWARM_VOICES", "us_male").split(",")
+        if v.strip()
+    ]
+
+    phrases = []
+    if nonverbal_engine:
+        phrases.extend(nonverbal_engine.speech_phrases())
+
+    # Messages spoken without an engine-assigned emotion
+    plain_messages = list(DEFAULT_SYMBOL_MESSAGES.values())
+    plain_messages.extend(BASIC_GESTURE_MESSAGES.values())
+    try:
+        with open("language_map.json", "r") as f:
+            plain_messages.extend(
+                entry["message"]
+                for entry in json.load(f).values()
+                if entry.get("message")
+            )
+    except (OSError, ValueError) as e:
+        logging.warning(f"Could not read language_map.json for pre-warm: {str(e)}")
+    for tier in PREWARM_EMOTION_TIERS:
+        phrases.extend((message, "neutral", tier) for message in plain_messages)
+
+    return [
+        (text, emotion, tier, voice_id)
+        for voice_id in voices
+        for text, emotion, tier in phrases
+    ]
+
+
 # Routes
 @app.route("/")
 def index():
@@ -670,6 +794,66 @@ def generate_speech_api():
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
+@app.route("/speak/stream", methods=["GET", "POST"])
+def speak_stream():
+    """Stream speech as chunked audio, one sentence at a time, so long
+    responses start playing after the first sentence"""
+    params = request.get_json(silent=True) or request.args
+    text = params.get("text", "")
+    if not text:
+        return jsonify({"status": "error", "message": "No text provided"}), 400
+
+    from advanced_tts_service import stream_speech
+
+    chunks, mimetype = stream_speech(
+        text,
+        voice_id=params.get("voice_id", "us_male"),
+        emotion=params.get("emotion"),
+        emotion_tier=params.get("emotion_tier"),
+    )
+    return Response(stream_with_context(chunks), mimetype=mimetype)
+
+
+@app.route("/speech/jobs/<job_id>", methods=["GET"])
+def speech_job_status(job_id):
+    """Poll the status of a queued speech synthesis job"""
+    job = speech_jobs.get(job_id)
+    if not job:
+        return jsonify({"status": "error", "message": "Unknown speech job"}), 404
+    return jsonify(job.to_dict())
+
+
+@app.route("/speech/jobs/<job_id>/events", methods=["GET"])
+def speech_job_events(job_id):
+    """Server-sent events stream that fires once the speech job finishes"""
+    job = speech_jobs.get(job_id)
+    if not job:
+        return jsonify({"status": "error", "message": "Unknown speech job"}), 404
+
+    def generate():
+        # Comment lines keep the connection alive while the job runs
+        while not job.wait(15):
+            yield ": waiting\n\n"
+        yield f"event: {job.status}\ndata: {json.dumps(job.to_dict())}\n\n"
+
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.route("/static/audio/<path:filename>")
+def cached_audio(filename):
+    """Serve rendered speech, forgetting files another worker evicted"""
+    try:
+        return send_from_directory(AUDIO_DIR, filename)
+    except NotFound:
+        # The next request for this phrase renders it again
+        get_phrase_cache().forget(os.path.basename(filename))
+        raise
+
+
 # API routes for hardware testing
 @app.route("/api/audio/devices", methods=["GET"])
 def get_audio_devices():
@@ -701,7 +885,16 @@ def speak_text():
         file_path = os.path.join("static", "audio", filename)
 
         # Return the audio file directly
-        return send_file(file_path, mimetype="audio/mpeg")
+        try:
+            return send_file(file_path, mimetype="audio/mpeg")
+        except FileNotFoundError:
+            # Evicted by another worker since it was cached; render it again
+            get_phrase_cache().forget(filename)
+            speech_url = text_to_speech(
+                text=text, emotion=emotion, emotion_tier=emotion_tier, voice_id=voice_id
+            )
+            file_path = os.path.join("static", "audio", os.path.basename(speech_url))
+            return send_file(file_path, mimetype="audio/mpeg")
     except Exception as e:
         app.logger.error(f"Error in speak_text: {str(e)}")
         return "Error generating speech", 500
@@ -902,16 +1095,15 @@ def process_input():
     # Save the interaction
     save_interaction(input_text, response["intent"], response["confidence"])
 
-    # Generate speech file and get URL
-    speech_url = text_to_speech(
-        response["message"],
-        emotion=response["expression"],
-        emotion_tier=response["emotion_tier"],
+    # Queue speech synthesis; the audio URL follows via the job endpoints
+    response.update(
+        queue_speech(
+            response["message"],
+            emotion=response["expression"],
+            emotion_tier=response["emotion_tier"],
+        )
     )
 
-    # Add speech URL to the response
-    response["speech_url"] = speech_url
-
     return jsonify(response)
 
 
@@ -1073,11 +1265,16 @@ def speak(gesture):
     # Save the interaction
     save_interaction(f"gesture:{gesture}", intent, confidence)
 
-    # Generate speech file and get URL
-    speech_url = text_to_speech(message, emotion=expression, emotion_tier=emotion_tier)
+    # Queue speech synthesis
+    speech = queue_speech(message, emotion=expression, emotion_tier=emotion_tier)
 
     # Check if this is a GET request (direct browser access)
     if request.method == "GET":
+        # The page embeds the audio, so wait for the shared job to finish
+        job = speech_jobs.get(speech["speech_job"])
+        if job:
+            job.wait(30)
+        speech_url = job.speech_url if job else None
         # Return HTML with embedded audio player
         return f"""
         <!DOCTYPE html>
@@ -1116,29 +1313,20 @@ def speak(gesture):
                 "confidence": confidence,
                 "expression": expression,
                 "emotion_tier": emotion_tier,
-                "speech_url": speech_url,
                 "advanced_ai": advanced_ai,
-                "html_audio": f'<audio controls autoplay src="{speech_url}"></audio>',
+                "html_audio": (
+                    f'<audio controls autoplay src="{speech["speech_url"]}"></audio>'
+                    if speech["speech_url"]
+                    else None
+                ),
+                **speech,
             }
         )
 
 
 def process_gesture_basic(gesture):
     """Basic gesture processing fallback"""
-    # Map gestures to common phrases (extended)
-    gesture_map = {
-        "nod": "Yes, I agree.",
-        "shake": "No, I don't want that.",
-        "point_up": "I need help.",
-        "wave": "Hello there!",
-        "thumbs_up": "That's great!",
-        "thumbs_down": "I don't like that.",
-        "open_palm": "Please stop.",
-        "stimming": "I need to self-regulate, please give me a moment.",
-        "rapid_blink": "I'm feeling overwhelmed.",
-    }
-
-    message = gesture_map.get(gesture, "I'm trying to communicate.")
+    message = BASIC_GESTURE_MESSAGES.get(gesture, "I'm trying to communicate.")
 
     # Use nonverbal engine to analyze the gesture with emotion
     if nonverbal_engine:
@@ -1222,6 +1410,9 @@ def stop_behavior_capture():
         )
 
     behavior_capture.stop_tracking()
+    key = behavior_session_key()
+    if key:
+        stop_behavior_pipeline(key)
 
     return jsonify(
         {"status": "success", "tracking": False, "message": "Behavior capture stopped"}
@@ -1243,6 +1434,18 @@ def get_behavior_status():
     return jsonify({"status": "success", "tracking_status": status})
 
 
+def behavior_session_key(create=False):
+    """Get the key binding this browser session to its behavior pipeline
+
+    The key is a random token kept in the signed session cookie, so only the
+    session that posted frames can read their results or annotated frames.
+    """
+    key = session.get("behavior_key")
+    if key is None and create:
+        key = session["behavior_key"] = secrets.token_urlsafe(16)
+    return key
+
+
 @app.route("/api/behavior/process", methods=["POST"])
 def process_behavior_frame():
     """Process a frame for behavior analysis"""
@@ -1269,23 +1472,35 @@ def process_behavior_frame():
         nparr = np.frombuffer(frame_data, np.uint8)
         frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
 
-        # Process the frame
-        results = behavior_capture.process_frame(frame)
-
-        # Encode the annotated frame
-        _, buffer = cv2.imencode(".jpg", results["frame"])
-        annotated_frame_b64 = base64.b64encode(buffer).decode("utf-8")
+        if data.get("pipeline"):
+            # Latest-frame-wins: queue the frame and answer with the newest
+            # finished result instead of waiting for this frame's analysis
+            key = behavior_session_key(create=True)
+            pipeline = submit_behavior_frame(key, frame_data, frame)
+            results = pipeline.latest_result if pipeline else None
+            if results is None:
+                # The session runs in another worker; only its shared
+                # compact result is available here
+                record = get_behavior_result_store().latest(key)
+                if record is None:
+                    return jsonify({"status": "pending", "tracking": True})
+                return jsonify({"status": "success", **record["result"]})
+        else:
+            results = behavior_capture.process_frame(frame)
 
         # Prepare and return results
-        response = {
-            "status": "success",
-            "tracking": results["tracking"],
-            "annotated_frame": annotated_frame_b64,
-        }
+        response = {"status": "success", "tracking": results["tracking"]}
+
+        # Encode the annotated frame unless the client opted out
+        if data.get("annotate", True):
+            _, buffer = cv2.imencode(".jpg", results["frame"])
+            response["annotated_frame"] = base64.b64encode(buffer).decode("utf-8")
 
         # Add analysis results if available
         if "results" in results:
             response["results"] = results["results"]
+        if "sequence" in results:
+            response["sequence"] = results["sequence"]
 
         return jsonify(response)
     except Exception as e:
@@ -1294,6 +1509,148 @@ def process_behavior_frame():
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
+@app.route("/api/behavior/stats", methods=["GET"])
+def get_behavior_stats():
+    """Get behavior pipeline throughput and per-stage timings"""
+    global behavior_capture
+
+    if not behavior_capture:
+        return jsonify(
+            {"status": "error", "message": "Behavior capture not initialized"}
+        )
+
+    key = behavior_session_key()
+    pipeline = find_behavior_pipeline(key) if key else None
+    if pipeline is None:
+        return jsonify({"status": "error", "message": "No behavior pipeline"}), 404
+
+    return jsonify({"status": "success", "stats": pipeline.get_stats()})
+
+
+@app.route("/api/behavior/frame", methods=["POST"])
+def ingest_behavior_frame():
+    """Submit one raw JPEG frame (request body) to the behavior pipeline
+
+    Returns the latest finished analysis without the frame. Pass ?wait=1 to
+    wait for a result newer than the one current when the frame arrived. The annotated frame is not included;
+    clients that want it fetch /api/behavior/annotated.jpg.
+    """
+    global behavior_capture
+
+    if not behavior_capture:
+        return jsonify(
+            {"status": "error", "message": "Behavior capture not initialized"}
+        )
+
+    data = request.get_data(cache=False)
+    try:
+        frame = decode_jpeg(data)
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    # The session's pipeline may run in another worker process, so the
+    # result is read back from the shared store
+    key = behavior_session_key(create=True)
+    store = get_behavior_result_store()
+    previous = store.latest(key)
+    submit_behavior_frame(key, data, frame)
+
+    if request.args.get("wait", type=int):
+        after = previous["version"] if previous else 0
+        record = store.wait_for_result(key, after, timeout=5)
+    else:
+        record = store.latest(key)
+    if record is None:
+        return jsonify({"status": "pending", "tracking": True})
+
+    return jsonify({"status": "success", **record["result"]})
+
+
+@app.route("/api/behavior/stream", methods=["POST"])
+def ingest_behavior_stream():
+    """Submit a chunked upload of length-prefixed JPEG frames
+
+    Each frame is a 4-byte big-endian length followed by the JPEG bytes.
+    Frames go to the behavior pipeline as they arrive; results are read from
+    /api/behavior/events while the upload runs.
+    """
+    global behavior_capture
+
+    if not behavior_capture:
+        return jsonify(
+            {"status": "error", "message": "Behavior capture not initialized"}
+        )
+
+    key = behavior_session_key(create=True)
+    received = 0
+    try:
+        for data in read_frame_stream(request.stream):
+            submit_behavior_frame(key, data, decode_jpeg(data))
+            received += 1
+    except ValueError as e:
+        return (
+            jsonify({"status": "error", "message": str(e), "frames": received}),
+            400,
+        )
+
+    return jsonify({"status": "success", "frames": received})
+
+
+@app.route("/api/behavior/events", methods=["GET"])
+def behavior_events():
+    """Server-sent events stream of this session's compact behavior results
+
+    Results are read from the shared result store, so the stream works
+    whichever worker process receives the frames. Slow readers skip to the
+    newest result rather than falling behind.
+    """
+    key = behavior_session_key()
+    if key is None:
+        return jsonify({"status": "error", "message": "No behavior session"}), 401
+    store = get_behavior_result_store()
+    after = request.headers.get("Last-Event-ID") or request.args.get("after", 0)
+    try:
+        after = int(after)
+    except ValueError:
+        after = 0
+
+    def generate():
+        version = after
+        while True:
+            record = store.wait_for_result(key, version, timeout=15)
+            if record is None:
+                # Comment lines keep the connection alive between results
+                yield ": waiting\n\n"
+                continue
+            version = record["version"]
+            yield f"id: {version}\ndata: {json.dumps(record['result'])}\n\n"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.route("/api/behavior/annotated.jpg", methods=["GET"])
+def behavior_annotated_frame():
+    """This session's latest annotated frame, re-encoded at most once a second"""
+    key = behavior_session_key()
+    if key is None:
+        return jsonify({"status": "error", "message": "No behavior session"}), 401
+
+    annotated = get_behavior_result_store().annotated_jpeg(key)
+    if annotated is None:
+        return jsonify({"status": "error", "message": "No annotated frame yet"}), 404
+
+    sequence, jpeg = annotated
+    return Response(
+        jpeg,
+        mimetype="image/jpeg",
+        headers={"Cache-Control": "no-store", "X-Frame-Sequence": str(sequence)},
+    )
+
+
 @app.route("/api/behavior/observations", methods=["GET"])
 def get_behavior_observations():
     """Get recorded behavior observations"""
@@ -1346,29 +1703,9 @@ def process_symbol(symbol_name):
         # Process through AlphaVox NLU
         result = processor.process_interaction(interaction, user_id)
 
-        # Default message patterns based on symbol name
-        default_messages = {
-            "food": "I'm hungry. I would like something to eat.",
-            "drink": "I'm thirsty. I would like something to drink.",
-            "bathroom": "I need to use the bathroom.",
-            "medicine": "I need my medicine.",
-            "happy": "I'm feeling happy!",
-            "sad": "I'm feeling sad.",
-            "pain": "I'm in pain or discomfort.",
-            "tired": "I'm feeling tired.",
-            "yes": "Yes.",
-            "no": "No.",
-            "help": "I need help, please.",
-            "question": "I have a question.",
-            "play": "I want to play.",
-            "music": "I want to listen to music.",
-            "book": "I want to read a book.",
-            "outside": "I want to go outside.",
-        }
-
         # Override the message with our default message for known symbols
-        if symbol_name in default_messages:
-            message = default_messages[
+        if symbol_name in DEFAULT_SYMBOL_MESSAGES:
+            message = DEFAULT_SYMBOL_MESSAGES[
                 symbol_name
             ]  # Prioritize defaults over AI-generated
         else:
@@ -1404,8 +1741,8 @@ def process_symbol(symbol_name):
     # Save the interaction
     save_interaction(f"symbol:{symbol_name}", intent, confidence)
 
-    # Generate speech file and get URL
-    speech_url = text_to_speech(message, emotion=expression, emotion_tier=emotion_tier)
+    # Queue speech synthesis; the audio URL follows via the job endpoints
+    speech = queue_speech(message, emotion=expression, emotion_tier=emotion_tier)
 
     return jsonify(
         {
@@ -1416,39 +1753,19 @@ def process_symbol(symbol_name):
             "expression": expression,
             "emotion_tier": emotion_tier,
             "symbol": symbol_name,
-            "speech_url": speech_url,
             "advanced_ai": advanced_ai,
             "root_cause": (
                 result.get("root_cause", "unknown")
                 if "result" in locals()
                 else "unknown"
             ),
+            **speech,
         }
     )
 
 
 def process_symbol_basic(symbol_name):
     """Basic symbol processing fallback"""
-    # Default symbol messages
-    symbol_messages = {
-        "food": "I'm hungry. I would like something to eat.",
-        "drink": "I'm thirsty. I would like something to drink.",
-        "bathroom": "I need to use the bathroom.",
-        "medicine": "I need my medicine.",
-        "happy": "I'm feeling happy!",
-        "sad": "I'm feeling sad.",
-        "pain": "I'm in pain or discomfort.",
-        "tired": "I'm feeling tired.",
-        "yes": "Yes.",
-        "no": "No.",
-        "help": "I need help, please.",
-        "question": "I have a question.",
-        "play": "I want to play.",
-        "music": "I want to listen to music.",
-        "book": "I want to read a book.",
-        "outside": "I want to go outside.",
-    }
-
     # If engine has symbol mapping, use it
     if (
         nonverbal_engine
@@ -1459,7 +1776,7 @@ def process_symbol_basic(symbol_name):
         intent = result.get("intent", "communicate")
         confidence = result.get("confidence", 0.7)
 
-        message = symbol_messages.get(
+        message = DEFAULT_SYMBOL_MESSAGES.get(
             symbol_name, f"I'm communicating using the {symbol_name} symbol."
         )
 
@@ -2353,9 +2670,12 @@ with app.app_context():
         CaregiverNote,
         CommunicationProfile,
         SystemSuggestion,
+        InteractionRollup,
     )
 
     db.create_all()
+    # Rollups for interactions saved before they existed are built by
+    # scripts/db_migrate.py, not here in every worker
 
 # Import AI learning and self-modification modules
 from ai_learning_engine import get_self_improvement_engine
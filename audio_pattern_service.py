@@ -18,10 +18,100 @@ import logging
 from datetime import datetime
 
 import numpy as np
-import sounddevice as sd
+from numpy.lib.stride_tricks import sliding_window_view
 
 logger = logging.getLogger(__name__)
 
+# Windowed analysis parameters
+WINDOW_SIZE = 2048  # Samples per analysis window (~46 ms at 44.1 kHz)
+HOP_SIZE = 1024  # Samples between window starts
+ACTIVITY_THRESHOLD = 0.02  # Mean absolute amplitude of a sounding window
+PITCH_RANGE = (60.0, 2000.0)  # Hz searched for the dominant frequency
+ENERGY_BANDS = {"low": (0, 300), "mid": (300, 1000), "high": (1000, 4000)}
+EVENT_GAP = 0.15  # Seconds of silence that end a sound event
+MAX_EVENT_DURATION = 3.0  # Seconds before an ongoing event is reported
+
+# Pattern score weights and tolerances
+FEATURE_WEIGHTS = {"frequency": 0.4, "duration": 0.3, "intensity": 0.3}
+DURATION_TOLERANCE = 0.2  # Seconds off the pattern duration scoring 0.5
+INTENSITY_TOLERANCE = 0.2  # Intensity off the pattern intensity scoring 0.5
+
+
+def window_features(audio_array, sample_rate):
+    """
+    Spectral features of every analysis window of a clip
+
+    Args:
+        audio_array: Mono float samples
+        sample_rate: Samples per second
+
+    Returns:
+        dict: Per-window "intensity", "pitch" (Hz, FFT peak with parabolic
+        interpolation) and "bands" (windows x bands energy fractions)
+    """
+    audio_array = np.asarray(audio_array, dtype=np.float32)
+    if len(audio_array) < WINDOW_SIZE:
+        audio_array = np.pad(audio_array, (0, WINDOW_SIZE - len(audio_array)))
+    windows = sliding_window_view(audio_array, WINDOW_SIZE)[::HOP_SIZE]
+
+    intensity = np.abs(windows).mean(axis=1)
+    spectrum = np.abs(np.fft.rfft(windows * np.hanning(WINDOW_SIZE), axis=1))
+    freqs = np.fft.rfftfreq(WINDOW_SIZE, d=1.0 / sample_rate)
+    power = spectrum**2
+
+    # Dominant frequency within the pitch range, refined between bins
+    in_range = np.flatnonzero((freqs >= PITCH_RANGE[0]) & (freqs <= PITCH_RANGE[1]))
+    peak = in_range[0] + spectrum[:, in_range].argmax(axis=1)
+    left = spectrum[np.arange(len(peak)), np.maximum(peak - 1, 0)]
+    center = spectrum[np.arange(len(peak)), peak]
+    right = spectrum[np.arange(len(peak)), np.minimum(peak + 1, len(freqs) - 1)]
+    denominator = left - 2 * center + right
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shift = np.where(denominator != 0, 0.5 * (left - right) / denominator, 0.0)
+    pitch = (peak + np.clip(shift, -0.5, 0.5)) * (freqs[1] - freqs[0])
+
+    total = power.sum(axis=1)
+    total[total == 0] = 1.0
+    bands = np.stack(
+        [
+            power[:, (freqs >= low) & (freqs < high)].sum(axis=1) / total
+            for low, high in ENERGY_BANDS.values()
+        ],
+        axis=1,
+    )
+    return {"intensity": intensity, "pitch": pitch, "bands": bands}
+
+
+def summarize_windows(features, sample_rate, active=None):
+    """
+    Reduce the windows of one sound to the features patterns are scored on
+
+    Args:
+        features: Output of window_features (or a slice of it)
+        sample_rate: Samples per second
+        active: Boolean mask of sounding windows (default: by intensity)
+
+    Returns:
+        dict: "frequency", "duration", "intensity" and "bands"
+    """
+    if active is None:
+        active = features["intensity"] > ACTIVITY_THRESHOLD
+    if not active.any():
+        return {
+            "frequency": 0.0,
+            "duration": 0.0,
+            "intensity": float(features["intensity"].mean()),
+            "bands": dict.fromkeys(ENERGY_BANDS, 0.0),
+        }
+    return {
+        "frequency": float(np.median(features["pitch"][active])),
+        "duration": float(active.sum() * HOP_SIZE / sample_rate),
+        "intensity": float(features["intensity"][active].mean()),
+        "bands": dict(
+            zip(ENERGY_BANDS, features["bands"][active].mean(axis=0).tolist())
+        ),
+    }
+
 
 class AudioPatternService:
     """Service for analyzing and interpreting non-verbal sounds."""
@@ -49,73 +139,110 @@ class AudioPatternService:
     def analyze_sound(self, audio_data):
         """Analyze incoming audio data for pattern matching."""
         try:
-            # Convert audio data to numpy array for processing
-            audio_array = np.frombuffer(audio_data, dtype=np.float32)
+            return self.classify_clips([audio_data])[0]
+        except Exception as e:
+            logger.error(f"Error analyzing audio pattern: {str(e)}", exc_info=True)
+            return [{"pattern": "error", "confidence": 0.0}]
 
-            # Calculate audio features
-            intensity = np.mean(np.abs(audio_array))
-            frequency = self._estimate_frequency(audio_array)
-            duration = len(audio_array) / self.sample_rate
+    def classify_clips(self, clips, return_features=False):
+        """
+        Classify many recorded clips in one call
 
-            # Match against known patterns
-            matches = []
-            for pattern_name, pattern in self.sound_patterns.items():
-                match_score = self._calculate_pattern_match(
-                    frequency, duration, intensity, pattern
-                )
-                if match_score > self.pattern_threshold:
-                    matches.append(
-                        {
-                            "pattern": pattern_name,
-                            "confidence": match_score,
-                            "timestamp": datetime.utcnow(),
-                        }
-                    )
+        Each clip is summarized from its windowed features, then all clips
+        are scored against all patterns as one matrix.
 
-            return matches if matches else [{"pattern": "unknown", "confidence": 0.0}]
+        Args:
+            clips: Raw float32 audio buffers (bytes or numpy arrays)
+            return_features: Also return each clip's summarized features
 
-        except Exception as e:
-            logger.error(f"Error analyzing audio pattern: {str(e)}", exc_info=True)
-            return [{"pattern": "error", "confidence": 0.0}]
+        Returns:
+            list: Matches per clip, or (matches, features) lists
+        """
+        features = [self._clip_features(clip) for clip in clips]
+        matches = self._matches(self.score_features(features))
+        if return_features:
+            return matches, features
+        return matches
 
-    def _estimate_frequency(self, audio_array):
-        """Estimate the fundamental frequency of the audio signal."""
-        try:
-            # Simple zero-crossing rate for frequency estimation
-            zero_crossings = np.where(np.diff(np.signbit(audio_array)))[0]
-            if len(zero_crossings) > 1:
-                return len(zero_crossings) * self.sample_rate / (2 * len(audio_array))
-            return 0
-        except Exception as e:
-            logger.error(f"Error estimating frequency: {str(e)}")
-            return 0
+    def score_features(self, features):
+        """
+        Score summarized sounds against every pattern
 
-    def _calculate_pattern_match(self, freq, duration, intensity, pattern):
-        """Calculate how well the current audio matches a known pattern."""
-        try:
-            freq_match = (
-                1.0
-                if pattern["freq_range"][0] <= freq <= pattern["freq_range"][1]
-                else 0.0
-            )
-            duration_match = 1.0 if abs(duration - pattern["duration"]) < 0.2 else 0.0
-            intensity_match = (
-                1.0 if abs(intensity - pattern["intensity"]) < 0.2 else 0.0
-            )
+        Args:
+            features: Dicts with "frequency", "duration" and "intensity"
 
-            # Weight the different components
-            return freq_match * 0.4 + duration_match * 0.3 + intensity_match * 0.3
-        except Exception as e:
-            logger.error(f"Error calculating pattern match: {str(e)}")
-            return 0.0
+        Returns:
+            numpy.ndarray: Scores shaped (sounds, patterns), in the order of
+            sound_patterns
+        """
+        patterns = list(self.sound_patterns.values())
+        low = np.array([p["freq_range"][0] for p in patterns], dtype=float)
+        high = np.array([p["freq_range"][1] for p in patterns], dtype=float)
+        durations = np.array([p["duration"] for p in patterns], dtype=float)
+        intensities = np.array([p["intensity"] for p in patterns], dtype=float)
+
+        frequency = np.array([f["frequency"] for f in features], dtype=float)[:, None]
+        duration = np.array([f["duration"] for f in features], dtype=float)[:, None]
+        intensity = np.array([f["intensity"] for f in features], dtype=float)[:, None]
+
+        # Full marks inside the frequency range, fading out over one range
+        # width outside it; duration and intensity fade linearly with error
+        distance = np.maximum(low - frequency, 0) + np.maximum(frequency - high, 0)
+        freq_match = np.clip(1.0 - distance / np.maximum(high - low, 1.0), 0.0, 1.0)
+        freq_match[frequency[:, 0] <= 0] = 0.0
+        duration_match = np.clip(
+            1.0 - np.abs(duration - durations) / (2 * DURATION_TOLERANCE), 0.0, 1.0
+        )
+        intensity_match = np.clip(
+            1.0 - np.abs(intensity - intensities) / (2 * INTENSITY_TOLERANCE),
+            0.0,
+            1.0,
+        )
+
+        return (
+            freq_match * FEATURE_WEIGHTS["frequency"]
+            + duration_match * FEATURE_WEIGHTS["duration"]
+            + intensity_match * FEATURE_WEIGHTS["intensity"]
+        )
+
+    def create_stream_analyzer(self):
+        """Create a streaming analyzer that reports sound events as they end"""
+        return StreamingSoundAnalyzer(self)
+
+    def _clip_features(self, audio_data):
+        if isinstance(audio_data, (bytes, bytearray, memoryview)):
+            audio_array = np.frombuffer(audio_data, dtype=np.float32)
+        else:
+            audio_array = np.asarray(audio_data, dtype=np.float32).reshape(-1)
+        return summarize_windows(
+            window_features(audio_array, self.sample_rate), self.sample_rate
+        )
+
+    def _matches(self, scores):
+        names = list(self.sound_patterns)
+        timestamp = datetime.utcnow()
+        results = []
+        for row in scores:
+            matches = [
+                {
+                    "pattern": names[column],
+                    "confidence": float(row[column]),
+                    "timestamp": timestamp,
+                }
+                for column in np.flatnonzero(row > self.pattern_threshold)
+            ]
+            results.append(
+                matches if matches else [{"pattern": "unknown", "confidence": 0.0}]
+            )
+        return results
 
     def update_pattern(self, pattern_name, audio_data):
         """Update existing patterns based on new audio data."""
         try:
-            audio_array = np.frombuffer(audio_data, dtype=np.float32)
-            frequency = self._estimate_frequency(audio_array)
-            intensity = np.mean(np.abs(audio_array))
-            duration = len(audio_array) / self.sample_rate
+            features = self._clip_features(audio_data)
+            frequency = features["frequency"]
+            intensity = features["intensity"]
+            duration = features["duration"]
 
             # Update pattern if it exists
             if pattern_name in self.sound_patterns:
@@ -133,3 +260,99 @@ class AudioPatternService:
         except Exception as e:
             logger.error(f"Error updating pattern: {str(e)}")
             return False
+
+
+class StreamingSoundAnalyzer:
+    """
+    Incremental sound event detection over a continuous audio stream.
+
+    Samples are analyzed window by window as they arrive; only the tail
+    shorter than a window is carried over between calls. Consecutive
+    sounding windows form an event, which is scored against all patterns
+    once it is followed by EVENT_GAP of silence or reaches
+    MAX_EVENT_DURATION.
+    """
+
+    def __init__(self, service):
+        self.service = service
+        self.sample_rate = service.sample_rate
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._gap_windows = max(1, round(EVENT_GAP * self.sample_rate / HOP_SIZE))
+        self._max_windows = round(MAX_EVENT_DURATION * self.sample_rate / HOP_SIZE)
+        self._event = []  # Feature slices of the current event
+        self._event_windows = 0
+        self._silent_windows = 0
+
+    def push(self, audio_data):
+        """
+        Feed samples from the stream
+
+        Args:
+            audio_data: Raw float32 audio (bytes or numpy array)
+
+        Returns:
+            list: Completed events, each with "features" and "matches"
+        """
+        if isinstance(audio_data, (bytes, bytearray, memoryview)):
+            samples = np.frombuffer(audio_data, dtype=np.float32)
+        else:
+            samples = np.asarray(audio_data, dtype=np.float32).reshape(-1)
+        self._pending = np.concatenate([self._pending, samples])
+        if len(self._pending) < WINDOW_SIZE:
+            return []
+
+        window_count = (len(self._pending) - WINDOW_SIZE) // HOP_SIZE + 1
+        features = window_features(
+            self._pending[: (window_count - 1) * HOP_SIZE + WINDOW_SIZE],
+            self.sample_rate,
+        )
+        self._pending = self._pending[window_count * HOP_SIZE :]
+
+        events = []
+        active = features["intensity"] > ACTIVITY_THRESHOLD
+        start = None  # First window of the current run within this batch
+        for index, sounding in enumerate(active):
+            if sounding:
+                self._silent_windows = 0
+                if start is None:
+                    start = index
+                self._event_windows += 1
+                if self._event_windows >= self._max_windows:
+                    self._event.append(self._slice(features, start, index + 1))
+                    events.append(self._finish_event())
+                    start = None
+            else:
+                if start is not None:
+                    self._event.append(self._slice(features, start, index))
+                    start = None
+                if self._event_windows:
+                    self._silent_windows += 1
+                    if self._silent_windows >= self._gap_windows:
+                        events.append(self._finish_event())
+        if start is not None:
+            self._event.append(self._slice(features, start, len(active)))
+
+        if not events:
+            return []
+        scores = self.service.score_features([event["features"] for event in events])
+        for event, matches in zip(events, self.service._matches(scores)):
+            event["matches"] = matches
+        return events
+
+    @staticmethod
+    def _slice(features, start, stop):
+        return {name: values[start:stop] for name, values in features.items()}
+
+    def _finish_event(self):
+        merged = {
+            name: np.concatenate([part[name] for part in self._event])
+            for name in ("intensity", "pitch", "bands")
+        }
+        self._event = []
+        self._event_windows = 0
+        self._silent_windows = 0
+        return {
+            "features": summarize_windows(
+                merged, self.sample_rate, np.ones(len(merged["intensity"]), bool)
+            )
+        }
@@ -0,0 +1,170 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Preallocated audio ring buffer and vectorized frame features.
+
+AudioRingBuffer stores the most recent samples of a mono stream in a
+fixed numpy array written twice (at i and i + capacity), so appending
+and trimming are O(1) per sample and any run of retained samples can be
+returned as a contiguous, zero-copy view. frame_features computes
+per-frame energy, zero-crossing rate and voice activity for a whole
+buffer in a few numpy passes.
+"""
+
+import logging
+from typing import Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class AudioRingBuffer:
+    """
+    Fixed-capacity buffer of the latest audio samples.
+
+    Positions are absolute sample counts since creation (or the last
+    clear), so a caller can remember where an utterance started and take
+    a view from there later. Views share memory with the buffer and are
+    only valid until capacity more samples have been appended; copy them
+    to keep them longer.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float32):
+        """
+        Args:
+            capacity: Number of samples retained
+            dtype: Sample type
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._data = np.zeros(2 * capacity, dtype=dtype)
+        self.clear()
+
+    def clear(self):
+        """Drop all retained samples"""
+        self._head = 0  # Next write index in [0, capacity)
+        self._size = 0
+        self.position = 0  # Samples appended so far
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def start_position(self) -> int:
+        """Absolute position of the oldest retained sample"""
+        return self.position - self._size
+
+    def append(self, samples: np.ndarray):
+        """
+        Append samples, overwriting the oldest ones once full
+
+        Args:
+            samples: Audio samples (any shape; flattened)
+        """
+        samples = np.asarray(samples).reshape(-1)
+        count = len(samples)
+        if count == 0:
+            return
+        self.position += count
+        if count >= self.capacity:
+            samples = samples[-self.capacity :]
+            count = self.capacity
+
+        # Write each sample at i and i + capacity so the last `capacity`
+        # samples are always contiguous in one of the two halves
+        first = min(count, self.capacity - self._head)
+        for offset in (self._head, self._head + self.capacity):
+            self._data[offset : offset + first] = samples[:first]
+        if first < count:
+            rest = count - first
+            self._data[:rest] = samples[first:]
+            self._data[self.capacity : self.capacity + rest] = samples[first:]
+
+        self._head = (self._head + count) % self.capacity
+        self._size = min(self._size + count, self.capacity)
+
+    def latest(self, count: Optional[int] = None) -> np.ndarray:
+        """
+        Zero-copy view of the most recent samples, oldest first
+
+        Args:
+            count: Number of samples (default: all retained)
+        """
+        if count is None or count > self._size:
+            count = self._size
+        end = self._head + self.capacity
+        view = self._data[end - count : end]
+        view.flags.writeable = False
+        return view
+
+    def since(self, position: int) -> np.ndarray:
+        """
+        Zero-copy view of the samples appended since an absolute position
+
+        Samples older than the buffer retains are silently omitted.
+        """
+        return self.latest(max(0, self.position - position))
+
+
+def frame_features(
+    audio: np.ndarray, frame_size: int, threshold: float = 0.0
+) -> Dict[str, np.ndarray]:
+    """
+    Per-frame features of a mono signal
+
+    Trailing samples that do not fill a frame are ignored.
+
+    Args:
+        audio: Audio samples
+        frame_size: Samples per frame
+        threshold: Mean absolute amplitude above which a frame is voiced
+
+    Returns:
+        dict: "energy" (mean absolute amplitude), "zcr" (zero crossings per
+        sample) and "voiced" (bool) arrays, one entry per frame
+    """
+    frame_count = len(audio) // frame_size
+    frames = np.asarray(audio)[: frame_count * frame_size].reshape(
+        frame_count, frame_size
+    )
+    energy = np.abs(frames).mean(axis=1)
+    crossings = np.count_nonzero(frames[:, :-1] * frames[:, 1:] < 0, axis=1)
+    return {
+        "energy": energy,
+        "zcr": crossings / frame_size,
+        "voiced": energy > threshold,
+    }
+
+
+def zero_crossing_rate(audio: np.ndarray) -> float:
+    """Fraction of adjacent sample pairs whose product is negative"""
+    audio = np.asarray(audio)
+    if len(audio) < 2:
+        return 0.0
+    return float(np.count_nonzero(audio[:-1] * audio[1:] < 0) / len(audio))
+
+
+# ==============================================================================
+# © 2025 Everett Nathaniel Christman & Misty Gail Christman
+# The Christman AI Project — Luma Cognify AI
+# All rights reserved. Unauthorized use, replication, or derivative training 
+# of this material is prohibited.
+# Core Directive: "How can I help you love yourself more?" 
+# Autonomy & Alignment Protocol v3.0
+# ==============================================================================
@@ -38,8 +38,19 @@ import logging
 import json
 import threading
 import base64
+import re
+import struct
+import tempfile
 from datetime import datetime
-from collections import deque
+from collections import OrderedDict, deque
+
+try:
+    import fcntl
+except ImportError:  # Windows - a single process owns every session
+    fcntl = None
+
+from face_tracker import FaceTracker
+from periodicity import PeriodicityDetector
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -50,12 +61,135 @@ MOVEMENT_THRESHOLD = 0.02  # Movement detection threshold (proportion of frame)
 MOVEMENT_HISTORY_LENGTH = 120  # 4 seconds at 30fps
 MICRO_EXPRESSION_SENSITIVITY = 0.15  # Sensitivity for micro-expression detection
 REPETITIVE_PATTERN_LENGTH = 60  # Frame length for repetitive pattern detection
+REPETITIVE_PATTERN_HOP = 10  # Frames between periodicity analyses
+MOVEMENT_SIGNALS = ("movement", "head", "body")  # Whole frame, face box, rest
+
+# Constants for frame transport
+MAX_FRAME_BYTES = 5 * 1024 * 1024  # Largest accepted encoded frame
+ANNOTATED_FRAME_INTERVAL = 1.0  # Minimum seconds between annotated frame encodes
+
+# Constants for per-session pipelines
+MAX_BEHAVIOR_SESSIONS = 32  # Pipelines kept per process before evicting the oldest
+BEHAVIOR_SESSION_IDLE_TIMEOUT = 300  # Seconds without frames before a pipeline stops
+RESULT_POLL_INTERVAL = 0.05  # Seconds between checks for a newer shared result
+FRAME_RELAY_INTERVAL = 0.02  # Seconds between checks for frames from other workers
+SESSION_KEY_PATTERN = re.compile(r"[A-Za-z0-9_-]{8,64}")
+
+# Latest results are shared between worker processes through this directory
+BEHAVIOR_RESULTS_DIR = os.environ.get(
+    "BEHAVIOR_RESULTS_DIR", os.path.join(tempfile.gettempdir(), "alphavox_behavior")
+)
 
 # Directories for data storage
 DATA_DIR = os.path.join("data", "behavior_patterns")
 os.makedirs(DATA_DIR, exist_ok=True)
 
 
+def decode_jpeg(data):
+    """
+    Decode an encoded image (JPEG or PNG) into a BGR frame
+
+    Raises:
+        ValueError: If the bytes are not a decodable image
+    """
+    if not data:
+        raise ValueError("Empty frame")
+    if len(data) > MAX_FRAME_BYTES:
+        raise ValueError(f"Frame exceeds {MAX_FRAME_BYTES} bytes")
+    frame = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+    if frame is None:
+        raise ValueError("Could not decode frame")
+    return frame
+
+
+def read_frame_stream(stream):
+    """
+    Yield encoded frames from a stream of length-prefixed messages
+
+    Each message is a 4-byte big-endian length followed by that many bytes
+    of encoded image, so a client can push frames over one chunked upload.
+
+    Raises:
+        ValueError: If a length exceeds MAX_FRAME_BYTES or a frame is cut short
+    """
+    while True:
+        header = stream.read(4)
+        if not header:
+            return
+        if len(header) < 4:
+            raise ValueError("Truncated frame header")
+        (length,) = struct.unpack(">I", header)
+        if length > MAX_FRAME_BYTES:
+            raise ValueError(f"Frame exceeds {MAX_FRAME_BYTES} bytes")
+        data = stream.read(length)
+        if len(data) < length:
+            raise ValueError("Truncated frame")
+        yield data
+
+
+def compact_result(result):
+    """Get the JSON-safe part of a processing result, without the frame"""
+    return {key: value for key, value in result.items() if key != "frame"}
+
+
+class FrameContext:
+    """
+    Per-frame preprocessing shared by all processors.
+
+    Each derived image is computed on first use and then reused, so a frame
+    costs at most one grayscale conversion, one blur and one face cascade
+    face localization no matter how many processors read it.
+    """
+
+    BLUR_KERNEL = (21, 21)
+
+    def __init__(self, frame, face_tracker, prev_blurred=None, timestamp=None):
+        """
+        Args:
+            frame: Video frame as numpy array (BGR format)
+            face_tracker: FaceTracker that locates faces across frames
+            prev_blurred: Blurred grayscale image of the previous frame
+            timestamp: Capture time of the frame (defaults to now)
+        """
+        self.frame = frame
+        self.face_tracker = face_tracker
+        self.prev_blurred = prev_blurred
+        self.timestamp = timestamp if timestamp is not None else time.time()
+        self._cache = {}
+        # One lock per product, so processors running in parallel compute
+        # each product once without blocking on unrelated ones
+        self._locks = {name: threading.Lock() for name in ("gray", "blurred", "faces")}
+
+    def _cached(self, name, compute):
+        value = self._cache.get(name)
+        if value is None:
+            with self._locks[name]:
+                value = self._cache.get(name)
+                if value is None:
+                    value = compute()
+                    self._cache[name] = value
+        return value
+
+    @property
+    def gray(self):
+        """Grayscale frame"""
+        return self._cached(
+            "gray", lambda: cv2.cvtColor(self.frame, cv2.COLOR_BGR2GRAY)
+        )
+
+    @property
+    def blurred(self):
+        """Blurred grayscale frame for motion detection"""
+        return self._cached(
+            "blurred", lambda: cv2.GaussianBlur(self.gray, self.BLUR_KERNEL, 0)
+        )
+
+    @property
+    def faces(self):
+        """Face boxes (x, y, w, h), tracked from the previous frames"""
+        return self._cached("faces", lambda: self.face_tracker.locate(self.gray))
+
+
 class BehaviorCapture:
     """
     Advanced behavior capture and analysis system that integrates with AlphaVox
@@ -65,13 +199,23 @@ class BehaviorCapture:
     def __init__(self):
         """Initialize the behavior capture system"""
         self.is_tracking = False
-        self.movement_history = deque(maxlen=MOVEMENT_HISTORY_LENGTH)
+        self.movement_detector = PeriodicityDetector(
+            MOVEMENT_SIGNALS,
+            capacity=MOVEMENT_HISTORY_LENGTH,
+            min_samples=REPETITIVE_PATTERN_LENGTH,
+            hop=REPETITIVE_PATTERN_HOP,
+            peak_threshold=MOVEMENT_THRESHOLD,
+        )
         self.face_cascade = cv2.CascadeClassifier(
             cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
         )
         self.eye_cascade = cv2.CascadeClassifier(
             cv2.data.haarcascades + "haarcascade_eye.xml"
         )
+        # Full detection every few frames, ROI search around the face between
+        self.face_tracker = FaceTracker(
+            self.face_cascade, scale_factor=1.3, min_neighbors=5
+        )
 
         # For pattern recognition
         self.patterns = {
@@ -83,10 +227,14 @@ class BehaviorCapture:
 
         # For behavior pattern storage
         self.observed_patterns = []
-        self.frame_buffer = []
+        self.prev_blurred = None  # Blurred grayscale of the last processed frame
         self.last_frame_time = time.time()
         self.fps = 0
 
+        # Per-processor timing (milliseconds), to see which stage limits FPS
+        self.stage_timings = {}
+        self._timing_lock = threading.Lock()
+
         # Load known patterns if available
         self._load_known_patterns()
 
@@ -125,6 +273,9 @@ class BehaviorCapture:
         """Start behavior tracking"""
         if not self.is_tracking:
             self.is_tracking = True
+            self.prev_blurred = None
+            self.face_tracker.reset()
+            self.movement_detector.reset()
             logger.info("Started behavior tracking")
 
             # Start analysis thread
@@ -138,12 +289,15 @@ class BehaviorCapture:
             self.is_tracking = False
             logger.info("Stopped behavior tracking")
 
-    def process_frame(self, frame):
+    def process_frame(self, frame, executor=None, timestamp=None):
         """
         Process a video frame for behavior analysis
 
         Args:
             frame: Video frame as numpy array (BGR format)
+            executor: Optional thread pool to run the processors in parallel
+                (OpenCV releases the GIL); processors run in turn without one
+            timestamp: Capture time of the frame (defaults to now)
 
         Returns:
             dict: Analysis results and annotated frame
@@ -152,29 +306,43 @@ class BehaviorCapture:
             return {"tracking": False, "frame": frame}
 
         # Calculate FPS
-        current_time = time.time()
+        current_time = timestamp if timestamp is not None else time.time()
         time_diff = current_time - self.last_frame_time
         if time_diff > 0:
             self.fps = 1.0 / time_diff
         self.last_frame_time = current_time
 
-        # Store frame in buffer
-        self.frame_buffer.append(frame.copy())
-        if len(self.frame_buffer) > MOVEMENT_HISTORY_LENGTH:
-            self.frame_buffer.pop(0)
+        # Shared preprocessing for all processors
+        context = FrameContext(
+            frame, self.face_tracker, self.prev_blurred, timestamp=current_time
+        )
 
         # Create a copy for annotation
         annotated_frame = frame.copy()
 
         # Run all processors on the frame
-        results = {}
-        for processor_name, processor_func in self.processors.items():
-            try:
-                processor_result = processor_func(frame, annotated_frame)
-                results[processor_name] = processor_result
-            except Exception as e:
-                logger.error(f"Error in {processor_name}: {e}")
-                results[processor_name] = {"error": str(e)}
+        if executor is None:
+            results = {
+                processor_name: self._run_processor(
+                    processor_name, processor_func, context, annotated_frame
+                )
+                for processor_name, processor_func in self.processors.items()
+            }
+        else:
+            futures = {
+                processor_name: executor.submit(
+                    self._run_processor,
+                    processor_name,
+                    processor_func,
+                    context,
+                    annotated_frame,
+                )
+                for processor_name, processor_func in self.processors.items()
+            }
+            results = {name: future.result() for name, future in futures.items()}
+
+        # Keep this frame's blurred image as the next frame's motion reference
+        self.prev_blurred = context.blurred
 
         # Add overall analysis
         pattern_matches = self._match_known_patterns(results)
@@ -194,38 +362,79 @@ class BehaviorCapture:
 
         return {"tracking": True, "frame": annotated_frame, "results": results}
 
-    def _detect_repetitive_movements(self, frame, annotated_frame):
+    def _run_processor(self, processor_name, processor_func, context, annotated_frame):
+        """Run one processor, recording its duration and containing its errors"""
+        start = time.perf_counter()
+        try:
+            return processor_func(context, annotated_frame)
+        except Exception as e:
+            logger.error(f"Error in {processor_name}: {e}")
+            return {"error": str(e)}
+        finally:
+            self._record_timing(processor_name, (time.perf_counter() - start) * 1000)
+
+    def _record_timing(self, stage, elapsed_ms):
+        with self._timing_lock:
+            timing = self.stage_timings.setdefault(
+                stage, {"count": 0, "last_ms": 0.0, "avg_ms": 0.0, "max_ms": 0.0}
+            )
+            timing["count"] += 1
+            timing["last_ms"] = elapsed_ms
+            timing["max_ms"] = max(timing["max_ms"], elapsed_ms)
+            # Exponential moving average so the figure tracks current load
+            if timing["count"] == 1:
+                timing["avg_ms"] = elapsed_ms
+            else:
+                timing["avg_ms"] += 0.1 * (elapsed_ms - timing["avg_ms"])
+
+    def get_stage_timings(self):
+        """Get per-processor timing statistics in milliseconds"""
+        with self._timing_lock:
+            return {stage: dict(timing) for stage, timing in self.stage_timings.items()}
+
+    def _detect_repetitive_movements(self, context, annotated_frame):
         """
         Detect repetitive movements (tics) in the video stream
 
         Args:
-            frame: Current video frame
+            context: FrameContext for the current video frame
             annotated_frame: Frame to annotate with detection results
 
         Returns:
             dict: Detection results
         """
-        # Convert to grayscale for motion detection
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        gray = cv2.GaussianBlur(gray, (21, 21), 0)
-
-        # If we have previous frames, calculate movement
-        if len(self.frame_buffer) > 1:
-            prev_gray = cv2.cvtColor(self.frame_buffer[-2], cv2.COLOR_BGR2GRAY)
-            prev_gray = cv2.GaussianBlur(prev_gray, (21, 21), 0)
+        # Blurred grayscale for motion detection
+        gray = context.blurred
+        prev_gray = context.prev_blurred
 
+        # If we have a previous frame of the same size, calculate movement
+        if prev_gray is not None and prev_gray.shape == gray.shape:
             # Calculate absolute difference
             frame_delta = cv2.absdiff(prev_gray, gray)
             thresh = cv2.threshold(frame_delta, 25, 255, cv2.THRESH_BINARY)[1]
 
-            # Calculate proportion of movement
-            movement_proportion = np.sum(thresh) / (
-                thresh.shape[0] * thresh.shape[1] * 255
+            # Proportion of moving pixels overall, inside the face box (head)
+            # and outside it (body). Without a face both are left out and
+            # the detector repeats their last values, so a flickering face
+            # detection does not show up as a rhythm.
+            moving = thresh > 0
+            movement_count = int(np.count_nonzero(moving))
+            movement_proportion = movement_count / moving.size
+            signals = {"movement": movement_proportion}
+            if len(context.faces) > 0:
+                x, y, w, h = context.faces[0]
+                head_count = int(np.count_nonzero(moving[y : y + h, x : x + w]))
+                if w * h > 0:
+                    signals["head"] = head_count / (w * h)
+                if moving.size > w * h:
+                    signals["body"] = (movement_count - head_count) / (
+                        moving.size - w * h
+                    )
+
+            # Check for repetitive patterns (re-analyzed every few frames)
+            repetitive_movements = self.movement_detector.push(
+                context.timestamp, signals
             )
-            self.movement_history.append(movement_proportion)
-
-            # Check for repetitive patterns
-            repetitive_movements = self._find_repetitive_patterns(self.movement_history)
 
             # Annotate frame with movement information
             cv2.putText(
@@ -260,21 +469,22 @@ class BehaviorCapture:
 
         return {"movement_proportion": 0, "repetitive_movements": []}
 
-    def _track_eye_movements(self, frame, annotated_frame):
+    def _track_eye_movements(self, context, annotated_frame):
         """
         Track eye movements and gaze direction
 
         Args:
-            frame: Current video frame
+            context: FrameContext for the current video frame
             annotated_frame: Frame to annotate with tracking results
 
         Returns:
             dict: Eye tracking results
         """
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        frame = context.frame
+        gray = context.gray
 
-        # Detect faces
-        faces = self.face_cascade.detectMultiScale(gray, 1.3, 5)
+        # Detected faces (shared with the expression analyzer)
+        faces = context.faces
 
         for x, y, w, h in faces:
             cv2.rectangle(annotated_frame, (x, y), (x + w, y + h), (255, 0, 0), 2)
@@ -327,12 +537,12 @@ class BehaviorCapture:
 
         return {"face_detected": False, "eyes_detected": 0, "eye_positions": []}
 
-    def _analyze_facial_expressions(self, frame, annotated_frame):
+    def _analyze_facial_expressions(self, context, annotated_frame):
         """
         Analyze facial expressions and micro-expressions
 
         Args:
-            frame: Current video frame
+            context: FrameContext for the current video frame
             annotated_frame: Frame to annotate with analysis results
 
         Returns:
@@ -342,8 +552,7 @@ class BehaviorCapture:
         # for facial landmark detection and expression classification
 
         # Placeholder implementation based on face detection
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        faces = self.face_cascade.detectMultiScale(gray, 1.3, 5)
+        faces = context.faces
 
         if len(faces) > 0:
             # Simulate expression analysis with limited capabilities
@@ -373,12 +582,12 @@ class BehaviorCapture:
 
         return {"face_detected": False}
 
-    def _track_body_posture(self, frame, annotated_frame):
+    def _track_body_posture(self, context, annotated_frame):
         """
         Track body posture and posture changes
 
         Args:
-            frame: Current video frame
+            context: FrameContext for the current video frame
             annotated_frame: Frame to annotate with tracking results
 
         Returns:
@@ -404,59 +613,6 @@ class BehaviorCapture:
             "movement_detected": False,  # Placeholder
         }
 
-    def _find_repetitive_patterns(self, movement_data):
-        """
-        Find repetitive patterns in movement data
-
-        Args:
-            movement_data: Sequence of movement measurements
-
-        Returns:
-            list: Detected repetitive patterns
-        """
-        # Simple threshold-based pattern detection
-        # A more sophisticated implementation would use signal processing techniques
-
-        if len(movement_data) < REPETITIVE_PATTERN_LENGTH:
-            return []
-
-        # Calculate peaks in movement
-        data_array = np.array(movement_data)
-        threshold = np.mean(data_array) + MOVEMENT_THRESHOLD
-        peaks = []
-
-        for i in range(1, len(data_array) - 1):
-            if (
-                data_array[i] > threshold
-                and data_array[i] > data_array[i - 1]
-                and data_array[i] > data_array[i + 1]
-            ):
-                peaks.append(i)
-
-        # Check for repetitive patterns in the peaks
-        if len(peaks) >= 3:
-            intervals = [peaks[i + 1] - peaks[i] for i in range(len(peaks) - 1)]
-
-            # Check if intervals are consistent
-            if len(intervals) >= 2:
-                mean_interval = np.mean(intervals)
-                std_interval = np.std(intervals)
-
-                # If standard deviation is low relative to mean, it's a repetitive pattern
-                if std_interval / mean_interval < 0.3:  # Threshold for consistency
-                    return [
-                        {
-                            "type": "repetitive_movement",
-                            "frequency": (
-                                self.fps / mean_interval if self.fps > 0 else 0
-                            ),
-                            "consistency": 1.0 - (std_interval / mean_interval),
-                            "count": len(peaks),
-                        }
-                    ]
-
-        return []
-
     def _match_known_patterns(self, current_results):
         """
         Match current results against known behavior patterns
@@ -560,6 +716,570 @@ def get_behavior_capture():
     return _behavior_capture
 
 
+class BehaviorPipeline:
+    """
+    Latest-frame-wins processing pipeline around a BehaviorCapture.
+
+    Frames are submitted into a single-slot inbox: a frame that has not
+    been picked up yet is replaced (and counted as dropped) by a newer one,
+    so latency stays bounded when frames arrive faster than they can be
+    analyzed. A worker thread processes the newest frame, running the
+    processors in parallel on a thread pool, and publishes each result to
+    subscribers.
+    """
+
+    def __init__(self, capture, max_workers=None):
+        """
+        Args:
+            capture: BehaviorCapture instance doing the analysis
+            max_workers: Processor threads (default: one per processor)
+        """
+        self.capture = capture
+        self.max_workers = max_workers or len(capture.processors)
+        self.executor = None
+        self.subscribers = []
+
+        self._inbox = None  # (sequence, frame, timestamp)
+        self._condition = threading.Condition()
+        self._sequence = 0
+        self._running = False
+        self._thread = None
+
+        self.latest_result = None
+        self.submitted = 0
+        self.processed = 0
+        self.dropped = 0
+        self.last_latency_ms = 0.0
+        self._processed_times = deque(maxlen=30)
+
+    def start(self):
+        """Start tracking on the capture and the pipeline worker"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.capture.start_tracking()
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="behavior-processor"
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="behavior-pipeline", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Started behavior pipeline with {self.max_workers} workers")
+
+    def stop(self):
+        """Stop the pipeline worker and tracking; a waiting frame is discarded"""
+        with self._condition:
+            if not self._running:
+                return
+            self._running = False
+            self._inbox = None
+            self._condition.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self.executor.shutdown(wait=False)
+        self.capture.stop_tracking()
+        logger.info("Stopped behavior pipeline")
+
+    @property
+    def running(self):
+        return self._running
+
+    def submit(self, frame, timestamp=None):
+        """
+        Offer a frame for processing, replacing any frame still waiting
+
+        Args:
+            frame: Video frame as numpy array (BGR format)
+            timestamp: Capture time (defaults to now)
+
+        Returns:
+            int: Sequence number of the submitted frame
+        """
+        with self._condition:
+            self._sequence += 1
+            self.submitted += 1
+            if self._inbox is not None:
+                self.dropped += 1
+            self._inbox = (
+                self._sequence,
+                frame,
+                timestamp if timestamp is not None else time.time(),
+            )
+            self._condition.notify_all()
+            return self._sequence
+
+    def subscribe(self, callback):
+        """Register callback(result) to receive every published result"""
+        with self._condition:
+            self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._condition:
+            if callback in self.subscribers:
+                self.subscribers.remove(callback)
+
+    def wait_for_result(self, after_sequence=0, timeout=None):
+        """
+        Wait for a result newer than a sequence number
+
+        Returns:
+            dict or None: The latest result, or None on timeout
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self.latest_result is not None
+                and self.latest_result["sequence"] > after_sequence,
+                timeout,
+            )
+            result = self.latest_result
+        if result is not None and result["sequence"] > after_sequence:
+            return result
+        return None
+
+    def get_stats(self):
+        """Get throughput, drop and per-stage timing statistics"""
+        times = list(self._processed_times)
+        fps = 0.0
+        if len(times) > 1 and times[-1] > times[0]:
+            fps = (len(times) - 1) / (times[-1] - times[0])
+        return {
+            "running": self._running,
+            "submitted": self.submitted,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "fps": fps,
+            "latency_ms": self.last_latency_ms,
+            "stages": self.capture.get_stage_timings(),
+        }
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._inbox is not None or not self._running
+                )
+                if not self._running:
+                    return
+                sequence, frame, timestamp = self._inbox
+                self._inbox = None
+
+            start = time.perf_counter()
+            try:
+                result = self.capture.process_frame(
+                    frame, executor=self.executor, timestamp=timestamp
+                )
+            except Exception as e:
+                logger.error(f"Error in behavior pipeline: {e}")
+                continue
+            self.capture._record_timing("total", (time.perf_counter() - start) * 1000)
+
+            result["sequence"] = sequence
+            result["timestamp"] = timestamp
+            self.last_latency_ms = (time.time() - timestamp) * 1000
+            self.processed += 1
+            self._processed_times.append(time.time())
+
+            with self._condition:
+                self.latest_result = result
+                subscribers = list(self.subscribers)
+                self._condition.notify_all()
+            for callback in subscribers:
+                try:
+                    callback(result)
+                except Exception as e:
+                    logger.error(f"Error in behavior pipeline subscriber: {e}")
+
+
+class BehaviorResultStore:
+    """
+    Per-session files shared between the worker processes on a host.
+
+    The web app runs several worker processes, and consecutive requests of
+    one browser can land in any of them. Only the process holding a
+    session's owner lock runs its pipeline, so face tracking and movement
+    history see every frame in order; other processes hand frames to it
+    through a single-slot frame file (a newer frame replaces one not yet
+    taken, like the pipeline inbox). The owner publishes each compact result
+    (and, at most once per annotated_interval, the annotated frame as JPEG)
+    for readers in any process. Files are replaced atomically, so a reader
+    never sees a partial write.
+    """
+
+    def __init__(
+        self, directory=BEHAVIOR_RESULTS_DIR, annotated_interval=ANNOTATED_FRAME_INTERVAL
+    ):
+        """
+        Args:
+            directory: Directory holding the shared result files
+            annotated_interval: Minimum seconds between annotated frame encodes
+        """
+        self.directory = directory
+        self.annotated_interval = annotated_interval
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self._annotated = {}  # key -> (sequence, encoded_at)
+        self._lock = threading.Lock()
+
+    def _path(self, key, suffix):
+        if not SESSION_KEY_PATTERN.fullmatch(key or ""):
+            raise ValueError("Invalid behavior session key")
+        return os.path.join(self.directory, key + suffix)
+
+    def _replace(self, path, data):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def publish(self, key, result):
+        """
+        Share a pipeline result for a session
+
+        Args:
+            key: Session key the result belongs to
+            result: Processing result, optionally holding the annotated frame
+        """
+        now = time.time()
+        with self._lock:
+            annotated_sequence, encoded_at = self._annotated.get(key, (None, 0.0))
+            encode = (
+                isinstance(result.get("frame"), np.ndarray)
+                and now - encoded_at >= self.annotated_interval
+            )
+            if encode:
+                self._annotated[key] = (result.get("sequence"), now)
+
+        if encode:
+            ok, buffer = cv2.imencode(".jpg", result["frame"])
+            if ok:
+                self._replace(self._path(key, ".jpg"), buffer.tobytes())
+                annotated_sequence = result.get("sequence")
+
+        record = {
+            "version": time.time_ns(),
+            "annotated_sequence": annotated_sequence,
+            "result": compact_result(result),
+        }
+        self._replace(self._path(key, ".json"), json.dumps(record).encode("utf-8"))
+
+    def latest(self, key):
+        """
+        Get the newest shared record for a session
+
+        Returns:
+            dict or None: {"version", "annotated_sequence", "result"}
+        """
+        try:
+            with open(self._path(key, ".json"), "rb") as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def wait_for_result(self, key, after_version=0, timeout=None):
+        """
+        Wait for a shared record newer than a version
+
+        Returns:
+            dict or None: The newest record, or None on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        path = self._path(key, ".json")
+        seen = None
+        while True:
+            try:
+                stamp = os.stat(path).st_mtime_ns
+            except OSError:
+                stamp = None
+            if stamp is not None and stamp != seen:
+                seen = stamp
+                record = self.latest(key)
+                if record is not None and record["version"] > after_version:
+                    return record
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(RESULT_POLL_INTERVAL)
+
+    def annotated_jpeg(self, key):
+        """
+        Get a session's latest annotated frame
+
+        Returns:
+            tuple or None: (sequence, jpeg_bytes), or None before any frame
+        """
+        record = self.latest(key)
+        try:
+            with open(self._path(key, ".jpg"), "rb") as f:
+                jpeg = f.read()
+        except OSError:
+            return None
+        sequence = record.get("annotated_sequence") if record else None
+        return sequence, jpeg
+
+    def claim(self, key):
+        """
+        Try to become the process running a session's pipeline
+
+        The lock is released when the returned descriptor is closed or the
+        process exits, so a crashed owner never blocks the session.
+
+        Returns:
+            int or None: Lock file descriptor to pass to release(), or None
+                if another process owns the session
+        """
+        fd = os.open(self._path(key, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        if fcntl:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                return None
+        return fd
+
+    def release(self, fd):
+        """Give up a session claimed with claim()"""
+        os.close(fd)
+
+    def forward_frame(self, key, data):
+        """Hand an encoded frame to the process owning the session"""
+        self._replace(self._path(key, ".frame"), data)
+
+    def take_frame(self, key):
+        """
+        Take the frame forwarded by another process, if any
+
+        Returns:
+            bytes or None: The encoded frame
+        """
+        path = self._path(key, ".frame")
+        taken = f"{path}.{os.getpid()}.taken"
+        try:
+            os.replace(path, taken)
+        except FileNotFoundError:
+            return None
+        try:
+            with open(taken, "rb") as f:
+                return f.read()
+        finally:
+            os.remove(taken)
+
+    def request_stop(self, key):
+        """Ask the process owning a session to stop its pipeline"""
+        self._replace(self._path(key, ".stop"), b"")
+
+    def take_stop(self, key):
+        """Check for (and clear) a stop request for a session"""
+        try:
+            os.remove(self._path(key, ".stop"))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def discard(self, key):
+        """Delete a session's shared files"""
+        with self._lock:
+            self._annotated.pop(key, None)
+        for suffix in (".json", ".jpg", ".frame", ".stop"):
+            try:
+                os.remove(self._path(key, suffix))
+            except OSError:
+                pass
+
+
+class BehaviorPipelineTable:
+    """
+    Bounded table of per-session BehaviorPipelines with LRU and idle eviction.
+
+    Each session gets its own BehaviorCapture, so face tracking and movement
+    history never mix between users, and publishes its results to the shared
+    BehaviorResultStore under its session key. A session's pipeline runs in
+    the one process that claimed it; submit() in any other process forwards
+    the frame there, and a relay thread feeds forwarded frames and stop
+    requests to the pipelines this process owns.
+    """
+
+    def __init__(
+        self,
+        store,
+        capture_factory=None,
+        max_sessions=MAX_BEHAVIOR_SESSIONS,
+        idle_timeout=BEHAVIOR_SESSION_IDLE_TIMEOUT,
+    ):
+        """
+        Args:
+            store: BehaviorResultStore results are published to
+            capture_factory: Callable creating a capture (default: BehaviorCapture)
+            max_sessions: Maximum pipelines kept before evicting the least recent
+            idle_timeout: Seconds without use before a pipeline is stopped
+        """
+        self.store = store
+        self.capture_factory = capture_factory or BehaviorCapture
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._pipelines = OrderedDict()  # key -> (pipeline, last_seen, lock_fd)
+        self._lock = threading.Lock()
+        self._relay_thread = None
+
+    def get(self, key):
+        """
+        Get or create the pipeline for a session
+
+        Returns:
+            BehaviorPipeline or None: None if another process owns the session
+        """
+        evicted = []
+        with self._lock:
+            evicted.extend(self._evict_idle())
+            entry = self._pipelines.pop(key, None)
+            if entry is None:
+                lock_fd = self.store.claim(key)
+                if lock_fd is None:
+                    pipeline = None
+                else:
+                    self.store.take_stop(key)  # Left over from an earlier owner
+                    pipeline = BehaviorPipeline(self.capture_factory())
+                    pipeline.subscribe(
+                        lambda result: self.store.publish(key, result)
+                    )
+            else:
+                pipeline, _, lock_fd = entry
+            if pipeline is not None:
+                self._pipelines[key] = (pipeline, time.monotonic(), lock_fd)
+            while len(self._pipelines) > self.max_sessions:
+                evicted_key, evicted_entry = self._pipelines.popitem(last=False)
+                evicted.append((evicted_key, evicted_entry))
+            if pipeline is not None and self._relay_thread is None:
+                self._relay_thread = threading.Thread(
+                    target=self._relay, name="behavior-frame-relay", daemon=True
+                )
+                self._relay_thread.start()
+        self._stop(evicted)
+        return pipeline
+
+    def submit(self, key, data, frame=None):
+        """
+        Submit an encoded frame to a session's pipeline, wherever it runs
+
+        Args:
+            key: Session key
+            data: Encoded frame bytes
+            frame: The decoded frame, if the caller already has it
+
+        Returns:
+            BehaviorPipeline or None: The local pipeline, or None if the
+                frame was forwarded to the owning process
+        """
+        pipeline = self.get(key)
+        if pipeline is None:
+            self.store.forward_frame(key, data)
+            return None
+        pipeline.start()
+        pipeline.submit(frame if frame is not None else decode_jpeg(data))
+        return pipeline
+
+    def find(self, key):
+        """Get a session's pipeline without creating one"""
+        with self._lock:
+            entry = self._pipelines.get(key)
+        return entry[0] if entry else None
+
+    def remove(self, key):
+        """Stop a session's pipeline and discard its shared results"""
+        with self._lock:
+            entry = self._pipelines.pop(key, None)
+        if entry:
+            self._stop([(key, entry)])
+
+    def stop(self, key):
+        """Stop a session's pipeline here or in the process owning it"""
+        if self.find(key) is not None:
+            self.remove(key)
+        else:
+            self.store.request_stop(key)
+
+    def _relay(self):
+        while True:
+            with self._lock:
+                keys = list(self._pipelines)
+            for key in keys:
+                try:
+                    if self.store.take_stop(key):
+                        self.remove(key)
+                        continue
+                    data = self.store.take_frame(key)
+                    if data is not None:
+                        self.submit(key, data)
+                except (OSError, ValueError) as e:
+                    logger.error(f"Error relaying behavior frame: {e}")
+            time.sleep(FRAME_RELAY_INTERVAL)
+
+    def _evict_idle(self):
+        # Pipelines are kept in recency order, so idle ones sit at the front
+        cutoff = time.monotonic() - self.idle_timeout
+        evicted = []
+        while self._pipelines:
+            key, entry = next(iter(self._pipelines.items()))
+            if entry[1] >= cutoff:
+                break
+            self._pipelines.popitem(last=False)
+            evicted.append((key, entry))
+        return evicted
+
+    def _stop(self, evicted):
+        for key, (pipeline, _, lock_fd) in evicted:
+            pipeline.stop()
+            self.store.discard(key)
+            self.store.release(lock_fd)
+            logger.info(f"Stopped behavior pipeline for session {key[:8]}")
+
+    def __len__(self):
+        return len(self._pipelines)
+
+
+_behavior_result_store = None
+_behavior_pipelines = None
+
+
+def get_behavior_result_store():
+    """Get or create the shared behavior result store"""
+    global _behavior_result_store
+    if _behavior_result_store is None:
+        _behavior_result_store = BehaviorResultStore()
+    return _behavior_result_store
+
+
+def get_behavior_pipelines():
+    """Get or create this process's table of session pipelines"""
+    global _behavior_pipelines
+    if _behavior_pipelines is None:
+        _behavior_pipelines = BehaviorPipelineTable(get_behavior_result_store())
+    return _behavior_pipelines
+
+
+def submit_behavior_frame(session_key, data, frame=None):
+    """
+    Submit an encoded frame to a session's pipeline in whichever process owns it
+
+    Returns:
+        BehaviorPipeline or None: The pipeline if it runs in this process
+    """
+    return get_behavior_pipelines().submit(session_key, data, frame)
+
+
+def find_behavior_pipeline(session_key):
+    """Get a session's behavior pipeline if this process has one"""
+    if _behavior_pipelines is None:
+        return None
+    return _behavior_pipelines.find(session_key)
+
+
+def stop_behavior_pipeline(session_key):
+    """Stop a session's behavior pipeline, in whichever process owns it"""
+    get_behavior_pipelines().stop(session_key)
+
+
 class BehaviorCaptureWebApp:
     """Web app for behavior capture integration with AlphaVox"""
 
@@ -26,13 +26,23 @@ Key features:
 - User profile management
 - Settings customization
 - Nonverbal communication training resources
+
+Communication history is kept in one append-only JSON-lines shard per
+user (data/communication_history/<user>.jsonl), with running symbol
+counts, so recording an event appends one line to one small file.
+Progress updates to user profiles are written behind.
 """
 
 import logging
+import threading
 import time
 import os
 import json
-from typing import Dict, Any, List, Optional, Tuple, Union
+from collections import Counter, deque
+from typing import Deque, Dict, Any, List, Optional, Tuple, Union
+from urllib.parse import quote, unquote
+
+from write_behind import AppendLog, WriteBehindPersister
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
@@ -63,6 +73,12 @@ except ImportError:
     logger.warning("Nonverbal expertise not available")
     expertise_available = False
 
+PROFILES_PATH = os.path.join('profiles', 'user_profiles.json')
+HISTORY_DIR = os.path.join('data', 'communication_history')
+# Whole-history format, imported into shards once
+LEGACY_HISTORY_PATH = os.path.join('data', 'communication_history.json')
+MAX_HISTORY_EVENTS = 1000  # Events kept per user
+
 class CaregiverInterface:
     """
     Interface for caregiver access to AlphaVox features and data.
@@ -76,10 +92,18 @@ class CaregiverInterface:
     
     def __init__(self):
         """Initialize the caregiver interface"""
+        self._lock = threading.RLock()
+        
         # User profiles
         self.user_profiles = self._load_user_profiles()
-        
-        # Communication history
+        self.profiles_persister = WriteBehindPersister(
+            "user-profiles", PROFILES_PATH, self._serialize_user_profiles
+        )
+        
+        # Communication history, one append log and symbol counter per user
+        self.history_logs: Dict[str, AppendLog] = {}
+        self.symbol_counts: Dict[str, Counter] = {}
+        self.favorite_symbols: Dict[str, str] = {}
         self.communication_history = self._load_communication_history()
         
         # Connected services
@@ -125,15 +149,13 @@ class CaregiverInterface:
         Returns:
             Dictionary of user profiles
         """
-        profiles_path = os.path.join('profiles', 'user_profiles.json')
-        
         # Default empty profiles
         default_profiles = {}
         
         # Try to load profiles from file
         try:
-            if os.path.exists(profiles_path):
-                with open(profiles_path, 'r') as f:
+            if os.path.exists(PROFILES_PATH):
+                with open(PROFILES_PATH, 'r') as f:
                     profiles = json.load(f)
                 logger.info(f"Loaded {len(profiles)} user profiles")
                 return profiles
@@ -167,8 +189,8 @@ class CaregiverInterface:
         
         # Save default profiles to file
         try:
-            os.makedirs(os.path.dirname(profiles_path), exist_ok=True)
-            with open(profiles_path, 'w') as f:
+            os.makedirs(os.path.dirname(PROFILES_PATH), exist_ok=True)
+            with open(PROFILES_PATH, 'w') as f:
                 json.dump(default_profiles, f, indent=4)
             logger.info("Created default user profiles")
         except Exception as e:
@@ -176,65 +198,118 @@ class CaregiverInterface:
         
         return default_profiles
     
-    def _load_communication_history(self) -> Dict[str, List[Dict[str, Any]]]:
+    def _serialize_user_profiles(self) -> bytes:
+        with self._lock:
+            return json.dumps(self.user_profiles, indent=4).encode('utf-8')
+    
+    def _history_log(self, user_id: str) -> AppendLog:
+        """Get the append log holding a user's communication history."""
+        log = self.history_logs.get(user_id)
+        if log is None:
+            path = os.path.join(HISTORY_DIR, quote(user_id, safe='') + '.jsonl')
+            log = self.history_logs[user_id] = AppendLog(path)
+        return log
+    
+    def _load_communication_history(self) -> Dict[str, Deque[Dict[str, Any]]]:
         """
-        Load communication history from file.
+        Load communication history from the per-user shards.
         
         Returns:
             Dictionary of user communication history
         """
-        history_path = os.path.join('data', 'communication_history.json')
-        
-        # Default empty history
-        default_history = {}
-        
-        # Try to load history from file
+        history = {}
+        
+        if os.path.isdir(HISTORY_DIR):
+            for filename in sorted(os.listdir(HISTORY_DIR)):
+                if not filename.endswith('.jsonl'):
+                    continue
+                user_id = unquote(filename[:-len('.jsonl')])
+                log = self._history_log(user_id)
+                history[user_id] = deque(log.read(), maxlen=MAX_HISTORY_EVENTS)
+                self._count_symbols(user_id, history[user_id])
+            logger.info(f"Loaded communication history for {len(history)} users")
+            return history
+        
+        # Import the whole-history file, or create a sample history
+        legacy_history = None
         try:
-            if os.path.exists(history_path):
-                with open(history_path, 'r') as f:
-                    history = json.load(f)
-                logger.info(f"Loaded communication history for {len(history)} users")
-                return history
+            if os.path.exists(LEGACY_HISTORY_PATH):
+                with open(LEGACY_HISTORY_PATH, 'r') as f:
+                    legacy_history = json.load(f)
+                logger.info(f"Importing communication history for {len(legacy_history)} users")
         except Exception as e:
             logger.warning(f"Could not load communication history: {e}")
         
-        # Create sample history if none exists
-        default_history = {
-            "1": [
-                {
-                    "timestamp": time.time() - 3600,
-                    "type": "symbol",
-                    "content": "food",
-                    "message": "I want food.",
-                    "response": "I'll get you some food right away."
-                },
-                {
-                    "timestamp": time.time() - 1800,
-                    "type": "symbol",
-                    "content": "help",
-                    "message": "I need help.",
-                    "response": "I'm here to help. What do you need?"
-                },
-                {
-                    "timestamp": time.time() - 900,
-                    "type": "gesture",
-                    "content": "wave",
-                    "message": "Hello/Greeting",
-                    "response": "Hello there!"
-                }
-            ]
-        }
-        
-        # Save default history to file
-        try:
-            os.makedirs(os.path.dirname(history_path), exist_ok=True)
-            with open(history_path, 'w') as f:
-                json.dump(default_history, f, indent=4)
+        if legacy_history is None:
+            legacy_history = {
+                "1": [
+                    {
+                        "timestamp": time.time() - 3600,
+                        "type": "symbol",
+                        "content": "food",
+                        "message": "I want food.",
+                        "response": "I'll get you some food right away."
+                    },
+                    {
+                        "timestamp": time.time() - 1800,
+                        "type": "symbol",
+                        "content": "help",
+                        "message": "I need help.",
+                        "response": "I'm here to help. What do you need?"
+                    },
+                    {
+                        "timestamp": time.time() - 900,
+                        "type": "gesture",
+                        "content": "wave",
+                        "message": "Hello/Greeting",
+                        "response": "Hello there!"
+                    }
+                ]
+            }
             logger.info("Created default communication history")
-        except Exception as e:
-            logger.warning(f"Could not save default communication history: {e}")
         
-        return default_history
+        os.makedirs(HISTORY_DIR, exist_ok=True)
+        for user_id, events in legacy_history.items():
+            history[user_id] = deque(events, maxlen=MAX_HISTORY_EVENTS)
+            self._count_symbols(user_id, history[user_id])
+            try:
+                self._history_log(user_id).compact(history[user_id])
+            except Exception as e:
+                logger.warning(f"Could not save communication history for user {user_id}: {e}")
+        
+        return history
+    
+    def _count_symbols(self, user_id: str, events) -> None:
+        """Rebuild a user's symbol counts and favorite symbol from events."""
+        counts = Counter(
+            e["content"] for e in events
+            if e.get("type") == "symbol" and "content" in e
+        )
+        self.symbol_counts[user_id] = counts
+        self.favorite_symbols[user_id] = max(counts, key=counts.get) if counts else ""
+    
+    def _update_symbol_counts(self, user_id: str, added: Dict[str, Any],
+                              evicted: Optional[Dict[str, Any]]) -> None:
+        """Keep a user's symbol counts in step with the retained history."""
+        counts = self.symbol_counts.setdefault(user_id, Counter())
+        favorite = self.favorite_symbols.get(user_id, "")
+        
+        if evicted and evicted.get("type") == "symbol" and "content" in evicted:
+            symbol = evicted["content"]
+            counts[symbol] -= 1
+            if counts[symbol] <= 0:
+                del counts[symbol]
+            if symbol == favorite:
+                # The favorite may have been overtaken; rescan the counts
+                favorite = max(counts, key=counts.get) if counts else ""
+        
+        if added.get("type") == "symbol" and "content" in added:
+            symbol = added["content"]
+            counts[symbol] += 1
+            if not favorite or counts[symbol] > counts[favorite]:
+                favorite = symbol
+        
+        self.favorite_symbols[user_id] = favorite
     
     def get_user_profile(self, user_id: str) -> Dict[str, Any]:
         """
@@ -274,18 +349,14 @@ class CaregiverInterface:
             return False
         
         # Update profile
-        self.user_profiles[user_id].update(profile_data)
+        with self._lock:
+            self.user_profiles[user_id].update(profile_data)
         
         # Save all profiles
-        try:
-            profiles_path = os.path.join('profiles', 'user_profiles.json')
-            with open(profiles_path, 'w') as f:
-                json.dump(self.user_profiles, f, indent=4)
+        if self.profiles_persister.flush(force=True):
             logger.info(f"Updated and saved profile for user {user_id}")
             return True
-        except Exception as e:
-            logger.error(f"Failed to save user profiles: {e}")
-            return False
+        return False
     
     def create_user_profile(self, profile_data: Dict[str, Any]) -> Optional[str]:
         """
@@ -325,18 +396,14 @@ class CaregiverInterface:
         new_profile.update(profile_data)
         
         # Add to profiles
-        self.user_profiles[user_id] = new_profile
+        with self._lock:
+            self.user_profiles[user_id] = new_profile
         
         # Save all profiles
-        try:
-            profiles_path = os.path.join('profiles', 'user_profiles.json')
-            with open(profiles_path, 'w') as f:
-                json.dump(self.user_profiles, f, indent=4)
+        if self.profiles_persister.flush(force=True):
             logger.info(f"Created and saved new user {user_id}")
             return user_id
-        except Exception as e:
-            logger.error(f"Failed to save user profiles: {e}")
-            return None
+        return None
     
     def get_user_communication_history(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -367,27 +434,32 @@ class CaregiverInterface:
         Returns:
             True if successful
         """
-        # Ensure user exists in history
-        if user_id not in self.communication_history:
-            self.communication_history[user_id] = []
-        
         # Add timestamp if not provided
         if "timestamp" not in event_data:
             event_data["timestamp"] = time.time()
         
-        # Add event to history
-        self.communication_history[user_id].append(event_data)
-        
-        # Trim history if too long (keep last 1000 events)
-        if len(self.communication_history[user_id]) > 1000:
-            self.communication_history[user_id] = self.communication_history[user_id][-1000:]
-        
-        # Save history
-        try:
-            history_path = os.path.join('data', 'communication_history.json')
-            with open(history_path, 'w') as f:
-                json.dump(self.communication_history, f, indent=4)
-            logger.info(f"Added communication event for user {user_id}")
+        with self._lock:
+            # Add event to history, keeping the last MAX_HISTORY_EVENTS
+            history = self.communication_history.get(user_id)
+            if history is None:
+                history = deque(maxlen=MAX_HISTORY_EVENTS)
+                self.communication_history[user_id] = history
+            evicted = history[0] if len(history) == history.maxlen else None
+            history.append(event_data)
+            self._update_symbol_counts(user_id, event_data, evicted)
+            
+            # Save history
+            try:
+                log = self._history_log(user_id)
+                log.append(event_data)
+                if log.lines > 2 * MAX_HISTORY_EVENTS:
+                    # Re-read under the log's lock: other workers append
+                    # to this shard too, and their events are not in history
+                    log.trim(MAX_HISTORY_EVENTS)
+                logger.info(f"Added communication event for user {user_id}")
+            except Exception as e:
+                logger.error(f"Failed to save communication history: {e}")
+                return False
             
             # Update user profile stats if available
             if user_id in self.user_profiles:
@@ -407,23 +479,12 @@ class CaregiverInterface:
                     
                     progress["recent_symbols"].insert(0, symbol)
                     progress["recent_symbols"] = progress["recent_symbols"][:10]
-                    
-                    # Update favorite symbol
-                    symbol_counts = {}
-                    for s in self.communication_history[user_id]:
-                        if s.get("type") == "symbol" and "content" in s:
-                            symbol_counts[s["content"]] = symbol_counts.get(s["content"], 0) + 1
-                    
-                    if symbol_counts:
-                        progress["favorite_symbol"] = max(symbol_counts.items(), key=lambda x: x[1])[0]
+                    progress["favorite_symbol"] = self.favorite_symbols[user_id]
                 
-                # Save updated profile
-                self.update_user_profile(user_id, {"progress": progress})
-            
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save communication history: {e}")
-            return False
+                # Save updated profile on the next write-behind flush
+                self.profiles_persister.mark_dirty()
+        
+        return True
     
     def get_user_progress_report(self, user_id: str) -> Dict[str, Any]:
         """
@@ -39,12 +39,17 @@ print("-" * 80)
 data_files = {
     "Topics": "data/knowledge/topics.json",
     "Facts": "data/knowledge/facts.json",
-    "Knowledge Graph": "data/knowledge_graph.json",
+    "Knowledge Graph": "data/knowledge_graph.jsonl",
     "Learning Log": "data/knowledge/learning_log.json",
 }
 
 for name, path in data_files.items():
-    if os.path.exists(path):
+    if os.path.exists(path) and path.endswith(".jsonl"):
+        # Append-only logs hold one JSON record per line
+        with open(path, 'r') as f:
+            count = sum(1 for line in f if line.strip())
+        print(f"✅ {name:<20} {path:<40} ({count} records)")
+    elif os.path.exists(path):
         with open(path, 'r') as f:
             try:
                 data = json.load(f)
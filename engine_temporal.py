@@ -31,7 +31,13 @@ import json
 import logging
 import os
 import pickle
+import queue
 import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
@@ -53,6 +59,14 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Result type name -> model key used by the LSTM models
+MODALITY_MODELS = {
+    "gesture": "gesture",
+    "eye": "eye_movement",
+    "emotion": "emotion",
+}
+
+
 class TemporalNonverbalEngine:
     """Enhanced engine for interpreting temporal nonverbal cues and generating
     appropriate responses.
@@ -354,49 +368,9 @@ class TemporalNonverbalEngine:
         Returns:
             Dictionary with expression, intent, confidence, and message
         """
-        if (
-            self.models["gesture"] is None
-            or len(self.gesture_buffer) < self.sequence_length
-        ):
-            return {
-                "expression": "Unknown",
-                "intent": "Unknown",
-                "confidence": 0.0,
-                "message": "I don't understand.",
-            }
-
-        # Convert buffer to numpy array and reshape for LSTM
-        sequence = np.array(self.gesture_buffer)
-
-        # Check if model is a TensorFlow model or a simplified model
-        if hasattr(self.models["gesture"], "predict"):
-            # TensorFlow model
-            sequence = np.expand_dims(sequence, axis=0)  # Add batch dimension
-            prediction = self.models["gesture"].predict(sequence, verbose=0)
-            gesture_idx = np.argmax(prediction, axis=1)[0]
-            confidence = prediction[0][gesture_idx]
-        else:
-            # Simplified model
-            gesture_idx = random.randint(0, len(self.labels["gesture"]) - 1)
-            confidence = random.uniform(0.6, 0.95)
-
-        # Get gesture label
-        if gesture_idx < len(self.labels["gesture"]):
-            gesture = self.labels["gesture"][gesture_idx]
-        else:
-            gesture = "Unknown"
-
-        # Get intent and message from language map
-        expression_data = self.language_map.get(
-            gesture, {"intent": "Unknown", "message": "I don't understand."}
-        )
-
-        return {
-            "expression": gesture,
-            "intent": expression_data["intent"],
-            "confidence": float(confidence),
-            "message": expression_data["message"],
-        }
+        if len(self.gesture_buffer) < self.sequence_length:
+            return self._unknown_result()
+        return self.classify_sequences("gesture", [np.array(self.gesture_buffer)])[0]
 
     def classify_eye_movement_sequence(self):
         """Classify an eye movement sequence using the LSTM model.
@@ -404,49 +378,9 @@ class TemporalNonverbalEngine:
         Returns:
             Dictionary with expression, intent, confidence, and message
         """
-        if (
-            self.models["eye_movement"] is None
-            or len(self.eye_buffer) < self.sequence_length
-        ):
-            return {
-                "expression": "Unknown",
-                "intent": "Unknown",
-                "confidence": 0.0,
-                "message": "I don't understand.",
-            }
-
-        # Convert buffer to numpy array and reshape for LSTM
-        sequence = np.array(self.eye_buffer)
-
-        # Check if model is a TensorFlow model or a simplified model
-        if hasattr(self.models["eye_movement"], "predict"):
-            # TensorFlow model
-            sequence = np.expand_dims(sequence, axis=0)  # Add batch dimension
-            prediction = self.models["eye_movement"].predict(sequence, verbose=0)
-            eye_idx = np.argmax(prediction, axis=1)[0]
-            confidence = prediction[0][eye_idx]
-        else:
-            # Simplified model
-            eye_idx = random.randint(0, len(self.labels["eye_movement"]) - 1)
-            confidence = random.uniform(0.6, 0.95)
-
-        # Get eye movement label
-        if eye_idx < len(self.labels["eye_movement"]):
-            eye_expression = self.labels["eye_movement"][eye_idx]
-        else:
-            eye_expression = "Unknown"
-
-        # Get intent and message from language map
-        expression_data = self.language_map.get(
-            eye_expression, {"intent": "Unknown", "message": "I don't understand."}
-        )
-
-        return {
-            "expression": eye_expression,
-            "intent": expression_data["intent"],
-            "confidence": float(confidence),
-            "message": expression_data["message"],
-        }
+        if len(self.eye_buffer) < self.sequence_length:
+            return self._unknown_result()
+        return self.classify_sequences("eye_movement", [np.array(self.eye_buffer)])[0]
 
     def classify_emotion_sequence(self):
         """Classify an emotion sequence using the LSTM model.
@@ -454,48 +388,63 @@ class TemporalNonverbalEngine:
         Returns:
             Dictionary with expression, intent, confidence, and message
         """
-        if (
-            self.models["emotion"] is None
-            or len(self.emotion_buffer) < self.sequence_length
-        ):
-            return {
-                "expression": "Unknown",
-                "intent": "Unknown",
-                "confidence": 0.0,
-                "message": "I don't understand.",
-            }
+        if len(self.emotion_buffer) < self.sequence_length:
+            return self._unknown_result()
+        return self.classify_sequences("emotion", [np.array(self.emotion_buffer)])[0]
 
-        # Convert buffer to numpy array and reshape for LSTM
-        sequence = np.array(self.emotion_buffer)
+    def classify_sequences(self, modality, sequences):
+        """Classify a batch of sequences for one modality in a single predict.
+
+        Args:
+            modality: Model key ('gesture', 'eye_movement' or 'emotion')
+            sequences: List of (sequence_length, n_features) arrays
+
+        Returns:
+            List of result dictionaries, one per sequence
+        """
+        model = self.models.get(modality)
+        if model is None or not sequences:
+            return [self._unknown_result() for _ in sequences]
+
+        labels = self.labels[modality]
 
         # Check if model is a TensorFlow model or a simplified model
-        if hasattr(self.models["emotion"], "predict"):
-            # TensorFlow model
-            sequence = np.expand_dims(sequence, axis=0)  # Add batch dimension
-            prediction = self.models["emotion"].predict(sequence, verbose=0)
-            emotion_idx = np.argmax(prediction, axis=1)[0]
-            confidence = prediction[0][emotion_idx]
+        if hasattr(model, "predict"):
+            # TensorFlow model - one call for the whole batch
+            batch = np.stack(sequences)
+            predictions = model.predict(batch, verbose=0)
+            indices = np.argmax(predictions, axis=1)
+            confidences = predictions[np.arange(len(indices)), indices]
         else:
             # Simplified model
-            emotion_idx = random.randint(0, len(self.labels["emotion"]) - 1)
-            confidence = random.uniform(0.6, 0.95)
+            indices = [random.randint(0, len(labels) - 1) for _ in sequences]
+            confidences = [random.uniform(0.6, 0.95) for _ in sequences]
 
-        # Get emotion label
-        if emotion_idx < len(self.labels["emotion"]):
-            emotion = self.labels["emotion"][emotion_idx]
-        else:
-            emotion = "Unknown"
+        results = []
+        for idx, confidence in zip(indices, confidences):
+            expression = labels[idx] if idx < len(labels) else "Unknown"
 
-        # Get intent and message from language map
-        expression_data = self.language_map.get(
-            emotion, {"intent": "Unknown", "message": "I don't understand."}
-        )
+            # Get intent and message from language map
+            expression_data = self.language_map.get(
+                expression, {"intent": "Unknown", "message": "I don't understand."}
+            )
+            results.append(
+                {
+                    "expression": expression,
+                    "intent": expression_data["intent"],
+                    "confidence": float(confidence),
+                    "message": expression_data["message"],
+                }
+            )
+        return results
 
+    def _unknown_result(self):
+        """Result returned when a sequence cannot be classified."""
         return {
-            "expression": emotion,
-            "intent": expression_data["intent"],
-            "confidence": float(confidence),
-            "message": expression_data["message"],
+            "expression": "Unknown",
+            "intent": "Unknown",
+            "confidence": 0.0,
+            "message": "I don't understand.",
         }
 
     def process_multimodal_sequence(
@@ -542,6 +491,77 @@ class TemporalNonverbalEngine:
         if not results:
             return self._get_default_response()
 
+        return self._combine_results(results)
+
+    def process_session_frame(
+        self,
+        session,
+        gesture_features=None,
+        eye_features=None,
+        emotion_features=None,
+        scheduler=None,
+    ):
+        """Process one frame of features for a single client session.
+
+        Features go into the session's own ring buffers, so concurrent
+        clients never share sequences. Ready sequences are classified
+        through the batch scheduler when one is given, otherwise inline.
+
+        Args:
+            session: TemporalSession holding this client's buffers
+            gesture_features: Optional gesture feature array for current frame
+            eye_features: Optional eye feature array for current frame
+            emotion_features: Optional emotion feature array for current frame
+            scheduler: Optional BatchInferenceScheduler shared across sessions
+
+        Returns:
+            Combined analysis dictionary, or None if no sequence is ready
+        """
+        ready = []
+        with session.lock:
+            for type_name, features in (
+                ("gesture", gesture_features),
+                ("eye", eye_features),
+                ("emotion", emotion_features),
+            ):
+                if features is not None and session.add(type_name, features):
+                    ready.append((type_name, session.sequence(type_name)))
+            for type_name, _ in ready:
+                session.reset_progress(type_name)
+
+        if not ready:
+            return None
+
+        if scheduler is not None:
+            futures = [
+                (type_name, scheduler.submit(MODALITY_MODELS[type_name], sequence))
+                for type_name, sequence in ready
+            ]
+            results = []
+            for type_name, future in futures:
+                try:
+                    result = future.result(timeout=scheduler.result_timeout)
+                except FutureTimeoutError:
+                    logger.warning(f"Batched {type_name} inference timed out")
+                    result = self._unknown_result()
+                results.append((type_name, result))
+        else:
+            results = [
+                (type_name, self.classify_sequences(MODALITY_MODELS[type_name], [sequence])[0])
+                for type_name, sequence in ready
+            ]
+
+        return self._combine_results(results)
+
+    def _combine_results(self, results):
+        """Pick the primary result, log it and build the enhanced response.
+
+        Args:
+            results: List of (type, result) tuples
+
+        Returns:
+            Dictionary with combined analysis and response
+        """
         # Select primary result based on confidence
         primary_type, primary_result = self._select_primary_result(results)
 
@@ -713,6 +733,216 @@ class TemporalNonverbalEngine:
         return f"Here's a {depth_text} of {topic}: (Academic content would be generated here based on the latest research)"
 
 
+class _SequenceRing:
+    """Fixed-size ring buffer of feature rows for one modality."""
+
+    def __init__(self, length):
+        self.length = length
+        self.data = None
+        self.pos = 0
+        self.count = 0
+
+    def append(self, features):
+        """Append a feature row; returns True once the ring is full."""
+        row = np.asarray(features, dtype=np.float32)
+        if self.data is None or self.data.shape[1] != row.shape[0]:
+            self.data = np.zeros((self.length, row.shape[0]), dtype=np.float32)
+            self.pos = 0
+            self.count = 0
+        self.data[self.pos] = row
+        self.pos = (self.pos + 1) % self.length
+        self.count = min(self.count + 1, self.length)
+        return self.count >= self.length
+
+    def sequence(self):
+        """Return the buffered rows oldest-first as a new array."""
+        if self.data is None:
+            return np.zeros((0, 0), dtype=np.float32)
+        if self.count < self.length:
+            return self.data[: self.count].copy()
+        return np.concatenate((self.data[self.pos :], self.data[: self.pos]))
+
+    def clear(self):
+        self.pos = 0
+        self.count = 0
+
+
+class TemporalSession:
+    """Per-client temporal buffers for gesture, eye and emotion features."""
+
+    def __init__(self, sequence_length=10):
+        self.sequence_length = sequence_length
+        self.rings = {name: _SequenceRing(sequence_length) for name in MODALITY_MODELS}
+        # Frames collected since the last classification, for progress reporting
+        self.progress_counts = {name: 0 for name in MODALITY_MODELS}
+        self.last_seen = time.monotonic()
+        self.lock = threading.Lock()
+
+    def add(self, type_name, features):
+        """Add one frame of features; returns True when the sequence is ready."""
+        self.last_seen = time.monotonic()
+        self.progress_counts[type_name] += 1
+        return self.rings[type_name].append(features)
+
+    def sequence(self, type_name):
+        return self.rings[type_name].sequence()
+
+    def reset_progress(self, type_name):
+        self.progress_counts[type_name] = 0
+
+    def progress(self):
+        """Fraction of a full sequence collected since the last result."""
+        return {
+            name: count / self.sequence_length
+            for name, count in self.progress_counts.items()
+        }
+
+    def clear(self):
+        with self.lock:
+            for name, ring in self.rings.items():
+                ring.clear()
+                self.progress_counts[name] = 0
+
+
+class TemporalSessionTable:
+    """Bounded table of TemporalSessions with LRU and idle eviction."""
+
+    def __init__(self, sequence_length=10, max_sessions=256, idle_timeout=600):
+        """Initialize the session table.
+
+        Args:
+            sequence_length: Length of each session's sequences
+            max_sessions: Maximum sessions kept before evicting the least recent
+            idle_timeout: Seconds without frames before a session is evicted
+        """
+        self.sequence_length = sequence_length
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id):
+        """Get or create the session for a client."""
+        with self._lock:
+            self._evict_idle()
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = TemporalSession(self.sequence_length)
+                self._sessions[session_id] = session
+                while len(self._sessions) > self.max_sessions:
+                    evicted_id, _ = self._sessions.popitem(last=False)
+                    logger.info(f"Evicted temporal session {evicted_id} (table full)")
+            else:
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def remove(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def _evict_idle(self):
+        # Sessions are kept in recency order, so idle ones sit at the front
+        cutoff = time.monotonic() - self.idle_timeout
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session.last_seen >= cutoff:
+                break
+            self._sessions.popitem(last=False)
+            logger.info(f"Evicted idle temporal session {session_id}")
+
+    def __len__(self):
+        return len(self._sessions)
+
+
+class BatchInferenceScheduler:
+    """Micro-batching scheduler for temporal LSTM inference.
+
+    Ready sequences submitted from any session are collected for up to
+    ``max_wait`` seconds, then classified with one batched predict per
+    modality on a single worker thread.
+    """
+
+    def __init__(self, engine, max_wait=0.005, max_batch=64, result_timeout=2.0):
+        """Initialize the scheduler and start its worker thread.
+
+        Args:
+            engine: TemporalNonverbalEngine providing classify_sequences
+            max_wait: Seconds to wait for more sequences after the first arrives
+            max_batch: Maximum sequences collected into one batch
+            result_timeout: Seconds a caller waits for its result before
+                answering with an unknown result
+        """
+        self.engine = engine
+        self.max_wait = max_wait
+        self.max_batch = max_batch
+        self.result_timeout = result_timeout
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, modality, sequence):
+        """Queue a sequence for classification.
+
+        Args:
+            modality: Model key ('gesture', 'eye_movement' or 'emotion')
+            sequence: (sequence_length, n_features) array
+
+        Returns:
+            Future resolving to the result dictionary
+        """
+        future = Future()
+        self._queue.put((modality, sequence, future))
+        return future
+
+    def shutdown(self):
+        """Stop the worker thread after pending work is drained."""
+        self._queue.put(None)
+        self._thread.join(timeout=1.0)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            stop = False
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._process_batch(batch)
+            if stop:
+                return
+
+    def _process_batch(self, batch):
+        by_modality = {}
+        for modality, sequence, future in batch:
+            by_modality.setdefault(modality, []).append((sequence, future))
+
+        for modality, items in by_modality.items():
+            try:
+                results = self.engine.classify_sequences(
+                    modality, [sequence for sequence, _ in items]
+                )
+            except Exception as e:
+                logger.error(f"Batched {modality} inference failed: {e}")
+                for _, future in items:
+                    future.set_exception(e)
+                continue
+            for (_, future), result in zip(items, results):
+                future.set_result(result)
+
+
 # Create singleton instance
 _temporal_engine_instance = None
 
@@ -0,0 +1,168 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Detect-then-track face localization.
+
+A full-frame Haar cascade pass is the most expensive step of eye and
+behavior tracking, yet the user's face barely moves between frames.
+FaceTracker runs a full detection only every few frames or after the
+face is lost; in between it searches a window around the last face box,
+with the cascade's size range pinned to the last face size, which is a
+small fraction of the full-frame cost and returns the same boxes.
+"""
+
+import logging
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+REDETECT_INTERVAL = 15  # Frames between full-frame detections
+ROI_MARGIN = 0.5  # Search window padding, as a fraction of the face size
+SIZE_TOLERANCE = 0.25  # Allowed change in face size between frames
+
+Box = Tuple[int, int, int, int]
+
+
+class FaceTracker:
+    """
+    Locates the primary face in successive grayscale frames.
+
+    Not tied to a camera: callers pass in each frame, so the same tracker
+    serves the webcam loop and frames uploaded by the browser.
+    """
+
+    def __init__(
+        self,
+        face_cascade,
+        scale_factor: float = 1.1,
+        min_neighbors: int = 5,
+        min_size: Tuple[int, int] = (0, 0),
+        redetect_interval: int = REDETECT_INTERVAL,
+        roi_margin: float = ROI_MARGIN,
+    ):
+        """
+        Args:
+            face_cascade: Haar cascade used for face detection
+            scale_factor: Cascade scale step
+            min_neighbors: Cascade neighbor threshold
+            min_size: Smallest face searched by a full detection ((0, 0)
+                for the cascade's own window size)
+            redetect_interval: Frames between full-frame detections
+            roi_margin: Search window padding around the last face
+        """
+        self.face_cascade = face_cascade
+        self.scale_factor = scale_factor
+        self.min_neighbors = min_neighbors
+        self.min_size = min_size
+        self.redetect_interval = redetect_interval
+        self.roi_margin = roi_margin
+
+        self.last_box: Optional[Box] = None
+        self.frames_since_detection = 0
+        self.stats = {"full_detections": 0, "roi_detections": 0, "losses": 0}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Forget the tracked face so the next frame runs a full detection"""
+        with self._lock:
+            self.last_box = None
+            self.frames_since_detection = 0
+
+    def locate(self, gray: np.ndarray) -> np.ndarray:
+        """
+        Find faces in a grayscale frame
+
+        Args:
+            gray: Grayscale frame
+
+        Returns:
+            numpy.ndarray: Face boxes (x, y, w, h) in frame coordinates; after
+            a full detection every face found, while tracking only the
+            primary face
+        """
+        with self._lock:
+            if (
+                self.last_box is not None
+                and self.frames_since_detection < self.redetect_interval
+            ):
+                box = self._search_roi(gray, self.last_box)
+                if box is not None:
+                    self.stats["roi_detections"] += 1
+                    self.frames_since_detection += 1
+                    self.last_box = box
+                    return np.array([box])
+                self.stats["losses"] += 1
+
+            return self._detect_full(gray)
+
+    def _detect_full(self, gray: np.ndarray) -> np.ndarray:
+        faces = self.face_cascade.detectMultiScale(
+            gray,
+            scaleFactor=self.scale_factor,
+            minNeighbors=self.min_neighbors,
+            minSize=self.min_size,
+        )
+        self.stats["full_detections"] += 1
+        self.frames_since_detection = 0
+        if len(faces) == 0:
+            self.last_box = None
+            return np.empty((0, 4), dtype=int)
+
+        # Track the largest face (assumed to be the user)
+        self.last_box = tuple(int(v) for v in max(faces, key=lambda f: f[2] * f[3]))
+        return np.asarray(faces)
+
+    def _search_roi(self, gray: np.ndarray, box: Box) -> Optional[Box]:
+        x, y, w, h = box
+        pad_x, pad_y = int(w * self.roi_margin), int(h * self.roi_margin)
+        x0, y0 = max(0, x - pad_x), max(0, y - pad_y)
+        x1 = min(gray.shape[1], x + w + pad_x)
+        y1 = min(gray.shape[0], y + h + pad_y)
+
+        # Only search scales near the last face size
+        min_side = max(self.min_size[0], int(min(w, h) * (1 - SIZE_TOLERANCE)))
+        max_side = int(max(w, h) * (1 + SIZE_TOLERANCE))
+        faces = self.face_cascade.detectMultiScale(
+            gray[y0:y1, x0:x1],
+            scaleFactor=self.scale_factor,
+            minNeighbors=self.min_neighbors,
+            minSize=(min_side, min_side),
+            maxSize=(max_side, max_side),
+        )
+        if len(faces) == 0:
+            return None
+
+        # Keep the candidate nearest the last face center
+        cx, cy = x + w / 2 - x0, y + h / 2 - y0
+        fx, fy, fw, fh = min(
+            faces,
+            key=lambda f: (f[0] + f[2] / 2 - cx) ** 2 + (f[1] + f[3] / 2 - cy) ** 2,
+        )
+        return (int(fx) + x0, int(fy) + y0, int(fw), int(fh))
+
+
+# ==============================================================================
+# © 2025 Everett Nathaniel Christman & Misty Gail Christman
+# The Christman AI Project — Luma Cognify AI
+# All rights reserved. Unauthorized use, replication, or derivative training 
+# of this material is prohibited.
+# Core Directive: "How can I help you love yourself more?" 
+# Autonomy & Alignment Protocol v3.0
+# ==============================================================================
@@ -0,0 +1,312 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Ranked fact search with BM25.
+
+FactSearchIndex tokenizes each fact once and keeps BM25 postings for the
+whole collection and for each topic, so a topic-filtered query only
+touches that topic's facts. Top results are picked with a heap instead
+of sorting every match, and recent query results are kept in a small
+LRU that is invalidated per partition as facts are added.
+
+Modules that learn facts call notify_fact_added(); indexes that want to
+stay current register with add_fact_listener(). Learned facts are also
+persisted by those modules, and FactFileWatcher re-reads their files, so
+an index built at startup (or in another worker process) sees them too.
+"""
+
+import heapq
+import json
+import logging
+import math
+import os
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+BM25_K1 = 1.5  # Term frequency saturation
+BM25_B = 0.75  # Document length normalization
+QUERY_CACHE_SIZE = 256
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Files the learning modules persist learned facts to
+LEARNED_FACT_FILES = (
+    os.path.join("data", "facts.json"),  # LearningJourney.add_fact
+    os.path.join("data", "knowledge", "facts.json"),  # FactManager (literature crawler)
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of a text, in order"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class _Partition:
+    """BM25 statistics and postings for one set of facts"""
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[int, int]] = {}  # term -> {fact: tf}
+        self.lengths: Dict[int, int] = {}
+        self.total_length = 0
+        self.generation = 0  # Bumped on every change
+
+    def add(self, fact_id: int, term_counts: Counter, length: int):
+        for term, count in term_counts.items():
+            self.postings.setdefault(term, {})[fact_id] = count
+        self.lengths[fact_id] = length
+        self.total_length += length
+        self.generation += 1
+
+    def scores(self, terms: List[str]) -> Dict[int, float]:
+        count = len(self.lengths)
+        if not count:
+            return {}
+        average_length = self.total_length / count
+        scores: Dict[int, float] = {}
+        for term in set(terms):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for fact_id, tf in postings.items():
+                norm = BM25_K1 * (
+                    1 - BM25_B + BM25_B * self.lengths[fact_id] / average_length
+                )
+                scores[fact_id] = scores.get(fact_id, 0.0) + idf * tf * (
+                    BM25_K1 + 1
+                ) / (tf + norm)
+        return scores
+
+
+class FactSearchIndex:
+    """
+    Incrementally updated BM25 index over facts.
+    """
+
+    def __init__(self, cache_size: int = QUERY_CACHE_SIZE):
+        """
+        Args:
+            cache_size: Number of query results kept in the LRU
+        """
+        self.facts: List[Dict[str, Any]] = []
+        self._keys = set()  # (text, topic) of every indexed fact
+        self.partitions: Dict[Optional[str], _Partition] = {None: _Partition()}
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.facts)
+
+    def add(self, fact: Dict[str, Any]) -> int:
+        """
+        Index a fact
+
+        Args:
+            fact: Fact dict with "text" and optionally "topic" and "source"
+
+        Returns:
+            int: Position of the fact in the index
+        """
+        with self._lock:
+            return self._add(fact)
+
+    def add_unique(self, fact: Dict[str, Any]) -> bool:
+        """
+        Index a fact unless one with the same text and topic is indexed
+
+        Returns:
+            bool: Whether the fact was added
+        """
+        with self._lock:
+            if (fact.get("text"), fact.get("topic")) in self._keys:
+                return False
+            self._add(fact)
+            return True
+
+    def _add(self, fact: Dict[str, Any]) -> int:
+        terms = tokenize(str(fact.get("text") or ""))
+        term_counts = Counter(terms)
+        topic = fact.get("topic")
+        fact_id = len(self.facts)
+        self.facts.append(fact)
+        self._keys.add((fact.get("text"), topic))
+        self.partitions[None].add(fact_id, term_counts, len(terms))
+        if topic is not None:
+            self.partitions.setdefault(topic, _Partition()).add(
+                fact_id, term_counts, len(terms)
+            )
+        return fact_id
+
+    def add_many(self, facts: List[Dict[str, Any]]):
+        """Index several facts"""
+        for fact in facts:
+            self.add(fact)
+
+    def search(
+        self, query: str, topic: Optional[str] = None, max_results: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the facts that best match a query
+
+        Args:
+            query: Text query
+            topic: Only search facts of this topic
+            max_results: Maximum number of results
+
+        Returns:
+            list: Matching facts as {"fact", "score"} dicts, best first
+        """
+        terms = tokenize(query)
+        key = (tuple(sorted(set(terms))), topic, max_results)
+        with self._lock:
+            partition = self.partitions.get(topic)
+            if partition is None or not terms:
+                return []
+
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == partition.generation:
+                self._cache.move_to_end(key)
+                return list(cached[1])
+
+            scores = partition.scores(terms)
+            best = heapq.nlargest(max_results, scores.items(), key=lambda x: x[1])
+            results = [
+                {"fact": self.facts[fact_id], "score": score}
+                for fact_id, score in best
+            ]
+
+            self._cache[key] = (partition.generation, results)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return list(results)
+
+
+def read_fact_file(path: str) -> List[Dict[str, Any]]:
+    """
+    Read the facts a learning module persisted
+
+    Handles LearningJourney's dict of facts keyed by id (with "content")
+    and FactManager's list of facts (with "text" and "topics").
+
+    Returns:
+        list: Facts as {"text", "topic", "source"} dicts
+    """
+    try:
+        with open(path, "r") as f:
+            stored = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"Error reading facts from {path}: {e}")
+        return []
+
+    records = stored.values() if isinstance(stored, dict) else stored
+    facts = []
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        text = record.get("text") or record.get("content")
+        if not text:
+            continue
+        topic = record.get("topic")
+        if topic is None and record.get("topics"):
+            topic = record["topics"][0]
+        facts.append({"text": text, "topic": topic, "source": record.get("source", "")})
+    return facts
+
+
+class FactFileWatcher:
+    """
+    Re-reads learned-fact files whenever they change on disk.
+    """
+
+    def __init__(self, paths=LEARNED_FACT_FILES):
+        """
+        Args:
+            paths: Fact files to watch
+        """
+        self.paths = list(paths)
+        self._mtimes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """
+        Get the facts of every file changed since the last poll
+
+        Returns:
+            list: All facts of the changed files (callers skip known ones)
+        """
+        changed = []
+        with self._lock:
+            for path in self.paths:
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                if self._mtimes.get(path) != mtime:
+                    self._mtimes[path] = mtime
+                    changed.append(path)
+        facts = []
+        for path in changed:
+            facts.extend(read_fact_file(path))
+        return facts
+
+
+# Listeners told about facts learned anywhere in the system
+_fact_listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+
+def add_fact_listener(callback: Callable[[Dict[str, Any]], None]):
+    """Register callback(fact) to be called for every newly learned fact"""
+    if callback not in _fact_listeners:
+        _fact_listeners.append(callback)
+
+
+def remove_fact_listener(callback: Callable[[Dict[str, Any]], None]):
+    if callback in _fact_listeners:
+        _fact_listeners.remove(callback)
+
+
+def notify_fact_added(text: str, topic: Optional[str] = None, source: str = ""):
+    """
+    Announce a newly learned fact to the registered listeners
+
+    Args:
+        text: Fact text
+        topic: Topic the fact belongs to
+        source: Where the fact came from
+    """
+    fact = {"text": text, "topic": topic, "source": source}
+    for callback in list(_fact_listeners):
+        try:
+            callback(fact)
+        except Exception as e:
+            logger.error(f"Error in fact listener: {e}")
+
+
+# ==============================================================================
+# © 2025 Everett Nathaniel Christman & Misty Gail Christman
+# The Christman AI Project — Luma Cognify AI
+# All rights reserved. Unauthorized use, replication, or derivative training 
+# of this material is prohibited.
+# Core Directive: "How can I help you love yourself more?" 
+# Autonomy & Alignment Protocol v3.0
+# ==============================================================================
@@ -0,0 +1,227 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Indexed knowledge graph store.
+
+Nodes and edges are kept in dicts keyed by id, with adjacency lists per
+node, so existence checks and neighborhood lookups do not scan the
+graph. Every new node or edge is appended to a JSON-lines log; the log
+is compacted into a snapshot when superseded records pile up, and a
+legacy knowledge_graph.json is imported on first use.
+"""
+
+import json
+import logging
+import os
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+
+from write_behind import AppendLog
+
+logger = logging.getLogger(__name__)
+
+COMPACT_MIN_RECORDS = 1000  # Superseded records tolerated before compacting
+
+
+class KnowledgeGraphStore:
+    """
+    Knowledge graph with id indexes, adjacency lists and an append log.
+    """
+
+    def __init__(self, log_path: str, legacy_path: Optional[str] = None):
+        """
+        Args:
+            log_path: JSON-lines log the graph is persisted to
+            legacy_path: Whole-graph JSON file to import if the log is missing
+        """
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.edges: Dict[str, Dict[str, Any]] = {}
+        self.adjacency: Dict[str, List[str]] = {}  # node id -> edge ids
+        self.log = AppendLog(log_path)
+
+        if self.log.exists():
+            for record in self.log.read():
+                self._apply(record)
+        elif legacy_path and os.path.exists(legacy_path):
+            self._import_legacy(legacy_path)
+        self._maybe_compact()
+
+    def _import_legacy(self, path: str):
+        try:
+            with open(path, "r") as f:
+                graph = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error loading {path}: {str(e)}")
+            return
+        for node in graph.get("nodes", []):
+            self._apply({"kind": "node", **node})
+        for edge in graph.get("edges", []):
+            self._apply({"kind": "edge", **edge})
+        self.log.compact(self._records())
+        logger.info(f"Imported knowledge graph with {len(self.nodes)} nodes")
+
+    def _apply(self, record: Dict[str, Any]):
+        record = dict(record)
+        kind = record.pop("kind", None)
+        if kind == "node":
+            self.nodes[record["id"]] = record
+            self.adjacency.setdefault(record["id"], [])
+        elif kind == "edge":
+            is_new = record["id"] not in self.edges
+            self.edges[record["id"]] = record
+            if is_new:
+                for node_id in {record["source"], record["target"]}:
+                    self.adjacency.setdefault(node_id, []).append(record["id"])
+
+    def _records(self) -> Iterable[Dict[str, Any]]:
+        for node in self.nodes.values():
+            yield {"kind": "node", **node}
+        for edge in self.edges.values():
+            yield {"kind": "edge", **edge}
+
+    def _maybe_compact(self):
+        live = len(self.nodes) + len(self.edges)
+        if self.log.lines - live > max(COMPACT_MIN_RECORDS, live):
+            self.log.compact(self._records())
+
+    def _write(self, record: Dict[str, Any]):
+        self._apply(record)
+        self.log.append(record)
+        self._maybe_compact()
+
+    def has_node(self, node_id: str) -> bool:
+        return node_id in self.nodes
+
+    def has_edge(self, edge_id: str) -> bool:
+        return edge_id in self.edges
+
+    def add_node(self, node_id: str, node_type: str, label: str) -> bool:
+        """
+        Add a node unless one with this id exists
+
+        Returns:
+            bool: Whether the node was added
+        """
+        if node_id in self.nodes:
+            return False
+        self._write({"kind": "node", "id": node_id, "type": node_type, "label": label})
+        return True
+
+    def add_edge(self, edge_id: str, source: str, target: str, edge_type: str) -> bool:
+        """
+        Add an edge unless one with this id exists
+
+        Returns:
+            bool: Whether the edge was added
+        """
+        if edge_id in self.edges:
+            return False
+        self._write(
+            {
+                "kind": "edge",
+                "id": edge_id,
+                "source": source,
+                "target": target,
+                "type": edge_type,
+            }
+        )
+        return True
+
+    def neighbors(self, node_id: str) -> List[str]:
+        """Ids of the nodes sharing an edge with a node"""
+        result = []
+        for edge_id in self.adjacency.get(node_id, ()):
+            edge = self.edges[edge_id]
+            other = edge["target"] if edge["source"] == node_id else edge["source"]
+            if other != node_id:
+                result.append(other)
+        return result
+
+    def to_dict(self) -> Dict[str, List[Dict[str, Any]]]:
+        """The whole graph as {"nodes": [...], "edges": [...]}"""
+        return {"nodes": list(self.nodes.values()), "edges": list(self.edges.values())}
+
+    def subgraph(
+        self,
+        node_id: Optional[str] = None,
+        depth: int = 1,
+        node_type: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        A slice of the graph
+
+        Args:
+            node_id: Center node; nodes within depth edges of it are included
+                (default: all nodes)
+            depth: Edge hops from the center node
+            node_type: Only include nodes of this type (the center always is)
+            limit: Maximum number of nodes
+
+        Returns:
+            dict: {"nodes": [...], "edges": [...]} with the edges between
+            the included nodes
+        """
+        if node_id is None:
+            candidates = iter(self.nodes)
+        elif node_id not in self.nodes:
+            return {"nodes": [], "edges": []}
+        else:
+            candidates = self._within(node_id, depth)
+
+        selected = {}
+        for candidate in candidates:
+            node = self.nodes.get(candidate)
+            if node is None:
+                continue
+            if node_type and node["type"] != node_type and candidate != node_id:
+                continue
+            selected[candidate] = node
+            if limit is not None and len(selected) >= limit:
+                break
+
+        edges = {}
+        for candidate in selected:
+            for edge_id in self.adjacency.get(candidate, ()):
+                edge = self.edges[edge_id]
+                if edge["source"] in selected and edge["target"] in selected:
+                    edges[edge_id] = edge
+        return {"nodes": list(selected.values()), "edges": list(edges.values())}
+
+    def _within(self, node_id: str, depth: int):
+        """Breadth-first node ids up to depth hops away, nearest first"""
+        seen = {node_id}
+        queue = deque([(node_id, 0)])
+        while queue:
+            current, distance = queue.popleft()
+            yield current
+            if distance >= depth:
+                continue
+            for other in self.neighbors(current):
+                if other not in seen:
+                    seen.add(other)
+                    queue.append((other, distance + 1))
+
+
+# ==============================================================================
+# © 2025 Everett Nathaniel Christman & Misty Gail Christman
+# The Christman AI Project — Luma Cognify AI
+# All rights reserved. Unauthorized use, replication, or derivative training 
+# of this material is prohibited.
+# Core Directive: "How can I help you love yourself more?" 
+# Autonomy & Alignment Protocol v3.0
+# ==============================================================================
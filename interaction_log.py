@@ -0,0 +1,238 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+
+"""
+Append-only interaction log and batched database writer.
+
+Interactions are appended to a JSON-lines file with one write per record
+on a file opened with O_APPEND, under an advisory lock, so concurrent
+gunicorn workers never lose or interleave records. A line torn by a
+crash mid-write is cut off before the next append. Database rows are
+queued and inserted in batches by a background flusher instead of a
+commit per request.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows - O_APPEND alone keeps single writes whole
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class InteractionLog:
+    """JSON-lines interaction log with safe concurrent appends."""
+
+    def __init__(self, path: str, legacy_path: Optional[str] = None):
+        """Initialize the log.
+
+        Args:
+            path: JSON-lines file to append to
+            legacy_path: Old JSON-array file migrated into the log once
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if legacy_path:
+            self._migrate_legacy(legacy_path)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append one record as a single line."""
+        line = (json.dumps(record, default=str) + "\n").encode("utf-8")
+        fd = os.open(self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            self._repair_tail(fd)
+            os.write(fd, line)
+        finally:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def _repair_tail(self, fd: int) -> None:
+        """Cut a torn last line so the next record starts on a line of its own.
+
+        Every append ends with a newline, so a file that does not was cut
+        short mid-write. A tail that still parses only lost its newline and
+        gets one; anything else is dropped. Runs with the append lock held.
+        """
+        size = os.fstat(fd).st_size
+        if size == 0 or os.pread(fd, 1, size - 1) == b"\n":
+            return
+
+        # Find the start of the torn line
+        start = size
+        while start > 0:
+            chunk_start = max(0, start - 65536)
+            newline = os.pread(fd, start - chunk_start, chunk_start).rfind(b"\n")
+            if newline >= 0:
+                start = chunk_start + newline + 1
+                break
+            start = chunk_start
+
+        try:
+            json.loads(os.pread(fd, size - start, start).decode("utf-8"))
+            os.write(fd, b"\n")
+        except ValueError:
+            os.ftruncate(fd, start)
+            logger.warning(f"Truncated torn record at the end of {self.path}")
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.iter_records()
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Stream records oldest-first without loading the whole file."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping malformed line in {self.path}")
+
+    def _migrate_legacy(self, legacy_path: str) -> None:
+        """Convert a JSON-array interaction file into the log, once.
+
+        Runs under the same lock as append so concurrent workers starting
+        together migrate exactly once.
+        """
+        if not os.path.exists(legacy_path):
+            return
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            if not os.path.exists(legacy_path) or os.fstat(fd).st_size > 0:
+                return
+            try:
+                with open(legacy_path, "r") as f:
+                    records = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.error(f"Could not migrate {legacy_path}: {str(e)}")
+                return
+            payload = "".join(json.dumps(r, default=str) + "\n" for r in records)
+            os.write(fd, payload.encode("utf-8"))
+            os.replace(legacy_path, f"{legacy_path}.migrated")
+            logger.info(f"Migrated {len(records)} interactions from {legacy_path}")
+        finally:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+
+class InteractionDBWriter:
+    """Batches UserInteraction inserts on a background thread."""
+
+    def __init__(self, app, db, batch_size: int = 50, interval: float = 2.0):
+        """Initialize the writer and start its flush thread.
+
+        Args:
+            app: Flask app, for an application context on the flush thread
+            db: Flask-SQLAlchemy instance
+            batch_size: Rows that trigger an immediate flush
+            interval: Maximum seconds the first row of a batch waits
+        """
+        self.app = app
+        self.db = db
+        self.batch_size = batch_size
+        self.interval = interval
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="interaction-db-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def submit(self, **fields) -> None:
+        """Queue a UserInteraction row (user_id, text, intent, confidence, timestamp)."""
+        self._queue.put(fields)
+
+    def _run(self) -> None:
+        while True:
+            rows = [self._queue.get()]
+            # The batch closes interval seconds after its first row, however
+            # steadily later rows keep arriving
+            deadline = time.monotonic() + self.interval
+            while len(rows) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    rows.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._flush(rows)
+
+    def flush(self) -> None:
+        """Insert everything queued so far (blocking)."""
+        rows = []
+        while True:
+            try:
+                rows.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if rows:
+            self._flush(rows)
+
+    def _flush(self, rows) -> None:
+        from models import InteractionRollup, UserInteraction
+
+        with self.app.app_context():
+            try:
+                interactions = [UserInteraction(**fields) for fields in rows]
+                rollups = InteractionRollup.tally(interactions)
+                self.db.session.add_all(interactions)
+                self.db.session.commit()
+                logger.debug(f"Saved {len(rows)} interactions to database")
+            except Exception as e:
+                self.db.session.rollback()
+                self.db.session.remove()
+                logger.error(f"Error saving interactions to database: {str(e)}")
+                return
+
+            # Rollups commit separately, so a failure there never loses raw rows
+            try:
+                InteractionRollup.add_counts(rollups)
+                self.db.session.commit()
+            except Exception as e:
+                self.db.session.rollback()
+                logger.error(f"Error updating interaction rollups: {str(e)}")
+            finally:
+                self.db.session.remove()
+
+
+# ==============================================================================
+# © 2025 Everett Nathaniel Christman & Misty Gail Christman
+# The Christman AI Project — Luma Cognify AI
+# All rights reserved. Unauthorized use, replication, or derivative training 
+# of this material is prohibited.
+# Core Directive: "How can I help you love yourself more?" 
+# Autonomy & Alignment Protocol v3.0
+# ==============================================================================
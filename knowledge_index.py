@@ -0,0 +1,274 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Persistent index over the learned knowledge files.
+
+Each domain directory under the knowledge directory holds one JSON file
+per learned topic. KnowledgeIndex parses each file once, keeping its
+token set, searchable text and summary fields, plus token postings
+across files, and saves all of it to an index file so a restart does
+not re-read the knowledge base. Files are re-checked by size and mtime
+on a polling interval, and only new or changed files are parsed again.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from write_behind import WriteBehindPersister
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".knowledge_index.json"
+INDEX_VERSION = 1
+REFRESH_INTERVAL = 5.0  # Seconds between checks for changed files
+EXCLUDED_DIRS = {"generated_code"}
+
+TOKEN_PATTERN = re.compile(r"\b\w+\b")
+
+
+def tokenize(text: str) -> Set[str]:
+    """Lowercase word tokens of a text"""
+    return set(TOKEN_PATTERN.findall(text.lower()))
+
+
+def searchable_text(data: Dict[str, Any]) -> str:
+    """Text of a knowledge file that questions are matched against"""
+    return " ".join(
+        [
+            str(data.get("topic", "")),
+            str(data.get("summary", "")),
+            str(data.get("key_concepts", [])),
+            str(data.get("practical_applications", [])),
+        ]
+    ).lower()
+
+
+class KnowledgeIndex:
+    """
+    Token index over the JSON knowledge files of a knowledge directory.
+    """
+
+    def __init__(
+        self,
+        knowledge_dir,
+        index_path: Optional[str] = None,
+        refresh_interval: float = REFRESH_INTERVAL,
+    ):
+        """
+        Args:
+            knowledge_dir: Directory with one subdirectory per domain
+            index_path: Where the index is saved (default: inside knowledge_dir)
+            refresh_interval: Seconds between checks for changed files
+        """
+        self.knowledge_dir = Path(knowledge_dir)
+        self.index_path = index_path or str(self.knowledge_dir / INDEX_FILENAME)
+        self.refresh_interval = refresh_interval
+
+        # Relative path -> {"mtime", "size", "words", "content", "item"}
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.postings: Dict[str, Set[str]] = {}
+        self.last_refresh = 0.0
+        self._lock = threading.RLock()
+
+        self._load()
+        self.persister = WriteBehindPersister(
+            "knowledge-index", self.index_path, self._serialize
+        )
+
+    def __len__(self):
+        return len(self.documents)
+
+    def _load(self):
+        try:
+            with open(self.index_path, "r") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        if saved.get("version") != INDEX_VERSION:
+            return
+        for path, document in saved.get("documents", {}).items():
+            self._add(path, document)
+        logger.info(f"Loaded knowledge index with {len(self.documents)} files")
+
+    def _serialize(self) -> bytes:
+        with self._lock:
+            return json.dumps(
+                {"version": INDEX_VERSION, "documents": self.documents}
+            ).encode("utf-8")
+
+    def _add(self, path: str, document: Dict[str, Any]):
+        self.documents[path] = document
+        for word in document["words"]:
+            self.postings.setdefault(word, set()).add(path)
+
+    def _remove(self, path: str):
+        document = self.documents.pop(path, None)
+        if not document:
+            return
+        for word in document["words"]:
+            paths = self.postings.get(word)
+            if paths is not None:
+                paths.discard(path)
+                if not paths:
+                    del self.postings[word]
+
+    def _scan(self) -> Dict[str, os.stat_result]:
+        """Stat every knowledge file without opening it"""
+        found = {}
+        if not self.knowledge_dir.is_dir():
+            return found
+        with os.scandir(self.knowledge_dir) as domains:
+            for domain in domains:
+                if not domain.is_dir() or domain.name in EXCLUDED_DIRS:
+                    continue
+                with os.scandir(domain.path) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".json") and entry.is_file():
+                            path = f"{domain.name}/{entry.name}"
+                            found[path] = entry.stat()
+        return found
+
+    def _parse(self, path: str, stat: os.stat_result) -> Dict[str, Any]:
+        document = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "words": [],
+            "content": "",
+            "item": None,
+        }
+        try:
+            with open(self.knowledge_dir / path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # Remember unreadable files too, so they are not re-read until
+            # they change
+            return document
+        if not isinstance(data, dict):
+            return document
+
+        content = searchable_text(data)
+        document["words"] = sorted(tokenize(content))
+        document["content"] = content
+        document["item"] = {
+            "topic": data.get("topic", ""),
+            "domain": data.get("domain", ""),
+            "summary": data.get("summary", ""),
+            "key_concepts": data.get("key_concepts", []),
+            "applications": data.get("practical_applications", []),
+            "learned_at": data.get("learned_at", ""),
+        }
+        return document
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        Re-index new, changed and deleted files
+
+        Args:
+            force: Check now even if the refresh interval has not passed
+
+        Returns:
+            int: Number of files added, updated or removed
+        """
+        with self._lock:
+            now = time.time()
+            if not force and now - self.last_refresh < self.refresh_interval:
+                return 0
+            self.last_refresh = now
+
+            found = self._scan()
+            changes = 0
+            for path in set(self.documents) - set(found):
+                self._remove(path)
+                changes += 1
+            for path, stat in found.items():
+                document = self.documents.get(path)
+                if (
+                    document is not None
+                    and document["mtime"] == stat.st_mtime_ns
+                    and document["size"] == stat.st_size
+                ):
+                    continue
+                self._remove(path)
+                self._add(path, self._parse(path, stat))
+                changes += 1
+
+        if changes:
+            self.persister.mark_dirty(changes)
+            logger.info(f"Knowledge index refreshed: {changes} files changed")
+        return changes
+
+    def search(
+        self, question: str, min_relevance: float = 0.15
+    ) -> List[Dict[str, Any]]:
+        """
+        Find knowledge files relevant to a question
+
+        Relevance is the share of question words found in a file, boosted
+        by half when any whitespace-separated question term appears in the
+        file's text verbatim.
+
+        Args:
+            question: User's question
+            min_relevance: Relevance a file must exceed to be returned
+
+        Returns:
+            list: Summary fields of each relevant file with its "relevance"
+            (capped at 1.0), most relevant first
+        """
+        self.refresh()
+
+        question_lower = question.lower()
+        question_words = tokenize(question_lower)
+        if not question_words:
+            return []
+        terms = question_lower.split()
+
+        with self._lock:
+            overlap = Counter()
+            for word in question_words:
+                overlap.update(self.postings.get(word, ()))
+
+            results = []
+            for path, count in overlap.items():
+                document = self.documents[path]
+                relevance = count / len(question_words)
+                if any(term in document["content"] for term in terms):
+                    relevance *= 1.5
+                if relevance > min_relevance:
+                    results.append(
+                        dict(document["item"], relevance=min(relevance, 1.0))
+                    )
+
+        results.sort(key=lambda item: item["relevance"], reverse=True)
+        return results
+
+
+# ==============================================================================
+# © 2025 Everett Nathaniel Christman & Misty Gail Christman
+# The Christman AI Project — Luma Cognify AI
+# All rights reserved. Unauthorized use, replication, or derivative training 
+# of this material is prohibited.
+# Core Directive: "How can I help you love yourself more?" 
+# Autonomy & Alignment Protocol v3.0
+# ==============================================================================
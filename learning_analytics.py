@@ -22,7 +22,13 @@ from datetime import datetime, timedelta
 import numpy as np
 
 from app_init import db
-from models import CommunicationProfile, User, UserInteraction, UserPreference
+from models import (
+    CommunicationProfile,
+    InteractionRollup,
+    User,
+    UserInteraction,
+    UserPreference,
+)
 
 # Setup logging
 logging.basicConfig(level=logging.DEBUG)
@@ -51,37 +57,32 @@ class LearningAnalytics:
         if not self.user_id:
             return {"labels": [], "data": []}
 
-        # Define time period
+        # Define time period; the week view uses hourly rollups so the
+        # window starts at the same hour as before
         if period == "week":
             start_date = datetime.now() - timedelta(days=7)
             date_format = "%A"  # Day name
             groupby_format = "%w"  # Day of week (0-6)
+            granularity = "hour"
         elif period == "month":
             start_date = datetime.now() - timedelta(days=30)
             date_format = "Week %U"  # Week number
             groupby_format = "%U"  # Week of year
+            granularity = "day"
         elif period == "year":
             start_date = datetime.now() - timedelta(days=365)
             date_format = "%b"  # Month abbreviation
             groupby_format = "%m"  # Month (01-12)
+            granularity = "day"
         else:
             return {"labels": [], "data": []}
 
-        # Get interactions for the user
-        interactions = UserInteraction.query.filter(
-            UserInteraction.user_id == self.user_id,
-            UserInteraction.timestamp >= start_date,
-        ).all()
-
-        # Count interactions by date
-        interaction_counts = {}
-
-        for interaction in interactions:
-            date_key = interaction.timestamp.strftime(groupby_format)
-            if date_key in interaction_counts:
-                interaction_counts[date_key] += 1
-            else:
-                interaction_counts[date_key] = 1
+        # Count interactions by date from the pre-aggregated rollups
+        interaction_counts = Counter()
+        for bucket_start, count in InteractionRollup.counts_by_bucket(
+            self.user_id, granularity, start_date
+        ):
+            interaction_counts[bucket_start.strftime(groupby_format)] += count
 
         # Format for charts
         if period == "week":
@@ -141,26 +142,12 @@ class LearningAnalytics:
         if not self.user_id:
             return {"labels": [], "data": []}
 
-        # Get all interactions for the user
-        interactions = UserInteraction.query.filter_by(user_id=self.user_id).all()
-
         # Count by interaction type
         method_counts = {"text": 0, "gesture": 0, "symbol": 0, "eye": 0, "sound": 0}
 
-        for interaction in interactions:
-            if not interaction.text:
-                continue
-
-            if interaction.text.startswith("symbol:"):
-                method_counts["symbol"] += 1
-            elif interaction.text.startswith("gesture:"):
-                method_counts["gesture"] += 1
-            elif interaction.text.startswith("eye:"):
-                method_counts["eye"] += 1
-            elif interaction.text.startswith("sound:"):
-                method_counts["sound"] += 1
-            else:
-                method_counts["text"] += 1
+        for method, count in InteractionRollup.counts_by(self.user_id, "method").items():
+            if method in method_counts:
+                method_counts[method] += count
 
         # Ensure we have some data for visualization purposes
         # Production systems would remove this
@@ -194,69 +181,34 @@ class LearningAnalytics:
                 "multimodal_percentage": 0,
             }
 
-        # Get all interactions
-        all_interactions = UserInteraction.query.filter_by(user_id=self.user_id).all()
+        # Totals come from the rollups instead of the raw interaction history
+        # Cutoff date for recent data (last 2 weeks)
+        recent_cutoff = datetime.now() - timedelta(days=14)
 
-        # Calculate metrics
-        # 1. Vocabulary growth
-        vocabulary = set()
-        recent_vocabulary = set()
+        # 1. Vocabulary growth (distinct expressions)
+        vocabulary_count = InteractionRollup.vocabulary_size(self.user_id)
+        recent_vocabulary_count = InteractionRollup.vocabulary_size(
+            self.user_id, since=recent_cutoff
+        )
 
-        # 2. Expression clarity (confidence scores)
-        confidence_scores = []
-        recent_confidence_scores = []
+        # 2. Expression clarity (confidence scores) and 3. multimodal usage
+        totals = InteractionRollup.method_totals(self.user_id)
+        recent_totals = InteractionRollup.method_totals(
+            self.user_id, since=recent_cutoff
+        )
 
-        # 3. Multimodal usage
-        interaction_types = []
-        recent_interaction_types = []
+        def average_confidence(by_method):
+            confidence_sum = sum(t[1] for t in by_method.values())
+            confidence_count = sum(t[2] for t in by_method.values())
+            return confidence_sum / confidence_count if confidence_count else 0.5
 
-        # Cutoff date for recent data (last 2 weeks)
-        recent_cutoff = datetime.now() - timedelta(days=14)
-
-        for interaction in all_interactions:
-            if not interaction.text:
-                continue
-
-            # Get base content without prefix
-            content = interaction.text
-            if ":" in content:
-                parts = content.split(":", 1)
-                if len(parts) > 1:
-                    content = parts[1].strip()
-
-            # Add to vocabulary sets
-            if content:
-                vocabulary.add(content.lower())
-                if interaction.timestamp >= recent_cutoff:
-                    recent_vocabulary.add(content.lower())
-
-            # Add to confidence scores
-            if interaction.confidence:
-                confidence_scores.append(interaction.confidence)
-                if interaction.timestamp >= recent_cutoff:
-                    recent_confidence_scores.append(interaction.confidence)
-
-            # Add to interaction types
-            interaction_type = "text"
-            if interaction.text.startswith("symbol:"):
-                interaction_type = "symbol"
-            elif interaction.text.startswith("gesture:"):
-                interaction_type = "gesture"
-            elif interaction.text.startswith("eye:"):
-                interaction_type = "eye"
-            elif interaction.text.startswith("sound:"):
-                interaction_type = "sound"
-
-            interaction_types.append(interaction_type)
-            if interaction.timestamp >= recent_cutoff:
-                recent_interaction_types.append(interaction_type)
+        interaction_count = sum(t[0] for t in totals.values())
+        recent_interaction_count = sum(t[0] for t in recent_totals.values())
 
         # For a real application, these would be calculated from long-term historical data
         # For demonstration, we'll use placeholder calculations
 
         # 1. Vocabulary growth (% increase in unique expressions)
-        vocabulary_count = len(vocabulary)
-        recent_vocabulary_count = len(recent_vocabulary)
         vocabulary_growth = 15  # Sample growth %
         vocabulary_percentage = min(100, max(0, vocabulary_count * 5))  # Scale for demo
 
@@ -269,10 +221,8 @@ class LearningAnalytics:
                 )
 
         # 2. Expression clarity (confidence improvement)
-        avg_confidence = np.mean(confidence_scores) if confidence_scores else 0.5
-        recent_avg_confidence = (
-            np.mean(recent_confidence_scores) if recent_confidence_scores else 0.5
-        )
+        avg_confidence = average_confidence(totals)
+        recent_avg_confidence = average_confidence(recent_totals)
         expression_growth = 8  # Sample growth %
         expression_percentage = min(100, max(0, int(avg_confidence * 100)))
 
@@ -285,13 +235,13 @@ class LearningAnalytics:
                 )
 
         # 3. Multimodal usage (variety of input methods)
-        unique_types = len(set(interaction_types))
-        recent_unique_types = len(set(recent_interaction_types))
+        unique_types = len(totals)
+        recent_unique_types = len(recent_totals)
         multimodal_growth = 23  # Sample growth %
         multimodal_percentage = min(100, max(0, unique_types * 20))  # Scale for demo
 
         # If we have real data, calculate growth
-        if len(interaction_types) > len(recent_interaction_types) and unique_types > 0:
+        if interaction_count > recent_interaction_count and unique_types > 0:
             old_unique_types = unique_types - recent_unique_types
             if old_unique_types > 0:
                 multimodal_growth = int(
@@ -319,31 +269,12 @@ class LearningAnalytics:
         if not self.user_id:
             return []
 
-        # Get all interactions
-        interactions = UserInteraction.query.filter_by(user_id=self.user_id).all()
-
-        # Extract expressions
-        expressions = []
-        for interaction in interactions:
-            if not interaction.text:
-                continue
-
-            # Get base content without prefix
-            content = interaction.text
-            if ":" in content:
-                parts = content.split(":", 1)
-                if len(parts) > 1:
-                    content = parts[1].strip()
-
-            if content:
-                expressions.append(content)
-
-        # Count frequencies
-        counter = Counter(expressions)
-
-        # Convert to list and sort
+        # Expression counts are kept per day in the rollups
         frequent_expressions = [
-            {"text": text, "count": count} for text, count in counter.most_common(limit)
+            {"text": expression, "count": count}
+            for expression, count in InteractionRollup.frequent_expressions(
+                self.user_id, limit
+            )
         ]
 
         return frequent_expressions
@@ -362,41 +293,24 @@ class LearningAnalytics:
 
         profile = CommunicationProfile.get_latest_profile(self.user_id)
 
-        # Get interactions
-        interactions = UserInteraction.query.filter_by(user_id=self.user_id).all()
-
-        # Analyze patterns
-        interaction_types = []
-        intent_counts = {}
-        expression_counts = {}
-
-        for interaction in interactions:
-            # Track input modality
-            interaction_type = "text"
-            if interaction.text:
-                if interaction.text.startswith("symbol:"):
-                    interaction_type = "symbol"
-                elif interaction.text.startswith("gesture:"):
-                    interaction_type = "gesture"
-                elif interaction.text.startswith("eye:"):
-                    interaction_type = "eye"
-                elif interaction.text.startswith("sound:"):
-                    interaction_type = "sound"
-
-            interaction_types.append(interaction_type)
-
-            # Track intent usage
-            if interaction.intent:
-                if interaction.intent in intent_counts:
-                    intent_counts[interaction.intent] += 1
-                else:
-                    intent_counts[interaction.intent] = 1
+        # Analyze patterns from the rollups; interactions without text count
+        # as text input here
+        modality_counter = Counter()
+        for method, count in InteractionRollup.counts_by(self.user_id, "method").items():
+            modality_counter["text" if method == "none" else method] += count
+
+        intent_counts = {
+            intent: count
+            for intent, count in InteractionRollup.counts_by(
+                self.user_id, "intent"
+            ).items()
+            if intent
+        }
 
         # Generate suggestions
         suggestions = []
 
         # Communication mode suggestions
-        modality_counter = Counter(interaction_types)
         primary_mode = (
             modality_counter.most_common(1)[0][0] if modality_counter else "text"
         )
@@ -498,6 +412,7 @@ class LearningAnalytics:
         )
 
         db.session.add(interaction)
+        InteractionRollup.record([interaction])
         db.session.commit()
 
         return interaction
@@ -643,6 +558,7 @@ class LearningAnalytics:
         for pref in preferences:
             db.session.add(pref)
 
+        InteractionRollup.record(interactions)
         db.session.commit()
 
         return interactions
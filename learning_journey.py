@@ -25,10 +25,14 @@ import json
 import os
 import logging
 import datetime
-from collections import defaultdict
-from typing import Dict, List, Any, Optional
+from collections import defaultdict, deque
+from typing import Dict, Iterable, List, Any, Optional, Set
 import threading
 
+from fact_search import notify_fact_added
+from graph_store import KnowledgeGraphStore
+from write_behind import AppendLog
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -37,9 +41,12 @@ logger = logging.getLogger(__name__)
 
 # Constants
 DATA_DIR = "data"
-LEARNING_DATA_PATH = os.path.join(DATA_DIR, "learning_log.json")
+LEARNING_LOG_PATH = os.path.join(DATA_DIR, "learning_log.jsonl")
 TOPICS_PATH = os.path.join(DATA_DIR, "topics.json")
 FACTS_PATH = os.path.join(DATA_DIR, "facts.json")
+KNOWLEDGE_GRAPH_LOG_PATH = os.path.join(DATA_DIR, "knowledge_graph.jsonl")
+# Whole-file formats of the learning log and graph, imported once
+LEARNING_DATA_PATH = os.path.join(DATA_DIR, "learning_log.json")
 KNOWLEDGE_GRAPH_PATH = os.path.join(DATA_DIR, "knowledge_graph.json")
 os.makedirs(DATA_DIR, exist_ok=True)
 
@@ -70,13 +77,25 @@ class LearningJourney:
 
     def _initialize(self):
         """Initialize the learning journey manager."""
-        self.learning_log = self._load_json(LEARNING_DATA_PATH, default=[])
+        self.event_log = AppendLog(LEARNING_LOG_PATH)
+        if self.event_log.exists():
+            self.learning_log = list(self.event_log.read())
+        else:
+            self.learning_log = self._load_json(LEARNING_DATA_PATH, default=[])
+            if self.learning_log:
+                self.event_log.compact(self.learning_log)
         self.topics = self._load_json(TOPICS_PATH, default=[])
         self.facts = self._load_json(FACTS_PATH, default={})
-        self.knowledge_graph = self._load_json(
-            KNOWLEDGE_GRAPH_PATH, default={"nodes": [], "edges": []}
-        )
+        self.graph = KnowledgeGraphStore(KNOWLEDGE_GRAPH_LOG_PATH, KNOWLEDGE_GRAPH_PATH)
         self._initialize_default_topics()
+        self.topic_index: Dict[str, Dict[str, Any]] = {}
+        for topic in self.topics:
+            self.topic_index.setdefault(topic["name"], topic)
+        # Goal name -> topics the goal needs, in learning order
+        self._prerequisite_closures: Dict[str, List[Dict[str, Any]]] = {}
+        self.explored_topics: Dict[str, Set[str]] = defaultdict(set)
+        for event in self.learning_log:
+            self._record_explored(event)
         logger.info("LearningJourney initialized")
 
     def _initialize_default_topics(self):
@@ -171,7 +190,8 @@ class LearningJourney:
             }
 
             self.learning_log.append(event)
-            self._save_json(self.learning_log, LEARNING_DATA_PATH)
+            self.event_log.append(event)
+            self._record_explored(event)
 
             if event_type in [
                 "topic_explored",
@@ -335,12 +355,7 @@ class LearningJourney:
             List of recommended topics
         """
         try:
-            user_events = [e for e in self.learning_log if e["user_id"] == user_id]
-            explored_topics = set(
-                e["details"]["topic"]
-                for e in user_events
-                if e["event_type"] == "topic_explored" and "topic" in e["details"]
-            )
+            explored_topics = self.explored_topics.get(user_id, set())
 
             # Filter unexplored topics
             unexplored_topics = [
@@ -382,9 +397,9 @@ class LearningJourney:
             The newly added topic
         """
         try:
-            if any(t["name"] == name for t in self.topics):
+            if name in self.topic_index:
                 logger.warning(f"Topic {name} already exists")
-                return next(t for t in self.topics if t["name"] == name)
+                return self.topic_index[name]
 
             topic = {
                 "id": len(self.topics) + 1,
@@ -395,6 +410,9 @@ class LearningJourney:
             }
 
             self.topics.append(topic)
+            self.topic_index[name] = topic
+            # The new topic may be a prerequisite that did not resolve before
+            self._prerequisite_closures.clear()
             self._save_json(self.topics, TOPICS_PATH)
             self._add_topic_to_knowledge_graph(topic)
 
@@ -429,6 +447,7 @@ class LearningJourney:
             self.facts[fact_id] = fact
             self._save_json(self.facts, FACTS_PATH)
             self._add_fact_to_knowledge_graph(fact)
+            notify_fact_added(content, topic, source)
 
             logger.info(f"Added fact: {fact_id}")
             return fact
@@ -441,48 +460,14 @@ class LearningJourney:
         try:
             if event["event_type"] == "topic_explored" and "topic" in event["details"]:
                 topic = event["details"]["topic"]
-                if not any(n["id"] == topic for n in self.knowledge_graph["nodes"]):
-                    self.knowledge_graph["nodes"].append(
-                        {"id": topic, "type": "topic", "label": topic}
-                    )
+                self.graph.add_node(topic, "topic", topic)
 
             elif (
                 event["event_type"] == "fact_learned" and "fact_id" in event["details"]
             ):
                 fact_id = event["details"]["fact_id"]
                 if fact_id in self.facts:
-                    fact = self.facts[fact_id]
-                    topic = fact["topic"]
-                    if not any(
-                        n["id"] == fact_id for n in self.knowledge_graph["nodes"]
-                    ):
-                        self.knowledge_graph["nodes"].append(
-                            {
-                                "id": fact_id,
-                                "type": "fact",
-                                "label": (
-                                    fact["content"][:30] + "..."
-                                    if len(fact["content"]) > 30
-                                    else fact["content"]
-                                ),
-                            }
-                        )
-                    if not any(n["id"] == topic for n in self.knowledge_graph["nodes"]):
-                        self.knowledge_graph["nodes"].append(
-                            {"id": topic, "type": "topic", "label": topic}
-                        )
-                    edge_id = f"{fact_id}_{topic}"
-                    if not any(
-                        e["id"] == edge_id for e in self.knowledge_graph["edges"]
-                    ):
-                        self.knowledge_graph["edges"].append(
-                            {
-                                "id": edge_id,
-                                "source": fact_id,
-                                "target": topic,
-                                "type": "belongs_to",
-                            }
-                        )
+                    self._add_fact_to_knowledge_graph(self.facts[fact_id])
 
             elif (
                 event["event_type"] == "concept_connected"
@@ -491,18 +476,12 @@ class LearningJourney:
                 concepts = event["details"]["concepts"]
                 for i in range(len(concepts)):
                     for j in range(i + 1, len(concepts)):
-                        edge_id = f"{concepts[i]}_{concepts[j]}"
-                        if not any(
-                            e["id"] == edge_id for e in self.knowledge_graph["edges"]
-                        ):
-                            self.knowledge_graph["edges"].append(
-                                {
-                                    "id": edge_id,
-                                    "source": concepts[i],
-                                    "target": concepts[j],
-                                    "type": "connected",
-                                }
-                            )
+                        self.graph.add_edge(
+                            f"{concepts[i]}_{concepts[j]}",
+                            concepts[i],
+                            concepts[j],
+                            "connected",
+                        )
 
             elif (
                 event["event_type"] == "gesture_learned"
@@ -510,92 +489,107 @@ class LearningJourney:
             ):
                 gesture = event["details"]["gesture"]
                 topic = event["details"].get("topic", "Gestures")
-                if not any(n["id"] == gesture for n in self.knowledge_graph["nodes"]):
-                    self.knowledge_graph["nodes"].append(
-                        {"id": gesture, "type": "gesture", "label": gesture}
-                    )
-                if not any(n["id"] == topic for n in self.knowledge_graph["nodes"]):
-                    self.knowledge_graph["nodes"].append(
-                        {"id": topic, "type": "topic", "label": topic}
-                    )
-                edge_id = f"{gesture}_{topic}"
-                if not any(e["id"] == edge_id for e in self.knowledge_graph["edges"]):
-                    self.knowledge_graph["edges"].append(
-                        {
-                            "id": edge_id,
-                            "source": gesture,
-                            "target": topic,
-                            "type": "learned_in",
-                        }
-                    )
-
-            self._save_json(self.knowledge_graph, KNOWLEDGE_GRAPH_PATH)
+                self.graph.add_node(gesture, "gesture", gesture)
+                self.graph.add_node(topic, "topic", topic)
+                self.graph.add_edge(f"{gesture}_{topic}", gesture, topic, "learned_in")
         except Exception as e:
             logger.error(f"Error updating knowledge graph: {str(e)}")
 
     def _add_topic_to_knowledge_graph(self, topic: Dict[str, Any]) -> None:
         """Add a topic to the knowledge graph."""
         try:
-            if not any(n["id"] == topic["name"] for n in self.knowledge_graph["nodes"]):
-                self.knowledge_graph["nodes"].append(
-                    {"id": topic["name"], "type": "topic", "label": topic["name"]}
-                )
+            self.graph.add_node(topic["name"], "topic", topic["name"])
             for prereq in topic["prerequisites"]:
-                if not any(n["id"] == prereq for n in self.knowledge_graph["nodes"]):
-                    self.knowledge_graph["nodes"].append(
-                        {"id": prereq, "type": "topic", "label": prereq}
-                    )
-                edge_id = f"{prereq}_{topic['name']}"
-                if not any(e["id"] == edge_id for e in self.knowledge_graph["edges"]):
-                    self.knowledge_graph["edges"].append(
-                        {
-                            "id": edge_id,
-                            "source": prereq,
-                            "target": topic["name"],
-                            "type": "prerequisite",
-                        }
-                    )
-            self._save_json(self.knowledge_graph, KNOWLEDGE_GRAPH_PATH)
+                self.graph.add_node(prereq, "topic", prereq)
+                self.graph.add_edge(
+                    f"{prereq}_{topic['name']}", prereq, topic["name"], "prerequisite"
+                )
         except Exception as e:
             logger.error(f"Error adding topic to knowledge graph: {str(e)}")
 
     def _add_fact_to_knowledge_graph(self, fact: Dict[str, Any]) -> None:
         """Add a fact to the knowledge graph."""
         try:
-            if not any(n["id"] == fact["id"] for n in self.knowledge_graph["nodes"]):
-                self.knowledge_graph["nodes"].append(
-                    {
-                        "id": fact["id"],
-                        "type": "fact",
-                        "label": (
-                            fact["content"][:30] + "..."
-                            if len(fact["content"]) > 30
-                            else fact["content"]
-                        ),
-                    }
-                )
+            label = (
+                fact["content"][:30] + "..."
+                if len(fact["content"]) > 30
+                else fact["content"]
+            )
+            self.graph.add_node(fact["id"], "fact", label)
             topic = fact["topic"]
-            if not any(n["id"] == topic for n in self.knowledge_graph["nodes"]):
-                self.knowledge_graph["nodes"].append(
-                    {"id": topic, "type": "topic", "label": topic}
-                )
-            edge_id = f"{fact['id']}_{topic}"
-            if not any(e["id"] == edge_id for e in self.knowledge_graph["edges"]):
-                self.knowledge_graph["edges"].append(
-                    {
-                        "id": edge_id,
-                        "source": fact["id"],
-                        "target": topic,
-                        "type": "belongs_to",
-                    }
-                )
-            self._save_json(self.knowledge_graph, KNOWLEDGE_GRAPH_PATH)
+            self.graph.add_node(topic, "topic", topic)
+            self.graph.add_edge(
+                f"{fact['id']}_{topic}", fact["id"], topic, "belongs_to"
+            )
         except Exception as e:
             logger.error(f"Error adding fact to knowledge graph: {str(e)}")
 
-    def get_knowledge_graph(self) -> Dict[str, Any]:
-        """Get the knowledge graph."""
-        return self.knowledge_graph
+    @property
+    def knowledge_graph(self) -> Dict[str, Any]:
+        """The whole knowledge graph as {"nodes": [...], "edges": [...]}."""
+        return self.graph.to_dict()
+
+    def get_knowledge_graph(
+        self,
+        node_id: Optional[str] = None,
+        depth: int = 1,
+        node_type: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get the knowledge graph, or a slice of it.
+
+        Args:
+            node_id: Only include nodes within depth edges of this node
+            depth: Edge hops from node_id
+            node_type: Only include nodes of this type
+            limit: Maximum number of nodes
+
+        Returns:
+            Dict with the "nodes" and "edges" of the graph or slice
+        """
+        if node_id is None and node_type is None and limit is None:
+            return self.graph.to_dict()
+        return self.graph.subgraph(node_id, depth, node_type, limit)
+
+    def _record_explored(self, event: Dict[str, Any]) -> None:
+        """Add a topic_explored event to its user's explored-topic set."""
+        if event.get("event_type") == "topic_explored" and "topic" in event.get(
+            "details", {}
+        ):
+            self.explored_topics[event["user_id"]].add(event["details"]["topic"])
+
+    def _prerequisite_closure(self, goal_topic: str) -> List[Dict[str, Any]]:
+        """
+        Get a goal topic and all of its prerequisites, in learning order.
+
+        Closures are memoized until add_topic changes the topic set.
+        """
+        closure = self._prerequisite_closures.get(goal_topic)
+        if closure is not None:
+            return closure
+
+        goal = self.topic_index.get(goal_topic)
+        if not goal:
+            return []
+
+        closure = []
+        queue = deque([goal])
+        visited = set()
+        while queue:
+            current = queue.popleft()
+            if current["name"] in visited:
+                continue
+            visited.add(current["name"])
+            closure.append(current)
+            for prereq_name in current["prerequisites"]:
+                prereq = self.topic_index.get(prereq_name)
+                if prereq and prereq_name not in visited:
+                    queue.append(prereq)
+
+        closure.reverse()
+        self._prerequisite_closures[goal_topic] = closure
+        return closure
 
     def get_learning_path(self, user_id: str, goal_topic: str) -> List[Dict[str, Any]]:
         """
@@ -608,45 +602,38 @@ class LearningJourney:
         Returns:
             List of steps in the learning path
         """
-        try:
-            user_events = [e for e in self.learning_log if e["user_id"] == user_id]
-            explored_topics = set(
-                e["details"]["topic"]
-                for e in user_events
-                if e["event_type"] == "topic_explored" and "topic" in e["details"]
-            )
+        return self.get_learning_paths(user_id, [goal_topic]).get(goal_topic, [])
 
-            goal = next((t for t in self.topics if t["name"] == goal_topic), None)
-            if not goal:
-                logger.warning(f"Goal topic {goal_topic} not found")
-                return []
+    def get_learning_paths(
+        self, user_id: str, goal_topics: Iterable[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Generate personalized learning paths to several goal topics at once.
 
-            path = []
-            queue = [goal]
-            visited = set()
+        Args:
+            user_id: Unique identifier for the user
+            goal_topics: The topics the user wants to learn
 
-            while queue:
-                current = queue.pop(0)
-                if current["name"] in visited:
+        Returns:
+            Dict mapping each goal topic to its learning path
+        """
+        paths = {}
+        try:
+            explored_topics = self.explored_topics.get(user_id, set())
+            for goal_topic in goal_topics:
+                if goal_topic not in self.topic_index:
+                    logger.warning(f"Goal topic {goal_topic} not found")
+                    paths[goal_topic] = []
                     continue
-                visited.add(current["name"])
-                if current["name"] not in explored_topics:
-                    path.append(current)
-                for prereq_name in current["prerequisites"]:
-                    prereq = next(
-                        (t for t in self.topics if t["name"] == prereq_name), None
-                    )
-                    if prereq and prereq_name not in visited:
-                        queue.append(prereq)
-
-            path.reverse()
-            logger.info(
-                f"Generated learning path for user {user_id} to {goal_topic}: {len(path)} steps"
-            )
-            return path
+                paths[goal_topic] = [
+                    topic
+                    for topic in self._prerequisite_closure(goal_topic)
+                    if topic["name"] not in explored_topics
+                ]
+            logger.info(f"Generated {len(paths)} learning path(s) for user {user_id}")
         except Exception as e:
             logger.error(f"Error generating learning path for user {user_id}: {str(e)}")
-            return []
+        return paths
 
     def get_topics(self) -> List[Dict[str, Any]]:
         """Get all available topics."""
@@ -654,7 +641,7 @@ class LearningJourney:
 
     def get_topic_by_name(self, topic_name: str) -> Optional[Dict[str, Any]]:
         """Get a topic by its name."""
-        return next((t for t in self.topics if t["name"] == topic_name), None)
+        return self.topic_index.get(topic_name)
 
     def get_fact(self, fact_id: str) -> Optional[Dict[str, Any]]:
         """Get a fact by its ID."""
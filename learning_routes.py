@@ -176,8 +176,13 @@ def api_get_facts():
 
 @learning_bp.route("/api/graph", methods=["GET"])
 def api_get_graph():
-    """API endpoint to get the knowledge graph data."""
-    graph = learning_journey.get_knowledge_graph()
+    """API endpoint to get the knowledge graph data, optionally a slice of it."""
+    graph = learning_journey.get_knowledge_graph(
+        node_id=request.args.get("node"),
+        depth=request.args.get("depth", 1, type=int),
+        node_type=request.args.get("type"),
+        limit=request.args.get("limit", type=int),
+    )
     return jsonify(graph)
 
 
@@ -198,6 +203,16 @@ def api_recommend_topics():
     return jsonify(recommendations)
 
 
+@learning_bp.route("/api/paths", methods=["GET"])
+def api_learning_paths():
+    """API endpoint to get learning paths to goal topics (default: all topics)."""
+    user_id = session.get("user_id", "default_user")
+    goals = request.args.getlist("goal") or [
+        t["name"] for t in learning_journey.get_topics()
+    ]
+    return jsonify(learning_journey.get_learning_paths(user_id, goals))
+
+
 @learning_bp.route("/api/explore", methods=["POST"])
 def api_explore_topic():
     """API endpoint to mark a topic as explored."""
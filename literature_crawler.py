@@ -36,6 +36,7 @@ from typing import List, Dict, Any, Optional, Tuple
 
 # Import knowledge engine components
 from knowledge_engine import FactManager
+from fact_search import notify_fact_added
 
 # Define topics if not available from knowledge_engine
 NONVERBAL_TOPICS = [
@@ -463,6 +464,7 @@ class LiteratureCrawler:
                     "verified": fact.get("verified", True)
                 }
             )
+            notify_fact_added(fact["text"], fact["topic"], "literature")
     
     def process_topic(self, topic: str):
         """
@@ -28,8 +28,11 @@ Mimics human memory architecture:
 "Memory is what makes us human. alphavox deserves the same."
 """
 
+import bisect
 import json
+import os
 import time
+import heapq
 import hashlib
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -38,6 +41,245 @@ import threading
 from collections import defaultdict
 
 
+_GRAM_SIZE = 3  # Character n-gram length used to find substring matches
+
+
+def _grams(text: str) -> set:
+    """Character trigrams of every whitespace-separated word in text"""
+    return {
+        word[i:i + _GRAM_SIZE]
+        for word in text.split()
+        for i in range(len(word) - _GRAM_SIZE + 1)
+    }
+
+
+class MemoryIndex:
+    """
+    Substring index over every stored memory, keyed by memory ID
+
+    Each memory is indexed once no matter how many tiers hold it
+    (working, episodic and a semantic category), with its lowercased
+    content and epoch timestamp precomputed so ranking never re-parses
+    ISO strings. Postings map the trigrams of each content word to memory
+    IDs, so the memories containing a query word of three or more letters
+    anywhere in their text (as the relevance scorer's ``word in content``
+    test does) are found without scanning. Shorter words occur in almost
+    every memory, so they are not indexed; an importance-ordered list lets
+    retrieval visit the remaining memories best-first instead.
+    """
+
+    def __init__(self):
+        self.postings = defaultdict(set)  # trigram -> {memory_id}
+        self.entries = {}                 # memory_id -> indexed entry
+        self.by_importance = []           # sorted (-importance, order, memory_id)
+        self._order = 0                   # insertion counter for stable ties
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, memory_id: str):
+        return memory_id in self.entries
+
+    def add(self, memory: Dict):
+        """Index a memory (no-op if its ID is already indexed)"""
+        memory_id = memory["id"]
+        with self._lock:
+            if memory_id in self.entries:
+                return
+            content_lower = memory["content"].lower()
+            try:
+                epoch = datetime.fromisoformat(memory["timestamp"]).timestamp()
+            except (KeyError, TypeError, ValueError):
+                epoch = time.time()
+            importance = memory.get("importance", 0.5)
+            self.entries[memory_id] = {
+                "memory": memory,
+                "content": content_lower,
+                "epoch": epoch,
+                "importance": importance,
+                "order": self._order,
+            }
+            bisect.insort(self.by_importance, (-importance, self._order, memory_id))
+            self._order += 1
+            for gram in _grams(content_lower):
+                self.postings[gram].add(memory_id)
+
+    def remove(self, memory_id: str):
+        """Drop a memory from the index"""
+        with self._lock:
+            entry = self.entries.pop(memory_id, None)
+            if not entry:
+                return
+            key = (-entry["importance"], entry["order"], memory_id)
+            position = bisect.bisect_left(self.by_importance, key)
+            if position < len(self.by_importance) and self.by_importance[position] == key:
+                del self.by_importance[position]
+            for gram in _grams(entry["content"]):
+                ids = self.postings.get(gram)
+                if ids is not None:
+                    ids.discard(memory_id)
+                    if not ids:
+                        del self.postings[gram]
+
+    def rebuild(self, memories):
+        """Rebuild the index from an iterable of memories"""
+        with self._lock:
+            self.clear()
+            for memory in memories:
+                self.add(memory)
+
+    def clear(self):
+        with self._lock:
+            self.postings.clear()
+            self.entries.clear()
+            self.by_importance.clear()
+            self._order = 0
+
+    def candidates(self, query_lower: str) -> List[Dict]:
+        """
+        Return indexed entries whose content contains any query word
+
+        Only words of at least three letters are looked up; shorter ones
+        are left to the caller.
+        """
+        with self._lock:
+            ids = set()
+            for word in set(query_lower.split()):
+                if len(word) < _GRAM_SIZE:
+                    continue
+                postings = sorted(
+                    (self.postings.get(gram, set()) for gram in _grams(word)),
+                    key=len,
+                )
+                if not postings[0]:
+                    continue
+                # Every trigram of the word must occur; then confirm the
+                # word itself does, since trigrams can occur apart
+                for memory_id in postings[0].intersection(*postings[1:]):
+                    if memory_id not in ids and word in self.entries[memory_id]["content"]:
+                        ids.add(memory_id)
+            return [self.entries[memory_id] for memory_id in ids]
+
+    def iter_by_importance(self):
+        """Yield indexed entries from most to least important"""
+        with self._lock:
+            keys = list(self.by_importance)
+        for _, _, memory_id in keys:
+            entry = self.entries.get(memory_id)
+            if entry is not None:
+                yield entry
+
+    def get(self, memory_id: str) -> Optional[Dict]:
+        return self.entries.get(memory_id)
+
+
+class MemoryJournal:
+    """
+    Append-only journal plus compacted snapshot for MemoryMesh persistence
+
+    Layout inside the memory directory:
+    - memory_snapshot.json: every memory stored once by ID, with episodic
+      order and semantic categories held as ID lists, plus metadata
+    - memory_journal.jsonl: one JSON record per line appended since the
+      last snapshot ("put" for a consolidated memory, "meta" for metadata)
+
+    Saving appends only what changed; compaction folds the journal back
+    into a fresh snapshot once it grows past a record threshold.
+    """
+
+    SNAPSHOT_FILE = "memory_snapshot.json"
+    JOURNAL_FILE = "memory_journal.jsonl"
+
+    def __init__(self, memory_dir: Path, compaction_threshold: int = 1000):
+        self.snapshot_file = memory_dir / self.SNAPSHOT_FILE
+        self.journal_file = memory_dir / self.JOURNAL_FILE
+        self.compaction_threshold = compaction_threshold
+        self.record_count = 0
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        return self.snapshot_file.exists() or self.journal_file.exists()
+
+    def load(self):
+        """
+        Read the snapshot and replayable journal records
+
+        Returns:
+            Tuple of (snapshot dict or None, list of journal records)
+        """
+        snapshot = None
+        records = []
+        with self._lock:
+            if self.snapshot_file.exists():
+                with open(self.snapshot_file, 'r') as f:
+                    snapshot = json.load(f)
+            if self.journal_file.exists():
+                with open(self.journal_file, 'rb') as f:
+                    data = f.read()
+                good_offset = 0
+                for line in data.splitlines(keepends=True):
+                    text = line.strip()
+                    if text:
+                        try:
+                            records.append(json.loads(text))
+                        except ValueError:
+                            # Torn write from a crash - everything after it is suspect
+                            break
+                    good_offset += len(line)
+                self._repair(data, good_offset)
+            self.record_count = len(records)
+        return snapshot, records
+
+    def _repair(self, data: bytes, good_offset: int):
+        """
+        Cut a torn tail off the journal so later appends stay readable
+
+        Without this, new records would be written after the broken line
+        and skipped by every later load.
+        """
+        complete = data[:good_offset]
+        if good_offset == len(data) and (not complete or complete.endswith(b"\n")):
+            return
+        with open(self.journal_file, 'r+b') as f:
+            f.truncate(good_offset)
+            if complete and not complete.endswith(b"\n"):
+                # Last record parsed but lost its newline
+                f.seek(good_offset)
+                f.write(b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def append(self, records: List[Dict]):
+        """Append records to the journal"""
+        if not records:
+            return
+        payload = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records)
+        with self._lock:
+            with open(self.journal_file, 'a') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            self.record_count += len(records)
+
+    def needs_compaction(self, pending: int = 0) -> bool:
+        return self.record_count + pending > self.compaction_threshold
+
+    def compact(self, snapshot: Dict):
+        """Atomically replace the snapshot and truncate the journal"""
+        with self._lock:
+            tmp_file = self.snapshot_file.with_suffix(".json.tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump(snapshot, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.snapshot_file)
+            # Snapshot now covers everything journaled so far
+            with open(self.journal_file, 'w'):
+                pass
+            self.record_count = 0
+
+
 class MemoryMesh:
     """
     Human-like memory system with automatic categorization and consolidation
@@ -93,6 +335,21 @@ class MemoryMesh:
         self.last_consolidation = time.time()
         self.auto_consolidate = True
         
+        # ========================================
+        # RETRIEVAL INDEX
+        # ========================================
+        # One entry per memory ID, updated on store/consolidation
+        self.index = MemoryIndex()
+        
+        # ========================================
+        # PERSISTENCE JOURNAL
+        # ========================================
+        # Changes since the last save, appended to the journal on save
+        self.journal = MemoryJournal(self.memory_dir)
+        self._unsaved_memories = []  # (memory, semantic category)
+        self._dirty_metadata = set()  # memory IDs with changed metadata
+        self._needs_compaction = False
+        
         # Load existing memories
         self.load_memories()
         
@@ -145,6 +402,8 @@ class MemoryMesh:
         # Store in working memory first (surface level)
         self.working_memory.append(memory)
         self.memory_importance[memory_id] = importance
+        self._dirty_metadata.add(memory_id)
+        self.index.add(memory)
         
         # Trim working memory if too full (like human cognitive load)
         if len(self.working_memory) > self.working_memory_limit:
@@ -244,14 +503,18 @@ class MemoryMesh:
         self.episodic_memory.append(memory)
         
         # Also store in appropriate semantic category
-        if category in self.semantic_memory:
-            self.semantic_memory[category].append(memory)
-        else:
-            self.semantic_memory["context"].append(memory)
+        if category not in self.semantic_memory:
+            category = "context"
+        self.semantic_memory[category].append(memory)
         
         # Update metadata
         memory_id = memory["id"]
         self.memory_last_access[memory_id] = datetime.now().isoformat()
+        self._unsaved_memories.append((memory, category))
+        self._dirty_metadata.add(memory_id)
+        
+        # Already indexed when stored; covers memories consolidated directly
+        self.index.add(memory)
     
     def _start_consolidation_thread(self):
         """
@@ -275,7 +538,9 @@ class MemoryMesh:
     def retrieve(self, query: str, category: Optional[str] = None, limit: int = 5) -> List[Dict]:
         """
         Retrieve relevant memories based on query
-        Searches across all memory types with relevance scoring
+        Searches across all memory types with relevance scoring, using the
+        substring index so memories matching no query word are only scored
+        while they could still reach the top results
         
         Args:
             query: Search query
@@ -286,49 +551,95 @@ class MemoryMesh:
             List of relevant memories, sorted by relevance
         """
         query_lower = query.lower()
-        results = []
-        
-        # Search working memory first (most recent/relevant)
-        for memory in self.working_memory:
-            score = self._calculate_relevance(memory, query_lower)
+        working_ids = {m["id"] for m in self.working_memory}
+        now = time.time()
+        
+        def allowed(memory):
+            # Working memory is always searched; long-term tiers honor the filter
+            return not category or memory["id"] in working_ids \
+                or memory.get("category") == category
+        
+        # Score the memories containing a query word of three or more
+        # letters; each memory is scored once even if it lives in both
+        # episodic and semantic tiers
+        top = []  # min-heap of (score, -order, memory), at most `limit` long
+        matched = set()
+        for entry in self.index.candidates(query_lower):
+            memory = entry["memory"]
+            if not allowed(memory):
+                continue
+            matched.add(memory["id"])
+            score = self._calculate_relevance(memory, query_lower, entry=entry, now=now)
             if score > 0:
-                results.append((score, memory))
                 self._mark_accessed(memory["id"])
-        
-        # Search episodic memory (experiences)
-        for memory in self.episodic_memory:
-            if category and memory.get("category") != category:
+                self._push_top(top, limit, (score, -entry["order"], memory))
+        
+        # The other memories can only match the short query words, and still
+        # score on importance, recency and access frequency. Visit them most
+        # important first and stop once even matching every short word (and
+        # the whole query, if it has only short words) plus a maximal recency
+        # and frequency bonus cannot reach the top-k.
+        query_words = query_lower.split()
+        short_words = {word for word in query_words if len(word) < _GRAM_SIZE}
+        bonus = 0.2
+        if query_words:
+            short_count = sum(1 for word in query_words if word in short_words)
+            bonus += short_count / len(query_words) * 0.5
+        if len(short_words) == len(set(query_words)):
+            bonus += 0.3
+        for entry in self.index.iter_by_importance():
+            if len(top) >= limit and entry["importance"] * 0.2 + bonus < top[0][0]:
+                break
+            memory = entry["memory"]
+            if memory["id"] in matched or not allowed(memory):
                 continue
-            score = self._calculate_relevance(memory, query_lower)
-            if score > 0:
-                results.append((score, memory))
+            score = self._calculate_relevance(memory, query_lower, entry=entry, now=now)
+            if any(word in entry["content"] for word in short_words):
                 self._mark_accessed(memory["id"])
+            if score > 0:
+                self._push_top(top, limit, (score, -entry["order"], memory))
         
-        # Search semantic memory (categorized knowledge)
-        categories_to_search = [category] if category else self.semantic_memory.keys()
-        for cat in categories_to_search:
-            for memory in self.semantic_memory.get(cat, []):
-                score = self._calculate_relevance(memory, query_lower)
-                if score > 0:
-                    results.append((score, memory))
-                    self._mark_accessed(memory["id"])
-        
-        # Sort by relevance and return top results
-        results.sort(key=lambda x: x[0], reverse=True)
-        return [memory for score, memory in results[:limit]]
+        # Top results by relevance, oldest-first on ties
+        top.sort(key=lambda x: (x[0], x[1]), reverse=True)
+        return [memory for score, order, memory in top]
     
-    def _calculate_relevance(self, memory: Dict, query: str) -> float:
+    @staticmethod
+    def _push_top(top: List, limit: int, item: tuple):
+        """Keep the `limit` best (score, -order, memory) items in a min-heap"""
+        if limit <= 0:
+            return
+        if len(top) < limit:
+            heapq.heappush(top, item)
+        elif item[:2] > top[0][:2]:
+            heapq.heapreplace(top, item)
+    
+    def _calculate_relevance(self, memory: Dict, query: str, entry: Optional[Dict] = None,
+                             now: Optional[float] = None) -> float:
         """
         Calculate how relevant a memory is to the query
         Considers: content match, importance, recency, access frequency
+        
+        Args:
+            memory: Memory to score
+            query: Lowercased query
+            entry: Optional index entry with precomputed content/timestamp
+            now: Optional epoch time shared across one retrieval
         """
         score = 0.0
-        content = memory["content"].lower()
+        if entry is None:
+            entry = self.index.get(memory["id"])
+        if entry is not None:
+            content = entry["content"]
+            timestamp = entry["epoch"]
+        else:
+            content = memory["content"].lower()
+            timestamp = datetime.fromisoformat(memory["timestamp"]).timestamp()
         
         # Content matching
         query_words = query.split()
-        matches = sum(1 for word in query_words if word in content)
-        score += (matches / len(query_words)) * 0.5
+        if query_words:
+            matches = sum(1 for word in query_words if word in content)
+            score += (matches / len(query_words)) * 0.5
         
         # Exact phrase match bonus
         if query in content:
@@ -339,8 +650,7 @@ class MemoryMesh:
         score += importance * 0.2
         
         # Recency bonus (more recent = more relevant)
-        timestamp = datetime.fromisoformat(memory["timestamp"])
-        age_hours = (datetime.now() - timestamp).total_seconds() / 3600
+        age_hours = ((now or time.time()) - timestamp) / 3600
         recency_score = max(0, 1 - (age_hours / (24 * 7)))  # Decay over a week
         score += recency_score * 0.1
         
@@ -357,6 +667,7 @@ class MemoryMesh:
         """
         self.memory_access_count[memory_id] += 1
         self.memory_last_access[memory_id] = datetime.now().isoformat()
+        self._dirty_metadata.add(memory_id)
     
     def get_working_memory(self) -> List[Dict]:
         """Get current working memory (surface/active context)"""
@@ -393,60 +704,148 @@ class MemoryMesh:
     # ========================================
     
     def save_memories(self):
-        """Save all memories to disk"""
+        """
+        Persist changes since the last save
+        
+        Appends newly consolidated memories and changed metadata to the
+        journal, compacting into a fresh snapshot when the journal grows
+        past its threshold.
+        """
+        # Swap out the pending changes so concurrent stores land in the next save
+        unsaved, self._unsaved_memories = self._unsaved_memories, []
+        dirty, self._dirty_metadata = self._dirty_metadata, set()
         try:
-            # Save episodic memory
-            episodic_file = self.memory_dir / "episodic_memory.json"
-            with open(episodic_file, 'w') as f:
-                json.dump(self.episodic_memory, f, indent=2)
+            records = [
+                {"op": "put", "memory": memory, "episodic": True, "semantic": category}
+                for memory, category in unsaved
+            ]
+            for memory_id in dirty:
+                records.append({
+                    "op": "meta",
+                    "id": memory_id,
+                    "importance": self.memory_importance.get(memory_id),
+                    "access_count": self.memory_access_count.get(memory_id, 0),
+                    "last_access": self.memory_last_access.get(memory_id)
+                })
             
-            # Save semantic memory
-            semantic_file = self.memory_dir / "semantic_memory.json"
-            with open(semantic_file, 'w') as f:
-                json.dump(self.semantic_memory, f, indent=2)
+            if self._needs_compaction or self.journal.needs_compaction(len(records)):
+                self.compact_memories()
+            else:
+                self.journal.append(records)
             
-            # Save metadata
-            metadata = {
+            print("💾 Memories saved to disk")
+        except Exception as e:
+            # Keep the changes pending so the next save retries them
+            self._unsaved_memories[:0] = unsaved
+            self._dirty_metadata.update(dirty)
+            print(f"⚠️  Error saving memories: {e}")
+    
+    def compact_memories(self):
+        """Write a full snapshot (one copy per memory) and truncate the journal"""
+        memories = {}
+        for memory in self.episodic_memory:
+            memories[memory["id"]] = memory
+        semantic = {}
+        for cat, cat_memories in self.semantic_memory.items():
+            semantic[cat] = []
+            for memory in cat_memories:
+                memories.setdefault(memory["id"], memory)
+                semantic[cat].append(memory["id"])
+        
+        snapshot = {
+            "memories": memories,
+            "episodic": [m["id"] for m in self.episodic_memory],
+            "semantic": semantic,
+            "metadata": {
                 "importance": self.memory_importance,
                 "access_count": dict(self.memory_access_count),
                 "last_access": self.memory_last_access
             }
-            metadata_file = self.memory_dir / "memory_metadata.json"
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
-            
-            print("💾 Memories saved to disk")
-        except Exception as e:
-            print(f"⚠️  Error saving memories: {e}")
+        }
+        self.journal.compact(snapshot)
+        self._needs_compaction = False
     
     def load_memories(self):
-        """Load memories from disk"""
+        """Load memories from the snapshot and replay the journal"""
         try:
-            # Load episodic memory
-            episodic_file = self.memory_dir / "episodic_memory.json"
-            if episodic_file.exists():
-                with open(episodic_file, 'r') as f:
-                    self.episodic_memory = json.load(f)
+            if self.journal.exists():
+                self._load_journal()
+            else:
+                self._load_legacy_files()
             
-            # Load semantic memory
-            semantic_file = self.memory_dir / "semantic_memory.json"
-            if semantic_file.exists():
-                with open(semantic_file, 'r') as f:
-                    self.semantic_memory = json.load(f)
-            
-            # Load metadata
-            metadata_file = self.memory_dir / "memory_metadata.json"
-            if metadata_file.exists():
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                    self.memory_importance = metadata.get("importance", {})
-                    self.memory_access_count = defaultdict(int, metadata.get("access_count", {}))
-                    self.memory_last_access = metadata.get("last_access", {})
+            self._rebuild_index()
             
             print("📂 Memories loaded from disk")
         except Exception as e:
             print(f"⚠️  Error loading memories: {e}")
     
+    def _load_journal(self):
+        """Rebuild memory tiers from snapshot + journal records"""
+        snapshot, records = self.journal.load()
+        snapshot = snapshot or {}
+        
+        memories = snapshot.get("memories", {})
+        self.episodic_memory = [memories[i] for i in snapshot.get("episodic", []) if i in memories]
+        semantic = {k: [] for k in self.semantic_memory.keys()}
+        for cat, ids in snapshot.get("semantic", {}).items():
+            semantic[cat] = [memories[i] for i in ids if i in memories]
+        self.semantic_memory = semantic
+        
+        metadata = snapshot.get("metadata", {})
+        self.memory_importance = metadata.get("importance", {})
+        self.memory_access_count = defaultdict(int, metadata.get("access_count", {}))
+        self.memory_last_access = metadata.get("last_access", {})
+        
+        for record in records:
+            op = record.get("op")
+            if op == "put":
+                memory = record["memory"]
+                memories[memory["id"]] = memory
+                if record.get("episodic"):
+                    self.episodic_memory.append(memory)
+                category = record.get("semantic")
+                if category:
+                    self.semantic_memory.setdefault(category, []).append(memory)
+            elif op == "meta":
+                memory_id = record["id"]
+                if record.get("importance") is not None:
+                    self.memory_importance[memory_id] = record["importance"]
+                self.memory_access_count[memory_id] = record.get("access_count", 0)
+                if record.get("last_access") is not None:
+                    self.memory_last_access[memory_id] = record["last_access"]
+    
+    def _load_legacy_files(self):
+        """Load the pre-journal JSON files and migrate them on next save"""
+        episodic_file = self.memory_dir / "episodic_memory.json"
+        if episodic_file.exists():
+            with open(episodic_file, 'r') as f:
+                self.episodic_memory = json.load(f)
+            self._needs_compaction = True
+        
+        semantic_file = self.memory_dir / "semantic_memory.json"
+        if semantic_file.exists():
+            with open(semantic_file, 'r') as f:
+                self.semantic_memory.update(json.load(f))
+            self._needs_compaction = True
+        
+        metadata_file = self.memory_dir / "memory_metadata.json"
+        if metadata_file.exists():
+            with open(metadata_file, 'r') as f:
+                metadata = json.load(f)
+                self.memory_importance = metadata.get("importance", {})
+                self.memory_access_count = defaultdict(int, metadata.get("access_count", {}))
+                self.memory_last_access = metadata.get("last_access", {})
+            self._needs_compaction = True
+    
+    def _rebuild_index(self):
+        """Re-index every memory held in working, episodic and semantic tiers"""
+        def all_memories():
+            yield from self.working_memory
+            yield from self.episodic_memory
+            for memories in self.semantic_memory.values():
+                yield from memories
+        self.index.rebuild(all_memories())
+    
     # ========================================
     # UTILITY METHODS
     # ========================================
@@ -480,6 +879,10 @@ class MemoryMesh:
         self.memory_importance.clear()
         self.memory_access_count.clear()
         self.memory_last_access.clear()
+        self.index.clear()
+        self._unsaved_memories.clear()
+        self._dirty_metadata.clear()
+        self._needs_compaction = True
         
         print("🗑️  All memories cleared")
 
@@ -0,0 +1,180 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+
+"""
+Model registry for pickled classifiers used by the NLU and NLC.
+
+Each model file is unpickled once and cached. The registry re-stats the
+file at most every ``check_interval`` seconds and, when its mtime or size
+changes, loads the new version off to the side and swaps it in under a
+lock, so callers always see a complete model.
+"""
+
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def predict_with_proba(model: Any, X) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Predict labels and class probabilities with a single model call.
+
+    For classifiers exposing predict_proba and classes_, the label is the
+    argmax of the probabilities, which is what predict() computes anyway.
+
+    Args:
+        model: Fitted classifier
+        X: 2-D feature array
+
+    Returns:
+        Tuple of (predicted labels, probability matrix or None)
+    """
+    X = np.asarray(X)
+    if hasattr(model, "predict_proba") and hasattr(model, "classes_"):
+        probabilities = model.predict_proba(X)
+        predictions = model.classes_[np.argmax(probabilities, axis=1)]
+        return predictions, probabilities
+    return model.predict(X), None
+
+
+class ModelRegistry:
+    """Caches pickled models by path and hot-swaps them when files change."""
+
+    def __init__(self, check_interval: float = 2.0):
+        """Initialize the registry.
+
+        Args:
+            check_interval: Minimum seconds between stat() calls per model
+        """
+        self.check_interval = check_interval
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+    def get(self, path: str) -> Optional[Any]:
+        """Return the current model for a path, loading or reloading as needed.
+
+        Returns:
+            The unpickled model, or None if the file does not exist
+        """
+        path = os.path.abspath(path)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and now - entry["checked"] < self.check_interval:
+                return entry["model"]
+            load_lock = self._load_locks.setdefault(path, threading.Lock())
+
+        # One loader per path; other callers keep using the current model
+        if not load_lock.acquire(blocking=entry is None):
+            return entry["model"]
+        try:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                with self._lock:
+                    self._entries.pop(path, None)
+                return None
+
+            signature = (stat.st_mtime_ns, stat.st_size)
+            with self._lock:
+                entry = self._entries.get(path)
+                if entry and entry["signature"] == signature:
+                    entry["checked"] = now
+                    return entry["model"]
+
+            try:
+                with open(path, "rb") as f:
+                    model = pickle.load(f)
+            except Exception as e:
+                logger.error(f"Error loading model {path}: {str(e)}")
+                return entry["model"] if entry else None
+
+            with self._lock:
+                self._entries[path] = {
+                    "model": model,
+                    "signature": signature,
+                    "checked": now,
+                }
+            logger.info(f"{'Reloaded' if entry else 'Loaded'} model from {path}")
+            return model
+        finally:
+            load_lock.release()
+
+    def put(self, path: str, model: Any) -> None:
+        """Register an in-memory model for a path (e.g. right after saving it)."""
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            signature = None
+        with self._lock:
+            self._entries[path] = {
+                "model": model,
+                "signature": signature,
+                "checked": time.monotonic(),
+            }
+
+    def predict_with_proba(self, path: str, X):
+        """Fused predict + predict_proba against the model stored at path.
+
+        Returns:
+            Tuple of (labels, probabilities), or None if the model is missing
+        """
+        model = self.get(path)
+        if model is None:
+            return None
+        return predict_with_proba(model, X)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Forget one cached model, or all of them."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+
+# Singleton instance
+_model_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get or create the ModelRegistry singleton."""
+    global _model_registry
+    with _registry_lock:
+        if _model_registry is None:
+            _model_registry = ModelRegistry()
+        return _model_registry
+
+
+# ==============================================================================
+# © 2025 Everett Nathaniel Christman & Misty Gail Christman
+# The Christman AI Project — Luma Cognify AI
+# All rights reserved. Unauthorized use, replication, or derivative training 
+# of this material is prohibited.
+# Core Directive: "How can I help you love yourself more?" 
+# Autonomy & Alignment Protocol v3.0
+# ==============================================================================
@@ -50,6 +50,383 @@ class UserInteraction(db.Model):
         return f"<UserInteraction {self.intent} ({self.confidence:.2f})>"
 
 
+class InteractionRollup(db.Model):
+    """Pre-aggregated interaction counts per user, time bucket, method and intent
+
+    "hour" and "day" rows count interactions per input method and intent,
+    with the sum and number of their non-zero confidence scores. "expression"
+    rows count each expression (the text without its method prefix) per day,
+    with method and intent left empty. The caregiver dashboard reads only
+    these rows, never the raw interaction history. A "backfill" row marks a
+    user whose earlier history has been rolled up.
+    """
+
+    GRANULARITIES = ("hour", "day", "expression", "backfill")
+    METHODS = ("symbol", "gesture", "eye", "sound")
+    UPSERT_CHUNK = 500  # Rows per upsert statement
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    granularity = db.Column(db.String(10), nullable=False)  # see GRANULARITIES
+    bucket_start = db.Column(db.DateTime, nullable=False)
+    method = db.Column(db.String(16), nullable=False)  # 'text', 'symbol', ..., 'none'
+    intent = db.Column(db.String(64), nullable=False, default="")
+    expression = db.Column(db.String(512), nullable=False, default="")
+    count = db.Column(db.Integer, nullable=False, default=0)
+    confidence_sum = db.Column(db.Float, nullable=False, default=0.0)
+    confidence_count = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        db.UniqueConstraint(
+            "user_id",
+            "granularity",
+            "bucket_start",
+            "method",
+            "intent",
+            "expression",
+            name="_interaction_rollup_bucket_uc",
+        ),
+        db.Index("ix_interaction_rollup_lookup", "user_id", "granularity", "bucket_start"),
+    )
+
+    def __repr__(self):
+        return f"<InteractionRollup {self.user_id} {self.granularity} {self.bucket_start}: {self.count}>"
+
+    @classmethod
+    def interaction_method(cls, text):
+        """Classify an interaction's input method from its text prefix"""
+        if not text:
+            return "none"
+        for method in cls.METHODS:
+            if text.startswith(f"{method}:"):
+                return method
+        return "text"
+
+    @staticmethod
+    def expression_of(text):
+        """The expression in an interaction's text, without a method prefix"""
+        if not text:
+            return ""
+        if ":" in text:
+            text = text.split(":", 1)[1]
+        return text.strip()
+
+    @staticmethod
+    def bucket(timestamp, granularity):
+        """Truncate a timestamp to the start of its hour or day"""
+        if granularity == "hour":
+            return timestamp.replace(minute=0, second=0, microsecond=0)
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    @classmethod
+    def add_counts(cls, rows):
+        """Add tallied rows to the rollups.
+
+        Args:
+            rows: {(user_id, granularity, bucket_start, method, intent,
+                expression): [count, confidence_sum, confidence_count]}, as
+                built by tally()
+
+        Each bucket is upserted with its totals added in one statement, so
+        concurrent workers never lose increments or collide on the unique
+        constraint. Runs in the caller's session; the caller commits.
+        """
+        if not rows:
+            return
+
+        dialect = db.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        # Chunked to stay under the database's bound-parameter limit
+        items = list(rows.items())
+        for start in range(0, len(items), cls.UPSERT_CHUNK):
+            cls._upsert(insert, dict(items[start:start + cls.UPSERT_CHUNK]))
+
+    @classmethod
+    def _upsert(cls, insert, rows):
+        stmt = insert(cls.__table__).values(
+            [
+                {
+                    "user_id": user_id,
+                    "granularity": granularity,
+                    "bucket_start": bucket_start,
+                    "method": method,
+                    "intent": intent,
+                    "expression": expression,
+                    "count": count,
+                    "confidence_sum": confidence_sum,
+                    "confidence_count": confidence_count,
+                }
+                for (
+                    user_id,
+                    granularity,
+                    bucket_start,
+                    method,
+                    intent,
+                    expression,
+                ), (count, confidence_sum, confidence_count) in rows.items()
+            ]
+        )
+        table = cls.__table__.c
+        db.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    "user_id", "granularity", "bucket_start", "method", "intent", "expression"
+                ],
+                set_={
+                    "count": table.count + stmt.excluded["count"],
+                    "confidence_sum": table.confidence_sum + stmt.excluded["confidence_sum"],
+                    "confidence_count": table.confidence_count
+                    + stmt.excluded["confidence_count"],
+                },
+            )
+        )
+
+    @classmethod
+    def _tally_into(cls, rows, user_id, hour, text, intent, count, confidence_sum,
+                    confidence_count, expressions=True):
+        """Add a group of interactions from one hour to the hour/day/expression rows"""
+        method = cls.interaction_method(text)
+        day = cls.bucket(hour, "day")
+        keys = [
+            (user_id, "hour", hour, method, intent or "", ""),
+            (user_id, "day", day, method, intent or "", ""),
+        ]
+        expression = cls.expression_of(text)[:512]
+        if expressions and expression:
+            keys.append((user_id, "expression", day, "", "", expression))
+        for key in keys:
+            totals = rows.setdefault(key, [0, 0.0, 0])
+            totals[0] += count
+            totals[1] += confidence_sum
+            totals[2] += confidence_count
+
+    @classmethod
+    def tally(cls, interactions):
+        """Build add_counts() rows from UserInteraction objects"""
+        rows = {}
+        for interaction in interactions:
+            if interaction.user_id is None:
+                continue
+            timestamp = interaction.timestamp or datetime.utcnow()
+            confidence = interaction.confidence or 0.0
+            cls._tally_into(
+                rows,
+                interaction.user_id,
+                cls.bucket(timestamp, "hour"),
+                interaction.text,
+                interaction.intent,
+                1,
+                confidence,
+                1 if confidence else 0,
+            )
+        return rows
+
+    @classmethod
+    def record(cls, interactions):
+        """Fold newly added UserInteraction objects into the rollups"""
+        cls.add_counts(cls.tally(interactions))
+
+    @classmethod
+    def _tally_history(cls, user_id=None, before=None):
+        """Build add_counts() rows from UserInteraction with a SQL GROUP BY
+
+        Args:
+            user_id: Only this user's interactions
+            before: Only interactions older than this
+
+        Returns:
+            (rows, number of grouped rows read)
+        """
+        dialect = db.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            hour = db.func.date_trunc("hour", UserInteraction.timestamp)
+        else:
+            hour = db.func.strftime("%Y-%m-%d %H:00:00", UserInteraction.timestamp)
+        confidence = db.case(
+            (UserInteraction.confidence != 0, UserInteraction.confidence), else_=None
+        )
+
+        query = db.session.query(
+            UserInteraction.user_id,
+            hour,
+            UserInteraction.text,
+            UserInteraction.intent,
+            db.func.count(UserInteraction.id),
+            db.func.coalesce(db.func.sum(confidence), 0.0),
+            db.func.count(confidence),
+        ).filter(
+            UserInteraction.user_id.isnot(None),
+            UserInteraction.timestamp.isnot(None),
+        )
+        if user_id is not None:
+            query = query.filter(UserInteraction.user_id == user_id)
+        if before is not None:
+            query = query.filter(UserInteraction.timestamp < before)
+        groups = query.group_by(
+            UserInteraction.user_id, hour, UserInteraction.text, UserInteraction.intent
+        ).yield_per(1000)
+
+        rows = {}
+        grouped = 0
+        for user_id, bucket_start, text, intent, n, confidence_sum, confidence_count in groups:
+            if isinstance(bucket_start, str):
+                bucket_start = datetime.strptime(bucket_start, "%Y-%m-%d %H:%M:%S")
+            cls._tally_into(
+                rows, user_id, bucket_start, text, intent, n, confidence_sum,
+                confidence_count,
+            )
+            grouped += 1
+        return rows, grouped
+
+    @classmethod
+    def _mark_backfilled(cls, user_id, cutoff, grouped):
+        """Record that a user's history before cutoff is in the rollups"""
+        db.session.add(
+            cls(
+                user_id=user_id,
+                granularity="backfill",
+                bucket_start=cutoff,
+                method="",
+                intent="",
+                expression="",
+                count=grouped,
+            )
+        )
+
+    @classmethod
+    def backfill(cls):
+        """Rebuild all rollups from UserInteraction with a SQL GROUP BY
+
+        Returns:
+            Number of grouped rows rolled up
+        """
+        rows, grouped = cls._tally_history()
+        cls.query.delete()
+        cls.add_counts(rows)
+        for user_id in {key[0] for key in rows}:
+            cls._mark_backfilled(user_id, datetime.utcnow(), 0)
+        db.session.commit()
+        return grouped
+
+    @classmethod
+    def backfill_missing(cls):
+        """Roll up history saved before live rollups began, once per user
+
+        Live writes cover a user from their first hourly rollup onwards, so
+        only older interactions are added. Each user's rows and a "backfill"
+        marker row commit together; users with a marker are skipped, which
+        makes reruns safe and lets a second concurrent run fail on the
+        marker's unique constraint instead of double counting.
+
+        Returns:
+            Number of users backfilled
+        """
+        marked = {
+            user_id
+            for (user_id,) in db.session.query(cls.user_id).filter(
+                cls.granularity == "backfill"
+            )
+        }
+        users = [
+            user_id
+            for (user_id,) in db.session.query(UserInteraction.user_id)
+            .filter(UserInteraction.user_id.isnot(None))
+            .distinct()
+            if user_id not in marked
+        ]
+
+        for user_id in users:
+            first_live = (
+                db.session.query(db.func.min(cls.bucket_start))
+                .filter(cls.user_id == user_id, cls.granularity == "hour")
+                .scalar()
+            )
+            rows, grouped = cls._tally_history(user_id=user_id, before=first_live)
+            cls.add_counts(rows)
+            cls._mark_backfilled(user_id, first_live or datetime.utcnow(), grouped)
+            db.session.commit()
+        return len(users)
+
+    @classmethod
+    def counts_by_bucket(cls, user_id, granularity, since):
+        """Total interactions per bucket for a user since a given time"""
+        return (
+            db.session.query(cls.bucket_start, db.func.sum(cls.count))
+            .filter(
+                cls.user_id == user_id,
+                cls.granularity == granularity,
+                cls.bucket_start >= cls.bucket(since, granularity),
+            )
+            .group_by(cls.bucket_start)
+            .all()
+        )
+
+    @classmethod
+    def counts_by(cls, user_id, column):
+        """Lifetime totals for a user grouped by 'method' or 'intent'"""
+        column = getattr(cls, column)
+        return dict(
+            db.session.query(column, db.func.sum(cls.count))
+            .filter(cls.user_id == user_id, cls.granularity == "day")
+            .group_by(column)
+            .all()
+        )
+
+    @classmethod
+    def method_totals(cls, user_id, since=None):
+        """Per-method (count, confidence_sum, confidence_count) for a user
+
+        Interactions without text are left out. With since, totals start at
+        the hour since falls in; otherwise they cover the whole history.
+        """
+        query = db.session.query(
+            cls.method,
+            db.func.sum(cls.count),
+            db.func.sum(cls.confidence_sum),
+            db.func.sum(cls.confidence_count),
+        ).filter(cls.user_id == user_id, cls.method != "none")
+        if since is None:
+            query = query.filter(cls.granularity == "day")
+        else:
+            query = query.filter(
+                cls.granularity == "hour",
+                cls.bucket_start >= cls.bucket(since, "hour"),
+            )
+        return {
+            method: (count, confidence_sum, confidence_count)
+            for method, count, confidence_sum, confidence_count in query.group_by(
+                cls.method
+            )
+        }
+
+    @classmethod
+    def vocabulary_size(cls, user_id, since=None):
+        """Distinct expressions (case-insensitive) a user used, optionally since a day"""
+        query = db.session.query(
+            db.func.count(db.func.distinct(db.func.lower(cls.expression)))
+        ).filter(cls.user_id == user_id, cls.granularity == "expression")
+        if since is not None:
+            query = query.filter(cls.bucket_start >= cls.bucket(since, "day"))
+        return query.scalar() or 0
+
+    @classmethod
+    def frequent_expressions(cls, user_id, limit=10):
+        """A user's most used expressions as (expression, count), most used first"""
+        total = db.func.sum(cls.count)
+        return (
+            db.session.query(cls.expression, total)
+            .filter(cls.user_id == user_id, cls.granularity == "expression")
+            .group_by(cls.expression)
+            .order_by(total.desc(), cls.expression)
+            .limit(limit)
+            .all()
+        )
+
+
 class UserPreference(db.Model):
     """Model for storing user preferences for the adaptive profile system"""
 
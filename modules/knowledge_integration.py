@@ -27,6 +27,8 @@ import json
 import time
 from typing import Dict, Any, List, Optional
 
+from fact_search import FactFileWatcher, FactSearchIndex, add_fact_listener
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -67,6 +69,15 @@ class KnowledgeIntegration:
         # Load knowledge base
         self._load_knowledge_base()
 
+        # Ranked search over the facts, kept current as facts are learned
+        self.fact_index = FactSearchIndex()
+        self.fact_index.add_many(self.facts)
+        # Facts learned by the learning modules, in this or another worker
+        # process, are read from the files those modules persist them to
+        self.learned_fact_files = FactFileWatcher()
+        self._index_learned_facts()
+        add_fact_listener(self._on_fact_added)
+
         logger.info("Knowledge Integration initialized")
 
     def _initialize_components(self):
@@ -137,41 +148,39 @@ class KnowledgeIntegration:
             except Exception as e:
                 logger.error(f"Error querying knowledge engine: {e}")
 
-        # Fall back to basic search
-        results = []
-
-        # Filter by topic if provided
-        filtered_facts = self.facts
-        if topic:
-            filtered_facts = [f for f in self.facts if f.get("topic") == topic]
-
-        # Simple keyword matching (very basic)
-        query_terms = query.lower().split()
-        for fact in filtered_facts:
-            text = fact.get("text", "").lower()
-            score = sum(1 for term in query_terms if term in text)
-            if score > 0:
-                results.append(
-                    {
-                        "text": fact.get("text"),
-                        "topic": fact.get("topic"),
-                        "source": fact.get("source"),
-                        "relevance": score / len(query_terms),
-                    }
-                )
-
-        # Sort by relevance and limit results
-        results.sort(key=lambda x: x["relevance"], reverse=True)
-        results = results[:max_results]
+        # Fall back to BM25 search over the indexed facts
+        self._index_learned_facts()
+        matches = self.fact_index.search(query, topic, max_results)
+        top_score = matches[0]["score"] if matches else 0.0
+        results = [
+            {
+                "text": match["fact"].get("text"),
+                "topic": match["fact"].get("topic"),
+                "source": match["fact"].get("source"),
+                "relevance": match["score"] / top_score,
+                "score": match["score"],
+            }
+            for match in matches
+        ]
 
         return {
             "query": query,
             "topic": topic,
             "results": results,
             "count": len(results),
-            "engine": "basic",
+            "engine": "bm25",
         }
 
+    def _on_fact_added(self, fact: Dict[str, Any]):
+        """Add a newly learned fact to the searchable facts"""
+        if self.fact_index.add_unique(fact):
+            self.facts.append(fact)
+
+    def _index_learned_facts(self):
+        """Index facts persisted by the learning modules since the last check"""
+        for fact in self.learned_fact_files.poll():
+            self._on_fact_added(fact)
+
     def get_topics(self) -> List[Dict[str, Any]]:
         """
         Get available topics in the knowledge base
@@ -18,15 +18,21 @@ import logging
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple
-from collections import deque
+from collections import defaultdict, deque
 from datetime import datetime
+import copy
 import pickle
 import os
+import threading
+import time
 from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import SGDClassifier
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import accuracy_score
 import spacy
 from scipy.stats import entropy
+from model_registry import predict_with_proba
+from write_behind import WriteBehindPersister, atomic_write_bytes
 
 # Configure logging
 logging.basicConfig(
@@ -34,10 +40,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Window for the per-user interaction frequency feature
+FREQUENCY_WINDOW_SECONDS = 3600
+
+ROOT_CAUSES = [
+    "emotional_state",
+    "sensory_trigger",
+    "communication_intent",
+    "social_context",
+    "cognitive_load",
+    "unknown",
+]
+
 # Data directory for models and memory
 DATA_DIR = "data"
 MODEL_DIR = "models"
 MEMORY_FILE = os.path.join(DATA_DIR, "nlc_memory.pkl")
+ROOT_CAUSE_MODEL_FILE = os.path.join(MODEL_DIR, "root_cause_model.pkl")
 os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs(MODEL_DIR, exist_ok=True)
 
@@ -51,16 +70,157 @@ except Exception as e:
     nlp = spacy.blank("en")
 
 
+class RootCauseTrainingScheduler:
+    """Retrains the NLC root cause model on a background thread.
+
+    Interactions queue labelled samples instead of refitting inline. The
+    worker retrains once enough new samples have arrived or enough time
+    has passed, fits a fresh model and scaler off to the side, saves the
+    model and swaps both into the NLC under its model lock.
+    """
+
+    def __init__(
+        self,
+        nlc,
+        min_new_samples: int = 25,
+        min_interval: float = 300.0,
+        min_memory: int = 100,
+        max_feedback: int = 1000,
+    ):
+        """Initialize the scheduler and start its worker thread.
+
+        Args:
+            nlc: NeuralLearningCore whose model is retrained
+            min_new_samples: New samples that trigger a retrain
+            min_interval: Seconds after which any pending samples trigger one
+            min_memory: Memory size required before retraining starts
+            max_feedback: Caregiver-labelled samples kept for training
+        """
+        self.nlc = nlc
+        self.min_new_samples = min_new_samples
+        self.min_interval = min_interval
+        self.min_memory = min_memory
+        self.feedback_samples = deque(maxlen=max_feedback)
+        self.pending = 0
+        self.last_trained = time.monotonic()
+        self._lock = threading.Lock()
+        self._train_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="nlc-trainer", daemon=True
+        )
+        self._thread.start()
+
+    def add_sample(self, features: List[float], label: str, feedback: bool = False):
+        """Queue a labelled sample; wakes the worker when a retrain is due."""
+        with self._lock:
+            if feedback:
+                self.feedback_samples.append((list(features), label))
+            self.pending += 1
+            if self._due():
+                self._wake.set()
+
+    def _due(self) -> bool:
+        if not self.pending or len(self.nlc.memory) <= self.min_memory:
+            return False
+        return (
+            self.pending >= self.min_new_samples
+            or time.monotonic() - self.last_trained >= self.min_interval
+        )
+
+    def _run(self):
+        while not self._stopped:
+            self._wake.wait(self.min_interval)
+            self._wake.clear()
+            if self._stopped:
+                break
+            with self._lock:
+                due = self._due()
+            if due:
+                self.train_now()
+
+    def train_now(self) -> bool:
+        """Retrain from high-confidence memory plus feedback samples.
+
+        Returns:
+            True if a new model was fitted and swapped in
+        """
+        with self._train_lock:
+            with self._lock:
+                self.pending = 0
+                self.last_trained = time.monotonic()
+                feedback = list(self.feedback_samples)
+
+            X = []
+            y = []
+            for entry in list(self.nlc.memory):
+                if entry["confidence"] > 0.7:  # Use high-confidence interactions
+                    X.append(entry["features"])
+                    y.append(ROOT_CAUSES.index(entry["root_cause"]))
+            for features, label in feedback:
+                X.append(features)
+                y.append(ROOT_CAUSES.index(label))
+
+            if len(X) <= 10:  # Minimum data threshold
+                return False
+
+            try:
+                X = np.array(X)
+                y = np.array(y)
+                scaler = StandardScaler()
+                X_scaled = scaler.fit_transform(X)
+                model = self.nlc._new_model()
+                if hasattr(model, "partial_fit"):
+                    # Declare every root cause so later feedback can use any label
+                    all_classes = np.arange(len(ROOT_CAUSES))
+                    for _ in range(5):
+                        model.partial_fit(X_scaled, y, classes=all_classes)
+                else:
+                    model.fit(X_scaled, y)
+                atomic_write_bytes(ROOT_CAUSE_MODEL_FILE, pickle.dumps(model))
+                with self.nlc.model_lock:
+                    self.nlc.scaler = scaler
+                    self.nlc.root_cause_model = model
+                logger.info(
+                    f"Retrained and saved root cause model with {len(X)} samples"
+                )
+                return True
+            except Exception as e:
+                logger.error(f"Error retraining model: {str(e)}")
+                return False
+
+    def close(self):
+        """Stop the worker thread."""
+        self._stopped = True
+        self._wake.set()
+
+
 class NeuralLearningCore:
     """Neural Learning Core for AlphaVox to learn root causes of user behaviors."""
 
-    def __init__(self, max_memory: int = 1000, learning_rate: float = 0.01):
-        """Initialize the NLC with memory and learning components."""
+    def __init__(
+        self,
+        max_memory: int = 1000,
+        learning_rate: float = 0.01,
+        model_type: str = "random_forest",
+    ):
+        """Initialize the NLC with memory and learning components.
+
+        Args:
+            max_memory: Maximum interactions kept in memory
+            learning_rate: Step size for intent weight updates
+            model_type: "random_forest", or "sgd" for a partial-fit model
+                that applies caregiver feedback immediately
+        """
         self.max_memory = max_memory
         self.learning_rate = learning_rate
+        self.model_type = model_type
         self.memory = deque(maxlen=max_memory)  # Store interactions
         self.root_cause_model = None
         self.scaler = StandardScaler()
+        # Guards swapping/updating the model and scaler against inference
+        self.model_lock = threading.Lock()
         self.emotion_map = {
             "positive": 1.0,
             "neutral": 0.0,
@@ -70,13 +230,26 @@ class NeuralLearningCore:
             "confused": -0.5,
         }
         self.intent_weights = {}  # Track intent importance
+        # Per-user timestamps inside the frequency window, oldest first
+        self.recent_interactions = defaultdict(deque)
         self.load_memory()
+        # Memory is flushed in the background instead of on every interaction
+        self.memory_persister = WriteBehindPersister(
+            "nlc_memory", MEMORY_FILE, self._serialize_memory
+        )
         self.initialize_model()
+        self.trainer = RootCauseTrainingScheduler(self)
         logger.info("Neural Learning Core initialized")
 
+    def _new_model(self):
+        """Create an unfitted root cause model of the configured type."""
+        if self.model_type == "sgd":
+            return SGDClassifier(loss="log_loss", random_state=42)
+        return RandomForestClassifier(n_estimators=100, random_state=42)
+
     def initialize_model(self):
         """Initialize or load the root cause model."""
-        model_path = os.path.join(MODEL_DIR, "root_cause_model.pkl")
+        model_path = ROOT_CAUSE_MODEL_FILE
         if os.path.exists(model_path):
             try:
                 with open(model_path, "rb") as f:
@@ -84,13 +257,9 @@ class NeuralLearningCore:
                 logger.info(f"Loaded root cause model from {model_path}")
             except Exception as e:
                 logger.error(f"Error loading root cause model: {str(e)}")
-                self.root_cause_model = RandomForestClassifier(
-                    n_estimators=100, random_state=42
-                )
+                self.root_cause_model = self._new_model()
         else:
-            self.root_cause_model = RandomForestClassifier(
-                n_estimators=100, random_state=42
-            )
+            self.root_cause_model = self._new_model()
         logger.info("Root cause model initialized")
 
     def load_memory(self):
@@ -106,21 +275,51 @@ class NeuralLearningCore:
                 self.memory = deque(maxlen=self.max_memory)
         else:
             self.memory = deque(maxlen=self.max_memory)
+        self._seed_recent_interactions()
+
+    def _seed_recent_interactions(self):
+        """Rebuild the per-user frequency windows from loaded memory."""
+        self.recent_interactions.clear()
+        now = datetime.now()
+        for entry in self.memory:
+            timestamp = entry.get("timestamp")
+            if timestamp and (now - timestamp).total_seconds() < FREQUENCY_WINDOW_SECONDS:
+                self.recent_interactions[entry["user_id"]].append(timestamp)
+
+    def _record_interaction_time(self, user_id: str, timestamp: datetime):
+        """Add an interaction to the user's frequency window."""
+        self.recent_interactions[user_id].append(timestamp)
+
+    def _count_recent_interactions(self, user_id: str) -> int:
+        """Count the user's interactions in the last hour, pruning expired ones."""
+        window = self.recent_interactions.get(user_id)
+        if not window:
+            return 0
+        now = datetime.now()
+        while window and (now - window[0]).total_seconds() >= FREQUENCY_WINDOW_SECONDS:
+            window.popleft()
+        return len(window)
 
     def save_memory(self):
-        """Save interaction memory to disk."""
-        try:
-            with open(MEMORY_FILE, "wb") as f:
-                pickle.dump(list(self.memory), f)
+        """Save interaction memory to disk immediately."""
+        if self.memory_persister.flush(force=True):
             logger.info(f"Saved {len(self.memory)} interactions to memory")
-        except Exception as e:
-            logger.error(f"Error saving memory: {str(e)}")
 
-    def process_interaction(self, interaction: Dict, user_id: str) -> Dict:
-        """Process a user interaction and infer root causes."""
+    def _serialize_memory(self) -> bytes:
+        """Snapshot the memory deque for the write-behind persister."""
+        return pickle.dumps(list(self.memory))
+
+    def process_interaction(self, interaction: Dict, user_id: str, doc=None) -> Dict:
+        """Process a user interaction and infer root causes.
+
+        Args:
+            interaction: Interaction dictionary from the input processor
+            user_id: User identifier
+            doc: Optional spaCy Doc already parsed from the text input
+        """
         try:
             # Extract features from interaction
-            features = self._extract_features(interaction)
+            features = self._extract_features(interaction, user_id=user_id, doc=doc)
             context = interaction.get("context", {})
             timestamp = datetime.now()
 
@@ -137,9 +336,12 @@ class NeuralLearningCore:
                 "timestamp": timestamp,
             }
             self.memory.append(memory_entry)
+            self._record_interaction_time(user_id, timestamp)
 
             # Update model with feedback
-            self._update_model(features, root_cause, interaction.get("feedback", None))
+            self._update_model(
+                features, root_cause, interaction.get("feedback", None), confidence
+            )
 
             # Update intent weights
             intent = interaction.get("intent", "unknown")
@@ -147,7 +349,7 @@ class NeuralLearningCore:
                 self.intent_weights.get(intent, 0.0) + self.learning_rate * confidence
             )
 
-            self.save_memory()
+            self.memory_persister.mark_dirty()
             logger.info(
                 f"Processed interaction for user {user_id}: Root cause = {root_cause} (confidence: {confidence:.2f})"
             )
@@ -160,8 +362,16 @@ class NeuralLearningCore:
             logger.error(f"Error processing interaction: {str(e)}")
             return {"root_cause": "unknown", "confidence": 0.0, "features": []}
 
-    def _extract_features(self, interaction: Dict) -> List[float]:
-        """Extract features from an interaction for root cause analysis."""
+    def _extract_features(
+        self, interaction: Dict, user_id: Optional[str] = None, doc=None
+    ) -> List[float]:
+        """Extract features from an interaction for root cause analysis.
+
+        Args:
+            interaction: Interaction dictionary
+            user_id: User identifier, used when the interaction has none
+            doc: Optional spaCy Doc for text input, reused instead of re-parsing
+        """
         features = []
 
         # Input type (gesture, symbol, text, sound)
@@ -191,18 +401,14 @@ class NeuralLearningCore:
         features.append(time_of_day)
 
         # Interaction frequency for user
-        user_id = interaction.get("user_id", "unknown")
-        recent_interactions = sum(
-            1
-            for m in self.memory
-            if m["user_id"] == user_id
-            and (datetime.now() - m["timestamp"]).total_seconds() < 3600
-        )
+        user_id = interaction.get("user_id", user_id or "unknown")
+        recent_interactions = self._count_recent_interactions(user_id)
         features.append(recent_interactions / 10.0)  # Normalize
 
         # Text complexity (if text input)
         if input_type == "text":
-            doc = nlp(interaction.get("input", ""))
+            if doc is None:
+                doc = nlp(interaction.get("input", ""))
             complexity = len(
                 [token for token in doc if not token.is_stop and not token.is_punct]
             ) / max(len(doc), 1)
@@ -215,104 +421,76 @@ class NeuralLearningCore:
     def _infer_root_cause(self, features: List[float]) -> Tuple[str, float]:
         """Infer the root cause of an interaction using the model."""
         try:
-            # Scale features
-            X = np.array([features])
-            X_scaled = (
-                self.scaler.fit_transform(X)
-                if not self.scaler.mean_
-                else self.scaler.transform(X)
-            )
-
-            # Predict root cause
-            root_causes = [
-                "emotional_state",
-                "sensory_trigger",
-                "communication_intent",
-                "social_context",
-                "cognitive_load",
-                "unknown",
-            ]
-            if self.root_cause_model:
-                prediction = self.root_cause_model.predict(X_scaled)[0]
-                probabilities = self.root_cause_model.predict_proba(X_scaled)[0]
+            # Scale and predict against a consistent model/scaler pair; models
+            # are swapped, never modified in place, so prediction is lock-free
+            with self.model_lock:
+                X_scaled = self._scale_features(np.array([features]))
+                model = self.root_cause_model
+
+            # Predict root cause and probabilities in one call
+            if model:
+                predictions, probabilities = predict_with_proba(model, X_scaled)
+                probabilities = probabilities[0]
                 confidence = float(np.max(probabilities))
-                root_cause = root_causes[prediction]
+                root_cause = ROOT_CAUSES[predictions[0]]
             else:
                 root_cause = "unknown"
                 confidence = 0.5
 
             # Adjust confidence based on entropy
-            if self.root_cause_model:
+            if model:
                 entropy_val = entropy(probabilities)
-                confidence *= 1 - entropy_val / np.log(len(root_causes))
+                confidence *= 1 - entropy_val / np.log(len(ROOT_CAUSES))
 
             return root_cause, confidence
         except Exception as e:
             logger.error(f"Error inferring root cause: {str(e)}")
             return "unknown", 0.0
 
+    def _scale_features(self, X: np.ndarray) -> np.ndarray:
+        """Scale features, fitting the scaler first if it has never been fit."""
+        if not hasattr(self.scaler, "mean_"):
+            return self.scaler.fit_transform(X)
+        return self.scaler.transform(X)
+
     def _update_model(
-        self, features: List[float], root_cause: str, feedback: Optional[Dict]
+        self,
+        features: List[float],
+        root_cause: str,
+        feedback: Optional[Dict],
+        confidence: float = 0.0,
     ):
-        """Update the root cause model with new data."""
+        """Queue new data for the training scheduler.
+
+        Caregiver feedback is applied immediately when the model supports
+        partial_fit. The update goes into a copy that is then swapped in,
+        so inference never predicts with a model that is being modified;
+        full refits always happen on the scheduler's worker.
+        """
         try:
-            root_causes = [
-                "emotional_state",
-                "sensory_trigger",
-                "communication_intent",
-                "social_context",
-                "cognitive_load",
-                "unknown",
-            ]
             if feedback and "correct_root_cause" in feedback:
                 true_label = feedback["correct_root_cause"]
-                if true_label in root_causes:
-                    X = np.array([features])
-                    y = np.array([root_causes.index(true_label)])
-                    X_scaled = (
-                        self.scaler.fit_transform(X)
-                        if not self.scaler.mean_
-                        else self.scaler.transform(X)
-                    )
-                    self.root_cause_model.fit(X_scaled, y)
+                if true_label in ROOT_CAUSES:
+                    if hasattr(self.root_cause_model, "partial_fit"):
+                        X = np.array([features])
+                        y = np.array([ROOT_CAUSES.index(true_label)])
+                        with self.model_lock:
+                            X_scaled = self._scale_features(X)
+                            model = copy.deepcopy(self.root_cause_model)
+                            model.partial_fit(
+                                X_scaled, y, classes=np.arange(len(ROOT_CAUSES))
+                            )
+                            self.root_cause_model = model
+                    self.trainer.add_sample(features, true_label, feedback=True)
                     logger.info(f"Updated model with feedback: {true_label}")
-            # Periodically retrain with memory
-            if len(self.memory) > 100:
-                self._retrain_model()
+            elif confidence > 0.7:  # High-confidence interactions feed retraining
+                self.trainer.add_sample(features, root_cause)
         except Exception as e:
             logger.error(f"Error updating model: {str(e)}")
 
     def _retrain_model(self):
-        """Retrain the root cause model using memory data."""
-        try:
-            X = []
-            y = []
-            for entry in self.memory:
-                if entry["confidence"] > 0.7:  # Use high-confidence interactions
-                    X.append(entry["features"])
-                    root_causes = [
-                        "emotional_state",
-                        "sensory_trigger",
-                        "communication_intent",
-                        "social_context",
-                        "cognitive_load",
-                        "unknown",
-                    ]
-                    y.append(root_causes.index(entry["root_cause"]))
-
-            if len(X) > 10:  # Minimum data threshold
-                X = np.array(X)
-                y = np.array(y)
-                X_scaled = self.scaler.fit_transform(X)
-                self.root_cause_model.fit(X_scaled, y)
-                model_path = os.path.join(MODEL_DIR, "root_cause_model.pkl")
-                with open(model_path, "wb") as f:
-                    pickle.dump(self.root_cause_model, f)
-                logger.info(
-                    f"Retrained and saved root cause model with {len(X)} samples"
-                )
-        except Exception as e:
-            logger.error(f"Error retraining model: {str(e)}")
+        """Retrain the root cause model now (blocking) using memory data."""
+        return self.trainer.train_now()
 
     def get_user_insights(self, user_id: str) -> Dict:
         """Generate insights about a user's root causes."""
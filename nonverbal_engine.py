@@ -30,6 +30,37 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("nonverbal_engine")
 
 
+# Spoken messages for classified inputs (also used to pre-warm speech audio)
+GESTURE_INTENT_MESSAGES = {
+    "affirm": "Yes, I agree.",
+    "deny": "No, I don't want that.",
+    "help": "I need help please.",
+    "greet": "Hello there!",
+    "like": "I like this.",
+    "dislike": "I don't like this.",
+    "stop": "Please stop.",
+    "unknown": "I'm trying to communicate something.",
+}
+
+EYE_REGION_MESSAGES = {
+    "top_left": "Let's go back.",
+    "top_right": "Let's go forward.",
+    "bottom_left": "I want to cancel.",
+    "bottom_right": "I confirm this choice.",
+    "center": "I select this option.",
+}
+
+SOUND_MESSAGES = {
+    "hum": "I'm thinking about it.",
+    "click": "I choose this option.",
+    "distress": "I need help right now.",
+    "soft": "I'm unsure about this.",
+    "loud": "I'm excited about this!",
+    "short_vowel": "I acknowledge that.",
+    "repeated_sound": "Please pay attention to this.",
+}
+
+
 class NonverbalEngine:
     """
     The NonverbalEngine is responsible for classifying gestures, eye movements,
@@ -358,18 +389,7 @@ class NonverbalEngine:
         )
 
         # Generate a relevant message based on the intent
-        intent_messages = {
-            "affirm": "Yes, I agree.",
-            "deny": "No, I don't want that.",
-            "help": "I need help please.",
-            "greet": "Hello there!",
-            "like": "I like this.",
-            "dislike": "I don't like this.",
-            "stop": "Please stop.",
-            "unknown": "I'm trying to communicate something.",
-        }
-
-        result["message"] = intent_messages.get(
+        result["message"] = GESTURE_INTENT_MESSAGES.get(
             result["intent"], "I'm trying to communicate."
         )
 
@@ -405,15 +425,7 @@ class NonverbalEngine:
         )
 
         # Generate appropriate message
-        region_messages = {
-            "top_left": "Let's go back.",
-            "top_right": "Let's go forward.",
-            "bottom_left": "I want to cancel.",
-            "bottom_right": "I confirm this choice.",
-            "center": "I select this option.",
-        }
-
-        result["message"] = region_messages.get(region, "I'm looking at something.")
+        result["message"] = EYE_REGION_MESSAGES.get(region, "I'm looking at something.")
 
         # Add to interaction history
         self.interaction_history.append(
@@ -446,17 +458,7 @@ class NonverbalEngine:
         )
 
         # Generate appropriate message
-        sound_messages = {
-            "hum": "I'm thinking about it.",
-            "click": "I choose this option.",
-            "distress": "I need help right now.",
-            "soft": "I'm unsure about this.",
-            "loud": "I'm excited about this!",
-            "short_vowel": "I acknowledge that.",
-            "repeated_sound": "Please pay attention to this.",
-        }
-
-        result["message"] = sound_messages.get(
+        result["message"] = SOUND_MESSAGES.get(
             sound_pattern, "I'm trying to say something."
         )
 
@@ -643,6 +645,34 @@ class NonverbalEngine:
         # Return the emotional mapping for the gesture, or an empty dict if not found
         return emotion_map.get(gesture_name, {})
 
+    def speech_phrases(self) -> List[Tuple[str, str, str]]:
+        """List the (message, expression, emotion_tier) outputs of the current maps.
+
+        Used to pre-render speech audio for the messages this engine produces.
+        """
+        phrases = []
+        sources = [
+            (self.gesture_map, lambda key, entry: GESTURE_INTENT_MESSAGES.get(
+                entry.get("intent"), "I'm trying to communicate."
+            )),
+            (self.eye_region_map, lambda key, entry: EYE_REGION_MESSAGES.get(
+                key, "I'm looking at something."
+            )),
+            (self.sound_map, lambda key, entry: SOUND_MESSAGES.get(
+                key, "I'm trying to say something."
+            )),
+        ]
+        for mapping, message_for in sources:
+            for key, entry in mapping.items():
+                phrases.append(
+                    (
+                        message_for(key, entry),
+                        entry.get("expression", "neutral"),
+                        entry.get("emotion_tier", "moderate"),
+                    )
+                )
+        return phrases
+
     def _get_default_gesture_map(self):
         """Get default gesture mappings"""
         return {
@@ -0,0 +1,236 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Streaming periodicity detection for movement signals.
+
+Samples of one or more movement signals (e.g. head, body) are written
+into a preallocated ring buffer together with their capture timestamps.
+Every few samples the window is analyzed for all signals at once:
+vectorized peak picking gives the rhythm and its regularity, and an FFT
+over the window (resampled onto an even time grid, since frames do not
+arrive at a fixed rate) gives the dominant frequency and how much of the
+signal's power it holds. Between analyses the last result is reused, so
+the per-frame cost is a single column write.
+"""
+
+import logging
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PEAK_THRESHOLD = 0.02  # Peak height above the window mean
+CONSISTENCY_THRESHOLD = 0.3  # Max std/mean of peak intervals for a rhythm
+PERIODICITY_THRESHOLD = 0.5  # Min share of band power in the dominant bin
+MIN_FREQUENCY = 0.25  # Hz
+MAX_FREQUENCY = 8.0  # Hz
+
+
+class PeriodicityDetector:
+    """
+    Incremental repetitive-movement detector over several signals.
+    """
+
+    def __init__(
+        self,
+        signals: Sequence[str] = ("movement",),
+        capacity: int = 120,
+        min_samples: int = 60,
+        hop: int = 10,
+        peak_threshold: float = PEAK_THRESHOLD,
+    ):
+        """
+        Args:
+            signals: Names of the signals sampled together
+            capacity: Samples kept per signal
+            min_samples: Samples needed before analyzing
+            hop: Samples between analyses
+            peak_threshold: Peak height above the window mean
+        """
+        self.signals = list(signals)
+        self.capacity = capacity
+        self.min_samples = min(min_samples, capacity)
+        self.hop = max(1, hop)
+        self.peak_threshold = peak_threshold
+
+        self._values = np.zeros((len(self.signals), capacity))
+        self._times = np.zeros(capacity)
+        self._index = {name: row for row, name in enumerate(self.signals)}
+        self.reset()
+
+    def reset(self):
+        """Drop all samples"""
+        self._head = 0  # Next write position
+        self._count = 0
+        self._since_analysis = 0
+        self.patterns: List[Dict] = []
+
+    def __len__(self):
+        return self._count
+
+    def push(self, timestamp: float, values: Dict[str, float]) -> List[Dict]:
+        """
+        Add one sample of every signal
+
+        Args:
+            timestamp: Capture time of the sample (seconds)
+            values: Signal values by name; missing signals repeat their
+                previous value (0 before the first sample)
+
+        Returns:
+            list: Repetitive patterns from the most recent analysis
+        """
+        column = self._values[:, self._head]
+        if self._count:
+            column[:] = self._values[:, self._head - 1]
+        else:
+            column[:] = 0.0
+        for name, value in values.items():
+            row = self._index.get(name)
+            if row is not None:
+                column[row] = value
+        self._times[self._head] = timestamp
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+        self._since_analysis += 1
+        if self._count >= self.min_samples and self._since_analysis >= self.hop:
+            self._since_analysis = 0
+            self.patterns = self.analyze()
+        return self.patterns
+
+    def window(self):
+        """
+        Get the buffered samples in time order
+
+        Returns:
+            tuple: (timestamps, values) with values shaped (signals, samples)
+        """
+        if self._count < self.capacity:
+            return self._times[: self._count], self._values[:, : self._count]
+        order = np.roll(np.arange(self.capacity), -self._head)
+        return self._times[order], self._values[:, order]
+
+    def analyze(self) -> List[Dict]:
+        """Analyze the current window for every signal"""
+        times, values = self.window()
+        if len(times) < 3 or times[-1] <= times[0]:
+            return []
+
+        peak_stats = self._peak_stats(times, values)
+        spectral = self._spectral_stats(times, values)
+
+        # Rhythms in movement too small to cross the peak threshold are noise
+        active = np.ptp(values, axis=1) >= self.peak_threshold
+
+        patterns = []
+        for row, name in enumerate(self.signals):
+            if not active[row]:
+                continue
+            peaks = peak_stats[row]
+            frequency, periodicity = spectral[row]
+            rhythmic = peaks is not None and peaks["consistency"] > (
+                1.0 - CONSISTENCY_THRESHOLD
+            )
+            if not rhythmic and periodicity < PERIODICITY_THRESHOLD:
+                continue
+            patterns.append(
+                {
+                    "type": "repetitive_movement",
+                    "signal": name,
+                    "frequency": peaks["frequency"] if rhythmic else frequency,
+                    "dominant_frequency": frequency,
+                    "periodicity": periodicity,
+                    "consistency": peaks["consistency"] if peaks else 0.0,
+                    "count": peaks["count"] if peaks else 0,
+                }
+            )
+        return patterns
+
+    def _peak_stats(self, times, values) -> List[Optional[Dict]]:
+        """Local maxima above the window mean, and the regularity of their spacing"""
+        threshold = values.mean(axis=1, keepdims=True) + self.peak_threshold
+        middle = values[:, 1:-1]
+        is_peak = (middle > threshold) & (middle > values[:, :-2]) & (
+            middle > values[:, 2:]
+        )
+
+        stats = []
+        for row_peaks in is_peak:
+            peak_times = times[1:-1][row_peaks]
+            if len(peak_times) < 3:
+                stats.append(None)
+                continue
+            intervals = np.diff(peak_times)
+            mean_interval = intervals.mean()
+            if mean_interval <= 0:
+                stats.append(None)
+                continue
+            stats.append(
+                {
+                    "frequency": float(1.0 / mean_interval),
+                    "consistency": float(1.0 - intervals.std() / mean_interval),
+                    "count": int(len(peak_times)),
+                }
+            )
+        return stats
+
+    def _spectral_stats(self, times, values):
+        """Dominant in-band frequency and its share of the in-band power"""
+        n = len(times)
+        grid = np.linspace(times[0], times[-1], n)
+        sample_rate = (n - 1) / (times[-1] - times[0])
+
+        if np.allclose(np.diff(times), grid[1] - grid[0], rtol=0.05):
+            resampled = values
+        else:
+            resampled = np.stack([np.interp(grid, times, row) for row in values])
+
+        detrended = resampled - resampled.mean(axis=1, keepdims=True)
+        power = np.abs(np.fft.rfft(detrended * np.hanning(n), axis=1)) ** 2
+        freqs = np.fft.rfftfreq(n, d=1.0 / sample_rate)
+        band = (freqs >= MIN_FREQUENCY) & (freqs <= min(MAX_FREQUENCY, sample_rate / 2))
+        if not band.any():
+            return [(0.0, 0.0)] * len(values)
+
+        band_power = power[:, band]
+        band_freqs = freqs[band]
+        totals = band_power.sum(axis=1)
+        peak_bins = band_power.argmax(axis=1)
+
+        results = []
+        for row, peak_bin in enumerate(peak_bins):
+            if totals[row] <= 0:
+                results.append((0.0, 0.0))
+                continue
+            # Count the neighbouring bins too, since the window spreads a
+            # pure tone over about three bins
+            lo, hi = max(0, peak_bin - 1), peak_bin + 2
+            share = band_power[row, lo:hi].sum() / totals[row]
+            results.append((float(band_freqs[peak_bin]), float(share)))
+        return results
+
+
+# ==============================================================================
+# © 2025 Everett Nathaniel Christman & Misty Gail Christman
+# The Christman AI Project — Luma Cognify AI
+# All rights reserved. Unauthorized use, replication, or derivative training 
+# of this material is prohibited.
+# Core Directive: "How can I help you love yourself more?" 
+# Autonomy & Alignment Protocol v3.0
+# ==============================================================================
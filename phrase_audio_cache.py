@@ -0,0 +1,448 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Managed cache of synthesized phrase audio.
+
+Speech files live in one directory under content-hash filenames. The
+cache keeps an LRU index of those files (size and last use) in memory,
+persists it to a JSON index file with write-behind, and evicts the
+least recently used files once the byte or entry budget is exceeded.
+Phrases rendered by the pre-warmer are pinned and never evicted, so the
+common AAC outputs are always served from disk.
+
+The app runs several worker processes over one audio directory. Hits
+are answered from the in-memory index without touching the disk. On a
+miss, a file another process already rendered is adopted instead of
+rendered again. One process, the owner (holder of an advisory lock on
+the directory), persists the index, evicts, rescans the directory for
+files the others wrote and runs the pre-warmer. A file the owner evicted
+can still be in another process's index; serving it fails, and forget()
+drops the entry so the next request renders it again.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows - every process acts as the owner
+    fcntl = None
+
+from write_behind import WriteBehindPersister
+
+logger = logging.getLogger(__name__)
+
+AUDIO_DIR = os.path.join(os.getcwd(), "static", "audio")
+INDEX_FILENAME = ".phrase_index.json"
+OWNER_LOCK_FILENAME = ".phrase_cache.lock"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 10000
+
+
+def acquire_owner_lock(directory: str):
+    """Try to become the cache owner for a directory.
+
+    Returns:
+        The open lock file (keep it open for the life of the process), or
+        None if another process already owns the directory
+    """
+    os.makedirs(directory, exist_ok=True)
+    lock_file = open(os.path.join(directory, OWNER_LOCK_FILENAME), "a")
+    if fcntl is None:
+        return lock_file
+    try:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+class PhraseAudioCache:
+    """LRU-bounded directory of rendered speech files with an index file."""
+
+    def __init__(
+        self,
+        directory: str = AUDIO_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        owner: bool = True,
+    ):
+        """Initialize the cache, loading or rebuilding the index.
+
+        Args:
+            directory: Directory holding the audio files
+            max_bytes: Total size budget for unpinned files
+            max_entries: Maximum number of unpinned files
+            owner: Whether this process persists the index and evicts files;
+                other processes only track what they use
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.owner = owner
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._render_locks: Dict[str, threading.Lock] = {}
+        # Unpinned files in LRU order (oldest first); pinned files apart,
+        # so eviction only ever walks evictable entries
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._pinned: Dict[str, Dict] = {}
+        self._bytes = 0  # Unpinned bytes
+        self.hits = 0
+        self.misses = 0
+
+        self.index_path = os.path.join(directory, INDEX_FILENAME)
+        self._load_index()
+        self.index_persister = None
+        if owner:
+            self.index_persister = WriteBehindPersister(
+                "phrase-audio-index", self.index_path, self._serialize_index
+            )
+
+    def _load_index(self) -> None:
+        try:
+            with open(self.index_path, "r") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = None
+
+        if entries is None:
+            # First run: adopt the files already on disk, oldest first
+            entries = self._scan_directory()
+            logger.info(f"Indexed {len(entries)} existing audio files in {self.directory}")
+
+        for entry in entries:
+            self._insert(entry)
+
+    def _scan_directory(self):
+        entries = []
+        for item in os.scandir(self.directory):
+            if item.name.startswith(".") or item.name.endswith(".tmp"):
+                continue
+            if not item.is_file():
+                continue
+            stat = item.stat()
+            entries.append(
+                {"file": item.name, "size": stat.st_size, "last_used": stat.st_mtime}
+            )
+        entries.sort(key=lambda e: e["last_used"])
+        return entries
+
+    def _insert(self, entry: Dict) -> None:
+        """Track an entry as most recently used (lock held)."""
+        if entry.get("pinned"):
+            self._pinned[entry["file"]] = entry
+        else:
+            self._entries[entry["file"]] = entry
+            self._bytes += entry["size"]
+
+    def _discard(self, filename: str) -> Optional[Dict]:
+        """Stop tracking a file; returns its entry (lock held)."""
+        entry = self._pinned.pop(filename, None)
+        if entry is None:
+            entry = self._entries.pop(filename, None)
+            if entry is not None:
+                self._bytes -= entry["size"]
+        return entry
+
+    def _mark_dirty(self) -> None:
+        if self.index_persister is not None:
+            self.index_persister.mark_dirty()
+
+    def _serialize_index(self) -> bytes:
+        with self._lock:
+            entries = list(self._pinned.values()) + list(self._entries.values())
+            return json.dumps(entries).encode("utf-8")
+
+    def path_for(self, filename: str) -> str:
+        return os.path.join(self.directory, filename)
+
+    def lookup(self, filename: str) -> Optional[str]:
+        """Return the file's path and mark it recently used, or None on a miss.
+
+        Only the index is consulted; see forget() for entries whose file
+        another process has deleted.
+        """
+        with self._lock:
+            entry = self._pinned.get(filename)
+            if entry is None:
+                entry = self._entries.get(filename)
+                if entry is not None:
+                    self._entries.move_to_end(filename)
+            if entry is None:
+                return None
+            entry["last_used"] = time.time()
+        self._mark_dirty()
+        return self.path_for(filename)
+
+    def forget(self, filename: str) -> None:
+        """Drop an entry whose file could not be opened.
+
+        Called when serving a cached file fails because another process
+        evicted it, so the next get_or_render() renders it again.
+        """
+        with self._lock:
+            entry = self._discard(filename)
+        if entry is not None:
+            logger.debug(f"Forgot missing cached audio {filename}")
+            self._mark_dirty()
+
+    def get_or_render(
+        self, filename: str, render: Callable[[str], None], pin: bool = False
+    ) -> str:
+        """Return the path of a cached file, rendering it on a miss.
+
+        Concurrent misses for the same filename render only once. The
+        render callback writes to a temporary path which is renamed into
+        place, so readers never see a partial file.
+
+        Args:
+            filename: Content-hash filename inside the cache directory
+            render: Called with the temporary output path on a miss
+            pin: Exempt the file from eviction
+
+        Returns:
+            Absolute path of the audio file
+        """
+        path = self.lookup(filename)
+        if path is not None:
+            self.hits += 1
+            if pin:
+                self.pin(filename)
+            return path
+
+        with self._lock:
+            render_lock = self._render_locks.setdefault(filename, threading.Lock())
+        with render_lock:
+            path = self.lookup(filename)
+            if path is not None:
+                self.hits += 1
+            elif self._adopt(filename, pin):
+                # Rendered by another worker process
+                path = self.path_for(filename)
+                self.hits += 1
+            else:
+                self.misses += 1
+                path = self.path_for(filename)
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                try:
+                    render(tmp_path)
+                    os.replace(tmp_path, path)
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.unlink(tmp_path)
+                self.add(filename, pinned=pin)
+        with self._lock:
+            self._render_locks.pop(filename, None)
+        if pin:
+            self.pin(filename)
+        return path
+
+    def _adopt(self, filename: str, pinned: bool) -> bool:
+        """Track a file already on disk; returns False if there is none."""
+        try:
+            self.add(filename, pinned=pinned)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def add(self, filename: str, pinned: bool = False) -> None:
+        """Record a file written into the cache directory and enforce the budget."""
+        size = os.path.getsize(self.path_for(filename))
+        with self._lock:
+            old = self._discard(filename)
+            if old is not None:
+                pinned = pinned or old.get("pinned", False)
+            entry = {"file": filename, "size": size, "last_used": time.time()}
+            if pinned:
+                entry["pinned"] = True
+            self._insert(entry)
+            self._evict()
+        self._mark_dirty()
+
+    def pin(self, filename: str) -> None:
+        with self._lock:
+            entry = self._entries.get(filename)
+            if entry is not None:
+                self._discard(filename)
+                entry["pinned"] = True
+                self._insert(entry)
+                self._mark_dirty()
+
+    def rescan(self) -> None:
+        """Adopt files other processes wrote and forget deleted ones, then evict."""
+        on_disk = {entry["file"]: entry for entry in self._scan_directory()}
+        with self._lock:
+            tracked = list(self._entries) + list(self._pinned)
+            for name in tracked:
+                if name not in on_disk:
+                    self._discard(name)
+            for name, entry in on_disk.items():
+                if name not in self._entries and name not in self._pinned:
+                    # Files new to this index count as just used
+                    entry["last_used"] = time.time()
+                    self._insert(entry)
+            self._evict()
+        self._mark_dirty()
+
+    def _evict(self) -> None:
+        """Drop least recently used unpinned entries while over budget (lock held).
+
+        Only the owner deletes files; other processes just forget entries
+        beyond the budget.
+        """
+        while self._entries and (
+            self._bytes > self.max_bytes or len(self._entries) > self.max_entries
+        ):
+            name, entry = self._entries.popitem(last=False)
+            self._bytes -= entry["size"]
+            if not self.owner:
+                continue
+            try:
+                os.unlink(self.path_for(name))
+            except OSError:
+                pass
+            logger.debug(f"Evicted cached audio {name}")
+
+    def stats(self) -> Dict:
+        with self._lock:
+            pinned_bytes = sum(e["size"] for e in self._pinned.values())
+            return {
+                "entries": len(self._entries) + len(self._pinned),
+                "bytes": self._bytes + pinned_bytes,
+                "pinned": len(self._pinned),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class PhrasePrewarmer:
+    """Renders the known phrase set in the background.
+
+    The phrase source is re-read every ``interval`` seconds and any phrase
+    not rendered yet is synthesized, so edits to the phrase maps are picked
+    up without a restart.
+    """
+
+    def __init__(
+        self,
+        cache: PhraseAudioCache,
+        collect_phrases: Callable[[], Iterable[Tuple]],
+        synthesize: Callable[..., Optional[str]],
+        interval: float = 300.0,
+    ):
+        """Initialize the pre-warmer.
+
+        Args:
+            cache: Cache whose rendered files are pinned
+            collect_phrases: Returns tuples of arguments for synthesize
+            synthesize: Renders one phrase and returns its URL or path
+            interval: Seconds between rescans of the phrase set
+        """
+        self.cache = cache
+        self.collect_phrases = collect_phrases
+        self.synthesize = synthesize
+        self.interval = interval
+        self.warmed: Set[Tuple] = set()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="phrase-prewarmer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def warm_once(self) -> int:
+        """Render every phrase not warmed yet.
+
+        Returns:
+            Number of phrases rendered or confirmed in this pass
+        """
+        try:
+            phrases = list(dict.fromkeys(self.collect_phrases()))
+        except Exception as e:
+            logger.error(f"Error collecting phrases to pre-warm: {str(e)}")
+            return 0
+
+        warmed = 0
+        for args in phrases:
+            if self._stop.is_set():
+                break
+            if args in self.warmed:
+                continue
+            try:
+                location = self.synthesize(*args)
+            except Exception as e:
+                logger.warning(f"Could not pre-warm phrase {args!r}: {str(e)}")
+                continue
+            if location:
+                self.cache.pin(os.path.basename(location))
+                self.warmed.add(args)
+                warmed += 1
+        if warmed:
+            logger.info(f"Pre-warmed {warmed} phrases ({self.cache.stats()})")
+        return warmed
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.warm_once()
+            self.cache.rescan()
+            self._stop.wait(self.interval)
+
+
+_phrase_cache = None
+_phrase_cache_lock = threading.Lock()
+
+
+_owner_lock_file = None
+
+
+def get_phrase_cache() -> PhraseAudioCache:
+    """Return this process's cache for static/audio.
+
+    The first worker process to start becomes the cache owner.
+    """
+    global _phrase_cache, _owner_lock_file
+    with _phrase_cache_lock:
+        if _phrase_cache is None:
+            _owner_lock_file = acquire_owner_lock(AUDIO_DIR)
+            _phrase_cache = PhraseAudioCache(owner=_owner_lock_file is not None)
+        return _phrase_cache
+
+
+# ==============================================================================
+# © 2025 Everett Nathaniel Christman & Misty Gail Christman
+# The Christman AI Project — Luma Cognify AI
+# All rights reserved. Unauthorized use, replication, or derivative training 
+# of this material is prohibited.
+# Core Directive: "How can I help you love yourself more?" 
+# Autonomy & Alignment Protocol v3.0
+# ==============================================================================
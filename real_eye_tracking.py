@@ -29,6 +29,8 @@ import threading
 import numpy as np
 from typing import Dict, Tuple, Optional, List
 
+from face_tracker import FaceTracker
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -108,6 +110,7 @@ class RealEyeTrackingService:
         self.eye_detect_interval = 0.1  # seconds
         self.last_detection_time = 0
         self.detection_count = 0
+        self.face_tracker = None  # Created once the cascades are loaded
 
         # Debug parameters
         self.debug_mode = False
@@ -153,6 +156,8 @@ class RealEyeTrackingService:
             return False
 
         # Start tracking thread
+        if self.face_tracker is not None:
+            self.face_tracker.reset()
         self.is_tracking = True
         self.tracking_thread = threading.Thread(target=self._tracking_loop)
         self.tracking_thread.daemon = True
@@ -233,10 +238,16 @@ class RealEyeTrackingService:
                 logger.error("Face cascade classifier is not loaded properly")
                 return
 
-            # Detect faces
-            faces = self.face_cascade.detectMultiScale(
-                gray, scaleFactor=1.1, minNeighbors=5, minSize=self.min_face_size
-            )
+            # Locate faces: a full detection every few frames or after the
+            # face is lost, a search around the last face box in between
+            if self.face_tracker is None:
+                self.face_tracker = FaceTracker(
+                    self.face_cascade,
+                    scale_factor=1.1,
+                    min_neighbors=5,
+                    min_size=self.min_face_size,
+                )
+            faces = self.face_tracker.locate(gray)
 
             # Update face detection status
             self.face_found = len(faces) > 0
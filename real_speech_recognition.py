@@ -24,6 +24,8 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 import numpy as np
 import sounddevice as sd
 
+from audio_ring import AudioRingBuffer, frame_features, zero_crossing_rate
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -31,6 +33,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 AUDIO_SAMPLE_RATE = 16000
+AUDIO_BUFFER_SECONDS = 5
+FRAME_DURATION = 0.02  # Seconds per analysis frame
 MIN_SPEECH_DURATION = 0.5
 SILENCE_THRESHOLD = 0.1
 AUDIO_CACHE_DIR = "audio_cache"
@@ -44,7 +48,8 @@ class RealSpeechRecognitionEngine:
         self.language = language
         self.is_listening = False
         self.callbacks = []
-        self.audio_buffer = []
+        self.audio_buffer = AudioRingBuffer(AUDIO_SAMPLE_RATE * AUDIO_BUFFER_SECONDS)
+        self.utterance_start = None  # Buffer position where speech began
         self.last_speech_time = 0
         self.silence_threshold = SILENCE_THRESHOLD
         self.min_speech_duration = MIN_SPEECH_DURATION
@@ -130,56 +135,44 @@ class RealSpeechRecognitionEngine:
             self.is_listening = False
 
     def _process_audio_chunk(self, audio_chunk: np.ndarray):
-        self.audio_buffer.append(audio_chunk.flatten())
-
-        max_buffer_size = int(AUDIO_SAMPLE_RATE * 5)
-        total_samples = sum(len(chunk) for chunk in self.audio_buffer)
-        while total_samples > max_buffer_size and self.audio_buffer:
-            removed = self.audio_buffer.pop(0)
-            total_samples -= len(removed)
+        self.audio_buffer.append(audio_chunk)
 
         if self._detect_speech(audio_chunk):
             self.last_speech_time = time.time()
-            if self._check_speech_duration():
-                combined_audio = np.concatenate(self.audio_buffer)
-                text, confidence, metadata = self._process_speech(combined_audio)
-                if text:
-                    for callback in self.callbacks:
-                        callback(text, confidence, metadata)
-                    self.audio_buffer = []
+            if self.utterance_start is None:
+                self.utterance_start = self.audio_buffer.position - audio_chunk.size
+        elif self.utterance_start is not None and self._check_speech_duration():
+            # Speech followed by enough silence: analyze the utterance in place
+            utterance = self.audio_buffer.since(self.utterance_start)
+            self.utterance_start = None
+            text, confidence, metadata = self._process_speech(utterance)
+            if text:
+                for callback in self.callbacks:
+                    callback(text, confidence, metadata)
+                self.audio_buffer.clear()
 
     def _detect_speech(self, audio_chunk: np.ndarray) -> bool:
         energy = np.mean(np.abs(audio_chunk))
         return energy > self.silence_threshold
 
     def _check_speech_duration(self) -> bool:
-        if not self.audio_buffer:
+        if not len(self.audio_buffer):
             return False
         return (time.time() - self.last_speech_time) > self.min_speech_duration
 
     def _process_speech(
         self, audio_data: np.ndarray
     ) -> Tuple[str, float, Dict[str, Any]]:
-        frame_size = int(AUDIO_SAMPLE_RATE * 0.02)
-        frames = [
-            audio_data[i : i + frame_size]
-            for i in range(0, len(audio_data), frame_size)
-        ]
-        energies = [
-            np.mean(np.abs(frame)) for frame in frames if len(frame) == frame_size
-        ]
+        frame_size = int(AUDIO_SAMPLE_RATE * FRAME_DURATION)
+        features = frame_features(audio_data, frame_size, self.silence_threshold)
+        energies = features["energy"]
 
-        if not energies:
+        if not len(energies):
             return "", 0.0, {"error": "No audio data"}
 
-        avg_energy = np.mean(energies)
-        energy_variance = np.var(energies)
-        zero_crossings = sum(
-            1
-            for i in range(1, len(audio_data))
-            if audio_data[i - 1] * audio_data[i] < 0
-        )
-        zero_crossing_rate = zero_crossings / len(audio_data)
+        avg_energy = energies.mean()
+        energy_variance = energies.var()
+        crossing_rate = zero_crossing_rate(audio_data)
 
         if avg_energy > self.silence_threshold * 2 and energy_variance > 0.001:
             text = (
@@ -199,7 +192,8 @@ class RealSpeechRecognitionEngine:
                     "audio_features": {
                         "energy": float(avg_energy),
                         "variance": float(energy_variance),
-                        "zero_crossing_rate": float(zero_crossing_rate),
+                        "zero_crossing_rate": float(crossing_rate),
+                        "voiced_ratio": float(features["voiced"].mean()),
                     },
                 },
             )
@@ -143,6 +143,23 @@ def add_initial_data():
         return True
 
 
+def backfill_rollups():
+    """Build caregiver analytics rollups for interactions saved before they existed."""
+    from app import app
+
+    with app.app_context():
+        from models import InteractionRollup
+
+        try:
+            # Users already backfilled are skipped, so this is safe to rerun
+            backfilled = InteractionRollup.backfill_missing()
+            logger.info(f"Backfilled interaction rollups for {backfilled} users.")
+            return True
+        except Exception as e:
+            logger.error(f"Error backfilling interaction rollups: {e}")
+            return False
+
+
 def run_migrations():
     """Run all database migrations."""
     db_url = get_database_url()
@@ -160,6 +177,9 @@ def run_migrations():
     if not add_initial_data():
         logger.warning("Failed to add initial data.")
 
+    if not backfill_rollups():
+        logger.warning("Failed to backfill interaction rollups.")
+
     return True
 
 
@@ -0,0 +1,356 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Asynchronous speech synthesis jobs.
+
+Routes submit the text to speak and return immediately; a bounded worker
+pool renders the audio. Jobs are keyed by a hash of their content, so
+simultaneous requests for the same message share one synthesis
+(single-flight). Clients read the result from the job status endpoint
+or its server-sent-event stream.
+
+The app runs several worker processes, so a status poll can reach a
+process that did not create the job. When given a state directory, the
+service writes each job's status there and answers lookups for jobs it
+does not hold from those files. An unfinished job whose owner process
+has exited, or whose state has not changed for SHARED_STALE_AFTER
+seconds, is treated as lost.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from write_behind import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_ERROR = "error"
+
+_JOB_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
+SHARED_POLL_INTERVAL = 0.1  # Seconds between reads of another process's job
+SHARED_STALE_AFTER = 300.0  # Seconds before an unfinished shared job is lost
+
+
+def _process_alive(pid) -> bool:
+    """Whether a process with this id exists on this host."""
+    if not isinstance(pid, int) or pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass  # Exists but belongs to another user
+    return True
+
+
+def _state_is_stale(state: Dict, mtime: float) -> bool:
+    """Whether an unfinished job's shared state can no longer complete."""
+    if state.get("status") in (JOB_DONE, JOB_ERROR):
+        return False
+    return (
+        not _process_alive(state.get("owner"))
+        or time.time() - mtime > SHARED_STALE_AFTER
+    )
+
+
+class SpeechJob:
+    """One synthesis request and its outcome."""
+
+    def __init__(self, job_id: str, args: tuple):
+        self.id = job_id
+        self.args = args
+        self.status = JOB_QUEUED
+        self.speech_url: Optional[str] = None
+        self.error: Optional[str] = None
+        self.created = time.time()
+        self.finished: Optional[float] = None
+        self._done = threading.Event()
+
+    @property
+    def is_finished(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job finishes; returns False on timeout."""
+        return self._done.wait(timeout)
+
+    def _finish(self, status: str, speech_url=None, error=None) -> None:
+        self.status = status
+        self.speech_url = speech_url
+        self.error = error
+        self.finished = time.time()
+        self._done.set()
+
+    def to_dict(self) -> Dict:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "speech_url": self.speech_url,
+            "error": self.error,
+        }
+
+
+class SharedSpeechJob(SpeechJob):
+    """A job owned by another process, read from its shared state file."""
+
+    def __init__(self, job_id: str, path: str):
+        super().__init__(job_id, ())
+        self.path = path
+
+    def refresh(self) -> bool:
+        """Reload the state file; returns False if it is gone or stale."""
+        try:
+            with open(self.path, "r") as f:
+                mtime = os.fstat(f.fileno()).st_mtime
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if _state_is_stale(state, mtime):
+            return False
+        if state["status"] in (JOB_DONE, JOB_ERROR):
+            self._finish(state["status"], state.get("speech_url"), state.get("error"))
+        else:
+            self.status = state["status"]
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.is_finished:
+            if not self.refresh():
+                self._finish(JOB_ERROR, error="Speech job was lost")
+                break
+            if self.is_finished:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(SHARED_POLL_INTERVAL)
+        return True
+
+
+class SpeechJobService:
+    """Bounded worker pool with single-flight deduplication of speech jobs."""
+
+    def __init__(
+        self,
+        render: Callable[..., Optional[str]],
+        max_workers: int = 4,
+        max_pending: int = 64,
+        max_finished: int = 1000,
+        finished_ttl: float = 600.0,
+        state_dir: Optional[str] = None,
+    ):
+        """Initialize the service.
+
+        Args:
+            render: Synthesizes (text, emotion, emotion_tier, voice_id) and
+                returns the speech URL, or None on failure
+            max_workers: Concurrent synthesis threads
+            max_pending: Unfinished jobs accepted before new ones are refused
+            max_finished: Finished jobs kept for status lookups
+            finished_ttl: Seconds a finished job is reused for identical requests
+            state_dir: Directory shared with other worker processes where job
+                status is written, so any process can answer lookups
+        """
+        self.render = render
+        self.max_pending = max_pending
+        self.max_finished = max_finished
+        self.finished_ttl = finished_ttl
+        self.state_dir = state_dir
+        if state_dir:
+            os.makedirs(state_dir, exist_ok=True)
+            self._clean_state_dir()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="speech-job"
+        )
+        self._jobs: "OrderedDict[str, SpeechJob]" = OrderedDict()
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def job_id(text, emotion=None, emotion_tier=None, voice_id=None) -> str:
+        """Content hash identifying a synthesis request."""
+        return hashlib.md5(
+            f"{text}|{emotion}|{emotion_tier}|{voice_id}".encode()
+        ).hexdigest()
+
+    def submit(
+        self,
+        text: str,
+        emotion: Optional[str] = None,
+        emotion_tier: Optional[str] = None,
+        voice_id: str = "us_male",
+        wait: float = 0.0,
+    ) -> SpeechJob:
+        """Queue a synthesis job, or join the identical one already queued.
+
+        Args:
+            text: Text to speak
+            emotion: Emotional expression
+            emotion_tier: Emotion intensity
+            voice_id: Voice profile
+            wait: Seconds to wait for completion, so cache hits can be
+                returned with their URL in the same response
+
+        Returns:
+            The (possibly shared) SpeechJob
+        """
+        args = (text, emotion, emotion_tier, voice_id)
+        job_id = self.job_id(*args)
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            reusable = job is not None and (
+                not job.is_finished
+                or (
+                    job.status == JOB_DONE
+                    and time.time() - job.finished < self.finished_ttl
+                )
+            )
+            created = not reusable
+            if created:
+                job = SpeechJob(job_id, args)
+                self._jobs[job_id] = job
+                self._jobs.move_to_end(job_id)
+                accepted = self._pending < self.max_pending
+                if accepted:
+                    self._pending += 1
+                self._prune()
+
+        # State files are written (and fsynced) outside the lock. The queued
+        # state is shared before the job runs, and a final state before the
+        # job is marked finished, so a later write never overwrites it
+        if created:
+            if accepted:
+                self._save_state(job)
+                self._executor.submit(self._run, job)
+            else:
+                self._finish(job, JOB_ERROR, error="Speech queue is full")
+
+        if wait and not job.is_finished:
+            job.wait(wait)
+        return job
+
+    def get(self, job_id: str) -> Optional[SpeechJob]:
+        """Look up a job, falling back to the state another process shared."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None or not self.state_dir:
+            return job
+        if not _JOB_ID_PATTERN.fullmatch(job_id):
+            return None
+        shared = SharedSpeechJob(job_id, self._state_path(job_id))
+        return shared if shared.refresh() else None
+
+    def _state_path(self, job_id: str) -> str:
+        return os.path.join(self.state_dir, f"{job_id}.json")
+
+    def _save_state(self, job: SpeechJob, **final) -> None:
+        if not self.state_dir:
+            return
+        state = job.to_dict()
+        state.update(final, owner=os.getpid())
+        try:
+            atomic_write_bytes(
+                self._state_path(job.id), json.dumps(state).encode("utf-8")
+            )
+        except OSError as e:
+            logger.error(f"Could not share speech job {job.id}: {str(e)}")
+
+    def _finish(self, job: SpeechJob, status: str, speech_url=None, error=None) -> None:
+        """Share a job's final state, then mark it finished."""
+        self._save_state(job, status=status, speech_url=speech_url, error=error)
+        job._finish(status, speech_url=speech_url, error=error)
+
+    def _clean_state_dir(self) -> None:
+        """Remove state left by exited processes and long-finished jobs."""
+        now = time.time()
+        for name in os.listdir(self.state_dir):
+            path = os.path.join(self.state_dir, name)
+            try:
+                mtime = os.path.getmtime(path)
+                if name.startswith("."):
+                    # Temp file of an interrupted atomic write
+                    stale = now - mtime > SHARED_STALE_AFTER
+                else:
+                    with open(path, "r") as f:
+                        state = json.load(f)
+                    stale = _state_is_stale(state, mtime) or (
+                        state.get("status") in (JOB_DONE, JOB_ERROR)
+                        and now - mtime > self.finished_ttl
+                    )
+            except ValueError:
+                stale = True
+            except OSError:
+                continue
+            if stale:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _run(self, job: SpeechJob) -> None:
+        job.status = JOB_RUNNING
+        try:
+            speech_url = self.render(*job.args)
+            if speech_url:
+                self._finish(job, JOB_DONE, speech_url=speech_url)
+            else:
+                self._finish(job, JOB_ERROR, error="Speech synthesis failed")
+        except Exception as e:
+            logger.error(f"Speech job {job.id} failed: {str(e)}")
+            self._finish(job, JOB_ERROR, error=str(e))
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _prune(self) -> None:
+        """Drop the oldest finished jobs beyond max_finished (lock held)."""
+        excess = len(self._jobs) - self.max_finished
+        if excess <= 0:
+            return
+        for job_id in [k for k, j in self._jobs.items() if j.is_finished][:excess]:
+            del self._jobs[job_id]
+            if self.state_dir:
+                try:
+                    os.remove(self._state_path(job_id))
+                except OSError:
+                    pass
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+# ==============================================================================
+# © 2025 Everett Nathaniel Christman & Misty Gail Christman
+# The Christman AI Project — Luma Cognify AI
+# All rights reserved. Unauthorized use, replication, or derivative training 
+# of this material is prohibited.
+# Core Directive: "How can I help you love yourself more?" 
+# Autonomy & Alignment Protocol v3.0
+# ==============================================================================
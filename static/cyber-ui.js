@@ -600,9 +600,7 @@ function processTextInput(text) {
         displayResponse(data);
 
         // Play audio if available
-        if (data.speech_url) {
-            playAudio(data.speech_url);
-        }
+        playSpeech(data);
 
         // Update self-learning status
         if (document.getElementById('learning-status-container')) {
@@ -664,9 +662,7 @@ function processGesture(gesture) {
         displayResponse(data);
 
         // Play audio if available
-        if (data.speech_url) {
-            playAudio(data.speech_url);
-        }
+        playSpeech(data);
 
         // Update self-learning status
         if (document.getElementById('learning-status-container')) {
@@ -734,9 +730,7 @@ function processSymbol(symbol) {
         displayResponse(data, responseContainer);
 
         // Play audio if available
-        if (data.speech_url) {
-            playAudio(data.speech_url);
-        }
+        playSpeech(data);
 
         // Update self-learning status if panel exists
         if (document.getElementById('learning-status-container')) {
@@ -856,6 +850,33 @@ function displayResponse(data, container = null) {
     `;
 }
 
+/**
+ * Play the speech for a response, waiting for queued synthesis if needed
+ * @param {Object} data - Response with speech_url and/or speech_events_url
+ */
+function playSpeech(data) {
+    if (data.speech_url) {
+        playAudio(data.speech_url);
+        return;
+    }
+    if (!data.speech_events_url || !window.EventSource) {
+        return;
+    }
+
+    // Audio is still being synthesized; play it when the job finishes
+    const events = new EventSource(data.speech_events_url);
+    events.addEventListener('done', function(event) {
+        events.close();
+        const job = JSON.parse(event.data);
+        if (job.speech_url) {
+            playAudio(job.speech_url);
+        }
+    });
+    events.addEventListener('error', function() {
+        events.close();
+    });
+}
+
 /**
  * Play audio from a URL
  */
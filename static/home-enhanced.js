@@ -170,9 +170,7 @@ function processTextInput(text) {
         displayResponse(data);
 
         // Play audio if available
-        if (data.speech_url) {
-            playAudio(data.speech_url);
-        }
+        playSpeech(data);
 
         // Simulate self-learning
         updateSelfLearningStatus(`Processing text input: "${text}"`, true);
@@ -213,9 +211,7 @@ function processGesture(gesture) {
         displayResponse(data);
 
         // Play audio if available
-        if (data.speech_url) {
-            playAudio(data.speech_url);
-        }
+        playSpeech(data);
 
         // Simulate self-learning
         updateSelfLearningStatus(`Processing gesture: "${gesture}"`, true);
@@ -398,9 +394,7 @@ function playWelcomeGreeting() {
     })
     .then(response => response.json())
     .then(data => {
-        if (data.speech_url) {
-            playAudio(data.speech_url);
-        }
+        playSpeech(data);
     })
     .catch(error => {
         console.error('Error with welcome greeting:', error);
@@ -529,9 +523,7 @@ function startAI() {
             `;
 
             // Play audio if available
-            if (data.speech_url) {
-                playAudio(data.speech_url);
-            }
+            playSpeech(data);
 
             // Start self-learning visualization
             window.selfLearningEnabled = true;
@@ -578,6 +570,33 @@ function stopAI() {
     });
 }
 
+/**
+ * Play the speech for a response, waiting for queued synthesis if needed
+ * @param {Object} data - Response with speech_url and/or speech_events_url
+ */
+function playSpeech(data) {
+    if (data.speech_url) {
+        playAudio(data.speech_url);
+        return;
+    }
+    if (!data.speech_events_url || !window.EventSource) {
+        return;
+    }
+
+    // Audio is still being synthesized; play it when the job finishes
+    const events = new EventSource(data.speech_events_url);
+    events.addEventListener('done', function(event) {
+        events.close();
+        const job = JSON.parse(event.data);
+        if (job.speech_url) {
+            playAudio(job.speech_url);
+        }
+    });
+    events.addEventListener('error', function() {
+        events.close();
+    });
+}
+
 function playAudio(url) {
     console.log('Playing audio from:', url);
 
@@ -36,9 +36,34 @@ function updateResponse(response) {
     responseContainer.appendChild(messageElement);
 
     // Play audio if a speech URL is provided
-    if (response.speech_url) {
-        playAudio(response.speech_url);
+    playSpeech(response);
+}
+
+/**
+ * Play the speech for a response, waiting for queued synthesis if needed
+ * @param {Object} data - Response with speech_url and/or speech_events_url
+ */
+function playSpeech(data) {
+    if (data.speech_url) {
+        playAudio(data.speech_url);
+        return;
+    }
+    if (!data.speech_events_url || !window.EventSource) {
+        return;
     }
+
+    // Audio is still being synthesized; play it when the job finishes
+    const events = new EventSource(data.speech_events_url);
+    events.addEventListener('done', function(event) {
+        events.close();
+        const job = JSON.parse(event.data);
+        if (job.speech_url) {
+            playAudio(job.speech_url);
+        }
+    });
+    events.addEventListener('error', function() {
+        events.close();
+    });
 }
 
 /**
@@ -163,9 +188,7 @@ function speakGreeting(greeting) {
     })
     .then(response => response.json())
     .then(data => {
-        if (data.speech_url) {
-            playAudio(data.speech_url);
-        }
+        playSpeech(data);
     })
     .catch(error => {
         console.error('Error with welcome greeting:', error);
@@ -0,0 +1,112 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Analytics Engine Unit Tests
+===========================
+
+Test the SQLite-backed analytics store and its reports.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import os
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from analytics_engine import AnalyticsEngine
+
+
+@pytest.mark.unit
+class TestAnalyticsEngine:
+    """Test buffered logging, reports and CSV migration"""
+
+    def test_logged_rows_are_visible_to_reports(self, tmp_path):
+        """Buffered rows are flushed before any report query"""
+        engine = AnalyticsEngine(data_dir=str(tmp_path), batch_size=100)
+        for _ in range(3):
+            engine.log_interaction("alice", "gesture", confidence=0.9)
+        engine.log_interaction("bob", "eye_movement")
+        engine.log_points("alice", 5)
+
+        stats = engine.get_user_stats("alice")
+        assert stats["total_interactions"] == 3
+        assert stats["most_used_interaction"] == "gesture"
+        assert stats["total_points"] == 5
+
+        report = engine.get_progress_report("alice", days=7)
+        assert report["total_interactions"] == 3
+
+    def test_session_counts_interactions(self, tmp_path):
+        """Ending a session records its duration and interaction count"""
+        engine = AnalyticsEngine(data_dir=str(tmp_path))
+        session_id = engine.start_session("alice")
+        engine.log_interaction("alice", "gesture")
+        assert engine.end_session(session_id)
+
+        sessions = engine.sessions_df
+        assert sessions.loc[0, "interaction_count"] == 1
+        assert pd.api.types.is_datetime64_any_dtype(sessions["start_time"])
+
+    def test_legacy_csv_is_imported_once(self, tmp_path):
+        """Existing CSV data is migrated into the database"""
+        pd.DataFrame(
+            [{"user_id": "alice", "symbol": "eat", "context": None,
+              "timestamp": datetime.now()}]
+        ).to_csv(tmp_path / "symbol_selections.csv", index=False)
+
+        engine = AnalyticsEngine(data_dir=str(tmp_path))
+        assert engine.get_user_stats("alice")["most_used_symbol"] == "eat"
+        assert not os.path.exists(tmp_path / "symbol_selections.csv")
+
+        engine = AnalyticsEngine(data_dir=str(tmp_path))
+        assert len(engine.symbol_selections_df) == 1
+
+    def test_sessions_started_together_stay_separate(self, tmp_path):
+        """Two sessions in the same second never replace each other"""
+        engine = AnalyticsEngine(data_dir=str(tmp_path))
+        first = engine.start_session("alice")
+        second = engine.start_session("alice")
+
+        assert first != second
+        assert engine.end_session(first)
+        sessions = engine.sessions_df.set_index("session_id")
+        assert len(sessions) == 2
+        assert pd.isna(sessions.loc[second, "end_time"])
+
+    def test_duplicate_legacy_session_ids_are_renamed(self, tmp_path):
+        """Legacy sessions sharing an id are all imported"""
+        pd.DataFrame(
+            [{"user_id": "alice", "session_id": "alice_20250101090000",
+              "start_time": datetime(2025, 1, 1, 9), "interaction_count": n}
+             for n in (1, 2, 3)]
+        ).to_csv(tmp_path / "sessions.csv", index=False)
+
+        engine = AnalyticsEngine(data_dir=str(tmp_path))
+        sessions = engine.sessions_df.sort_values("interaction_count")
+        assert sessions["session_id"].tolist() == [
+            "alice_20250101090000",
+            "alice_20250101090000_2",
+            "alice_20250101090000_3",
+        ]
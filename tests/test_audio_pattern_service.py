@@ -0,0 +1,88 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Audio Pattern Service Unit Tests
+================================
+
+Test windowed sound features and vectorized pattern scoring.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import numpy as np
+import pytest
+from audio_pattern_service import AudioPatternService
+
+
+def tone(service, frequency, duration, intensity):
+    """Sine tone whose mean absolute amplitude equals intensity"""
+    t = np.arange(int(service.sample_rate * duration)) / service.sample_rate
+    amplitude = intensity * np.pi / 2
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+@pytest.mark.unit
+class TestAudioPatternService:
+    """Test the audio pattern service"""
+
+    def test_clip_features_use_fft_pitch_and_sounding_duration(self):
+        """Silence around a sound does not count toward its duration"""
+        service = AudioPatternService()
+        silence = np.zeros(service.sample_rate // 10, dtype=np.float32)
+        clip = np.concatenate([silence, tone(service, 450, 0.3, 0.8), silence])
+
+        matches, features = service.classify_clips(
+            [clip.tobytes()], return_features=True
+        )
+
+        assert features[0]["frequency"] == pytest.approx(450, abs=5)
+        assert features[0]["duration"] == pytest.approx(0.3, abs=0.06)
+        assert "distressed" in [match["pattern"] for match in matches[0]]
+
+    def test_batch_scores_match_single_clip_scores(self):
+        """Scoring clips together gives the same scores as one at a time"""
+        service = AudioPatternService()
+        clips = [tone(service, f, 0.5, 0.6) for f in (250, 700, 1100)]
+        _, features = service.classify_clips(clips, return_features=True)
+
+        batch = service.score_features(features)
+        single = np.vstack([service.score_features([f]) for f in features])
+        assert batch.shape == (3, len(service.sound_patterns))
+        assert np.allclose(batch, single)
+
+    def test_stream_reports_each_sound_event(self):
+        """Events are split on silence and scored as they end"""
+        service = AudioPatternService()
+        gap = np.zeros(service.sample_rate // 2, dtype=np.float32)
+        stream = np.concatenate(
+            [gap, tone(service, 450, 0.3, 0.8), gap, tone(service, 700, 0.6, 0.9), gap]
+        )
+        analyzer = service.create_stream_analyzer()
+
+        events = []
+        for start in range(0, len(stream), 1000):
+            events += analyzer.push(stream[start : start + 1000])
+
+        assert [round(e["features"]["frequency"], -1) for e in events] == [450, 700]
+        assert all(e["matches"] for e in events)
@@ -0,0 +1,77 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Audio Ring Buffer Unit Tests
+============================
+
+Test the audio ring buffer and vectorized frame features.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import numpy as np
+import pytest
+from audio_ring import AudioRingBuffer, frame_features, zero_crossing_rate
+
+
+@pytest.mark.unit
+class TestAudioRingBuffer:
+    """Test the audio ring buffer"""
+
+    def test_keeps_latest_samples_across_wraparound(self):
+        """Views match the tail of everything appended"""
+        ring = AudioRingBuffer(10)
+        appended = np.arange(37, dtype=np.float32)
+        for chunk in np.split(appended, [3, 10, 11, 25]):
+            ring.append(chunk)
+
+        assert len(ring) == 10
+        assert np.array_equal(ring.latest(), appended[-10:])
+        assert np.array_equal(ring.latest(4), appended[-4:])
+        assert np.array_equal(ring.since(30), appended[30:])
+        assert ring.start_position == 27
+
+    def test_views_are_zero_copy_and_read_only(self):
+        """Views share the buffer's memory and cannot be written"""
+        ring = AudioRingBuffer(8)
+        ring.append(np.ones(5))
+        view = ring.latest()
+        assert np.shares_memory(view, ring._data)
+        with pytest.raises(ValueError):
+            view[0] = 0
+
+
+@pytest.mark.unit
+class TestFrameFeatures:
+    """Test vectorized frame features"""
+
+    def test_energy_zcr_and_voicing_per_frame(self):
+        """Features match a direct per-frame computation"""
+        audio = np.concatenate([np.zeros(4), np.array([1, -1, 1, -1]), np.ones(2)])
+        features = frame_features(audio, 4, threshold=0.5)
+
+        assert features["energy"].tolist() == [0.0, 1.0]
+        assert features["zcr"].tolist() == [0.0, 0.75]
+        assert features["voiced"].tolist() == [False, True]
+        assert zero_crossing_rate(audio) == pytest.approx(4 / 10)
@@ -0,0 +1,262 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Behavior Pipeline Unit Tests
+============================
+
+Test latest-frame-wins scheduling of behavior analysis.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import io
+import struct
+import threading
+import time
+
+import cv2
+import pytest
+import numpy as np
+from behavior_capture import (
+    BehaviorCapture,
+    BehaviorPipeline,
+    BehaviorPipelineTable,
+    BehaviorResultStore,
+    read_frame_stream,
+)
+
+
+class FakeCapture:
+    """Stand-in for BehaviorCapture that blocks until released"""
+
+    processors = {"a": None, "b": None}
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.frames = []
+        self.is_tracking = False
+
+    def start_tracking(self):
+        self.is_tracking = True
+
+    def stop_tracking(self):
+        self.is_tracking = False
+
+    def process_frame(self, frame, executor=None, timestamp=None):
+        self.release.wait(5)
+        self.frames.append(frame)
+        return {"frame": frame, "tracking": True, "results": {}}
+
+    def _record_timing(self, stage, elapsed_ms):
+        pass
+
+    def get_stage_timings(self):
+        return {}
+
+
+def released_capture():
+    capture = FakeCapture()
+    capture.release.set()
+    return capture
+
+
+@pytest.mark.unit
+class TestBehaviorPipeline:
+    """Test the behavior pipeline"""
+
+    def test_stale_frames_are_dropped(self):
+        """Only the newest waiting frame is processed"""
+        capture = FakeCapture()
+        pipeline = BehaviorPipeline(capture)
+        pipeline.start()
+        try:
+            pipeline.submit("first")
+            assert pipeline.wait_for_result(0, timeout=0.2) is None
+            pipeline.submit("second")
+            last = pipeline.submit("third")
+            capture.release.set()
+
+            result = pipeline.wait_for_result(last - 1, timeout=5)
+            assert result["sequence"] == last
+            assert "second" not in capture.frames
+            assert capture.frames[-1] == "third"
+            assert pipeline.get_stats()["dropped"] == 1
+        finally:
+            pipeline.stop()
+
+    def test_subscribers_receive_results(self):
+        """Published results reach subscribers"""
+        capture = FakeCapture()
+        capture.release.set()
+        pipeline = BehaviorPipeline(capture)
+        received = []
+        pipeline.subscribe(received.append)
+        pipeline.start()
+        try:
+            sequence = pipeline.submit("frame")
+            pipeline.wait_for_result(sequence - 1, timeout=5)
+            assert received and received[-1]["sequence"] == sequence
+        finally:
+            pipeline.stop()
+
+
+@pytest.mark.unit
+class TestBehaviorSessions:
+    """Test per-session pipelines and the shared result store"""
+
+    def test_results_are_shared_between_processes(self, tmp_path):
+        """A store on the same directory sees another store's results"""
+        writer = BehaviorResultStore(str(tmp_path))
+        reader = BehaviorResultStore(str(tmp_path))
+        frame = np.zeros((8, 8, 3), dtype=np.uint8)
+        writer.publish("session-one", {"sequence": 3, "frame": frame, "tracking": True})
+
+        record = reader.wait_for_result("session-one", 0, timeout=1)
+        assert record["result"] == {"sequence": 3, "tracking": True}
+        sequence, jpeg = reader.annotated_jpeg("session-one")
+        assert sequence == 3 and jpeg.startswith(b"\xff\xd8")
+        assert reader.latest("session-two") is None
+        assert reader.annotated_jpeg("session-two") is None
+
+    def test_invalid_keys_are_rejected(self, tmp_path):
+        """Session keys cannot name files outside the store"""
+        store = BehaviorResultStore(str(tmp_path))
+        with pytest.raises(ValueError):
+            store.publish("../../etc/passwd", {"sequence": 1})
+
+    def test_sessions_get_separate_pipelines(self, tmp_path):
+        """Each session's frames reach only its own pipeline and results"""
+        store = BehaviorResultStore(str(tmp_path))
+        table = BehaviorPipelineTable(store, capture_factory=FakeCapture)
+        first, second = table.get("session-one"), table.get("session-two")
+        assert first is not second and table.get("session-one") is first
+
+        first.capture.release.set()
+        first.start()
+        try:
+            sequence = first.submit("frame")
+            first.wait_for_result(sequence - 1, timeout=5)
+            assert store.wait_for_result("session-one", 0, timeout=1) is not None
+            assert store.latest("session-two") is None
+        finally:
+            table.remove("session-one")
+            table.remove("session-two")
+        assert not first.running
+        assert store.latest("session-one") is None
+
+    def test_least_recent_pipeline_is_evicted(self, tmp_path):
+        """The table stops the oldest pipeline once full"""
+        store = BehaviorResultStore(str(tmp_path))
+        table = BehaviorPipelineTable(store, capture_factory=FakeCapture, max_sessions=2)
+        table.get("session-one")
+        table.get("session-two")
+        table.get("session-one")
+        table.get("session-three")
+        assert table.find("session-two") is None
+        assert table.find("session-one") is not None
+        assert len(table) == 2
+
+    def test_frames_reach_the_owning_process(self, tmp_path):
+        """Only one table runs a session; others forward frames to it"""
+        owner = BehaviorPipelineTable(
+            BehaviorResultStore(str(tmp_path)), capture_factory=released_capture
+        )
+        other = BehaviorPipelineTable(
+            BehaviorResultStore(str(tmp_path)), capture_factory=released_capture
+        )
+        pipeline = owner.get("session-one")
+        assert other.get("session-one") is None
+
+        frame = np.full((8, 8, 3), 200, dtype=np.uint8)
+        _, jpeg = cv2.imencode(".jpg", frame)
+        try:
+            assert other.submit("session-one", jpeg.tobytes()) is None
+            result = pipeline.wait_for_result(0, timeout=5)
+            assert result["frame"].shape == (8, 8, 3)
+            record = other.store.wait_for_result("session-one", 0, timeout=1)
+            assert record["result"]["tracking"] is True
+        finally:
+            owner.remove("session-one")
+
+    def test_stop_reaches_the_owning_process(self, tmp_path):
+        """Stopping from another table stops the owner's pipeline"""
+        owner = BehaviorPipelineTable(
+            BehaviorResultStore(str(tmp_path)), capture_factory=released_capture
+        )
+        other = BehaviorPipelineTable(
+            BehaviorResultStore(str(tmp_path)), capture_factory=released_capture
+        )
+        pipeline = owner.get("session-one")
+        pipeline.start()
+        other.stop("session-one")
+
+        # The session is free for another process once the owner let it go
+        deadline = time.monotonic() + 5
+        taken_over = None
+        while taken_over is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+            taken_over = other.get("session-one")
+        assert taken_over is not None
+        assert owner.find("session-one") is None
+        assert not pipeline.running
+        other.remove("session-one")
+
+    def test_session_pipelines_analyze_real_frames(self, tmp_path):
+        """A table-made BehaviorCapture tracks while its pipeline runs"""
+        store = BehaviorResultStore(str(tmp_path))
+        table = BehaviorPipelineTable(store)
+        pipeline = table.get("session-one")
+        assert isinstance(pipeline.capture, BehaviorCapture)
+
+        rng = np.random.default_rng(0)
+        pipeline.start()
+        try:
+            for _ in range(2):
+                frame = rng.integers(0, 255, (120, 160, 3), dtype=np.uint8)
+                sequence = pipeline.submit(frame)
+                result = pipeline.wait_for_result(sequence - 1, timeout=5)
+            assert result["tracking"] is True
+            assert "results" in result
+            record = store.wait_for_result("session-one", 0, timeout=1)
+            assert record["result"]["tracking"] is True
+        finally:
+            table.remove("session-one")
+        assert not pipeline.capture.is_tracking
+
+
+@pytest.mark.unit
+class TestFrameStream:
+    """Test length-prefixed frame framing"""
+
+    def test_frames_are_split_on_length_prefixes(self):
+        """Each message yields its payload"""
+        payloads = [b"one", b"", b"three"]
+        stream = io.BytesIO(b"".join(struct.pack(">I", len(p)) + p for p in payloads))
+        assert list(read_frame_stream(stream)) == payloads
+
+    def test_truncated_frames_are_rejected(self):
+        """A frame shorter than its prefix raises ValueError"""
+        stream = io.BytesIO(struct.pack(">I", 10) + b"abc")
+        with pytest.raises(ValueError):
+            list(read_frame_stream(stream))
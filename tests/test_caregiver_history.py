@@ -0,0 +1,123 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Caregiver History Unit Tests
+============================
+
+Test per-user communication history shards, running symbol counts and
+written-behind profile updates.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import json
+
+import pytest
+import caregiver_interface
+from caregiver_interface import CaregiverInterface
+
+
+@pytest.fixture
+def make_interface(tmp_path, monkeypatch):
+    """Build CaregiverInterfaces with their data under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    for flag in ("eye_tracking_available", "analytics_available",
+                 "expertise_available"):
+        monkeypatch.setattr(caregiver_interface, flag, False)
+    interfaces = []
+
+    def make():
+        interface = CaregiverInterface()
+        interfaces.append(interface)
+        return interface
+
+    yield make
+    for interface in interfaces:
+        interface.profiles_persister.close()
+        for log in interface.history_logs.values():
+            log.close()
+
+
+def _symbol(content):
+    return {"type": "symbol", "content": content}
+
+
+@pytest.mark.unit
+class TestCaregiverHistory:
+    """Test the sharded communication history."""
+
+    def test_events_append_to_user_shard(self, tmp_path, make_interface):
+        interface = make_interface()
+        assert interface.add_communication_event("1", _symbol("help"))
+        assert interface.add_communication_event("user/2", _symbol("drink"))
+
+        shard = tmp_path / "data" / "communication_history" / "1.jsonl"
+        assert len(shard.read_text().splitlines()) == 4  # 3 sample events + 1
+        interface.history_logs["1"].close()
+        interface.history_logs["user/2"].close()
+
+        reloaded = make_interface()
+        assert [e["content"] for e in reloaded.communication_history["user/2"]] == [
+            "drink"
+        ]
+        assert reloaded.favorite_symbols["1"] == "help"
+
+    def test_favorite_symbol_follows_retained_history(self, monkeypatch,
+                                                      make_interface):
+        monkeypatch.setattr(caregiver_interface, "MAX_HISTORY_EVENTS", 3)
+        interface = make_interface()
+        for symbol in ("yes", "yes", "no"):
+            interface.add_communication_event("u", _symbol(symbol))
+        assert interface.favorite_symbols["u"] == "yes"
+
+        interface.add_communication_event("u", _symbol("no"))
+        interface.add_communication_event("u", _symbol("help"))
+        assert list(interface.symbol_counts["u"].items()) == [("no", 2), ("help", 1)]
+        assert interface.favorite_symbols["u"] == "no"
+
+    def test_trimming_keeps_other_workers_events(self, tmp_path, monkeypatch,
+                                                 make_interface):
+        monkeypatch.setattr(caregiver_interface, "MAX_HISTORY_EVENTS", 3)
+        worker, other = make_interface(), make_interface()
+        for n in range(1, 7):
+            worker.add_communication_event("u", _symbol(f"a{n}"))
+        other.add_communication_event("u", _symbol("b1"))
+        worker.add_communication_event("u", _symbol("a7"))  # Trims the shard
+
+        shard = tmp_path / "data" / "communication_history" / "u.jsonl"
+        assert [json.loads(line)["content"] for line in shard.read_text().splitlines()] == [
+            "a6", "b1", "a7"
+        ]
+
+    def test_profile_progress_written_behind(self, tmp_path, make_interface):
+        interface = make_interface()
+        profiles_path = tmp_path / "profiles" / "user_profiles.json"
+        interface.add_communication_event("1", _symbol("food"))
+        saved = json.loads(profiles_path.read_text())
+        assert saved["1"]["progress"]["total_interactions"] == 120
+
+        interface.profiles_persister.flush()
+        saved = json.loads(profiles_path.read_text())
+        assert saved["1"]["progress"]["total_interactions"] == 121
+        assert saved["1"]["progress"]["recent_symbols"][0] == "food"
@@ -0,0 +1,173 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Temporal Engine Unit Tests
+==========================
+
+Test per-session temporal buffers and batched sequence inference.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import threading
+
+import numpy as np
+import pytest
+from engine_temporal import (
+    BatchInferenceScheduler,
+    TemporalNonverbalEngine,
+    TemporalSession,
+    TemporalSessionTable,
+)
+
+
+class FakeEngine:
+    """Records the batches it classifies, optionally blocking first"""
+
+    def __init__(self, release=None):
+        self.batches = []
+        self.release = release
+
+    def classify_sequences(self, modality, sequences):
+        if self.release is not None:
+            self.release.wait(5)
+        self.batches.append((modality, len(sequences)))
+        return [
+            {"modality": modality, "total": float(np.sum(sequence))}
+            for sequence in sequences
+        ]
+
+
+@pytest.mark.unit
+class TestTemporalSessionTable:
+    """Test the per-client session table"""
+
+    def test_sessions_keep_separate_sequences(self):
+        """Frames from one client never reach another client's buffers"""
+        table = TemporalSessionTable(sequence_length=3)
+        first = table.get("a")
+        second = table.get("b")
+        for i in range(3):
+            first.add("gesture", [float(i)])
+        second.add("gesture", [9.0])
+
+        assert table.get("a") is first
+        assert first.sequence("gesture").ravel().tolist() == [0.0, 1.0, 2.0]
+        assert second.sequence("gesture").ravel().tolist() == [9.0]
+
+    def test_sequence_is_oldest_first_after_wrapping(self):
+        """The ring returns the last sequence_length frames in order"""
+        session = TemporalSession(sequence_length=3)
+        ready = [session.add("eye", [float(i)]) for i in range(5)]
+
+        assert ready == [False, False, True, True, True]
+        assert session.sequence("eye").ravel().tolist() == [2.0, 3.0, 4.0]
+
+    def test_least_recent_session_is_evicted_when_full(self):
+        """Looking a session up keeps it; the oldest one goes"""
+        table = TemporalSessionTable(max_sessions=2)
+        first = table.get("a")
+        table.get("b")
+        assert table.get("a") is first
+        table.get("c")
+
+        assert len(table) == 2
+        assert table.get("a") is first
+        assert "b" not in table._sessions
+
+    def test_idle_sessions_are_evicted(self):
+        """Sessions without frames for idle_timeout are dropped"""
+        table = TemporalSessionTable(idle_timeout=60)
+        stale = table.get("a")
+        stale.last_seen -= 61
+        table.get("b")
+
+        assert len(table) == 1
+        assert table.get("a") is not stale
+
+
+@pytest.mark.unit
+class TestBatchInferenceScheduler:
+    """Test micro-batched inference"""
+
+    def test_sequences_within_max_wait_share_one_predict(self):
+        """Sequences arriving together are classified once per modality"""
+        engine = FakeEngine()
+        scheduler = BatchInferenceScheduler(engine, max_wait=0.2)
+        try:
+            futures = [
+                scheduler.submit("gesture", np.full((3, 2), i)) for i in range(4)
+            ]
+            futures.append(scheduler.submit("emotion", np.ones((3, 1))))
+
+            assert [f.result(5)["total"] for f in futures[:4]] == [0, 6, 12, 18]
+            assert futures[4].result(5)["modality"] == "emotion"
+        finally:
+            scheduler.shutdown()
+
+        assert sorted(engine.batches) == [("emotion", 1), ("gesture", 4)]
+
+    def test_batches_are_capped_at_max_batch(self):
+        """No predict sees more than max_batch sequences"""
+        release = threading.Event()
+        engine = FakeEngine(release)
+        scheduler = BatchInferenceScheduler(engine, max_wait=0.05, max_batch=2)
+        try:
+            futures = [
+                scheduler.submit("eye_movement", np.ones((3, 1))) for _ in range(5)
+            ]
+            release.set()
+            for future in futures:
+                future.result(5)
+        finally:
+            scheduler.shutdown()
+
+        assert sum(size for _, size in engine.batches) == 5
+        assert max(size for _, size in engine.batches) <= 2
+
+    def test_slow_inference_times_out_to_unknown(self, tmp_path):
+        """A frame waits at most result_timeout for its classification"""
+        release = threading.Event()
+        scheduler = BatchInferenceScheduler(
+            FakeEngine(release), max_wait=0.0, result_timeout=0.05
+        )
+        engine = TemporalNonverbalEngine(
+            lstm_model_dir=str(tmp_path / "models"),
+            language_map_path=str(tmp_path / "language_map.json"),
+            sequence_length=2,
+        )
+        session = TemporalSession(sequence_length=2)
+        try:
+            engine.process_session_frame(
+                session, gesture_features=[0.1], scheduler=scheduler
+            )
+            result = engine.process_session_frame(
+                session, gesture_features=[0.2], scheduler=scheduler
+            )
+        finally:
+            release.set()
+            scheduler.shutdown()
+
+        assert result["primary_result"]["expression"] == "Unknown"
+        assert result["primary_result"]["confidence"] == 0.0
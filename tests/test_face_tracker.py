@@ -0,0 +1,92 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Face Tracker Unit Tests
+=======================
+
+Test detect-then-track face localization.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import numpy as np
+import pytest
+from face_tracker import FaceTracker
+
+
+class FakeCascade:
+    """Reports a face wherever a bright square is, recording search areas"""
+
+    def __init__(self):
+        self.searched = []
+
+    def detectMultiScale(self, gray, **kwargs):
+        self.searched.append(gray.shape)
+        ys, xs = np.nonzero(gray)
+        if len(xs) == 0:
+            return ()
+        x, y = xs.min(), ys.min()
+        return np.array([[x, y, xs.max() - x + 1, ys.max() - y + 1]])
+
+
+def frame_with_face(x, y, size=100):
+    gray = np.zeros((480, 640), np.uint8)
+    gray[y : y + size, x : x + size] = 255
+    return gray
+
+
+@pytest.mark.unit
+class TestFaceTracker:
+    """Test the face tracker"""
+
+    def test_tracks_within_roi_between_detections(self):
+        """Frames after a detection search only around the face"""
+        cascade = FakeCascade()
+        tracker = FaceTracker(cascade, redetect_interval=10)
+
+        faces = tracker.locate(frame_with_face(200, 150))
+        assert faces.tolist() == [[200, 150, 100, 100]]
+        faces = tracker.locate(frame_with_face(210, 155))
+
+        assert faces.tolist() == [[210, 155, 100, 100]]
+        assert cascade.searched[0] == (480, 640)
+        assert cascade.searched[1] == (200, 200)
+        assert tracker.stats["roi_detections"] == 1
+
+    def test_loss_and_interval_trigger_full_detection(self):
+        """A lost face or an expired interval searches the whole frame"""
+        cascade = FakeCascade()
+        tracker = FaceTracker(cascade, redetect_interval=2)
+        tracker.locate(frame_with_face(200, 150))
+
+        # Face jumped out of the search window
+        faces = tracker.locate(frame_with_face(500, 350))
+        assert faces.tolist() == [[500, 350, 100, 100]]
+        assert tracker.stats["full_detections"] == 2
+        assert tracker.stats["losses"] == 1
+
+        tracker.locate(frame_with_face(500, 350))
+        tracker.locate(frame_with_face(500, 350))
+        tracker.locate(frame_with_face(500, 350))
+        assert tracker.stats["full_detections"] == 3
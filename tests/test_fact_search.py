@@ -0,0 +1,134 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Fact Search Unit Tests
+======================
+
+Test BM25 fact ranking, topic partitions and fact notifications.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import json
+
+import pytest
+from fact_search import (
+    FactFileWatcher,
+    FactSearchIndex,
+    add_fact_listener,
+    notify_fact_added,
+    remove_fact_listener,
+)
+
+FACTS = [
+    {
+        "text": "Visual schedules help autistic children with routines",
+        "topic": "autism",
+    },
+    {"text": "Music therapy can support sensory regulation", "topic": "sensory"},
+    {
+        "text": "Routines routines routines: predictable routines reduce anxiety "
+        "for many people, and visual supports make routines concrete",
+        "topic": "autism",
+    },
+    {"text": "Eye gaze boards support communication", "topic": "communication"},
+]
+
+
+@pytest.mark.unit
+class TestFactSearchIndex:
+    """Test the BM25 fact index"""
+
+    def test_ranks_by_bm25_within_topic(self):
+        """Term frequency counts, and topic queries only see that topic"""
+        index = FactSearchIndex()
+        index.add_many(FACTS)
+
+        results = index.search("routines", topic="autism")
+        assert [r["fact"] for r in results] == [FACTS[2], FACTS[0]]
+        assert results[0]["score"] > results[1]["score"]
+        assert index.search("music", topic="autism") == []
+        assert index.search("music")[0]["fact"] is FACTS[1]
+
+    def test_cached_results_refresh_when_partition_changes(self):
+        """Adding a fact to a topic invalidates that topic's cached queries"""
+        index = FactSearchIndex()
+        index.add_many(FACTS)
+        assert len(index.search("gaze", topic="communication")) == 1
+
+        index.add({"text": "Gaze tracking selects symbols", "topic": "communication"})
+        assert len(index.search("gaze", topic="communication")) == 2
+
+    def test_listeners_receive_learned_facts(self):
+        """notify_fact_added reaches registered listeners"""
+        received = []
+        add_fact_listener(received.append)
+        try:
+            notify_fact_added("Signs can precede speech", "communication", "journey")
+        finally:
+            remove_fact_listener(received.append)
+        assert received == [
+            {
+                "text": "Signs can precede speech",
+                "topic": "communication",
+                "source": "journey",
+            }
+        ]
+
+    def test_learned_fact_files_are_indexed(self, tmp_path):
+        """Facts persisted by the learning modules reach the index once"""
+        journey = tmp_path / "facts.json"
+        manager = tmp_path / "knowledge_facts.json"
+        journey.write_text(
+            json.dumps(
+                {
+                    "fact_1": {
+                        "id": "fact_1",
+                        "topic": "aac",
+                        "content": "Core words first",
+                        "source": "journey",
+                    }
+                }
+            )
+        )
+        manager.write_text(
+            json.dumps(
+                [
+                    {
+                        "text": "Gestures precede words",
+                        "topics": ["gesture"],
+                        "source": "literature",
+                    }
+                ]
+            )
+        )
+        watcher = FactFileWatcher([str(journey), str(manager)])
+        index = FactSearchIndex()
+
+        added = [index.add_unique(fact) for fact in watcher.poll()]
+        assert added == [True, True]
+        assert watcher.poll() == []  # Unchanged files are not re-read
+        assert not index.add_unique({"text": "Core words first", "topic": "aac"})
+        results = index.search("gestures", topic="gesture")
+        assert results[0]["fact"]["source"] == "literature"
@@ -0,0 +1,105 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Knowledge Graph Store Unit Tests
+================================
+
+Test node/edge indexing, subgraph slicing and the append-log persistence.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import json
+
+import pytest
+from graph_store import KnowledgeGraphStore
+
+
+@pytest.mark.unit
+class TestKnowledgeGraphStore:
+    """Test the indexed, append-logged knowledge graph."""
+
+    def _chain(self, store):
+        for name in ("A", "B", "C", "D"):
+            store.add_node(name, "topic", name)
+        store.add_node("f1", "fact", "A fact")
+        store.add_edge("A_B", "A", "B", "prerequisite")
+        store.add_edge("B_C", "B", "C", "prerequisite")
+        store.add_edge("C_D", "C", "D", "prerequisite")
+        store.add_edge("f1_A", "f1", "A", "belongs_to")
+
+    def test_duplicates_ignored_and_adjacency(self, tmp_path):
+        store = KnowledgeGraphStore(str(tmp_path / "graph.jsonl"))
+        self._chain(store)
+        assert not store.add_node("A", "topic", "A again")
+        assert not store.add_edge("A_B", "A", "B", "prerequisite")
+        assert store.nodes["A"]["label"] == "A"
+        assert sorted(store.neighbors("B")) == ["A", "C"]
+        assert len(store.to_dict()["edges"]) == 4
+
+    def test_subgraph(self, tmp_path):
+        store = KnowledgeGraphStore(str(tmp_path / "graph.jsonl"))
+        self._chain(store)
+
+        near = store.subgraph("B", depth=1)
+        assert {n["id"] for n in near["nodes"]} == {"A", "B", "C"}
+        assert {e["id"] for e in near["edges"]} == {"A_B", "B_C"}
+
+        topics = store.subgraph("A", depth=2, node_type="topic")
+        assert {n["id"] for n in topics["nodes"]} == {"A", "B", "C"}
+        assert len(store.subgraph(limit=2)["nodes"]) == 2
+        assert store.subgraph("missing") == {"nodes": [], "edges": []}
+
+    def test_persistence_and_legacy_import(self, tmp_path):
+        legacy = tmp_path / "graph.json"
+        legacy.write_text(
+            json.dumps(
+                {
+                    "nodes": [{"id": "X", "type": "topic", "label": "X"}],
+                    "edges": [
+                        {"id": "X_Y", "source": "X", "target": "Y", "type": "t"}
+                    ],
+                }
+            )
+        )
+        log_path = str(tmp_path / "graph.jsonl")
+        store = KnowledgeGraphStore(log_path, legacy_path=str(legacy))
+        assert store.has_node("X") and store.has_edge("X_Y")
+        store.add_node("Z", "topic", "Z")
+        store.log.close()
+
+        reloaded = KnowledgeGraphStore(log_path, legacy_path=str(legacy))
+        assert set(reloaded.nodes) == {"X", "Z"}
+        assert reloaded.neighbors("X") == ["Y"]
+
+    def test_node_added_after_torn_write_survives(self, tmp_path):
+        log_path = str(tmp_path / "graph.jsonl")
+        store = KnowledgeGraphStore(log_path)
+        store.add_node("a", "topic", "a")
+        with open(log_path, "a") as f:
+            f.write('{"kind": "node", "id": "tor')
+
+        recovered = KnowledgeGraphStore(log_path)
+        recovered.add_node("b", "topic", "b")
+        assert set(KnowledgeGraphStore(log_path).nodes) == {"a", "b"}
@@ -0,0 +1,152 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Interaction Log Unit Tests
+==========================
+
+Test the JSON-lines interaction log and batching in the background
+interaction database writer.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import json
+import threading
+import time
+
+import pytest
+from interaction_log import InteractionDBWriter, InteractionLog
+
+
+def recording_writer(**kwargs):
+    """A writer whose flushes are recorded instead of hitting a database"""
+    writer = InteractionDBWriter(None, None, **kwargs)
+    writer.batches = []
+    writer.flushed = threading.Event()
+
+    def record(rows):
+        writer.batches.append((time.monotonic(), len(rows)))
+        writer.flushed.set()
+
+    writer._flush = record
+    return writer
+
+
+@pytest.mark.unit
+class TestInteractionLog:
+    """Test appends, reads and migration of the interaction log"""
+
+    def test_appended_records_are_read_back_in_order(self, tmp_path):
+        """Each append is one line, streamed back oldest first"""
+        log = InteractionLog(str(tmp_path / "logs" / "interactions.jsonl"))
+        assert list(log) == []
+
+        log.append({"text": "hello", "n": 1})
+        log.append({"text": "line\nbreak", "n": 2})
+        assert [r["n"] for r in log] == [1, 2]
+        with open(log.path) as f:
+            assert len(f.readlines()) == 2
+
+    def test_malformed_lines_are_skipped(self, tmp_path):
+        """A corrupt line in the middle does not hide the others"""
+        path = tmp_path / "interactions.jsonl"
+        path.write_text('{"n": 1}\nnot json\n\n{"n": 2}\n')
+        assert [r["n"] for r in InteractionLog(str(path)).iter_records()] == [1, 2]
+
+    def test_torn_tail_is_cut_before_appending(self, tmp_path):
+        """A half-written last line is dropped instead of swallowing the next record"""
+        path = tmp_path / "interactions.jsonl"
+        path.write_bytes(b'{"n": 1}\n{"n": 2, "te')
+        log = InteractionLog(str(path))
+
+        log.append({"n": 3})
+        assert path.read_bytes() == b'{"n": 1}\n{"n": 3}\n'
+        assert [r["n"] for r in log] == [1, 3]
+
+    def test_tail_missing_only_its_newline_is_kept(self, tmp_path):
+        """A complete last record that lost its newline survives the repair"""
+        path = tmp_path / "interactions.jsonl"
+        path.write_bytes(b'{"n": 1}\n{"n": 2}')
+        log = InteractionLog(str(path))
+
+        log.append({"n": 3})
+        assert [r["n"] for r in log] == [1, 2, 3]
+
+        torn_only = tmp_path / "torn.jsonl"
+        torn_only.write_bytes(b'{"n": 1')
+        log = InteractionLog(str(torn_only))
+        log.append({"n": 2})
+        assert [r["n"] for r in log] == [2]
+
+    def test_legacy_file_is_migrated_once(self, tmp_path):
+        """The old JSON array moves into the log and is renamed aside"""
+        legacy = tmp_path / "interactions.json"
+        legacy.write_text(json.dumps([{"n": 1}, {"n": 2}]))
+        path = str(tmp_path / "interactions.jsonl")
+
+        log = InteractionLog(path, legacy_path=str(legacy))
+        assert [r["n"] for r in log] == [1, 2]
+        assert not legacy.exists()
+        assert (tmp_path / "interactions.json.migrated").exists()
+
+        # A legacy file reappearing later is not merged into a started log
+        legacy.write_text(json.dumps([{"n": 9}]))
+        log = InteractionLog(path, legacy_path=str(legacy))
+        assert [r["n"] for r in log] == [1, 2]
+        assert legacy.exists()
+
+    def test_unreadable_legacy_file_is_left_in_place(self, tmp_path):
+        """A corrupt legacy file is not renamed, so nothing is lost"""
+        legacy = tmp_path / "interactions.json"
+        legacy.write_text("[{broken")
+        log = InteractionLog(str(tmp_path / "interactions.jsonl"), legacy_path=str(legacy))
+        assert list(log) == []
+        assert legacy.exists()
+
+
+@pytest.mark.unit
+class TestInteractionDBWriter:
+    """Test when queued rows are flushed"""
+
+    def test_full_batch_flushes_immediately(self):
+        """batch_size rows are written without waiting for the interval"""
+        writer = recording_writer(batch_size=3, interval=30.0)
+        for i in range(3):
+            writer.submit(user_id=1, text=str(i))
+
+        assert writer.flushed.wait(5)
+        assert writer.batches[0][1] == 3
+
+    def test_steady_trickle_flushes_after_interval(self):
+        """A row arriving just inside each timeout cannot hold a batch open"""
+        writer = recording_writer(batch_size=50, interval=0.2)
+        start = time.monotonic()
+        for i in range(12):
+            writer.submit(user_id=1, text=str(i))
+            time.sleep(0.05)
+
+        assert writer.flushed.wait(5)
+        first_flush, first_size = writer.batches[0]
+        assert first_flush - start < 0.45
+        assert first_size < 12
@@ -0,0 +1,193 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Interaction Rollup Unit Tests
+=============================
+
+Test the upserted caregiver analytics rollups and the batched writer.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from flask import Flask
+
+from app_init import db
+from interaction_log import InteractionDBWriter
+from learning_analytics import LearningAnalytics
+from models import InteractionRollup, User, UserInteraction
+
+HOUR = datetime(2025, 1, 1, 9)
+
+
+@pytest.fixture
+def app(tmp_path):
+    """Flask app bound to a throwaway SQLite database"""
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        db.session.add(User(id=1, name="tester"))
+        db.session.commit()
+    return app
+
+
+def _rows():
+    return {
+        (r.granularity, r.bucket_start, r.method, r.intent, r.expression):
+        (r.count, round(r.confidence_sum, 6), r.confidence_count)
+        for r in InteractionRollup.query.filter(InteractionRollup.granularity != "backfill")
+    }
+
+
+def _counts(granularity):
+    return {
+        (r.bucket_start, r.method, r.intent): r.count
+        for r in InteractionRollup.query.filter_by(granularity=granularity)
+    }
+
+
+@pytest.mark.unit
+class TestInteractionRollups:
+    """Test rollup upserts and writer transactions"""
+
+    def test_add_counts_increments_existing_buckets(self, app):
+        """Repeated adds to one bucket accumulate instead of colliding"""
+        def rows(*texts):
+            return InteractionRollup.tally(
+                [UserInteraction(user_id=1, text=text, intent=intent, timestamp=HOUR)
+                 for text, intent in texts]
+            )
+
+        with app.app_context():
+            InteractionRollup.add_counts(rows(("symbol:help", "help")))
+            db.session.commit()
+            InteractionRollup.add_counts(
+                rows(("symbol:help", "help"), ("symbol:help", "help"), ("hi", None))
+            )
+            db.session.commit()
+
+            assert _counts("hour") == {
+                (HOUR, "symbol", "help"): 3,
+                (HOUR, "text", ""): 1,
+            }
+            assert _counts("day")[(datetime(2025, 1, 1), "symbol", "help")] == 3
+            assert InteractionRollup.frequent_expressions(1) == [("help", 3), ("hi", 1)]
+
+    def test_backfill_matches_recorded_counts(self, app):
+        """Rebuilding from raw rows gives the same rollups"""
+        with app.app_context():
+            rows = [
+                UserInteraction(user_id=1, text="symbol:help", intent="help",
+                                confidence=0.5, timestamp=HOUR),
+                UserInteraction(user_id=1, text="symbol:help", intent="help",
+                                confidence=0.0, timestamp=HOUR),
+                UserInteraction(user_id=1, text="hello", intent=None, timestamp=HOUR),
+            ]
+            db.session.add_all(rows)
+            InteractionRollup.record(rows)
+            db.session.commit()
+            recorded = _rows()
+
+            InteractionRollup.backfill()
+            assert _rows() == recorded
+
+    def test_backfill_missing_adds_only_history_before_live_rollups(self, app):
+        """Old interactions are rolled up once; live-recorded ones are not doubled"""
+        earlier = datetime(2024, 12, 31, 9)
+        with app.app_context():
+            db.session.add(
+                UserInteraction(user_id=1, text="symbol:help", intent="help", timestamp=earlier)
+            )
+            live = [UserInteraction(user_id=1, text="symbol:help", intent="help", timestamp=HOUR)]
+            db.session.add_all(live)
+            InteractionRollup.record(live)
+            db.session.commit()
+
+            assert InteractionRollup.backfill_missing() == 1
+            assert _counts("hour") == {
+                (earlier, "symbol", "help"): 1,
+                (HOUR, "symbol", "help"): 1,
+            }
+            assert InteractionRollup.frequent_expressions(1) == [("help", 2)]
+
+            # A rerun finds the marker and changes nothing
+            assert InteractionRollup.backfill_missing() == 0
+            assert InteractionRollup.frequent_expressions(1) == [("help", 2)]
+
+    def test_rollup_failure_keeps_raw_rows(self, app, monkeypatch):
+        """Raw interactions are committed even if the rollup update fails"""
+        def fail(hourly):
+            raise RuntimeError("rollup conflict")
+
+        monkeypatch.setattr(InteractionRollup, "add_counts", fail)
+        writer = InteractionDBWriter(app, db)
+        writer._flush([{"user_id": 1, "text": "symbol:drink", "intent": "drink"}])
+
+        with app.app_context():
+            assert UserInteraction.query.count() == 1
+            assert InteractionRollup.query.count() == 0
+
+    def test_dashboard_is_served_from_rollups(self, app):
+        """Progress and frequent expressions match the raw interactions"""
+        now = datetime.now()
+        old, recent = now - timedelta(days=30), now - timedelta(days=2)
+        with app.app_context():
+            rows = [
+                UserInteraction(user_id=1, text=text, confidence=confidence,
+                                timestamp=timestamp)
+                for text, confidence, timestamp in [
+                    ("symbol:Eat", 0.5, old),
+                    ("hello", 0.75, old),
+                    ("gesture:wave", None, old),
+                    ("symbol:eat", 1.0, recent),
+                    ("symbol:eat", None, recent),
+                    ("eye:up", 0.0, recent),
+                    ("", 0.8, recent),
+                ]
+            ]
+            db.session.add_all(rows)
+            InteractionRollup.record(rows)
+            db.session.commit()
+
+            # Reading the rollups only: the raw rows are not consulted
+            UserInteraction.query.delete()
+            db.session.commit()
+            analytics = LearningAnalytics(user_id=1)
+            progress = analytics.get_learning_progress()
+            expressions = analytics.get_frequent_expressions(limit=2)
+
+        assert progress == {
+            "vocabulary_growth": 0,  # eat, hello, wave, up; eat and up recently
+            "vocabulary_percentage": 20,
+            "expression_growth": 33,  # 1.0 recently against 0.75 overall
+            "expression_percentage": 75,
+            "multimodal_growth": 0,  # 4 methods; symbol and eye recently
+            "multimodal_percentage": 80,
+        }
+        assert expressions[0] == {"text": "eat", "count": 2}
+        assert len(expressions) == 2
@@ -0,0 +1,79 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Knowledge Index Unit Tests
+==========================
+
+Test the persistent token index over learned knowledge files.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import json
+import os
+
+import pytest
+from knowledge_index import KnowledgeIndex
+
+
+def write_topic(directory, domain, name, topic, summary):
+    os.makedirs(directory / domain, exist_ok=True)
+    with open(directory / domain / f"{name}.json", "w") as f:
+        json.dump({"topic": topic, "summary": summary, "domain": domain}, f)
+
+
+@pytest.mark.unit
+class TestKnowledgeIndex:
+    """Test the knowledge index"""
+
+    def test_search_ranks_by_question_word_overlap(self, tmp_path):
+        """Files sharing more question words rank first"""
+        write_topic(tmp_path, "autism", "a", "autism", "sensory needs in autism")
+        write_topic(tmp_path, "speech", "b", "speech", "speech and autism support")
+        write_topic(tmp_path, "generated_code", "c", "autism", "ignored")
+        index = KnowledgeIndex(tmp_path)
+        index.refresh(force=True)
+
+        results = index.search("autism sensory needs")
+        assert [item["topic"] for item in results] == ["autism", "speech"]
+        assert results[0]["relevance"] == 1.0
+        index.persister.close()
+
+    def test_changes_are_picked_up_and_index_persists(self, tmp_path):
+        """Only changed files are re-read, and a new index loads from disk"""
+        write_topic(tmp_path, "autism", "a", "routines", "visual schedules")
+        index = KnowledgeIndex(tmp_path)
+        assert index.refresh(force=True) == 1
+        assert index.refresh(force=True) == 0
+
+        write_topic(tmp_path, "autism", "b", "music", "music therapy")
+        os.remove(tmp_path / "autism" / "a.json")
+        assert index.refresh(force=True) == 2
+        assert index.search("visual schedules") == []
+        index.persister.close()
+
+        reloaded = KnowledgeIndex(tmp_path)
+        assert len(reloaded) == 1
+        assert reloaded.search("music therapy")[0]["topic"] == "music"
+        reloaded.persister.close()
@@ -0,0 +1,81 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Learning Path Unit Tests
+========================
+
+Test memoized prerequisite closures and per-user explored topics.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import pytest
+import learning_journey
+from learning_journey import LearningJourney
+
+
+@pytest.fixture
+def journey(tmp_path, monkeypatch):
+    """A fresh LearningJourney with its data directory under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(LearningJourney, "_instance", None)
+    journey = learning_journey.get_learning_journey()
+    yield journey
+    journey.event_log.close()
+    journey.graph.log.close()
+
+
+def _names(path):
+    return [topic["name"] for topic in path]
+
+
+@pytest.mark.unit
+class TestLearningPath:
+    """Test learning path generation."""
+
+    def test_path_skips_explored_topics(self, journey):
+        assert _names(journey.get_learning_path("u1", "AAC")) == ["PECS", "AAC"]
+        journey.log_learning_event("topic_explored", "u1", {"topic": "PECS"})
+        assert _names(journey.get_learning_path("u1", "AAC")) == ["AAC"]
+        assert _names(journey.get_learning_path("u2", "AAC")) == ["PECS", "AAC"]
+        assert journey.get_learning_path("u1", "Unknown") == []
+
+    def test_add_topic_invalidates_closures(self, journey):
+        journey.add_topic("Advanced AAC", "", "advanced", ["AAC", "Core Words"])
+        assert _names(journey.get_learning_path("u1", "Advanced AAC")) == [
+            "PECS",
+            "AAC",
+            "Advanced AAC",
+        ]
+        journey.add_topic("Core Words", "", "beginner")
+        assert "Core Words" in _names(journey.get_learning_path("u1", "Advanced AAC"))
+
+    def test_batch_paths(self, journey):
+        journey.log_learning_event("topic_explored", "u1", {"topic": "PECS"})
+        paths = journey.get_learning_paths("u1", ["AAC", "PECS", "Missing"])
+        assert {goal: _names(path) for goal, path in paths.items()} == {
+            "AAC": ["AAC"],
+            "PECS": [],
+            "Missing": [],
+        }
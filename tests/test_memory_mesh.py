@@ -0,0 +1,219 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Memory Mesh Unit Tests
+======================
+
+Test indexed retrieval and persistence of the memory mesh.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+from datetime import datetime
+
+import pytest
+from memory_mesh import MemoryMesh, MemoryIndex
+
+
+@pytest.fixture
+def mesh(tmp_path, monkeypatch):
+    """MemoryMesh rooted in a temp dir without the consolidation thread."""
+    monkeypatch.setattr(MemoryMesh, "_start_consolidation_thread", lambda self: None)
+    return MemoryMesh(memory_dir=str(tmp_path / "memory"))
+
+
+@pytest.mark.unit
+class TestMemoryIndex:
+    """Test the inverted retrieval index."""
+    
+    def test_index_deduplicates_by_id(self):
+        """Test a memory held in several tiers is indexed once."""
+        index = MemoryIndex()
+        memory = {"id": "abc", "content": "Likes Python", "timestamp": "2025-01-01T00:00:00"}
+        index.add(memory)
+        index.add(memory)
+        
+        assert len(index) == 1
+        assert [e["memory"]["id"] for e in index.candidates("python")] == ["abc"]
+    
+    def test_remove_clears_postings(self):
+        """Test removing a memory drops its postings."""
+        index = MemoryIndex()
+        index.add({"id": "abc", "content": "Likes Python", "timestamp": "2025-01-01T00:00:00"})
+        index.remove("abc")
+        
+        assert index.candidates("python") == []
+        assert not index.postings and not index.by_importance
+    
+    def test_candidates_match_substrings(self):
+        """Test query words match anywhere in the content, as the scorer does."""
+        index = MemoryIndex()
+        index.add({"id": "abc", "content": "The user loves dogs", "timestamp": "2025-01-01T00:00:00"})
+        
+        assert [e["memory"]["id"] for e in index.candidates("dog")] == ["abc"]
+        assert [e["memory"]["id"] for e in index.candidates("ves d")] == ["abc"]
+        assert index.candidates("god") == []
+    
+    def test_short_words_are_not_indexed(self):
+        """Test only trigrams inside words are posted, never 1-2 letter grams."""
+        index = MemoryIndex()
+        index.add({"id": "abc", "content": "A dog is here", "timestamp": "2025-01-01T00:00:00"})
+        
+        assert set(index.postings) == {"dog", "her", "ere"}
+        assert index.candidates("a is") == []
+
+
+def _scan_top(mesh, query, limit=5):
+    """Reference ranking: score every unique memory with the original scan."""
+    query = query.lower()
+    words = query.split()
+    now = datetime.now()
+    memories = {}
+    for memory in mesh.working_memory + mesh.episodic_memory:
+        memories.setdefault(memory["id"], memory)
+    for tier in mesh.semantic_memory.values():
+        for memory in tier:
+            memories.setdefault(memory["id"], memory)
+    
+    scored = []
+    for memory in memories.values():
+        content = memory["content"].lower()
+        score = sum(1 for word in words if word in content) / len(words) * 0.5
+        if query in content:
+            score += 0.3
+        score += memory.get("importance", 0.5) * 0.2
+        age_hours = (now - datetime.fromisoformat(memory["timestamp"])).total_seconds() / 3600
+        score += max(0, 1 - age_hours / (24 * 7)) * 0.1
+        score += min(1.0, mesh.memory_access_count.get(memory["id"], 0) / 10) * 0.1
+        scored.append((score, memory["id"]))
+    scored.sort(reverse=True)
+    return [memory_id for score, memory_id in scored[:limit]]
+
+
+@pytest.mark.unit
+class TestMemoryRetrieval:
+    """Test MemoryMesh.retrieve over the index."""
+    
+    def test_matches_full_scan_ranking(self, mesh):
+        """Test retrieval returns the same top-k as scoring every memory."""
+        contents = [
+            "The user loves dogs and long walks",
+            "Everett created The Christman AI Project",
+            "Favorite color is blue",
+            "Python is used for the backend",
+            "Walking the dog happens every morning",
+            "Critical: always ask before touching",
+            "Prefers quiet rooms when anxious",
+            "The sky is blue because of scattering",
+        ]
+        for i, content in enumerate(contents):
+            mesh.store(content, category="learning", importance=0.05 + i * 0.12)
+        mesh.consolidate_all(force=True)
+        mesh.store("A dog barked during lunch", importance=0.33)
+        
+        queries = ["dog", "walk blue", "touching", "zebra", "the", "ai project",
+                   "a", "is blue", "ai", "of the", "a dog"]
+        for query in queries:
+            for limit in (1, 3, 5):
+                expected = _scan_top(mesh, query, limit)
+                assert [m["id"] for m in mesh.retrieve(query, limit=limit)] == expected
+    
+    def test_retrieve_ranks_matches(self, mesh):
+        """Test the best matching memory ranks first."""
+        mesh.store("User prefers Python for backend development", importance=0.5)
+        mesh.store("Everett created The Christman AI Project", importance=0.5)
+        
+        results = mesh.retrieve("python backend")
+        assert results[0]["content"].startswith("User prefers Python")
+        # Non-matching memories still rank, below every match
+        assert results[-1]["content"].startswith("Everett")
+    
+    def test_consolidated_memory_returned_once(self, mesh):
+        """Test episodic + semantic copies are not returned twice."""
+        mesh.store("AlphaVox helps nonverbal people communicate", category="learning")
+        mesh.consolidate_all(force=True)
+        
+        results = mesh.retrieve("nonverbal")
+        assert len(results) == 1
+    
+    def test_category_filter(self, mesh):
+        """Test category filter applies to long-term memory."""
+        mesh.store("Favorite color is blue", category="preferences")
+        mesh.store("The sky is blue because of scattering", category="learning")
+        mesh.consolidate_all(force=True)
+        
+        results = mesh.retrieve("blue", category="learning")
+        assert [m["category"] for m in results] == ["learning"]
+
+
+@pytest.mark.unit
+class TestMemoryPersistence:
+    """Test journaled persistence of the memory mesh."""
+    
+    def test_save_appends_and_reloads(self, mesh):
+        """Test journaled memories survive a reload with a single copy."""
+        mesh.store("AlphaVox helps nonverbal people communicate", category="learning")
+        mesh.consolidate_all(force=True)
+        
+        reloaded = MemoryMesh(memory_dir=str(mesh.memory_dir))
+        assert len(reloaded.episodic_memory) == 1
+        assert reloaded.episodic_memory[0] is reloaded.semantic_memory["learning"][0]
+        assert reloaded.retrieve("nonverbal")[0]["content"].startswith("AlphaVox")
+    
+    def test_compaction_truncates_journal(self, mesh):
+        """Test compaction folds the journal into the snapshot."""
+        mesh.journal.compaction_threshold = 3
+        for i in range(4):
+            mesh.store(f"Fact number {i}", category="learning")
+        mesh.consolidate_all(force=True)
+        
+        assert mesh.journal.record_count == 0
+        assert mesh.journal.snapshot_file.exists()
+        reloaded = MemoryMesh(memory_dir=str(mesh.memory_dir))
+        assert len(reloaded.episodic_memory) == 4
+    
+    def test_torn_journal_tail_is_truncated(self, mesh):
+        """Test memories saved after a torn journal line survive reloads."""
+        mesh.store("First memory before the crash", category="learning")
+        mesh.consolidate_all(force=True)
+        with open(mesh.journal.journal_file, 'a') as f:
+            f.write('{"op": "put", "memory": {"id": "torn')
+        
+        recovered = MemoryMesh(memory_dir=str(mesh.memory_dir))
+        recovered.store("Second memory after the crash", category="learning")
+        recovered.consolidate_all(force=True)
+        
+        reloaded = MemoryMesh(memory_dir=str(mesh.memory_dir))
+        contents = [m["content"] for m in reloaded.episodic_memory]
+        assert contents == ["First memory before the crash", "Second memory after the crash"]
+
+
+# ==============================================================================
+# © 2025 Everett Nathaniel Christman & Misty Gail Christman
+# The Christman AI Project — Luma Cognify AI
+# All rights reserved. Unauthorized use, replication, or derivative training 
+# of this material is prohibited.
+# Core Directive: "How can I help you love yourself more?" 
+# Autonomy & Alignment Protocol v3.0
+# ==============================================================================
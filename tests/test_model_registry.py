@@ -0,0 +1,133 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Model Registry Unit Tests
+=========================
+
+Test cached, hot-swapped loading of pickled classifiers.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import os
+import pickle
+
+import numpy as np
+import pytest
+from model_registry import ModelRegistry, predict_with_proba
+
+
+def save(path, model):
+    with open(path, "wb") as f:
+        pickle.dump(model, f)
+
+
+@pytest.mark.unit
+class TestModelRegistry:
+    """Test model lookup and reloading"""
+
+    def test_model_is_unpickled_once(self, tmp_path):
+        """Lookups within check_interval return the cached object"""
+        path = tmp_path / "model.pkl"
+        save(path, {"version": 1})
+        registry = ModelRegistry(check_interval=60)
+
+        first = registry.get(str(path))
+        save(path, {"version": 2, "padding": "x" * 10})
+
+        assert first == {"version": 1}
+        assert registry.get(str(path)) is first
+
+    def test_changed_file_is_reloaded(self, tmp_path):
+        """A new mtime or size swaps in the new model"""
+        path = tmp_path / "model.pkl"
+        save(path, {"version": 1})
+        registry = ModelRegistry(check_interval=0)
+        first = registry.get(str(path))
+
+        assert registry.get(str(path)) is first
+        save(path, {"version": 2, "padding": "x" * 10})
+        assert registry.get(str(path))["version"] == 2
+
+    def test_unreadable_update_keeps_the_current_model(self, tmp_path):
+        """A half-written file never replaces a working model"""
+        path = tmp_path / "model.pkl"
+        save(path, {"version": 1})
+        registry = ModelRegistry(check_interval=0)
+        first = registry.get(str(path))
+
+        path.write_bytes(b"not a pickle")
+        assert registry.get(str(path)) is first
+
+    def test_missing_file_returns_none(self, tmp_path):
+        """Deleting the file drops the cached model"""
+        path = tmp_path / "model.pkl"
+        registry = ModelRegistry(check_interval=0)
+        assert registry.get(str(path)) is None
+
+        save(path, {"version": 1})
+        assert registry.get(str(path)) == {"version": 1}
+        os.remove(path)
+        assert registry.get(str(path)) is None
+        assert registry.predict_with_proba(str(path), [[0.0]]) is None
+
+    def test_put_and_invalidate(self, tmp_path):
+        """put() serves an in-memory model until invalidated"""
+        path = tmp_path / "model.pkl"
+        save(path, {"version": 1})
+        registry = ModelRegistry(check_interval=60)
+
+        registry.put(str(path), {"version": "memory"})
+        assert registry.get(str(path)) == {"version": "memory"}
+        registry.invalidate(str(path))
+        assert registry.get(str(path)) == {"version": 1}
+
+
+@pytest.mark.unit
+class TestPredictWithProba:
+    """Test the fused predict + predict_proba call"""
+
+    def test_labels_match_predict(self):
+        """The argmax of predict_proba gives the same labels as predict"""
+        sklearn = pytest.importorskip("sklearn.ensemble")
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(60, 3))
+        y = np.array(["wave", "point", "nod"])[rng.integers(0, 3, 60)]
+        model = sklearn.RandomForestClassifier(n_estimators=10, random_state=0)
+        model.fit(X, y)
+
+        labels, probabilities = predict_with_proba(model, X[:20])
+        assert labels.tolist() == model.predict(X[:20]).tolist()
+        assert probabilities.shape == (20, 3)
+
+    def test_models_without_probabilities(self):
+        """Plain predictors return None for the probabilities"""
+
+        class Constant:
+            def predict(self, X):
+                return np.zeros(len(X))
+
+        labels, probabilities = predict_with_proba(Constant(), [[1.0], [2.0]])
+        assert labels.tolist() == [0.0, 0.0]
+        assert probabilities is None
@@ -0,0 +1,208 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Neural Learning Core Unit Tests
+===============================
+
+Test root cause model training, feedback updates and inference.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+pytest.importorskip("spacy")
+pytest.importorskip("sklearn")
+
+import neural_learning_core  # noqa: E402
+from neural_learning_core import (  # noqa: E402
+    FREQUENCY_WINDOW_SECONDS,
+    ROOT_CAUSES,
+    NeuralLearningCore,
+    RootCauseTrainingScheduler,
+)
+
+
+@pytest.fixture
+def nlc(tmp_path, monkeypatch):
+    """An SGD-backed core that reads and writes only under tmp_path"""
+    monkeypatch.setattr(
+        neural_learning_core, "MEMORY_FILE", str(tmp_path / "nlc_memory.pkl")
+    )
+    monkeypatch.setattr(
+        neural_learning_core,
+        "ROOT_CAUSE_MODEL_FILE",
+        str(tmp_path / "root_cause_model.pkl"),
+    )
+    core = NeuralLearningCore(model_type="sgd")
+    yield core
+    core.trainer.close()
+    core.memory_persister.close()
+
+
+def remember(nlc, count, confidence=0.9):
+    """Fill memory with separable high-confidence interactions"""
+    rng = np.random.default_rng(0)
+    for i in range(count):
+        label = i % 2
+        features = list(rng.normal(label * 3.0, 0.1, 6))
+        nlc.memory.append(
+            {
+                "user_id": "user",
+                "features": features,
+                "root_cause": ROOT_CAUSES[label],
+                "confidence": confidence,
+                "timestamp": datetime.now(),
+            }
+        )
+
+
+@pytest.mark.unit
+class TestRootCauseTrainingScheduler:
+    """Test background retraining of the root cause model"""
+
+    def test_retrain_waits_for_enough_new_samples(self, nlc):
+        """The worker is woken only once min_new_samples have arrived"""
+        scheduler = RootCauseTrainingScheduler(
+            nlc, min_new_samples=3, min_interval=3600, min_memory=10
+        )
+        trained = threading.Event()
+        scheduler.train_now = trained.set
+        try:
+            remember(nlc, 20)
+            scheduler.add_sample([0.0] * 6, ROOT_CAUSES[0])
+            scheduler.add_sample([0.0] * 6, ROOT_CAUSES[0])
+            assert not trained.wait(0.2)
+
+            scheduler.add_sample([0.0] * 6, ROOT_CAUSES[0])
+            assert trained.wait(5)
+        finally:
+            scheduler.close()
+
+    def test_train_now_swaps_in_a_fresh_model(self, nlc):
+        """A retrain replaces the model and scaler instead of mutating them"""
+        nlc.trainer.close()
+        old_model, old_scaler = nlc.root_cause_model, nlc.scaler
+        remember(nlc, 40)
+
+        assert nlc._retrain_model()
+        assert nlc.root_cause_model is not old_model
+        assert nlc.scaler is not old_scaler
+        assert nlc.trainer.pending == 0
+        root_cause, _ = nlc._infer_root_cause(list(np.full(6, 3.0)))
+        assert root_cause == ROOT_CAUSES[1]
+
+    def test_train_now_needs_confident_samples(self, nlc):
+        """Low-confidence memory is not used for training"""
+        nlc.trainer.close()
+        old_model = nlc.root_cause_model
+        remember(nlc, 40, confidence=0.5)
+
+        assert not nlc._retrain_model()
+        assert nlc.root_cause_model is old_model
+
+
+@pytest.mark.unit
+class TestModelUpdates:
+    """Test the confidence gate and feedback updates"""
+
+    def test_only_confident_predictions_are_queued(self, nlc):
+        """Interactions at or below 0.7 confidence never reach the trainer"""
+        nlc.trainer.close()
+        nlc._update_model([0.0] * 6, ROOT_CAUSES[0], None, confidence=0.7)
+        assert nlc.trainer.pending == 0
+
+        nlc._update_model([0.0] * 6, ROOT_CAUSES[0], None, confidence=0.71)
+        assert nlc.trainer.pending == 1
+
+    def test_feedback_updates_a_copy_of_the_model(self, nlc):
+        """Feedback never modifies a model inference may be using"""
+        nlc.trainer.close()
+        remember(nlc, 40)
+        nlc._retrain_model()
+        model = nlc.root_cause_model
+        coef = model.coef_.copy()
+
+        feedback = {"correct_root_cause": ROOT_CAUSES[2]}
+        nlc._update_model([0.0] * 6, ROOT_CAUSES[0], feedback)
+
+        assert nlc.root_cause_model is not model
+        assert np.array_equal(model.coef_, coef)
+        assert not np.array_equal(nlc.root_cause_model.coef_, coef)
+        assert list(nlc.trainer.feedback_samples) == [([0.0] * 6, ROOT_CAUSES[2])]
+
+
+@pytest.mark.unit
+class TestFeatureExtraction:
+    """Test the per-user frequency window and Doc reuse"""
+
+    def test_frequency_is_counted_per_user(self, nlc):
+        """Each user's frequency feature counts only their interactions"""
+        for user_id in ("a", "a", "b"):
+            nlc.process_interaction({"type": "symbol"}, user_id)
+
+        assert nlc._extract_features({"type": "symbol"}, user_id="a")[4] == 0.2
+        assert nlc._extract_features({"type": "symbol"}, user_id="b")[4] == 0.1
+        assert nlc._extract_features({"type": "symbol", "user_id": "b"})[4] == 0.1
+
+    def test_expired_interactions_leave_the_window(self, nlc):
+        """Timestamps older than the window are pruned when counting"""
+        old = datetime.now() - timedelta(seconds=FREQUENCY_WINDOW_SECONDS + 1)
+        nlc._record_interaction_time("a", old)
+        nlc._record_interaction_time("a", datetime.now())
+
+        assert nlc._count_recent_interactions("a") == 1
+        assert len(nlc.recent_interactions["a"]) == 1
+
+    def test_window_is_seeded_from_memory(self, nlc):
+        """Loaded memory restores recent interactions only"""
+        now = datetime.now()
+        for age in (10, 20, FREQUENCY_WINDOW_SECONDS + 60):
+            nlc.memory.append(
+                {"user_id": "a", "timestamp": now - timedelta(seconds=age)}
+            )
+        nlc._seed_recent_interactions()
+
+        assert nlc._count_recent_interactions("a") == 2
+        assert nlc._count_recent_interactions("b") == 0
+
+    def test_parsed_doc_is_reused(self, nlc, monkeypatch):
+        """Text complexity comes from the given Doc without re-parsing"""
+        doc = neural_learning_core.nlp("the dog runs")
+
+        def fail(text):
+            raise AssertionError("text was parsed again")
+
+        monkeypatch.setattr(neural_learning_core, "nlp", fail)
+        interaction = {"type": "text", "input": "the dog runs"}
+
+        features = nlc._extract_features(interaction, user_id="a", doc=doc)
+        expected = sum(not t.is_stop and not t.is_punct for t in doc) / len(doc)
+        assert features[5] == pytest.approx(expected)
+        result = nlc.process_interaction(interaction, "a", doc=doc)
+        assert result["features"][5] == pytest.approx(expected)
@@ -0,0 +1,93 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Periodicity Detector Unit Tests
+===============================
+
+Test streaming detection of repetitive movement.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import numpy as np
+import pytest
+from periodicity import PeriodicityDetector
+
+
+def push_samples(detector, count, rate=25.0, jitter=0.004, seed=0):
+    """Push a 2 Hz head rhythm and low-level body noise at an uneven rate"""
+    rng = np.random.default_rng(seed)
+    timestamp = 0.0
+    patterns = []
+    for _ in range(count):
+        timestamp += 1.0 / rate + rng.normal(0, jitter)
+        patterns = detector.push(
+            timestamp,
+            {
+                "head": 0.05 + 0.05 * np.sin(2 * np.pi * 2.0 * timestamp),
+                "body": 0.01 * rng.random(),
+            },
+        )
+    return patterns
+
+
+@pytest.mark.unit
+class TestPeriodicityDetector:
+    """Test the periodicity detector"""
+
+    def test_detects_rhythm_on_the_rhythmic_signal_only(self):
+        """Frequency comes from timestamps, not the frame count"""
+        detector = PeriodicityDetector(("head", "body"), capacity=120, hop=10)
+        patterns = push_samples(detector, 200)
+
+        assert [p["signal"] for p in patterns] == ["head"]
+        assert patterns[0]["frequency"] == pytest.approx(2.0, abs=0.2)
+        assert patterns[0]["dominant_frequency"] == pytest.approx(2.0, abs=0.3)
+
+    def test_analysis_waits_for_window_and_hop(self):
+        """No analysis before min_samples, then one every hop samples"""
+        detector = PeriodicityDetector(("head",), capacity=120, min_samples=60, hop=10)
+        analyses = []
+        detector.analyze = lambda: analyses.append(len(detector)) or []
+
+        for i in range(100):
+            detector.push(i * 0.04, {"head": float(i % 2)})
+
+        assert analyses == [60, 70, 80, 90, 100]
+
+    def test_missing_samples_repeat_the_last_value(self):
+        """A face lost every other frame is not reported as a rhythm"""
+        detector = PeriodicityDetector(
+            ("movement", "head", "body"), capacity=120, hop=10
+        )
+        patterns = []
+        for i in range(200):
+            values = {"movement": 0.2}
+            if i % 2 == 0:
+                values.update(head=0.2, body=0.2)
+            patterns = detector.push(i * 0.2, values)
+
+        _, values = detector.window()
+        assert np.all(values == 0.2)
+        assert patterns == []
@@ -0,0 +1,155 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Phrase Audio Cache Unit Tests
+=============================
+
+Test LRU eviction, pinning, single-flight rendering and pre-warming.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import os
+import threading
+import time
+
+import pytest
+from phrase_audio_cache import PhraseAudioCache, PhrasePrewarmer
+
+
+def _writer(payload=b"x" * 100, calls=None):
+    def render(path):
+        if calls is not None:
+            calls.append(path)
+        time.sleep(0.01)
+        with open(path, "wb") as f:
+            f.write(payload)
+
+    return render
+
+
+@pytest.mark.unit
+class TestPhraseAudioCache:
+    """Test the bounded phrase audio cache"""
+
+    def test_renders_once_then_hits(self, tmp_path):
+        """A cached file is served without rendering again"""
+        cache = PhraseAudioCache(str(tmp_path))
+        calls = []
+        first = cache.get_or_render("a.mp3", _writer(calls=calls))
+        second = cache.get_or_render("a.mp3", _writer(calls=calls))
+        assert first == second and os.path.exists(first)
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_concurrent_misses_render_once(self, tmp_path):
+        """Simultaneous requests for one phrase share a single render"""
+        cache = PhraseAudioCache(str(tmp_path))
+        calls = []
+        threads = [
+            threading.Thread(
+                target=cache.get_or_render, args=("a.mp3", _writer(calls=calls))
+            )
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+
+    def test_lru_eviction_spares_pinned_files(self, tmp_path):
+        """Least recently used unpinned files go first once over budget"""
+        cache = PhraseAudioCache(str(tmp_path), max_bytes=250)
+        cache.get_or_render("pinned.mp3", _writer(), pin=True)
+        cache.get_or_render("old.mp3", _writer())
+        cache.get_or_render("new.mp3", _writer())
+        cache.lookup("old.mp3")
+        cache.get_or_render("newest.mp3", _writer())
+
+        assert not os.path.exists(tmp_path / "new.mp3")
+        for name in ("pinned.mp3", "old.mp3", "newest.mp3"):
+            assert os.path.exists(tmp_path / name)
+
+    def test_index_survives_restart(self, tmp_path):
+        """The index file restores entries and pins"""
+        cache = PhraseAudioCache(str(tmp_path))
+        cache.get_or_render("a.mp3", _writer(), pin=True)
+        cache.index_persister.flush()
+
+        reopened = PhraseAudioCache(str(tmp_path))
+        assert reopened.stats()["entries"] == 1
+        assert reopened.stats()["pinned"] == 1
+
+    def test_files_from_other_processes_are_hits(self, tmp_path):
+        """A file another process rendered is served without rendering"""
+        owner = PhraseAudioCache(str(tmp_path))
+        worker = PhraseAudioCache(str(tmp_path), owner=False)
+        owner.get_or_render("a.mp3", _writer())
+
+        calls = []
+        assert worker.get_or_render("a.mp3", _writer(calls=calls)) == owner.path_for("a.mp3")
+        assert calls == [] and worker.stats()["hits"] == 1
+
+    def test_hits_trust_the_index_until_forgotten(self, tmp_path):
+        """Hits skip the disk; a file evicted elsewhere is rendered after forget()"""
+        worker = PhraseAudioCache(str(tmp_path), owner=False)
+        calls = []
+        path = worker.get_or_render("a.mp3", _writer(calls=calls))
+        os.remove(path)  # Evicted by the owner process
+
+        assert worker.get_or_render("a.mp3", _writer(calls=calls)) == path
+        assert len(calls) == 1
+
+        worker.forget("a.mp3")
+        worker.forget("never-cached.mp3")
+        assert worker.get_or_render("a.mp3", _writer(calls=calls)) == path
+        assert len(calls) == 2 and os.path.exists(path)
+
+    def test_only_the_owner_deletes_files(self, tmp_path):
+        """Non-owners forget entries over budget but leave files for the owner"""
+        worker = PhraseAudioCache(str(tmp_path), max_bytes=150, owner=False)
+        worker.get_or_render("old.mp3", _writer())
+        worker.get_or_render("new.mp3", _writer())
+        assert worker.stats()["entries"] == 1
+        assert os.path.exists(tmp_path / "old.mp3")
+
+        owner = PhraseAudioCache(str(tmp_path), max_bytes=150)
+        owner.rescan()
+        assert owner.stats()["entries"] == 1
+        assert len([n for n in os.listdir(tmp_path) if n.endswith(".mp3")]) == 1
+
+    def test_prewarmer_pins_new_phrases_only(self, tmp_path):
+        """Each phrase is synthesized once and pinned"""
+        cache = PhraseAudioCache(str(tmp_path))
+        phrases = [("hello", "neutral")]
+
+        def synthesize(text, emotion):
+            return cache.get_or_render(f"{text}-{emotion}.mp3", _writer())
+
+        warmer = PhrasePrewarmer(cache, lambda: phrases, synthesize)
+        assert warmer.warm_once() == 1
+        phrases.append(("bye", "neutral"))
+        assert warmer.warm_once() == 1
+        assert cache.stats()["pinned"] == 2
@@ -0,0 +1,178 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Speech Job Service Unit Tests
+=============================
+
+Test asynchronous speech synthesis with single-flight deduplication.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+import speech_jobs
+from speech_jobs import JOB_DONE, JOB_ERROR, JOB_QUEUED, SpeechJobService
+
+
+def _exited_pid():
+    """Id of a process that has already exited"""
+    process = subprocess.Popen([sys.executable, "-c", ""])
+    process.wait()
+    return process.pid
+
+
+@pytest.mark.unit
+class TestSpeechJobService:
+    """Test the speech job queue"""
+
+    def test_identical_requests_share_one_job(self):
+        """Concurrent submissions of the same message render once"""
+        release = threading.Event()
+        calls = []
+
+        def render(text, emotion, emotion_tier, voice_id):
+            calls.append(text)
+            release.wait(5)
+            return f"/static/audio/{text}.mp3"
+
+        service = SpeechJobService(render, max_workers=2)
+        first = service.submit("hello", "neutral", "moderate")
+        second = service.submit("hello", "neutral", "moderate")
+        assert first is second
+        assert not first.is_finished
+
+        release.set()
+        assert first.wait(5)
+        assert first.status == JOB_DONE
+        assert first.speech_url == "/static/audio/hello.mp3"
+        assert calls == ["hello"]
+        assert service.get(first.id) is first
+
+    def test_inline_wait_returns_fast_results(self):
+        """Quick renders come back with their URL on submit"""
+        service = SpeechJobService(lambda *args: "/static/audio/x.mp3")
+        job = service.submit("hi", wait=1.0)
+        assert job.to_dict()["speech_url"] == "/static/audio/x.mp3"
+
+    def test_failures_and_full_queue_are_reported(self):
+        """Render errors and overflow finish the job with an error"""
+        release = threading.Event()
+
+        def render(text, *args):
+            if text == "bad":
+                raise RuntimeError("boom")
+            release.wait(5)
+            return "/static/audio/ok.mp3"
+
+        service = SpeechJobService(render, max_workers=1, max_pending=1)
+        blocked = service.submit("slow")
+        overflow = service.submit("other")
+        assert overflow.status == JOB_ERROR
+        release.set()
+        blocked.wait(5)
+
+        failed = service.submit("bad", wait=1.0)
+        assert failed.status == JOB_ERROR and "boom" in failed.error
+
+    def test_jobs_are_found_from_other_processes(self, tmp_path):
+        """A service sharing the state directory answers for the owner's jobs"""
+        release = threading.Event()
+
+        def render(text, *args):
+            release.wait(5)
+            return f"/static/audio/{text}.mp3"
+
+        owner = SpeechJobService(render, state_dir=str(tmp_path))
+        other = SpeechJobService(render, state_dir=str(tmp_path))
+        job = owner.submit("hello")
+
+        seen = other.get(job.id)
+        assert seen.status == JOB_QUEUED
+        assert not seen.wait(0.2)
+        release.set()
+        assert seen.wait(5)
+        assert seen.to_dict()["speech_url"] == "/static/audio/hello.mp3"
+        assert other.get("0" * 32) is None
+        assert other.get("../../etc/passwd") is None
+
+    def test_state_is_written_outside_the_lock(self, tmp_path, monkeypatch):
+        """Shared state writes (which fsync) never hold the service lock"""
+        service = SpeechJobService(lambda *args: "/static/audio/x.mp3",
+                                   max_pending=1, state_dir=str(tmp_path))
+        held = []
+        write = speech_jobs.atomic_write_bytes
+
+        def checked_write(path, data):
+            held.append(service._lock.locked())
+            write(path, data)
+
+        monkeypatch.setattr(speech_jobs, "atomic_write_bytes", checked_write)
+        job = service.submit("hi", wait=1.0)
+        assert job.status == JOB_DONE
+        assert held and not any(held)
+
+        with open(os.path.join(str(tmp_path), f"{job.id}.json")) as f:
+            assert json.load(f)["status"] == JOB_DONE
+
+    def test_jobs_of_exited_owners_are_lost(self, tmp_path):
+        """Unfinished state left by a dead or silent owner is not waited on forever"""
+        service = SpeechJobService(lambda *args: None, state_dir=str(tmp_path))
+        orphan = service.job_id("orphan")
+        silent = service.job_id("silent")
+        for job_id, owner in ((orphan, _exited_pid()), (silent, os.getpid())):
+            with open(os.path.join(str(tmp_path), f"{job_id}.json"), "w") as f:
+                json.dump({"job_id": job_id, "status": JOB_QUEUED, "owner": owner}, f)
+
+        assert service.get(orphan) is None
+        seen = service.get(silent)
+        assert seen.status == JOB_QUEUED
+
+        old = time.time() - speech_jobs.SHARED_STALE_AFTER - 1
+        os.utime(seen.path, (old, old))
+        assert seen.wait(1)
+        assert seen.status == JOB_ERROR and "lost" in seen.error
+
+    def test_startup_cleans_stale_state(self, tmp_path):
+        """A new service removes orphaned and long-finished state files"""
+        state = {
+            "orphan": {"status": JOB_QUEUED, "owner": _exited_pid()},
+            "live": {"status": JOB_QUEUED, "owner": os.getpid()},
+            "finished": {"status": JOB_DONE, "owner": os.getpid()},
+            "expired": {"status": JOB_DONE, "owner": os.getpid()},
+        }
+        for name, content in state.items():
+            with open(os.path.join(str(tmp_path), f"{name}.json"), "w") as f:
+                json.dump(content, f)
+        old = time.time() - 700
+        os.utime(os.path.join(str(tmp_path), "expired.json"), (old, old))
+
+        SpeechJobService(lambda *args: None, finished_ttl=600, state_dir=str(tmp_path))
+        assert sorted(os.listdir(str(tmp_path))) == ["finished.json", "live.json"]
@@ -0,0 +1,107 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+TTS Backend Unit Tests
+======================
+
+Test sentence splitting, backend selection and offline WAV streaming.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import io
+import json
+import sys
+import wave
+
+import pytest
+import tts_backends
+from tts_backends import EspeakBackend, TTSBackend, get_backend, split_sentences
+
+# Stand-in for the espeak binary: writes a short silent WAV to stdout
+FAKE_ESPEAK = [
+    sys.executable,
+    "-c",
+    "import io, sys, wave\n"
+    "buf = io.BytesIO()\n"
+    "w = wave.open(buf, 'wb'); w.setnchannels(1); w.setsampwidth(2)\n"
+    "w.setframerate(22050); w.writeframes(b'\\x00\\x00' * 100); w.close()\n"
+    "sys.stdout.buffer.write(buf.getvalue())",
+]
+
+
+@pytest.mark.unit
+class TestTTSBackends:
+    """Test the pluggable TTS backends"""
+
+    def test_split_sentences(self):
+        """Text is split at sentence ends and long sentences are wrapped"""
+        text = 'Hello there. "Are you ok?" Yes!  ' + "word " * 100
+        chunks = split_sentences(text, max_chars=60)
+        assert chunks[:3] == ["Hello there.", '"Are you ok?"', "Yes!"]
+        assert all(len(c) <= 61 for c in chunks)
+
+    def test_espeak_stream_is_one_wav(self):
+        """Each sentence streams as PCM after a single WAV header"""
+        backend = EspeakBackend(command=FAKE_ESPEAK)
+        chunks = list(backend.stream("One. Two. Three.", {}))
+        assert len(chunks) == 4  # header + three sentences
+        assert chunks[0].startswith(b"RIFF")
+
+        with wave.open(io.BytesIO(b"".join(chunks))) as w:
+            assert w.getframerate() == 22050
+            assert w.getnchannels() == 1
+
+    def test_espeak_text_is_never_an_option(self):
+        """Text beginning with '-' reaches espeak on stdin, not argv"""
+        recorder = [
+            sys.executable,
+            "-c",
+            "import json, sys\n"
+            "data = sys.stdin.buffer.read().decode()\n"
+            "sys.stdout.write(json.dumps({'argv': sys.argv[1:], 'stdin': data}))",
+        ]
+        backend = EspeakBackend(command=recorder)
+        seen = json.loads(backend.synthesize("-w/tmp/pwned.wav hello", {}))
+        assert "-w/tmp/pwned.wav hello" not in seen["argv"]
+        assert "--stdin" in seen["argv"]
+        assert seen["stdin"] == "-w/tmp/pwned.wav hello"
+
+    def test_backend_selected_per_voice(self, monkeypatch):
+        """A voice's backend key picks its synthesizer, with fallback"""
+
+        class Fake(TTSBackend):
+            name = "fake"
+
+        class Missing(TTSBackend):
+            name = "missing"
+
+            def is_available(self):
+                return False
+
+        monkeypatch.setattr(
+            tts_backends, "BACKENDS", {"missing": Missing(), "fake": Fake()}
+        )
+        assert get_backend({"backend": "fake"}).name == "fake"
+        assert get_backend({"backend": "missing"}).name == "fake"
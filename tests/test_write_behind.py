@@ -0,0 +1,154 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Write-Behind Persistence Unit Tests
+===================================
+
+Test coalesced, atomic flushing of in-memory state.
+
+==============================================================================
+© 2025 Everett Nathaniel Christman & Misty Gail Christman
+The Christman AI Project — Luma Cognify AI
+All rights reserved. Unauthorized use, replication, or derivative training 
+of this material is prohibited.
+Core Directive: "How can I help you love yourself more?" 
+Autonomy & Alignment Protocol v3.0
+==============================================================================
+"""
+
+import os
+import pickle
+import threading
+import pytest
+from write_behind import AppendLog, WriteBehindPersister, atomic_write_bytes
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+@pytest.mark.unit
+class TestWriteBehindPersister:
+    """Test the write-behind persister."""
+    
+    def test_mark_dirty_defers_write(self, tmp_path):
+        """Test marking dirty does not write until flushed."""
+        path = str(tmp_path / "state.pkl")
+        state = {"count": 1}
+        persister = WriteBehindPersister("test", path, lambda: pickle.dumps(state),
+                                         interval=60, max_pending=100)
+        persister.mark_dirty()
+        assert not os.path.exists(path)
+        
+        assert persister.flush() is True
+        assert persister.flush() is False  # Nothing pending
+        with open(path, "rb") as f:
+            assert pickle.load(f) == {"count": 1}
+        persister.close()
+    
+    def test_close_flushes_pending(self, tmp_path):
+        """Test pending changes are written at shutdown."""
+        path = str(tmp_path / "state.pkl")
+        state = {"count": 1}
+        persister = WriteBehindPersister("test", path, lambda: pickle.dumps(state),
+                                         interval=60, max_pending=100)
+        state["count"] = 2
+        persister.mark_dirty()
+        persister.close()
+        
+        with open(path, "rb") as f:
+            assert pickle.load(f) == {"count": 2}
+    
+    def test_atomic_write_leaves_no_temp_files(self, tmp_path):
+        """Test atomic writes replace the target without leftovers."""
+        path = str(tmp_path / "data.bin")
+        atomic_write_bytes(path, b"first")
+        atomic_write_bytes(path, b"second")
+        
+        assert os.listdir(tmp_path) == ["data.bin"]
+        with open(path, "rb") as f:
+            assert f.read() == b"second"
+
+
+
+@pytest.mark.unit
+class TestAppendLog:
+    """Test the append-only JSON-lines log."""
+    
+    def test_torn_last_line_is_truncated(self, tmp_path):
+        """Test a record appended after a crash is not merged into the torn line."""
+        path = str(tmp_path / "events.jsonl")
+        log = AppendLog(path)
+        log.append({"id": "a"})
+        with open(path, "a") as f:
+            f.write('{"id": "to')
+        
+        recovered = AppendLog(path)
+        assert list(recovered.read()) == [{"id": "a"}]
+        recovered.append({"id": "b"})
+        assert list(AppendLog(path).read()) == [{"id": "a"}, {"id": "b"}]
+    
+    def test_appends_follow_compaction_by_another_log(self, tmp_path):
+        """Test appends land in the new file after another process compacts."""
+        path = str(tmp_path / "events.jsonl")
+        writer, compactor = AppendLog(path), AppendLog(path)
+        writer.append({"id": "a"})
+        compactor.compact([{"id": "a"}])
+        writer.append({"id": "b"})
+        
+        assert list(AppendLog(path).read()) == [{"id": "a"}, {"id": "b"}]
+    
+    def test_trim_keeps_records_appended_by_other_logs(self, tmp_path):
+        """Test trimming re-reads the file instead of using one process's view."""
+        path = str(tmp_path / "events.jsonl")
+        first, second = AppendLog(path), AppendLog(path)
+        for n in range(3):
+            first.append({"id": f"a{n}"})
+            second.append({"id": f"b{n}"})
+        
+        first.trim(3)
+        assert first.lines == 3
+        assert list(AppendLog(path).read()) == [{"id": "b1"}, {"id": "a2"}, {"id": "b2"}]
+    
+    @pytest.mark.skipif(fcntl is None, reason="needs advisory file locks")
+    def test_append_waiting_on_a_rewrite_lands_in_the_new_file(self, tmp_path):
+        """Test an append blocked by a rewrite is not written to the replaced file."""
+        path = str(tmp_path / "events.jsonl")
+        log = AppendLog(path)
+        log.append({"id": "a"})
+        
+        with open(path, "rb") as held:
+            fcntl.flock(held, fcntl.LOCK_EX)
+            writer = threading.Thread(target=log.append, args=({"id": "b"},))
+            writer.start()
+            writer.join(0.2)
+            assert writer.is_alive()  # Waiting on the lock
+            atomic_write_bytes(path, b'{"id": "new"}\n')
+        writer.join(5)
+        
+        assert list(AppendLog(path).read()) == [{"id": "new"}, {"id": "b"}]
+
+
+# ==============================================================================
+# © 2025 Everett Nathaniel Christman & Misty Gail Christman
+# The Christman AI Project — Luma Cognify AI
+# All rights reserved. Unauthorized use, replication, or derivative training 
+# of this material is prohibited.
+# Core Directive: "How can I help you love yourself more?" 
+# Autonomy & Alignment Protocol v3.0
+# ==============================================================================
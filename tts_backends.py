@@ -0,0 +1,264 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+"""
+Pluggable text-to-speech backends.
+
+Each backend renders text to audio bytes and can stream an utterance one
+sentence at a time, so playback can start after the first sentence
+instead of after the whole response. Voice profiles select a backend
+with their ``backend`` key; profiles without one use
+ALPHAVOX_TTS_BACKEND (default ``gtts``).
+
+Backends:
+    gtts   - Google Translate TTS (MP3, needs network)
+    espeak - local espeak-ng/espeak binary (WAV, fully offline)
+"""
+
+import io
+import logging
+import os
+import re
+import shutil
+import struct
+import subprocess
+import wave
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKEND = os.environ.get("ALPHAVOX_TTS_BACKEND", "gtts")
+
+# Sentence boundary: terminal punctuation (plus closing quotes/brackets) and whitespace
+_SENTENCE_BOUNDARY = re.compile(r"(?:(?<=[.!?])|(?<=[.!?][\"')\]]))\s+")
+
+
+def split_sentences(text: str, max_chars: int = 240) -> List[str]:
+    """Split text into sentences, breaking overlong ones at commas or spaces.
+
+    Args:
+        text: Text to split
+        max_chars: Longest chunk handed to a backend in one call
+
+    Returns:
+        Non-empty sentence chunks in order
+    """
+    chunks = []
+    for sentence in _SENTENCE_BOUNDARY.split(text.strip()):
+        sentence = sentence.strip()
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(", ", 0, max_chars)
+            if cut <= 0:
+                cut = sentence.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            chunks.append(sentence[: cut + 1].strip())
+            sentence = sentence[cut + 1 :].strip()
+        if sentence:
+            chunks.append(sentence)
+    return chunks
+
+
+class TTSBackend:
+    """Interface for speech synthesizers."""
+
+    name = "base"
+    extension = ".mp3"
+    mimetype = "audio/mpeg"
+    requires_network = False
+
+    def is_available(self) -> bool:
+        return True
+
+    def synthesize(
+        self, text: str, voice: Dict, rate: float = 1.0, lang: str = "en"
+    ) -> bytes:
+        """Render text to a complete audio file in this backend's format."""
+        raise NotImplementedError
+
+    def save(
+        self, text: str, voice: Dict, path: str, rate: float = 1.0, lang: str = "en"
+    ) -> str:
+        """Render text and write it to path."""
+        with open(path, "wb") as f:
+            f.write(self.synthesize(text, voice, rate, lang))
+        return path
+
+    def stream(
+        self, text: str, voice: Dict, rate: float = 1.0, lang: str = "en"
+    ) -> Iterator[bytes]:
+        """Yield playable audio for text one sentence at a time."""
+        for sentence in split_sentences(text):
+            yield self.synthesize(sentence, voice, rate, lang)
+
+
+class GTTSBackend(TTSBackend):
+    """gTTS over the network; voices vary by the ``tld`` profile key."""
+
+    name = "gtts"
+    requires_network = True
+
+    def is_available(self) -> bool:
+        try:
+            import gtts  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def synthesize(self, text, voice, rate=1.0, lang="en"):
+        from gtts import gTTS
+
+        buffer = io.BytesIO()
+        gTTS(
+            text=text,
+            lang=lang,
+            slow=voice.get("slow", False) or rate < 0.92,
+            tld=voice.get("tld", "com"),
+        ).write_to_fp(buffer)
+        return buffer.getvalue()
+
+    # MP3 frames from consecutive calls concatenate into a playable stream,
+    # so the base class per-sentence stream works unchanged.
+
+
+class EspeakBackend(TTSBackend):
+    """Offline synthesis with the espeak-ng (or espeak) command-line tool.
+
+    Profile keys: ``espeak_voice`` (e.g. "en-us", "en-gb+f3") and
+    ``espeak_pitch`` (0-99).
+    """
+
+    name = "espeak"
+    extension = ".wav"
+    mimetype = "audio/wav"
+    base_words_per_minute = 165
+
+    def __init__(self, command: Optional[List[str]] = None, timeout: float = 30.0):
+        """Initialize the backend.
+
+        Args:
+            command: Executable (plus fixed arguments) to run; defaults to
+                espeak-ng or espeak found on PATH
+            timeout: Seconds allowed per synthesis call
+        """
+        if command is None:
+            binary = shutil.which("espeak-ng") or shutil.which("espeak")
+            command = [binary] if binary else None
+        self.command = command
+        self.timeout = timeout
+
+    def is_available(self) -> bool:
+        return bool(self.command)
+
+    def synthesize(self, text, voice, rate=1.0, lang="en"):
+        if not self.command:
+            raise RuntimeError("espeak is not installed")
+        # Text goes in on stdin so that input starting with "-" can never
+        # be parsed as an espeak option (e.g. "-w <path>" writes a file).
+        args = list(self.command) + [
+            "--stdin",
+            "--stdout",
+            "-v",
+            voice.get("espeak_voice", lang),
+            "-s",
+            str(int(self.base_words_per_minute * rate)),
+        ]
+        if "espeak_pitch" in voice:
+            args += ["-p", str(voice["espeak_pitch"])]
+        result = subprocess.run(
+            args,
+            input=text.encode("utf-8"),
+            capture_output=True,
+            timeout=self.timeout,
+            check=True,
+        )
+        return result.stdout
+
+    def stream(self, text, voice, rate=1.0, lang="en"):
+        # WAV files cannot be concatenated, so send one streaming header
+        # (unknown length) followed by each sentence's PCM frames.
+        header_sent = False
+        for sentence in split_sentences(text):
+            with wave.open(io.BytesIO(self.synthesize(sentence, voice, rate, lang))) as w:
+                frames = w.readframes(w.getnframes())
+                if not header_sent:
+                    yield streaming_wav_header(
+                        w.getnchannels(), w.getsampwidth(), w.getframerate()
+                    )
+                    header_sent = True
+            yield frames
+
+
+def streaming_wav_header(channels: int, sample_width: int, sample_rate: int) -> bytes:
+    """RIFF/WAVE header with maximal sizes, for audio of unknown length."""
+    unknown = 0xFFFFFFFF
+    block_align = channels * sample_width
+    return (
+        b"RIFF"
+        + struct.pack("<I", unknown)
+        + b"WAVEfmt "
+        + struct.pack(
+            "<IHHIIHH",
+            16,
+            1,
+            channels,
+            sample_rate,
+            sample_rate * block_align,
+            block_align,
+            sample_width * 8,
+        )
+        + b"data"
+        + struct.pack("<I", unknown - 36)
+    )
+
+
+BACKENDS: Dict[str, TTSBackend] = {
+    "gtts": GTTSBackend(),
+    "espeak": EspeakBackend(),
+}
+
+
+def register_backend(backend: TTSBackend) -> None:
+    """Add or replace a backend by name."""
+    BACKENDS[backend.name] = backend
+
+
+def get_backend(voice: Optional[Dict] = None) -> TTSBackend:
+    """Return the backend for a voice profile, falling back to any available one.
+
+    Args:
+        voice: Voice profile dict; its ``backend`` key selects the backend
+    """
+    name = (voice or {}).get("backend", DEFAULT_BACKEND)
+    backend = BACKENDS.get(name)
+    if backend is not None and backend.is_available():
+        return backend
+
+    for fallback in BACKENDS.values():
+        if fallback.is_available():
+            logger.warning(f"TTS backend {name} unavailable, using {fallback.name}")
+            return fallback
+    raise RuntimeError("No text-to-speech backend is available")
+
+
+# ==============================================================================
+# © 2025 Everett Nathaniel Christman & Misty Gail Christman
+# The Christman AI Project — Luma Cognify AI
+# All rights reserved. Unauthorized use, replication, or derivative training 
+# of this material is prohibited.
+# Core Directive: "How can I help you love yourself more?" 
+# Autonomy & Alignment Protocol v3.0
+# ==============================================================================
@@ -39,7 +39,7 @@ import tempfile
 import uuid
 from typing import Any, Dict, Optional
 
-from gtts import gTTS
+from tts_backends import get_backend
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -125,27 +125,28 @@ def text_to_speech(
         if not text.endswith(".") and not text.endswith("?") and not text.endswith("!"):
             text = text + "."
 
+    # Select the synthesizer for this voice profile (gTTS unless it names another)
+    backend = get_backend(selected_voice)
+
     # Generate a unique filename if not provided
     if not output_path:
-        filename = f"speech_{uuid.uuid4()}.mp3"
+        filename = f"speech_{uuid.uuid4()}{backend.extension}"
         output_path = os.path.join(tempfile.gettempdir(), filename)
 
     # Apply voice speed adjustment to the slow parameter
     # If the speed factor is below 0.92, use slow=True
     effective_slow = slow or (voice_speed_factor < 0.92)
 
-    # Use the voice profile to generate speech
-    tts = gTTS(
-        text=text,
+    # Use the voice profile to generate speech and save the audio file
+    backend.save(
+        text,
+        dict(selected_voice, slow=effective_slow),
+        output_path,
+        rate=voice_speed_factor * rate,
         lang=lang,
-        slow=effective_slow,
-        tld=selected_voice.get("tld", "com"),  # Use TLD for voice variation
     )
-
-    # Save the audio file
-    tts.save(output_path)
     logger.info(
-        f"Generated speech with TLD {selected_voice.get('tld', 'com')}, speed factor {voice_speed_factor}: {output_path}"
+        f"Generated speech with {backend.name} (TLD {selected_voice.get('tld', 'com')}), speed factor {voice_speed_factor}: {output_path}"
     )
 
     return output_path
@@ -26,9 +26,10 @@ import os
 import tempfile
 
 import pygame
-from gtts import gTTS
 from gtts.lang import tts_langs
 
+from tts_backends import DEFAULT_BACKEND, get_backend
+
 # Initialize logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -59,6 +60,7 @@ class VoiceSynthesizer:
         self.default_language = "en"
         self.default_tld = "com"  # US English
         self.default_slow = False
+        self.backend = DEFAULT_BACKEND
 
         # Get available languages
         try:
@@ -130,13 +132,11 @@ class VoiceSynthesizer:
         logger.info(f"Text: {text[:50]}..." if len(text) > 50 else f"Text: {text}")
 
         try:
-            # Create gTTS object
-            tts = gTTS(
-                text=text,
-                lang=language,
-                slow=slow,
-                tld=tld if language == "en" else None,
-            )
+            # Voice settings for the configured backend
+            voice = {"backend": self.backend, "slow": slow}
+            if language == "en":
+                voice["tld"] = tld
+            backend = get_backend(voice)
 
             # Determine output path
             if save_path:
@@ -144,12 +144,12 @@ class VoiceSynthesizer:
             else:
                 # Create temporary file in cache directory
                 with tempfile.NamedTemporaryFile(
-                    suffix=".mp3", dir=self.cache_dir, delete=False
+                    suffix=backend.extension, dir=self.cache_dir, delete=False
                 ) as temp_file:
                     output_path = temp_file.name
 
             # Save the audio file
-            tts.save(output_path)
+            backend.save(text, voice, output_path, lang=language)
             logger.info(f"Audio saved to {output_path}")
 
             # Play the audio if requested
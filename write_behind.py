@@ -0,0 +1,301 @@
+# © 2025 The Christman AI Project. All rights reserved.
+#
+# This code is released as part of a trauma-informed, dignity-first AI ecosystem
+# designed to protect, empower, and elevate vulnerable populations.
+#
+# By using, modifying, or distributing this software, you agree to uphold the following:
+# 1. Truth — No deception, no manipulation.
+# 2. Dignity — Respect the autonomy and humanity of all users.
+# 3. Protection — Never use this to exploit or harm vulnerable individuals.
+# 4. Transparency — Disclose all modifications and contributions clearly.
+# 5. No Erasure — Preserve the mission and ethical origin of this work.
+#
+# This is not just code. This is redemption in code.
+# Contact: lumacognify@thechristmanaiproject.com
+# https://thechristmanaiproject.com
+
+
+"""
+Write-behind persistence for in-memory state.
+
+Request paths mark state dirty instead of serializing it; a background
+thread coalesces changes and flushes on a timer, when enough changes
+are pending, or at interpreter shutdown. Files are written atomically
+(temp file + rename) so a crash never leaves a truncated pickle.
+
+State that grows by small records can use AppendLog instead: each
+change is one JSON line appended to a file, and the file is rewritten
+from a snapshot only when compacted. Appends hold a shared advisory lock
+and rewrites an exclusive one, so a log several processes append to can
+be trimmed without losing their records.
+"""
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows - no cross-process locking
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+def atomic_write_bytes(path: str, data: bytes) -> None:
+    """Write data to path via a temp file in the same directory and rename."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class WriteBehindPersister:
+    """Coalesces writes of one piece of state to one file."""
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        serialize: Callable[[], bytes],
+        interval: float = 5.0,
+        max_pending: int = 50,
+    ):
+        """Initialize the persister and start its flush thread.
+
+        Args:
+            name: Label used in log messages
+            path: File the serialized state is written to
+            serialize: Returns a consistent byte snapshot of the state;
+                called on the flush thread, so it must take any lock the
+                state's writers use
+            interval: Seconds between timed flushes
+            max_pending: Changes that trigger an early flush
+        """
+        self.name = name
+        self.path = path
+        self.serialize = serialize
+        self.interval = interval
+        self.max_pending = max_pending
+
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"write-behind-{name}", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def mark_dirty(self, changes: int = 1) -> None:
+        """Record that the state changed; flushes early past max_pending."""
+        with self._lock:
+            self._pending += changes
+            if self._pending >= self.max_pending:
+                self._wake.set()
+
+    def flush(self, force: bool = False) -> bool:
+        """Write the state now if it is dirty (or always when forced).
+
+        Returns:
+            True if a write happened
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending = self._pending
+                if not pending and not force:
+                    return False
+                self._pending = 0
+            try:
+                atomic_write_bytes(self.path, self.serialize())
+                logger.debug(f"Flushed {self.name} ({pending} changes) to {self.path}")
+                return True
+            except Exception as e:
+                # Keep the changes pending so the next flush retries them
+                with self._lock:
+                    self._pending += pending
+                logger.error(f"Error flushing {self.name}: {str(e)}")
+                return False
+
+    def close(self) -> None:
+        """Stop the flush thread and write any pending changes."""
+        if self._stopped:
+            return
+        self._stopped = True
+        self._wake.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.interval + 1)
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stopped:
+                break
+            self.flush()
+
+
+class AppendLog:
+    """Append-only JSON-lines log of records, with snapshot compaction.
+
+    Every append opens the file with O_APPEND, so after another process
+    compacts (renames a new file into place) the next append lands in the
+    new file rather than in a deleted one.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the log.
+
+        Args:
+            path: JSON-lines file the records are appended to
+        """
+        self.path = path
+        self.lines = 0  # Records in the file, including superseded ones
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def read(self) -> Iterator[Any]:
+        """Yield the logged records in order, dropping a torn last line.
+
+        A last line cut short by a crash is truncated from the file once
+        the records have been read, so the next append starts on a fresh
+        line instead of being merged into the broken one.
+        """
+        self.lines = 0
+        if not self.exists():
+            return
+        with open(self.path, "rb") as f:
+            data = f.read()
+        good_offset = 0
+        for raw in data.splitlines(keepends=True):
+            line = raw.strip()
+            if line:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    if not raw.endswith(b"\n"):
+                        break  # Torn last line
+                    logger.warning(f"Skipping unreadable record in {self.path}")
+                    good_offset += len(raw)
+                    continue
+                self.lines += 1
+                yield record
+            good_offset += len(raw)
+        self._repair(data, good_offset)
+
+    def _repair(self, data: bytes, good_offset: int) -> None:
+        complete = data[:good_offset]
+        if good_offset == len(data) and (not complete or complete.endswith(b"\n")):
+            return
+        with self._lock:
+            with open(self.path, "r+b") as f:
+                f.truncate(good_offset)
+                if complete and not complete.endswith(b"\n"):
+                    # Last record parsed but lost its newline
+                    f.seek(good_offset)
+                    f.write(b"\n")
+        logger.warning(f"Truncated torn record at the end of {self.path}")
+
+    @contextmanager
+    def _locked(self, operation: int, flags: int):
+        """Open the current log file with an advisory lock held.
+
+        A rewrite renames a new file into place, so a caller that waited on
+        the lock of the replaced file opens the new one and locks again.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        while True:
+            fd = os.open(self.path, flags | os.O_CREAT, 0o644)
+            if not fcntl:
+                break
+            fcntl.flock(fd, operation)
+            try:
+                if os.fstat(fd).st_ino == os.stat(self.path).st_ino:
+                    break
+            except FileNotFoundError:
+                pass
+            os.close(fd)
+        try:
+            yield fd
+        finally:
+            os.close(fd)
+
+    def append(self, record: Any) -> None:
+        """Append one record."""
+        line = (json.dumps(record) + "\n").encode("utf-8")
+        with self._lock:
+            shared = fcntl.LOCK_SH if fcntl else 0
+            with self._locked(shared, os.O_WRONLY | os.O_APPEND) as fd:
+                os.write(fd, line)
+            self.lines += 1
+
+    def compact(self, records: Iterable[Any]) -> None:
+        """Replace the log with a snapshot of the live records."""
+        data = "".join(json.dumps(record) + "\n" for record in records)
+        with self._lock:
+            exclusive = fcntl.LOCK_EX if fcntl else 0
+            with self._locked(exclusive, os.O_RDONLY):
+                atomic_write_bytes(self.path, data.encode("utf-8"))
+            self.lines = data.count("\n")
+
+    def trim(self, keep: int) -> None:
+        """Cut the log to its last keep records.
+
+        Unlike compact(), the records are re-read from the file under the
+        exclusive lock, so records other processes appended are kept.
+        """
+        with self._lock:
+            exclusive = fcntl.LOCK_EX if fcntl else 0
+            with self._locked(exclusive, os.O_RDONLY) as fd:
+                with os.fdopen(os.dup(fd), "rb") as f:
+                    lines = [line for line in f if line.strip()]
+                records = []
+                for line in lines[-keep:] if keep > 0 else []:
+                    try:
+                        json.loads(line)
+                    except ValueError:
+                        continue  # Unreadable or torn record
+                    records.append(line.rstrip(b"\n") + b"\n")
+                atomic_write_bytes(self.path, b"".join(records))
+            self.lines = len(records)
+
+    def close(self) -> None:
+        """No-op: appends do not keep the file open between records."""
+
+
+# ==============================================================================
+# © 2025 Everett Nathaniel Christman & Misty Gail Christman
+# The Christman AI Project — Luma Cognify AI
+# All rights reserved. Unauthorized use, replication, or derivative training 
+# of this material is prohibited.
+# Core Directive: "How can I help you love yourself more?" 
+# Autonomy & Alignment Protocol v3.0
+# ==============================================================================